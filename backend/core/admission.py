@@ -0,0 +1,256 @@
+"""Admission control and fair scheduling of parses between clients.
+
+Two layers protect the parse workers from a single busy client:
+
+- RateLimiter admits uploads with a token bucket per client: each
+  client may submit `burst` documents at once and `rate` documents per
+  second after that. Rejected requests get a Retry-After.
+- FairScheduler hands out a fixed number of parse slots. Waiting parses
+  are queued per client and served weighted round-robin (a client with
+  weight 2 gets two slots per round), so a client with one upload waits
+  for at most one parse per other client rather than behind a whole
+  batch, while batch clients keep every slot nobody else wants.
+
+Both are per API process and run on its event loop. Clients are
+identified by their remote address; the API trusts an X-Client-ID header
+only from configured proxies (see main.client_id). Per-client metrics
+are kept for the most recently seen clients only.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Deque, Dict, Optional
+
+from core.storage import LRUCache
+
+logger = logging.getLogger(__name__)
+
+# Client buckets and metrics kept in memory (least recently seen clients are dropped, i.e. refilled)
+MAX_TRACKED_CLIENTS = 10_000
+
+# Clients listed per metric, most affected first
+METRICS_TOP_CLIENTS = 20
+
+
+def _top(counts: Dict[str, Any], key: Callable[[Any], float]) -> Dict[str, Any]:
+    return dict(sorted(counts.items(), key=lambda item: -key(item[1]))[:METRICS_TOP_CLIENTS])
+
+
+@dataclass
+class TokenBucket:
+    """Tokens refilled at `rate` per second up to `burst`."""
+    rate: float
+    burst: float
+    tokens: float
+    updated_at: float
+
+    def take(self, cost: float, now: float) -> float:
+        """Take cost tokens if available.
+
+        Returns:
+            0.0 when taken, otherwise seconds until enough tokens are available
+        """
+        self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+        if self.tokens >= cost:
+            self.tokens -= cost
+            return 0.0
+        return (cost - self.tokens) / self.rate
+
+
+class RateLimiter:
+    """Per-client token-bucket rate limits."""
+
+    def __init__(self, rate_per_minute: float, burst: int, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            rate_per_minute: Documents each client may submit per minute (0 disables limiting)
+            burst: Documents a client may submit at once
+            clock: Time source in seconds
+        """
+        self.rate = rate_per_minute / 60
+        self.burst = max(burst, 1)
+        self.clock = clock
+        self._buckets: Dict[str, TokenBucket] = LRUCache(MAX_TRACKED_CLIENTS)
+        self.admitted = 0
+        self.rejected = 0
+        self._rejected_by_client: Dict[str, int] = LRUCache(MAX_TRACKED_CLIENTS)
+
+    @property
+    def enabled(self) -> bool:
+        return self.rate > 0
+
+    def check(self, client: str, cost: int = 1) -> float:
+        """Whether the client could be admitted for cost documents now, without taking tokens.
+
+        Lets a request be turned away before its body is read; a
+        rejection counts in the metrics like one from acquire.
+
+        Returns:
+            0.0 when it could be admitted, otherwise seconds the client should wait
+        """
+        bucket = self._buckets.get(client) if self.enabled else None
+        if bucket is None:
+            return 0.0
+        now = self.clock()
+        tokens = min(self.burst, bucket.tokens + (now - bucket.updated_at) * self.rate)
+        retry_after = max(min(cost, self.burst) - tokens, 0.0) / self.rate
+        if retry_after:
+            self._reject(client, retry_after)
+        return retry_after
+
+    def acquire(self, client: str, cost: int = 1) -> float:
+        """Admit a request for cost documents.
+
+        Requests larger than the burst cost the whole burst, so they are
+        admitted once the client's bucket is full.
+
+        Returns:
+            0.0 when admitted, otherwise seconds the client should wait
+        """
+        if not self.enabled:
+            self.admitted += 1
+            return 0.0
+        now = self.clock()
+        bucket = self._buckets.get(client)
+        if bucket is None:
+            bucket = self._buckets[client] = TokenBucket(self.rate, self.burst, self.burst, now)
+        retry_after = bucket.take(min(cost, self.burst), now)
+        if retry_after:
+            self._reject(client, retry_after)
+        else:
+            self.admitted += 1
+        return retry_after
+
+    def _reject(self, client: str, retry_after: float):
+        self.rejected += 1
+        self._rejected_by_client[client] = self._rejected_by_client.get(client, 0) + 1
+        logger.info(f"Rate limited client {client}: retry in {retry_after:.1f} s")
+
+    def metrics(self) -> Dict[str, Any]:
+        """Limits, admitted requests and rejections (per client for the most rejected)."""
+        return {
+            'rate_per_minute': round(self.rate * 60, 3),
+            'burst': self.burst,
+            'admitted': self.admitted,
+            'rejected': self.rejected,
+            'rejected_by_client': _top(self._rejected_by_client, key=lambda count: count),
+        }
+
+
+@dataclass
+class _WaitStats:
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def add(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'parses': self.count,
+            'mean_wait_ms': round(self.total / self.count * 1000, 1) if self.count else None,
+            'max_wait_ms': round(self.max * 1000, 1),
+        }
+
+
+@dataclass
+class _ClientQueue:
+    waiters: Deque[asyncio.Future] = field(default_factory=deque)
+    turns: int = 0  # Slots granted in the current round
+
+
+class FairScheduler:
+    """Weighted round-robin scheduling of a fixed number of slots between clients."""
+
+    def __init__(self, slots: int, weights: Optional[Dict[str, int]] = None):
+        """
+        Args:
+            slots: Parses running at once
+            weights: Client ID -> slots per round (default 1)
+        """
+        self.slots = max(slots, 1)
+        self.weights = weights or {}
+        self.running = 0
+        self._queues: Dict[str, _ClientQueue] = {}
+        self._round: Deque[str] = deque()  # Clients with waiters, next to be served first
+        self._wait_total = _WaitStats()
+        self._waits: Dict[str, _WaitStats] = LRUCache(MAX_TRACKED_CLIENTS)
+
+    def weight(self, client: str) -> int:
+        return max(int(self.weights.get(client, 1)), 1)
+
+    @asynccontextmanager
+    async def slot(self, client: str) -> AsyncIterator[None]:
+        """Hold a slot for the duration of the block, waiting for the client's turn."""
+        queued_at = time.perf_counter()
+        if self.running < self.slots and not self._round:
+            self.running += 1
+        else:
+            waiter = asyncio.get_running_loop().create_future()
+            queue = self._queues.setdefault(client, _ClientQueue())
+            queue.waiters.append(waiter)
+            if client not in self._round:
+                self._round.append(client)
+            self._dispatch()  # In case slots are free
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    self._release()  # Granted just as the waiting task was cancelled
+                raise
+        waited = time.perf_counter() - queued_at
+        self._wait_total.add(waited)
+        stats = self._waits.get(client)
+        if stats is None:
+            stats = self._waits[client] = _WaitStats()
+        stats.add(waited)
+        try:
+            yield
+        finally:
+            self._release()
+
+    def _release(self):
+        self.running -= 1
+        self._dispatch()
+
+    def _dispatch(self):
+        """Grant free slots to waiting clients in weighted round-robin order."""
+        while self.running < self.slots and self._round:
+            client = self._round[0]
+            queue = self._queues[client]
+            waiter = queue.waiters.popleft()
+            if not waiter.cancelled():
+                waiter.set_result(None)
+                self.running += 1
+                queue.turns += 1
+            if not queue.waiters:
+                self._round.popleft()
+                del self._queues[client]
+            elif queue.turns >= self.weight(client):
+                queue.turns = 0
+                self._round.rotate(-1)
+
+    def queued(self) -> Dict[str, int]:
+        """Waiting parses per client."""
+        return {client: sum(not w.cancelled() for w in queue.waiters) for client, queue in self._queues.items()}
+
+    def metrics(self) -> Dict[str, Any]:
+        """Slot use, queue depth and queue time (per client for the longest waits)."""
+        queued = self.queued()
+        return {
+            'slots': self.slots,
+            'running': self.running,
+            'queued': sum(queued.values()),
+            'queued_by_client': queued,
+            'queue_time': self._wait_total.as_dict(),
+            'queue_time_by_client': {client: stats.as_dict()
+                                     for client, stats in _top(self._waits, key=lambda stats: stats.max).items()},
+        }
@@ -0,0 +1,114 @@
+"""Batch uploads: expanding uploaded files and zips into PDFs, and batch statistics.
+
+/upload/batch accepts several PDFs, zip archives of PDFs, or both. Each
+PDF becomes a BatchItem that reads its bytes only when its parse starts,
+so a zip of 80 manuscripts is not decompressed all at once. Files that
+cannot be parsed (wrong type, too large, corrupt zip) become items that
+already carry their error, and are reported like any other failure.
+"""
+
+import io
+import logging
+import time
+import zipfile
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BatchItem:
+    """One PDF of a batch upload."""
+    filename: str                               # Upload name, or "archive.zip/member.pdf"
+    load: Optional[Callable[[], bytes]] = None  # Reads the PDF; None when error is set
+    error: Optional[str] = None                 # Why the file is not parsed
+
+
+def _is_pdf(name: str) -> bool:
+    return name.lower().endswith('.pdf')
+
+
+def _read_member(archive: zipfile.ZipFile, info: zipfile.ZipInfo, max_size: int) -> bytes:
+    with archive.open(info) as member:
+        data = member.read(max_size + 1)  # Stop early if the declared size is wrong
+    if len(data) > max_size:
+        raise ValueError(f"{info.filename} is larger than {max_size} bytes")
+    return data
+
+
+def expand_uploads(uploads: List[Tuple[str, bytes]], max_file_size: int) -> List[BatchItem]:
+    """Batch items for uploaded (filename, contents) pairs.
+
+    PDFs become one item each; zip archives one item per PDF they contain
+    (directories, macOS metadata and other files are ignored).
+
+    Args:
+        uploads: Uploaded files in request order
+        max_file_size: Largest PDF accepted, in bytes
+
+    Returns:
+        Items in upload order, zip members in archive order
+    """
+    items = []
+    for filename, contents in uploads:
+        if _is_pdf(filename):
+            if len(contents) > max_file_size:
+                items.append(BatchItem(filename, error=f"File too large ({len(contents)} bytes)"))
+            else:
+                items.append(BatchItem(filename, load=lambda contents=contents: contents))
+        elif filename.lower().endswith('.zip'):
+            items.extend(_expand_zip(filename, contents, max_file_size))
+        else:
+            items.append(BatchItem(filename, error="Only PDF and zip files are supported"))
+    return items
+
+
+def _expand_zip(filename: str, contents: bytes, max_file_size: int) -> List[BatchItem]:
+    try:
+        archive = zipfile.ZipFile(io.BytesIO(contents))
+    except zipfile.BadZipFile as e:
+        return [BatchItem(filename, error=f"Invalid zip file: {e}")]
+
+    items = []
+    for info in archive.infolist():
+        name = info.filename
+        if info.is_dir() or name.startswith('__MACOSX/') or not _is_pdf(name):
+            continue
+        label = f"{filename}/{name}"
+        if info.file_size > max_file_size:
+            items.append(BatchItem(label, error=f"File too large ({info.file_size} bytes)"))
+        else:
+            items.append(BatchItem(label, load=lambda info=info: _read_member(archive, info, max_file_size)))
+    if not items:
+        logger.warning(f"No PDFs in {filename}")
+        items.append(BatchItem(filename, error="No PDF files in zip"))
+    return items
+
+
+@dataclass
+class BatchStats:
+    """Counts and throughput of a batch, for its final NDJSON line."""
+    total: int
+    started_at: float = field(default_factory=time.perf_counter)
+    parsed: int = 0
+    failed: int = 0
+    cached: int = 0
+
+    def record(self, result: Dict[str, Any]):
+        if result["status"] == "parsed":
+            self.parsed += 1
+            self.cached += bool(result.get("cached"))
+        else:
+            self.failed += 1
+
+    def summary(self) -> Dict[str, Any]:
+        elapsed = time.perf_counter() - self.started_at
+        return {
+            "documents": self.total,
+            "parsed": self.parsed,
+            "failed": self.failed,
+            "cached": self.cached,
+            "duration_s": round(elapsed, 2),
+            "documents_per_minute": round(self.parsed / elapsed * 60, 1) if elapsed > 0 else None
+        }
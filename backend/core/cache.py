@@ -0,0 +1,238 @@
+"""Cache tier for parse results, analyses and serialized API responses.
+
+A Cache stores compressed values (core.storage.serialize) under
+namespaced keys with a TTL, in one of two backends:
+
+- MemoryBackend: an in-process LRU, the fallback when Redis is unavailable
+- RedisBackend: shared by every worker, so a warm entry computed by one
+  worker is a hit for the others
+
+Cache failures never fail a request: a backend error is logged and
+counted, and the lookup is treated as a miss. Hits, misses, writes and
+errors are counted per namespace for the /debug/cache endpoint.
+
+Values are pickled, and unpickling runs code chosen by whoever wrote
+the bytes. Redis must therefore be trusted: only reachable by the API
+and its workers (a private network, authentication), since anyone who
+can write a key under KEY_PREFIX can run code in every worker that
+reads it.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, Optional
+
+from .storage import LRUCache, deserialize, serialize
+
+logger = logging.getLogger(__name__)
+
+# Key namespaces
+PARSE = 'parse'          # (document, analysis) by PDF content hash; the author flag is analysis.has_authors
+RESPONSE = 'response'    # Serialized API responses, by endpoint and document ID
+
+# Prefix of every key written to Redis
+KEY_PREFIX = 'peerpreview:'
+
+
+def cache_key(namespace: str, *parts: str) -> str:
+    """Key for a namespace and identifying parts ("parse:<sha256>")."""
+    return ':'.join((namespace, *parts))
+
+
+def content_hash(data: bytes) -> str:
+    """SHA-256 of raw content, for content-addressed keys."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def connect_redis(url: str) -> Any:
+    """Connected redis-py client; raises ImportError or a connection error if unavailable."""
+    import redis
+    client = redis.Redis.from_url(url, socket_connect_timeout=1, socket_timeout=1)
+    client.ping()
+    return client
+
+
+# ============== Backends ==============
+
+class MemoryBackend:
+    """In-process LRU of (expiry time, value) entries."""
+
+    name = 'memory'
+
+    def __init__(self, max_entries: int = 256):
+        self._entries = LRUCache(max_entries)
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key: str, value: bytes, ttl: Optional[int]):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl if ttl else None, value)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class RedisBackend:
+    """Redis keys under KEY_PREFIX, expiring with Redis TTLs.
+
+    Values are unpickled on read, so the Redis server must be trusted
+    (see the module docstring).
+    """
+
+    name = 'redis'
+
+    def __init__(self, client: Any, prefix: str = KEY_PREFIX):
+        """Wrap a redis-py compatible client (get / set(ex=) / delete / scan_iter)."""
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str) -> 'RedisBackend':
+        """Connect to Redis; raises ImportError or a connection error if unavailable."""
+        return cls(connect_redis(url))
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(self.prefix + key)
+
+    def set(self, key: str, value: bytes, ttl: Optional[int]):
+        self.client.set(self.prefix + key, value, ex=ttl or None)
+
+    def delete(self, key: str):
+        self.client.delete(self.prefix + key)
+
+    def clear(self):
+        keys = list(self.client.scan_iter(match=self.prefix + '*'))
+        if keys:
+            self.client.delete(*keys)
+
+
+# ============== Cache ==============
+
+class Cache:
+    """Compressed, TTL-bound values with hit/miss metrics."""
+
+    def __init__(self, backend: Optional[Any], ttl: Optional[int] = None):
+        """Create a cache.
+
+        Args:
+            backend: MemoryBackend, RedisBackend, or None to disable caching
+            ttl: Default time to live in seconds (None keeps entries until evicted)
+        """
+        self.backend = backend
+        self.ttl = ttl
+        self._counts: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None
+
+    def _count(self, key: str, event: str):
+        self._counts[key.split(':', 1)[0]][event] += 1
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Cached value, or default on a miss, an expired entry or a backend error."""
+        if self.backend is None:
+            return default
+        try:
+            data = self.backend.get(key)
+        except Exception as e:
+            logger.warning(f"Cache get failed for {key}: {e}")
+            self._count(key, 'errors')
+            return default
+        if data is None:
+            self._count(key, 'misses')
+            return default
+        self._count(key, 'hits')
+        return deserialize(data)
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None):
+        """Store a value (ttl overrides the default)."""
+        if self.backend is None:
+            return
+        try:
+            self.backend.set(key, serialize(value), ttl if ttl is not None else self.ttl)
+            self._count(key, 'sets')
+        except Exception as e:
+            logger.warning(f"Cache set failed for {key}: {e}")
+            self._count(key, 'errors')
+
+    def delete(self, key: str):
+        if self.backend is None:
+            return
+        try:
+            self.backend.delete(key)
+        except Exception as e:
+            logger.warning(f"Cache delete failed for {key}: {e}")
+            self._count(key, 'errors')
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any], ttl: Optional[int] = None) -> Any:
+        """Cached value, computing and storing it on a miss."""
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = compute()
+            self.set(key, value, ttl)
+        return value
+
+    def clear(self):
+        if self.backend is not None:
+            self.backend.clear()
+
+    def metrics(self) -> Dict[str, Any]:
+        """Backend name and per-namespace hits, misses, sets, errors and hit rate."""
+        namespaces = {}
+        for namespace, counts in self._counts.items():
+            lookups = counts['hits'] + counts['misses']
+            namespaces[namespace] = {
+                'hits': counts['hits'],
+                'misses': counts['misses'],
+                'sets': counts['sets'],
+                'errors': counts['errors'],
+                'hit_rate': round(counts['hits'] / lookups, 3) if lookups else None,
+            }
+        return {
+            'backend': self.backend.name if self.backend is not None else 'disabled',
+            'ttl': self.ttl,
+            'namespaces': namespaces,
+        }
+
+
+def create_cache(enabled: bool, ttl: Optional[int], redis_url: Optional[str], max_entries: int = 256) -> Cache:
+    """Cache from settings: Redis when reachable, otherwise the in-process LRU.
+
+    Args:
+        enabled: settings.enable_cache; False returns a cache that never hits
+        ttl: settings.cache_ttl
+        redis_url: settings.redis_url (None or empty for memory only)
+        max_entries: Size of the in-process LRU
+    """
+    if not enabled:
+        return Cache(None, ttl)
+    if redis_url:
+        try:
+            backend = RedisBackend.from_url(redis_url)
+            logger.info(f"Cache using Redis at {redis_url.split('@')[-1]}")
+            return Cache(backend, ttl)
+        except ImportError:
+            logger.info("redis package not installed; using in-process cache")
+        except Exception as e:
+            logger.warning(f"Redis unavailable ({e}); using in-process cache")
+    return Cache(MemoryBackend(max_entries), ttl)
@@ -0,0 +1,208 @@
+"""Progress events for parse and review jobs, streamed over Server-Sent Events.
+
+Every event for a document is appended to that document's log with a
+sequential ID. GET /events/{document_id} replays the log and then pushes
+new events as they are published, so a client that connects late (or
+reconnects with Last-Event-ID) misses nothing and never polls.
+
+- LocalEventLog: in process; publishers may run in worker threads (the
+  parse pipeline) and wake waiting streams on the event loop
+- RedisEventLog: one Redis list per document, shared by the API and
+  review worker processes; streams wait by checking the list length.
+  Streams make their Redis calls in a thread, off the event loop
+"""
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from services.parser.pipeline.events import STAGE_FINISHED, STAGE_SKIPPED, STAGE_STARTED  # noqa: F401
+
+from .cache import KEY_PREFIX, connect_redis
+from .storage import LRUCache
+
+logger = logging.getLogger(__name__)
+
+# Parse events; the STAGE_* events come from the PipelineBuilder hook
+PARSE_STARTED = 'parse_started'        # {'filename'}
+PARSE_FINISHED = 'parse_finished'      # {'sections', 'duration_ms', 'cached', 'degraded'}
+PARSE_FAILED = 'parse_failed'          # {'stage', 'error'}
+INDEX_BUILT = 'index_built'            # {'sentences', 'duration_ms'}
+
+# Review events
+REVIEW_QUEUED = 'review_queued'        # {'priority'}
+REVIEW_STARTED = 'review_started'      # {'attempt'}
+AGENT_STARTED = 'agent_started'        # {'agent', 'sections'}
+AGENT_FINISHED = 'agent_finished'      # {'agent', 'issues', 'duration_ms'}
+REVIEW_RETRYING = 'review_retrying'    # {'attempt', 'error'}
+RESULTS_READY = 'results_ready'        # {'issues'}
+REVIEW_FAILED = 'review_failed'        # {'error'}
+
+# A stream ends when the latest event is one of these
+TERMINAL_EVENTS = {PARSE_FAILED, RESULTS_READY, REVIEW_FAILED}
+
+# Documents whose events are kept in process
+MAX_LOCAL_DOCUMENTS = 1000
+# Seconds events are kept in Redis
+REDIS_EVENT_TTL = 24 * 3600
+# Seconds between Redis list checks of a waiting stream
+REDIS_POLL_INTERVAL = 0.25
+
+
+def make_event(event_id: int, event: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    return {'id': event_id, 'event': event, 'time': time.time(), 'data': data}
+
+
+def format_sse(event: Dict[str, Any]) -> str:
+    """Server-Sent Events message for an event."""
+    payload = json.dumps({'time': event['time'], **event['data']}, default=str)
+    return f"id: {event['id']}\nevent: {event['event']}\ndata: {payload}\n\n"
+
+
+class LocalEventLog:
+    """Per-document event lists in this process."""
+
+    name = 'local'
+
+    def __init__(self, max_documents: int = MAX_LOCAL_DOCUMENTS):
+        self._logs: Dict[str, List[Dict[str, Any]]] = LRUCache(max_documents)
+        self._waiters: Dict[str, List[tuple]] = {}  # document ID -> (loop, future)
+        self._lock = threading.Lock()
+
+    def publish(self, document_id: str, event: str, **data: Any) -> Dict[str, Any]:
+        """Append an event; safe to call from any thread."""
+        with self._lock:
+            log = self._logs.get(document_id)
+            if log is None:
+                log = self._logs[document_id] = []
+            entry = make_event(len(log), event, data)
+            log.append(entry)
+            waiters = self._waiters.pop(document_id, [])
+        for loop, future in waiters:
+            loop.call_soon_threadsafe(_wake, future)
+        return entry
+
+    def read(self, document_id: str, start: int = 0) -> List[Dict[str, Any]]:
+        """Events with IDs from start on."""
+        with self._lock:
+            return list(self._logs.get(document_id, [])[start:])
+
+    async def read_async(self, document_id: str, start: int = 0) -> List[Dict[str, Any]]:
+        return self.read(document_id, start)
+
+    async def wait(self, document_id: str, start: int, timeout: float) -> bool:
+        """Wait until an event with ID >= start exists.
+
+        Returns:
+            False on timeout
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._lock:
+            if len(self._logs.get(document_id, [])) > start:
+                return True
+            self._waiters.setdefault(document_id, []).append((loop, future))
+        try:
+            await asyncio.wait_for(future, timeout)
+            return True
+        except asyncio.TimeoutError:
+            with self._lock:
+                waiters = self._waiters.get(document_id, [])
+                if (loop, future) in waiters:
+                    waiters.remove((loop, future))
+            return False
+
+    def clear(self):
+        with self._lock:
+            self._logs.clear()
+
+
+def _wake(future: asyncio.Future):
+    if not future.done():
+        future.set_result(True)
+
+
+class RedisEventLog:
+    """Per-document Redis lists of JSON events, shared by all processes."""
+
+    name = 'redis'
+
+    def __init__(self, client: Any, prefix: str = KEY_PREFIX + 'events:'):
+        """Wrap a redis-py compatible client (rpush / lrange / llen / expire / scan_iter / delete)."""
+        self.client = client
+        self.prefix = prefix
+
+    def publish(self, document_id: str, event: str, **data: Any) -> Dict[str, Any]:
+        key = self.prefix + document_id
+        # The ID is the list position; RPUSH returns the new length atomically
+        entry = make_event(0, event, data)
+        length = self.client.rpush(key, json.dumps(entry, default=str))
+        self.client.expire(key, REDIS_EVENT_TTL)
+        entry['id'] = length - 1
+        return entry
+
+    def read(self, document_id: str, start: int = 0) -> List[Dict[str, Any]]:
+        entries = []
+        for offset, raw in enumerate(self.client.lrange(self.prefix + document_id, start, -1)):
+            entry = json.loads(raw)
+            entry['id'] = start + offset
+            entries.append(entry)
+        return entries
+
+    async def read_async(self, document_id: str, start: int = 0) -> List[Dict[str, Any]]:
+        return await asyncio.to_thread(self.read, document_id, start)
+
+    async def wait(self, document_id: str, start: int, timeout: float) -> bool:
+        deadline = time.monotonic() + timeout
+        while await asyncio.to_thread(self.client.llen, self.prefix + document_id) <= start:
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(REDIS_POLL_INTERVAL)
+        return True
+
+    def clear(self):
+        keys = list(self.client.scan_iter(match=self.prefix + '*'))
+        if keys:
+            self.client.delete(*keys)
+
+
+class EventBus:
+    """Publishes events to a log without ever failing the publisher."""
+
+    def __init__(self, log: Any):
+        self.log = log
+
+    def publish(self, document_id: str, event: str, **data: Any) -> Optional[Dict[str, Any]]:
+        try:
+            return self.log.publish(document_id, event, **data)
+        except Exception as e:
+            logger.warning(f"Could not publish {event} for {document_id}: {e}")
+            return None
+
+    def read(self, document_id: str, start: int = 0) -> List[Dict[str, Any]]:
+        return self.log.read(document_id, start)
+
+    async def read_async(self, document_id: str, start: int = 0) -> List[Dict[str, Any]]:
+        """read() without blocking the event loop on Redis."""
+        return await self.log.read_async(document_id, start)
+
+    async def wait(self, document_id: str, start: int, timeout: float) -> bool:
+        return await self.log.wait(document_id, start, timeout)
+
+    def clear(self):
+        self.log.clear()
+
+
+def create_event_bus(redis_url: Optional[str]) -> EventBus:
+    """Event bus on Redis when reachable, otherwise in process."""
+    if redis_url:
+        try:
+            return EventBus(RedisEventLog(connect_redis(redis_url)))
+        except ImportError:
+            logger.info("redis package not installed; using in-process event log")
+        except Exception as e:
+            logger.warning(f"Redis unavailable ({e}); using in-process event log")
+    return EventBus(LocalEventLog())
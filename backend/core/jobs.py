@@ -0,0 +1,425 @@
+"""Review job queue and worker pool.
+
+/review submits a job instead of running the review inside the request's
+process. A pool of async workers claims jobs in priority order, at most
+`concurrency` at a time, and retries failures with exponential backoff.
+
+- Job records (status, stage, progress, attempts, last error) live in the
+  database, so /status reports real progress whichever worker runs the
+  job, and a restart can requeue unfinished jobs
+- The queue of job IDs is a Redis sorted set shared by every API and
+  worker process, or an in-process heap when Redis is unavailable (for
+  single-process deployments)
+
+A job is claimed with a compare-and-set on its record (queued ->
+running), so a job ID pushed twice, or popped by two workers, still runs
+once. A running job's worker refreshes its heartbeat every
+HEARTBEAT_INTERVAL seconds; recover() requeues running jobs only once
+their heartbeat has expired, not merely because they report no progress
+(an LLM stage can run for minutes).
+"""
+
+import asyncio
+import copy
+import heapq
+import itertools
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, MutableMapping, Optional
+
+from .cache import KEY_PREFIX, connect_redis
+
+logger = logging.getLogger(__name__)
+
+# Job status
+QUEUED = 'queued'
+RUNNING = 'running'
+COMPLETED = 'completed'
+FAILED = 'failed'
+
+# Priorities (higher runs first)
+PRIORITY_LOW = -10
+PRIORITY_NORMAL = 0
+PRIORITY_HIGH = 10
+
+# Seconds between queue polls of an idle worker
+POLL_INTERVAL = 0.5
+
+# Seconds between heartbeats of a running job, and without one before it counts as orphaned
+HEARTBEAT_INTERVAL = 10.0
+HEARTBEAT_TIMEOUT = 3 * HEARTBEAT_INTERVAL
+
+# Stage and fraction done, reported by a running job
+ProgressCallback = Callable[[str, float], None]
+
+
+@dataclass
+class Job:
+    """A queued or finished job and its progress."""
+    job_id: str
+    params: Dict[str, Any]                  # Keyword arguments for the handler
+    priority: int = PRIORITY_NORMAL
+    status: str = QUEUED
+    stage: Optional[str] = None             # Last stage reported by the handler
+    progress: float = 0.0                   # 0.0 - 1.0
+    attempts: int = 0
+    error: Optional[str] = None             # Error of the last failed attempt
+    created_at: float = field(default_factory=time.time)
+    updated_at: float = field(default_factory=time.time)
+    heartbeat_at: float = 0.0               # Last sign of life from the worker running it
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (COMPLETED, FAILED)
+
+
+# ============== Queues of job IDs ==============
+
+class LocalQueue:
+    """In-process priority queue with delayed (retry) entries."""
+
+    name = 'local'
+
+    def __init__(self):
+        self._ready = []    # (-priority, sequence, job ID)
+        self._delayed = []  # (ready time, sequence, priority, job ID)
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+
+    def push(self, job_id: str, priority: int, ready_at: Optional[float] = None):
+        with self._lock:
+            if ready_at is not None and ready_at > time.time():
+                heapq.heappush(self._delayed, (ready_at, next(self._sequence), priority, job_id))
+            else:
+                heapq.heappush(self._ready, (-priority, next(self._sequence), job_id))
+
+    def pop(self) -> Optional[str]:
+        """Highest-priority ready job ID (oldest first within a priority), if any."""
+        with self._lock:
+            now = time.time()
+            while self._delayed and self._delayed[0][0] <= now:
+                _, _, priority, job_id = heapq.heappop(self._delayed)
+                heapq.heappush(self._ready, (-priority, next(self._sequence), job_id))
+            return heapq.heappop(self._ready)[2] if self._ready else None
+
+    def __len__(self) -> int:
+        return len(self._ready) + len(self._delayed)
+
+    def __contains__(self, job_id: str) -> bool:
+        with self._lock:
+            return any(entry[-1] == job_id for entry in self._ready + self._delayed)
+
+    def clear(self):
+        with self._lock:
+            self._ready.clear()
+            self._delayed.clear()
+
+
+class RedisQueue:
+    """Sorted sets of ready and delayed job IDs, shared by all processes."""
+
+    name = 'redis'
+
+    def __init__(self, client: Any, prefix: str = KEY_PREFIX + 'jobs:'):
+        """Wrap a redis-py compatible client (zadd / zpopmin / zrangebyscore / zrem / zcard / zscore)."""
+        self.client = client
+        self.ready_key = prefix + 'ready'
+        self.delayed_key = prefix + 'delayed'
+
+    def push(self, job_id: str, priority: int, ready_at: Optional[float] = None):
+        if ready_at is not None and ready_at > time.time():
+            # Delayed members carry their priority for promotion
+            self.client.zadd(self.delayed_key, {f"{priority}|{job_id}": ready_at})
+        else:
+            # Lowest score pops first: priority, then submission time
+            self.client.zadd(self.ready_key, {job_id: -priority * 1e10 + time.time()})
+
+    def pop(self) -> Optional[str]:
+        for member in self.client.zrangebyscore(self.delayed_key, '-inf', time.time()):
+            if self.client.zrem(self.delayed_key, member):  # Only one process promotes an entry
+                priority, job_id = _text(member).split('|', 1)
+                self.push(job_id, int(priority))
+        popped = self.client.zpopmin(self.ready_key)
+        return _text(popped[0][0]) if popped else None
+
+    def __len__(self) -> int:
+        return self.client.zcard(self.ready_key) + self.client.zcard(self.delayed_key)
+
+    def __contains__(self, job_id: str) -> bool:
+        if self.client.zscore(self.ready_key, job_id) is not None:
+            return True
+        delayed = self.client.zrangebyscore(self.delayed_key, '-inf', '+inf')
+        return any(_text(member).split('|', 1)[1] == job_id for member in delayed)
+
+    def clear(self):
+        self.client.delete(self.ready_key, self.delayed_key)
+
+
+def _text(value: Any) -> str:
+    return value.decode('utf-8') if isinstance(value, bytes) else value
+
+
+# ============== Job queue ==============
+
+class JobQueue:
+    """Job records plus a queue of job IDs."""
+
+    def __init__(
+        self,
+        queue: Any,
+        records: MutableMapping[str, Job],
+        max_attempts: int = 3,
+        retry_backoff: float = 2.0
+    ):
+        """Create a job queue.
+
+        Args:
+            queue: LocalQueue or RedisQueue
+            records: Job ID -> Job store (a database table in the API)
+            max_attempts: Attempts before a job is marked failed
+            retry_backoff: Seconds before the first retry; doubles with each attempt
+        """
+        self.queue = queue
+        self.records = records
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self._lock = threading.Lock()  # Compare-and-set for records kept in a dict
+
+    def submit(self, job_id: str, params: Dict[str, Any], priority: int = PRIORITY_NORMAL) -> Job:
+        """Record and enqueue a job, replacing a finished job with the same ID."""
+        job = Job(job_id, params, priority)
+        self.records[job_id] = job
+        self.queue.push(job_id, priority)
+        logger.info(f"Queued job {job_id} (priority {priority}, {len(self.queue)} queued)")
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self.records.get(job_id)
+
+    def claim(self) -> Optional[Job]:
+        """Next queued job, marked running, or None if the queue is empty."""
+        while True:
+            job_id = self.queue.pop()
+            if job_id is None:
+                return None
+            job = self._update_if(job_id, _start)
+            if job is not None:
+                return job
+            # Duplicate entry, the job was cleared, or another worker claimed it
+
+    def heartbeat(self, job: Job):
+        """Record that a running job's worker is alive."""
+        job.heartbeat_at = time.time()
+        self.records[job.job_id] = job
+
+    def update(self, job: Job, stage: str, progress: float):
+        """Record a running job's stage and fraction done."""
+        job.stage = stage
+        job.progress = progress
+        self._save(job)
+
+    def complete(self, job: Job):
+        job.status = COMPLETED
+        job.stage = COMPLETED
+        job.progress = 1.0
+        job.error = None
+        self._save(job)
+
+    def fail(self, job: Job, error: str) -> bool:
+        """Requeue a failed job with backoff, or mark it failed after max_attempts.
+
+        Returns:
+            True if the job will be retried
+        """
+        job.error = error
+        if job.attempts < self.max_attempts:
+            delay = self.retry_backoff * 2 ** (job.attempts - 1)
+            job.status = QUEUED
+            self._save(job)
+            self.queue.push(job.job_id, job.priority, ready_at=time.time() + delay)
+            logger.warning(f"Job {job.job_id} failed (attempt {job.attempts}), retrying in {delay:.0f}s: {error}")
+            return True
+        job.status = FAILED
+        self._save(job)
+        logger.error(f"Job {job.job_id} failed after {job.attempts} attempts: {error}")
+        return False
+
+    def recover(self, heartbeat_timeout: float = HEARTBEAT_TIMEOUT) -> int:
+        """Requeue jobs lost by a restart.
+
+        Queued jobs missing from the queue are pushed again (the in-process
+        queue does not survive restarts). Running jobs whose heartbeat is
+        older than heartbeat_timeout lost their worker and are set back to
+        queued, by one process only.
+
+        Returns:
+            Number of jobs requeued
+        """
+        expired_before = time.time() - heartbeat_timeout
+        requeued = 0
+        for job_id in list(self.records):
+            job = self.records.get(job_id)
+            if job is None:
+                continue
+            if job.status == RUNNING and job.heartbeat_at < expired_before:
+                job = self._update_if(job_id, lambda job: _orphan(job, expired_before))
+                if job is not None:
+                    logger.warning(f"Job {job_id} lost its worker (no heartbeat for {heartbeat_timeout:.0f}s)")
+            if job is not None and job.status == QUEUED and job_id not in self.queue:
+                self.queue.push(job_id, job.priority)
+                requeued += 1
+        if requeued:
+            logger.info(f"Requeued {requeued} unfinished jobs")
+        return requeued
+
+    def clear(self):
+        self.queue.clear()
+        self.records.clear()
+
+    def _save(self, job: Job):
+        job.updated_at = job.heartbeat_at = time.time()
+        self.records[job.job_id] = job
+
+    def _update_if(self, job_id: str, update: Callable[[Job], Optional[Job]]) -> Optional[Job]:
+        """Apply update to a job record atomically (see KeyValueStore.update_if)."""
+        if hasattr(self.records, 'update_if'):
+            return self.records.update_if(job_id, update)
+        with self._lock:
+            job = self.records.get(job_id)
+            job = update(copy.copy(job)) if job is not None else None
+            if job is not None:
+                self.records[job_id] = job
+            return job
+
+
+def _start(job: Job) -> Optional[Job]:
+    """The job marked running, if it is still queued."""
+    if job.status != QUEUED:
+        return None
+    job.status = RUNNING
+    job.attempts += 1
+    job.updated_at = job.heartbeat_at = time.time()
+    return job
+
+
+def _orphan(job: Job, expired_before: float) -> Optional[Job]:
+    """The job set back to queued, if it is still running without a recent heartbeat."""
+    if job.status != RUNNING or job.heartbeat_at >= expired_before:
+        return None
+    job.status = QUEUED
+    job.updated_at = time.time()
+    return job
+
+
+def create_job_queue(
+    records: MutableMapping[str, Job],
+    redis_url: Optional[str],
+    max_attempts: int = 3,
+    retry_backoff: float = 2.0
+) -> JobQueue:
+    """Job queue on Redis when reachable, otherwise in process."""
+    queue = None
+    if redis_url:
+        try:
+            queue = RedisQueue(connect_redis(redis_url))
+        except ImportError:
+            logger.info("redis package not installed; using in-process job queue")
+        except Exception as e:
+            logger.warning(f"Redis unavailable ({e}); using in-process job queue")
+    return JobQueue(queue or LocalQueue(), records, max_attempts, retry_backoff)
+
+
+# ============== Workers ==============
+
+class WorkerPool:
+    """Async workers running claimed jobs, at most `concurrency` at a time."""
+
+    def __init__(
+        self,
+        jobs: JobQueue,
+        handler: Callable[[Job, ProgressCallback], Awaitable[None]],
+        concurrency: int = 2,
+        on_failure: Optional[Callable[[Job], None]] = None,
+        poll_interval: float = POLL_INTERVAL,
+        heartbeat_interval: float = HEARTBEAT_INTERVAL
+    ):
+        """Create a worker pool.
+
+        Args:
+            jobs: Queue to claim jobs from
+            handler: Coroutine run for each job with a progress callback
+            concurrency: Number of workers
+            on_failure: Called when a job fails for the last time
+            poll_interval: Seconds an idle worker waits before polling again
+            heartbeat_interval: Seconds between heartbeats of a running job
+        """
+        self.jobs = jobs
+        self.handler = handler
+        self.concurrency = concurrency
+        self.on_failure = on_failure
+        self.poll_interval = poll_interval
+        self.heartbeat_interval = heartbeat_interval
+        self._tasks = []
+
+    def start(self):
+        self._tasks = [asyncio.create_task(self._work()) for _ in range(self.concurrency)]
+        self._tasks.append(asyncio.create_task(self._recover()))
+        logger.info(f"Started {self.concurrency} workers on the {self.jobs.queue.name} job queue")
+
+    async def stop(self):
+        """Cancel the workers; interrupted jobs are requeued by recover()."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _work(self):
+        while True:
+            if not await self.run_next():
+                await asyncio.sleep(self.poll_interval)
+
+    async def _recover(self):
+        """Requeue jobs of workers that stopped sending heartbeats, in any process."""
+        while True:
+            await asyncio.sleep(3 * self.heartbeat_interval)
+            try:
+                self.jobs.recover(3 * self.heartbeat_interval)
+            except Exception as e:
+                logger.warning(f"Job recovery failed: {e}")
+
+    async def _heartbeat(self, job: Job):
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            try:
+                self.jobs.heartbeat(job)
+            except Exception as e:
+                logger.warning(f"Heartbeat of job {job.job_id} failed: {e}")
+
+    async def run_next(self) -> bool:
+        """Claim and run one job.
+
+        Returns:
+            False if no job was ready
+        """
+        job = self.jobs.claim()
+        if job is None:
+            return False
+
+        def progress(stage: str, fraction: float):
+            self.jobs.update(job, stage, fraction)
+
+        heartbeat = asyncio.create_task(self._heartbeat(job))
+        try:
+            await self.handler(job, progress)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            if not self.jobs.fail(job, str(e)) and self.on_failure is not None:
+                self.on_failure(job)
+        else:
+            self.jobs.complete(job)
+        finally:
+            heartbeat.cancel()
+        return True
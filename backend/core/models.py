@@ -1,7 +1,7 @@
 """Core data models for manuscript review system."""
 
 from pydantic import BaseModel, Field
-from typing import Optional, List, Dict, Any, Literal
+from typing import TYPE_CHECKING, Optional, List, Dict, Any, Literal, Tuple
 from enum import Enum
 from datetime import datetime
 import hashlib
@@ -25,69 +25,27 @@ class OverallStatus(str, Enum):
 
 
 # ============== Document Structure Models ==============
-
-class Sentence(BaseModel):
-    """Individual sentence with precise location for highlighting."""
-    id: str                    # Unique ID: "methods-s3"
-    section: str               # "methods", "results", etc.
-    text: str
-    char_start: int            # Offset in section text
-    char_end: int
-    paragraph_index: int
-
-
-class ParsedSection(BaseModel):
-    """A single section of the paper."""
-    name: str                  # "abstract", "methods", etc.
-    text: str                  # Full text of section
-    sentences: List[Sentence]  # Indexed sentences
-
-
-class FigureBlock(BaseModel):
-    """A figure with its caption."""
-    id: str                    # "fig-1"
-    label: str                 # "Figure 1", "Fig. 2"
-    caption: str
-    page: int
-    image_path: Optional[str] = None  # For future vision pass
-    image_bytes: Optional[bytes] = None
-
-
-class FigureRef(BaseModel):
-    """An in-text reference to a figure."""
-    label: str                 # "Figure 1"
-    section: str
-    sentence_id: str
-    sentence_text: str
-
-
-class CitationRef(BaseModel):
-    """An in-text citation."""
-    id: str                    # "[3]" or "Smith 2020"
-    section: str
-    sentence_id: str
-    sentence_text: str         # The claim being supported
-
-
-class BibliographyEntry(BaseModel):
-    """A bibliography/references entry."""
-    id: str                    # Normalized key matching CitationRef.id
-    raw_text: str
-    doi: Optional[str] = None
-    is_review_paper: Optional[bool] = None  # From Semantic Scholar or mock
-
-
-class ParsedDocument(BaseModel):
-    """Complete parsed representation of a paper."""
-    doc_id: str
-    doc_hash: str              # SHA-256 for DEMO_MODE matching
-    title: str
-    sections: Dict[str, ParsedSection]
-    figures: List[FigureBlock]
-    figure_refs: List[FigureRef]
-    citations: List[CitationRef]
-    bibliography: List[BibliographyEntry]
-    raw_markdown: str          # Original pymupdf4llm output
+# The parsing pipeline's dataclasses are the single document model: indexes
+# and agents reference the parsed objects directly instead of copying them
+# into parallel Pydantic models.
+
+from services.parser.pipeline.models import (  # noqa: E402
+    Sentence,
+    Paragraph,
+    ParsedSection,
+    FigureBlock,
+    FigureRef,
+    CitationRef,
+    BibliographyEntry,
+    RevisionInfo,
+    ParsedDocument,
+)
+from services.parser.pipeline.lookup import DocumentLookup  # noqa: E402
+
+if TYPE_CHECKING:
+    # Built by the indexers, which import these models: annotated as Any below
+    from services.indexers.definitions import DefinitionIndex
+    from services.indexers.numeric_facts import NumericFactTable
 
 
 # ============== Issue & Report Models ==============
@@ -194,8 +152,16 @@ class CrossDocIndex(BaseModel):
     """Pre-computed cross-document lookups."""
     ns_by_section: Dict[str, List[int]]           # {"methods": [150, 75], "results": [150]}
     key_numbers: Dict[str, List[float]]           # {"p_values": [0.05, 0.01], "means": [3.5, 4.2]}
-    term_to_sentence_ids: Dict[str, List[str]]    # {"ANOVA": ["methods-s5", "results-s12"]}
+    term_to_sentence_ids: Dict[str, List[str]]    # {"anova": ["methods-s5", "results-s12"]}
     notation_map: Dict[str, str]                  # {"α": "significance level", "N": "sample size"}
+    term_positions: Dict[str, List[Tuple[str, int, int]]] = {}  # term → [(sentence_id, char_start, char_end)]
+    numeric_facts: Any = None  # NumericFactTable: columnar N / p / mean ± SD / % facts
+    near_duplicate_sentences: List[Tuple[str, str, float]] = []   # (sentence_id, sentence_id, similarity)
+    near_duplicate_paragraphs: List[Tuple[str, str, float]] = []  # (paragraph_id, paragraph_id, similarity)
+    definitions: Any = None  # DefinitionIndex: acronym / symbol definitions and first uses
+
+    class Config:
+        arbitrary_types_allowed = True
 
 
 class CitationIndex(BaseModel):
@@ -225,6 +191,10 @@ class AgentContext(BaseModel):
         arbitrary_types_allowed = True
 
 
+# ParsedDocument.lookup is annotated with a forward reference
+AgentContext.model_rebuild(_types_namespace={'DocumentLookup': DocumentLookup})
+
+
 # ============== Semantic Scholar Models ==============
 
 class PaperMetadata(BaseModel):
@@ -259,6 +229,8 @@ ISSUE_TYPES = {
     "orphaned_figure": "Figure defined but never referenced",
     "n_inconsistency": "Sample size differs between sections",
     "missing_effect_size": "Effect size not reported with p-value",
+    "p_value_mismatch": "Reported p-value inconsistent with the test statistic and degrees of freedom",
+    "grim_inconsistency": "Reported mean impossible for integer-valued data with the reported N",
 
     # Citations
     "lazy_citation": "General claim supported by specific/primary source",
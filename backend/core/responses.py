@@ -0,0 +1,204 @@
+"""JSON responses: fast encoding, field projection, compression and ETags.
+
+Large payloads (/document with the full markdown, /results with every
+issue) go through negotiated_response(), which
+
+- answers If-None-Match with 304 before building anything, using an
+  ETag derived from what the body depends on (document hash, review
+  version, requested fields)
+- keeps only the requested ?fields= ("title,statistics.total_figures")
+- encodes with orjson when installed, compact json otherwise
+- compresses bodies of MIN_COMPRESS_BYTES or more with brotli (when
+  installed) or gzip, as the client's Accept-Encoding allows
+"""
+
+import dataclasses
+import datetime
+import enum
+import gzip
+import hashlib
+import json
+import logging
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# Bump when the layout of a cached response changes, so clients revalidate
+RESPONSE_VERSION = 1
+
+# Smaller bodies are sent uncompressed
+MIN_COMPRESS_BYTES = 1024
+
+# Compressed bodies are cached per document, fields and coding, so the
+# one-off cost of the default levels is paid once per representation
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+
+# ============== Encoding ==============
+
+def _default(value: Any) -> Any:
+    """JSON form of values json cannot encode natively."""
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    if hasattr(value, 'model_dump'):
+        return value.model_dump()
+    if dataclasses.is_dataclass(value):
+        return dataclasses.asdict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def encode_json(content: Any) -> bytes:
+    """Encode content as compact UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(content, default=_default, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with encode_json()."""
+
+    def render(self, content: Any) -> bytes:
+        return encode_json(content)
+
+
+# ============== Projection ==============
+
+def parse_fields(fields: Optional[str]) -> Optional[Dict[str, dict]]:
+    """Field tree of a ?fields= value ("a,b.c" -> {'a': {}, 'b': {'c': {}}}); None keeps everything."""
+    if not fields:
+        return None
+    tree: Dict[str, dict] = {}
+    for path in fields.split(','):
+        node = tree
+        for name in path.strip().split('.'):
+            if name:
+                node = node.setdefault(name, {})
+    return tree or None
+
+
+def project(content: Any, tree: Optional[Dict[str, dict]]) -> Any:
+    """Keep the fields of a tree; lists are projected item by item.
+
+    Raises:
+        ValueError: A top-level field that the content does not have
+    """
+    if tree is None:
+        return content
+    unknown = [name for name in tree if not isinstance(content, dict) or name not in content]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    return {name: _project_value(content[name], subtree) for name, subtree in tree.items()}
+
+
+def _project_value(value: Any, tree: Dict[str, dict]) -> Any:
+    if not tree:
+        return value
+    if isinstance(value, list):
+        return [_project_value(item, tree) for item in value]
+    if isinstance(value, dict):
+        return {name: _project_value(value[name], subtree) for name, subtree in tree.items() if name in value}
+    return value
+
+
+# ============== Negotiation ==============
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """Best supported content coding the client accepts ('br', 'gzip' or None)."""
+    accepted = set()
+    for part in accept_encoding.split(','):
+        coding, _, params = part.strip().partition(';')
+        if params.strip().replace(' ', '') in ('q=0', 'q=0.0'):
+            continue
+        accepted.add(coding.strip().lower())
+    if brotli is not None and 'br' in accepted:
+        return 'br'
+    if 'gzip' in accepted or '*' in accepted:
+        return 'gzip'
+    return None
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == 'br':
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def make_etag(*parts: Any) -> str:
+    """Weak ETag of the values a response body depends on (same for every encoding)."""
+    digest = hashlib.sha256('\x1f'.join(map(str, (RESPONSE_VERSION, *parts))).encode('utf-8')).hexdigest()
+    return f'W/"{digest[:20]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header covers an ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    bare = etag[2:] if etag.startswith('W/') else etag
+    return any(
+        (tag.strip()[2:] if tag.strip().startswith('W/') else tag.strip()) == bare
+        for tag in if_none_match.split(',')
+    )
+
+
+def negotiated_response(
+    request: Request,
+    build: Callable[[], Any],
+    etag_parts: Tuple[Any, ...],
+    fields: Optional[str] = None,
+    cache: Any = None,
+    cache_key: Optional[str] = None
+) -> Response:
+    """JSON response with projection, compression and conditional GET.
+
+    Args:
+        request: Incoming request (If-None-Match and Accept-Encoding)
+        build: Returns the full content; only called when a body is needed
+        etag_parts: Values identifying this version of the content
+        fields: ?fields= value
+        cache: core.cache.Cache for encoded bodies (optional)
+        cache_key: Base cache key; the ETag and content coding are appended
+
+    Raises:
+        ValueError: Unknown fields requested
+    """
+    etag = make_etag(*etag_parts, fields or '')
+    headers = {'ETag': etag, 'Cache-Control': 'private, no-cache', 'Vary': 'Accept-Encoding'}
+    if etag_matches(request.headers.get('if-none-match'), etag):
+        return Response(status_code=304, headers=headers)
+
+    encoding = choose_encoding(request.headers.get('accept-encoding', ''))
+    key = f"{cache_key}:{etag}:{encoding or 'identity'}" if cache is not None and cache_key else None
+    cached = cache.get(key) if key else None
+    if cached is not None:
+        body, body_encoding = cached
+    else:
+        body = encode_json(project(build(), parse_fields(fields)))
+        body_encoding = encoding if encoding and len(body) >= MIN_COMPRESS_BYTES else None
+        if body_encoding:
+            body = compress(body, body_encoding)
+        if key:
+            cache.set(key, (body, body_encoding))
+
+    if body_encoding:
+        headers['Content-Encoding'] = body_encoding
+    return Response(body, media_type='application/json', headers=headers)
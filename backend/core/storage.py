@@ -0,0 +1,461 @@
+"""Persistent storage for parsed documents, analyses, reviews and status.
+
+Replaces the API's module-level dicts with tables in SQLite (the default,
+a single local file) or PostgreSQL, selected by settings.database_url, so
+data survives restarts and is shared between uvicorn workers.
+
+Values are pickled and zlib-compressed. A document is stored as a header
+row (title, figures, citations, bibliography, markdown) plus one row per
+section, and loaded sections-last: `doc.sections` fetches each section on
+first access, so listing or checking a document never deserializes its
+sentences. The markdown is also kept as plain text, so a range of it can
+be read without loading the document. Each store keeps a small LRU cache
+of loaded values, so repeated reads return the same objects. Stores evict
+independently: an analysis matches its document by ID and content hash
+(DocumentAnalysis.is_current), not by object identity.
+"""
+
+import hashlib
+import logging
+import pickle
+import sqlite3
+import threading
+import zlib
+from collections import OrderedDict
+from collections.abc import Mapping, MutableMapping
+from contextlib import contextmanager
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+from services.parser.pipeline.lookup import DocumentLookup
+from services.parser.pipeline.models import ParsedDocument, ParsedSection
+
+logger = logging.getLogger(__name__)
+
+# zlib level: 6 is within a few percent of 9 on pickles at a fraction of the time
+COMPRESSION_LEVEL = 6
+
+# Loaded values kept in memory per store
+DEFAULT_CACHE_SIZE = 16
+
+TABLES = {
+    'documents': "doc_id TEXT PRIMARY KEY, title TEXT NOT NULL, section_names {blob} NOT NULL, header {blob} NOT NULL",
+    'sections': "doc_id TEXT NOT NULL, name TEXT NOT NULL, data {blob} NOT NULL, PRIMARY KEY (doc_id, name)",
+    'markdown': "doc_id TEXT PRIMARY KEY, text TEXT NOT NULL",
+    'analyses': "key TEXT PRIMARY KEY, value {blob} NOT NULL",
+    'reviews': "key TEXT PRIMARY KEY, value {blob} NOT NULL",
+    'status': "key TEXT PRIMARY KEY, value {blob} NOT NULL",
+    'jobs': "key TEXT PRIMARY KEY, value {blob} NOT NULL",
+}
+
+
+def serialize(value: Any) -> bytes:
+    """Pickle and compress a value."""
+    return zlib.compress(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), COMPRESSION_LEVEL)
+
+
+def deserialize(data: bytes) -> Any:
+    """Inverse of serialize()."""
+    return pickle.loads(zlib.decompress(data))
+
+
+# ============== Database connection ==============
+
+class Database:
+    """A SQLite or PostgreSQL connection shared by the stores.
+
+    Statements are written with '?' placeholders and rewritten for
+    PostgreSQL drivers. A lock serializes access to the connection.
+    Each statement commits on its own unless run inside transaction(); a
+    failed statement is rolled back, so a PostgreSQL connection is never
+    left in an aborted transaction.
+    """
+
+    def __init__(self, url: str):
+        """Connect and create missing tables.
+
+        Args:
+            url: "sqlite:///path/to/file.db", "sqlite://" (in memory) or "postgresql://..."
+        """
+        self.url = url
+        self._lock = threading.RLock()
+        self._depth = 0  # Nesting of transaction() blocks
+        if url.startswith('sqlite:'):
+            # sqlite:///relative.db, sqlite:////absolute.db, sqlite:// for in-memory
+            path = url[len('sqlite:///'):] if url.startswith('sqlite:///') else ''
+            path = path or ':memory:'
+            if path != ':memory:':
+                Path(path).parent.mkdir(parents=True, exist_ok=True)
+            self.connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            self.connection.execute('PRAGMA journal_mode=WAL')
+            self.placeholder, blob_type = '?', 'BLOB'
+        elif url.startswith(('postgresql:', 'postgres:')):
+            self.connection = _connect_postgres(url)
+            self.placeholder, blob_type = '%s', 'BYTEA'
+        else:
+            raise ValueError(f"Unsupported database URL: {url}")
+
+        for table, columns in TABLES.items():
+            self.execute(f"CREATE TABLE IF NOT EXISTS {table} ({columns.format(blob=blob_type)})")
+        logger.info(f"Storage ready at {url.split('@')[-1]}")
+
+    def execute(self, sql: str, params: Tuple = ()) -> List[Tuple]:
+        """Run a statement and return its rows (empty for writes)."""
+        if self.placeholder != '?':
+            sql = sql.replace('?', self.placeholder)
+        with self._lock:
+            cursor = self.connection.cursor()
+            try:
+                cursor.execute(sql, params)
+                rows = cursor.fetchall() if cursor.description else []
+                if self.placeholder != '?' and not self._depth:
+                    self.connection.commit()
+                return [tuple(bytes(v) if isinstance(v, memoryview) else v for v in row) for row in rows]
+            except Exception:
+                if not self._depth:
+                    self._rollback()
+                raise
+            finally:
+                cursor.close()
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Run the statements of the block atomically, holding the lock.
+
+        Commits when the block finishes and rolls back if it raises.
+        Nested blocks join the outermost transaction.
+        """
+        with self._lock:
+            if self._depth:
+                self._depth += 1
+                try:
+                    yield
+                finally:
+                    self._depth -= 1
+                return
+            if self.placeholder == '?':
+                self.connection.execute('BEGIN')  # sqlite3 in autocommit mode; PostgreSQL drivers begin implicitly
+            self._depth = 1
+            try:
+                yield
+            except BaseException:
+                self._depth = 0
+                self._rollback()
+                raise
+            self._depth = 0
+            self.connection.commit()
+
+    def _rollback(self):
+        try:
+            self.connection.rollback()
+        except Exception as e:
+            logger.warning(f"Rollback failed: {e}")
+
+    def close(self):
+        self.connection.close()
+
+
+def _connect_postgres(url: str):
+    """Connect with psycopg (3) or psycopg2, whichever is installed."""
+    try:
+        import psycopg
+        return psycopg.connect(url)
+    except ImportError:
+        pass
+    try:
+        import psycopg2
+        return psycopg2.connect(url)
+    except ImportError:
+        raise RuntimeError(
+            "PostgreSQL storage needs psycopg or psycopg2; install one or use a sqlite:/// database_url"
+        )
+
+
+# ============== Stores ==============
+
+class LRUCache(OrderedDict):
+    """OrderedDict that drops its least recently used entries beyond maxsize."""
+
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def get(self, key, default=None):
+        if key in self:
+            self.move_to_end(key)
+            return self[key]
+        return default
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        while len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
+class KeyValueStore(MutableMapping):
+    """Dict-like table of pickled values."""
+
+    def __init__(self, db: Database, table: str, cache_size: int = DEFAULT_CACHE_SIZE):
+        self.db = db
+        self.table = table
+        self._cache = LRUCache(cache_size)
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._cache:
+            return self._cache.get(key)
+        rows = self.db.execute(f"SELECT value FROM {self.table} WHERE key = ?", (key,))
+        if not rows:
+            raise KeyError(key)
+        value = deserialize(rows[0][0])
+        self._cache[key] = value
+        return value
+
+    def __setitem__(self, key: str, value: Any):
+        self.db.execute(
+            f"INSERT INTO {self.table} (key, value) VALUES (?, ?) "
+            f"ON CONFLICT (key) DO UPDATE SET value = excluded.value",
+            (key, serialize(value))
+        )
+        self._cache[key] = value
+
+    def __delitem__(self, key: str):
+        if key not in self:
+            raise KeyError(key)
+        self.db.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+        self._cache.pop(key, None)
+
+    def get_versioned(self, key: str) -> Tuple[Any, str]:
+        """A value and its version: a digest of the stored bytes, which changes whenever it is rewritten.
+
+        Raises:
+            KeyError: If the key is missing
+        """
+        rows = self.db.execute(f"SELECT value FROM {self.table} WHERE key = ?", (key,))
+        if not rows:
+            raise KeyError(key)
+        return deserialize(rows[0][0]), hashlib.blake2b(rows[0][0], digest_size=16).hexdigest()
+
+    def update_if(self, key: str, update: Callable[[Any], Any]) -> Any:
+        """Replace a value with update(value) unless another writer changed it first.
+
+        A compare-and-set on the stored bytes: of several processes updating
+        the same value at once, exactly one succeeds.
+
+        Args:
+            key: Key of the value
+            update: Returns the new value, or None to leave the value as it is
+
+        Returns:
+            The new value, or None if the key is missing, update returned None
+            or the value changed after it was read
+        """
+        rows = self.db.execute(f"SELECT value FROM {self.table} WHERE key = ?", (key,))
+        if not rows:
+            return None
+        stored = rows[0][0]
+        value = update(deserialize(stored))
+        if value is None:
+            return None
+        if not self.db.execute(f"UPDATE {self.table} SET value = ? WHERE key = ? AND value = ? RETURNING key",
+                               (serialize(value), key, stored)):
+            return None
+        self._cache[key] = value
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return bool(self.db.execute(f"SELECT 1 FROM {self.table} WHERE key = ?", (key,)))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter([row[0] for row in self.db.execute(f"SELECT key FROM {self.table} ORDER BY key")])
+
+    def __len__(self) -> int:
+        return self.db.execute(f"SELECT COUNT(*) FROM {self.table}")[0][0]
+
+    def clear(self):
+        self.db.execute(f"DELETE FROM {self.table}")
+        self._cache.clear()
+
+
+class LazySections(Mapping):
+    """A document's sections, each loaded from storage on first access."""
+
+    def __init__(self, names: List[str], load: Callable[[str], ParsedSection]):
+        self._names = names
+        self._load = load
+        self._loaded: Dict[str, ParsedSection] = {}
+
+    def __getitem__(self, name: str) -> ParsedSection:
+        section = self._loaded.get(name)
+        if section is None:
+            if name not in self._names:
+                raise KeyError(name)
+            section = self._loaded[name] = self._load(name)
+        return section
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._names
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __repr__(self) -> str:
+        return f"LazySections({self._names}, loaded={list(self._loaded)})"
+
+    def __reduce__(self):
+        # Pickle as a plain dict (loads every section)
+        return dict, (dict(self.items()),)
+
+
+class LazyDocumentLookup(DocumentLookup):
+    """DocumentLookup built on first use, so loading a document does not load its sections."""
+
+    def __init__(self, sections: Mapping):
+        self._pending = sections
+
+    def __getattr__(self, name: str):
+        pending = self.__dict__.pop('_pending', None)
+        if pending is None:
+            raise AttributeError(name)
+        DocumentLookup.__init__(self, pending)
+        return getattr(self, name)
+
+
+# Document fields stored in the header row (sections and lookup are stored separately)
+_HEADER_FIELDS = [f.name for f in fields(ParsedDocument) if f.name not in ('sections', 'lookup')]
+
+
+class DocumentStore(MutableMapping):
+    """Dict-like store of ParsedDocuments with lazily loaded sections."""
+
+    def __init__(self, db: Database, cache_size: int = DEFAULT_CACHE_SIZE):
+        self.db = db
+        self._cache = LRUCache(cache_size)
+
+    def __getitem__(self, doc_id: str) -> ParsedDocument:
+        if doc_id in self._cache:
+            return self._cache.get(doc_id)
+        rows = self.db.execute("SELECT section_names, header FROM documents WHERE doc_id = ?", (doc_id,))
+        if not rows:
+            raise KeyError(doc_id)
+        section_names, header = rows[0]
+        sections = LazySections(deserialize(section_names), lambda name: self._load_section(doc_id, name))
+        doc = ParsedDocument(sections=sections, **deserialize(header))
+        doc.lookup = LazyDocumentLookup(sections)
+        self._cache[doc_id] = doc
+        return doc
+
+    def _load_section(self, doc_id: str, name: str) -> ParsedSection:
+        rows = self.db.execute("SELECT data FROM sections WHERE doc_id = ? AND name = ?", (doc_id, name))
+        if not rows:
+            raise KeyError(f"{doc_id}/{name}")
+        return deserialize(rows[0][0])
+
+    def markdown_range(self, doc_id: str, start: int, end: int) -> Tuple[str, int]:
+        """Characters start:end of a document's markdown and its total length.
+
+        Sliced in the database unless the document is already loaded, so a
+        page of a long document costs the page, not the document.
+        """
+        end = max(start, end)
+        if doc_id not in self._cache:
+            rows = self.db.execute(
+                "SELECT substr(text, ?, ?), length(text) FROM markdown WHERE doc_id = ?",
+                (start + 1, end - start, doc_id)
+            )
+            if rows:
+                return rows[0]
+        markdown = self[doc_id].raw_markdown  # In memory, or stored before the markdown table
+        return markdown[start:end], len(markdown)
+
+    def __setitem__(self, doc_id: str, doc: ParsedDocument):
+        header = {name: getattr(doc, name) for name in _HEADER_FIELDS}
+        sections = [(doc_id, name, serialize(section)) for name, section in doc.sections.items()]
+        row = (doc_id, doc.title, serialize(list(doc.sections)), serialize(header))
+        with self.db.transaction():  # Readers never see a document with some of its sections
+            self.db.execute("DELETE FROM sections WHERE doc_id = ?", (doc_id,))
+            for section_row in sections:
+                self.db.execute("INSERT INTO sections (doc_id, name, data) VALUES (?, ?, ?)", section_row)
+            self.db.execute(
+                "INSERT INTO documents (doc_id, title, section_names, header) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (doc_id) DO UPDATE SET title = excluded.title, "
+                "section_names = excluded.section_names, header = excluded.header",
+                row
+            )
+            self.db.execute(
+                "INSERT INTO markdown (doc_id, text) VALUES (?, ?) "
+                "ON CONFLICT (doc_id) DO UPDATE SET text = excluded.text",
+                (doc_id, doc.raw_markdown)
+            )
+        self._cache[doc_id] = doc
+
+    def __delitem__(self, doc_id: str):
+        if doc_id not in self:
+            raise KeyError(doc_id)
+        with self.db.transaction():
+            self.db.execute("DELETE FROM sections WHERE doc_id = ?", (doc_id,))
+            self.db.execute("DELETE FROM markdown WHERE doc_id = ?", (doc_id,))
+            self.db.execute("DELETE FROM documents WHERE doc_id = ?", (doc_id,))
+        self._cache.pop(doc_id, None)
+
+    def __contains__(self, doc_id: object) -> bool:
+        return bool(self.db.execute("SELECT 1 FROM documents WHERE doc_id = ?", (doc_id,)))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter([row[0] for row in self.db.execute("SELECT doc_id FROM documents ORDER BY doc_id")])
+
+    def __len__(self) -> int:
+        return self.db.execute("SELECT COUNT(*) FROM documents")[0][0]
+
+    def summaries(self) -> List[Tuple[str, str, List[str]]]:
+        """(doc_id, title, section names) of every document, without loading any."""
+        return [
+            (doc_id, title, deserialize(section_names))
+            for doc_id, title, section_names in self.db.execute(
+                "SELECT doc_id, title, section_names FROM documents ORDER BY doc_id"
+            )
+        ]
+
+    def clear(self):
+        with self.db.transaction():
+            self.db.execute("DELETE FROM sections")
+            self.db.execute("DELETE FROM markdown")
+            self.db.execute("DELETE FROM documents")
+        self._cache.clear()
+
+
+@dataclass
+class Storage:
+    """The API's stores, backed by one database."""
+    db: Database
+    documents: DocumentStore
+    analyses: KeyValueStore
+    reviews: KeyValueStore
+    status: KeyValueStore
+    jobs: KeyValueStore
+
+    def clear(self):
+        for store in (self.documents, self.analyses, self.reviews, self.status, self.jobs):
+            store.clear()
+
+
+def open_storage(url: str, cache_size: int = DEFAULT_CACHE_SIZE) -> Storage:
+    """Open (and create if needed) the stores at a database URL.
+
+    Documents and analyses never change once written under an ID, so they
+    are cached; reviews, status and job records are rewritten by whichever
+    worker runs the review and are always read from the database.
+    """
+    db = Database(url)
+    return Storage(
+        db=db,
+        documents=DocumentStore(db, cache_size),
+        analyses=KeyValueStore(db, 'analyses', cache_size),
+        reviews=KeyValueStore(db, 'reviews', cache_size=0),
+        status=KeyValueStore(db, 'status', cache_size=0),
+        jobs=KeyValueStore(db, 'jobs', cache_size=0),
+    )
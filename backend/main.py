@@ -1,22 +1,37 @@
 """Main FastAPI application for manuscript review system."""
 
-from fastapi import FastAPI, UploadFile, File, HTTPException, BackgroundTasks
+from fastapi import FastAPI, UploadFile, File, Form, HTTPException, Query, Request, Header
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel
-from typing import Optional, Dict, Any
+from fastapi.responses import JSONResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from pydantic import BaseModel, Field
+from typing import Optional, Dict, Any, Tuple
+from dataclasses import asdict, replace
+import asyncio
 import uuid
 import os
 import logging
 from datetime import datetime
 import hashlib
+import math
+import time
 
+from core.admission import FairScheduler, RateLimiter
+from core.batch import BatchItem, BatchStats, expand_uploads
+from core.cache import PARSE, RESPONSE, cache_key, content_hash, create_cache
 from core.config import settings
-from core.models import ParsedDocument, FullReviewOutput
+from core import events as event_types
+from core.events import TERMINAL_EVENTS, create_event_bus, format_sse
+from core.jobs import PRIORITY_NORMAL, Job, ProgressCallback, WorkerPool, create_job_queue
+from core.responses import FastJSONResponse, encode_json, negotiated_response
+from core.models import ParsedDocument
+from core.storage import LRUCache, open_storage
 from services.parser.pdf_parser import DocumentBuilder
-from services.indexers.cross_doc_indexer import CrossDocIndexer
-from services.indexers.citation_indexer import CitationIndexer
-from services.indexers.figure_indexer import FigureIndexer
+from services.parser.pipeline import default_config
+from services.parser.pipeline.stages.indexing import preload_tokenizer, shutdown_pool
+from services.indexers.document_analysis import DocumentAnalysis, analyze_document
+from services.indexers.quote_index import locate_issues
+from services.indexers.term_matcher import configure_vocabulary
 
 # Configure logging
 logging.basicConfig(level=settings.log_level)
@@ -26,7 +41,8 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="PeerPreview API",
     description="AI-powered manuscript review system",
-    version="0.1.0"
+    version="0.1.0",
+    default_response_class=FastJSONResponse
 )
 
 # Configure CORS
@@ -38,11 +54,50 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# In-memory storage for demo (replace with database in production)
-documents_store: Dict[str, ParsedDocument] = {}
-reviews_store: Dict[str, FullReviewOutput] = {}
-processing_status: Dict[str, str] = {}
-builders_store: Dict[str, Any] = {}  # Store builder instances for stage debugging
+# Persistent storage (SQLite by default), shared by all workers
+storage = open_storage(settings.database_url, settings.storage_cache_size)
+documents_store = storage.documents
+reviews_store = storage.reviews
+processing_status = storage.status
+analysis_store = storage.analyses  # Indexes and stats, computed once per document
+# Builder instances for stage debugging (recent uploads in this worker only)
+builders_store: Dict[str, Any] = LRUCache(settings.storage_cache_size)
+
+# Parse results and API responses (Redis when available, shared by all workers)
+cache = create_cache(settings.enable_cache, settings.cache_ttl, settings.redis_url, settings.cache_max_entries)
+
+# Parse and review progress events for /events (Redis when available)
+events = create_event_bus(settings.redis_url)
+
+# Per-client upload rate limits and fair sharing of parse slots (this process)
+rate_limiter = RateLimiter(settings.rate_limit_per_minute, settings.rate_limit_burst)
+parse_scheduler = FairScheduler(settings.parse_slots, settings.client_weights)
+
+# Review jobs, keyed by document ID (Redis queue when available, shared by all workers)
+review_jobs = create_job_queue(storage.jobs, settings.redis_url, settings.review_max_attempts,
+                               settings.review_retry_backoff)
+
+
+@app.on_event("startup")
+async def load_models():
+    """Load the sentence tokenizer and term vocabulary once; fail startup if data is missing."""
+    preload_tokenizer(default_config().indexing)
+    configure_vocabulary(settings.term_vocabularies)
+
+
+@app.on_event("startup")
+async def start_review_workers():
+    """Requeue reviews lost by a restart and start this process's review workers."""
+    review_jobs.recover()
+    if settings.review_workers > 0:
+        review_workers.start()
+
+
+@app.on_event("shutdown")
+async def release_workers():
+    """Stop the review workers and the sentence indexing process pool."""
+    await review_workers.stop()
+    shutdown_pool()
 
 
 # ============== Request/Response Models ==============
@@ -53,12 +108,27 @@ class UploadResponse(BaseModel):
     sections: list[str]
     section_validation: dict[str, bool]  # e.g., {"has_introduction": True, "has_methods": False}
     message: str
+    previous_document_id: Optional[str] = None
+    changed_paragraphs: Optional[dict[str, list[int]]] = None  # Revision uploads only
+    degraded: list[str] = []  # Optional parse stages skipped to meet the processing deadline
 
 
 class ReviewRequest(BaseModel):
     document_id: str
     track_b_enabled: bool = True
     agents_to_run: Optional[list[str]] = None  # None means all agents
+    changed_only: bool = True  # For revisions, only re-review changed sections
+    priority: int = PRIORITY_NORMAL  # Higher runs first (core.jobs.PRIORITY_*)
+
+
+class QuoteQuery(BaseModel):
+    quote: str
+    section: Optional[str] = None  # Searched first when given
+
+
+class ResolveQuotesRequest(BaseModel):
+    quotes: list[QuoteQuery]
+    limit: int = Field(3, ge=1, le=10)  # Matches per quote
 
 
 class StatusResponse(BaseModel):
@@ -66,6 +136,7 @@ class StatusResponse(BaseModel):
     status: str
     message: Optional[str] = None
     progress: Optional[float] = None
+    stage: Optional[str] = None  # Review stage while processing
 
 
 # ============== Health Check ==============
@@ -100,9 +171,97 @@ async def health():
 
 # ============== Document Upload ==============
 
+# Client of requests without a remote address
+ANONYMOUS_CLIENT = "anonymous"
+
+# Endpoints whose uploads count against the client's rate limit
+UPLOAD_PATHS = {"/upload", "/upload/batch"}
+
+# Stop waiting for a parse at this multiple of its timeout. The builder
+# enforces the timeout at its checkpoints; this only catches a single
+# PyMuPDF call that never returns (its thread is left to finish).
+HARD_TIMEOUT_FACTOR = 1.2
+
+
+def client_id(request: Request) -> str:
+    """Client a request is accounted to: its remote address.
+
+    Behind a proxy listed in settings.trusted_proxies (e.g. an
+    authenticating gateway), the X-Client-ID header set by the proxy, else
+    the original address in X-Forwarded-For. The headers of any other
+    sender are ignored, since a client could change them freely to get
+    around its rate limit.
+    """
+    host = request.client.host if request.client else ANONYMOUS_CLIENT
+    if host not in settings.trusted_proxies:
+        return host
+    forwarded_for = request.headers.get("x-forwarded-for", "").split(",")[0].strip()
+    return request.headers.get("x-client-id") or forwarded_for or host
+
+
+@app.middleware("http")
+async def reject_rate_limited_uploads(request: Request, call_next):
+    """Answer 429 to uploads of rate-limited clients before their files are read.
+
+    Only checks the limit; the endpoints take the tokens for the documents
+    they accept.
+    """
+    if request.method == "POST" and request.url.path in UPLOAD_PATHS:
+        retry_after = rate_limiter.check(client_id(request))
+        if retry_after:
+            return JSONResponse({"detail": "Too many uploads, try again later"}, status_code=429,
+                                headers={"Retry-After": str(math.ceil(retry_after))})
+    return await call_next(request)
+
+
+def admit(client: str, documents: int, check_only: bool = False):
+    """Take documents from the client's rate limit, or raise 429 with Retry-After.
+
+    With check_only, raise if the client could not be admitted for the
+    documents now, without taking any.
+    """
+    retry_after = (rate_limiter.check if check_only else rate_limiter.acquire)(client, documents)
+    if retry_after:
+        raise HTTPException(429, "Too many uploads, try again later",
+                            headers={"Retry-After": str(math.ceil(retry_after))})
+
+
 @app.post("/upload", response_model=UploadResponse)
-async def upload_document(file: UploadFile = File(...)):
-    """Upload and parse a PDF document."""
+async def upload_document(
+    request: Request,
+    file: UploadFile = File(...),
+    previous_document_id: Optional[str] = Form(None),
+    document_id: Optional[str] = Form(None)
+):
+    """Upload and parse a PDF document.
+
+    Pass previous_document_id to upload a revision: unchanged sentences keep
+    their IDs and only changed paragraphs are flagged for re-review.
+
+    Pass document_id (a new UUID) to choose the ID up front and follow the
+    parse on /events/{document_id} while the upload is running.
+
+    Valid uploads count against the client's rate limit (429 when
+    exceeded), and the parse waits for the client's turn in the fair-share
+    scheduler.
+    """
+    client = client_id(request)
+
+    previous_doc = None
+    if previous_document_id is not None:
+        if previous_document_id not in documents_store:
+            raise HTTPException(404, "Previous document not found")
+        previous_doc = documents_store[previous_document_id]
+
+    if document_id is not None:
+        try:
+            uuid.UUID(document_id)
+        except ValueError:
+            raise HTTPException(400, "document_id must be a UUID")
+        if document_id in documents_store:
+            raise HTTPException(409, "Document ID already in use")
+    doc_id = document_id or str(uuid.uuid4())
+
     try:
         # Validate file type
         if not file.filename.endswith('.pdf'):
@@ -113,104 +272,403 @@ async def upload_document(file: UploadFile = File(...)):
         if len(contents) > settings.max_file_size:
             raise HTTPException(413, f"File too large. Maximum size is {settings.max_file_size / 1024 / 1024}MB")
 
-        # Parse document
-        logger.info(f"Parsing document: {file.filename}")
-        builder = DocumentBuilder(capture_stages=True)  # Enable stage capture for debugging
-        parsed_doc = builder.build(contents, file.filename)
+        admit(client, 1)
+    except HTTPException as e:
+        events.publish(doc_id, event_types.PARSE_FAILED, stage=None, error=e.detail)
+        raise
+
+    try:
+        parsed_doc, analysis, _ = await parse_upload(contents, file.filename, doc_id, previous_doc, client,
+                                                     timeout=settings.processing_timeout)
+    except Exception as e:
+        logger.error(f"Upload failed: {e}")
+        raise HTTPException(500, str(e))
+
+    return UploadResponse(
+        document_id=parsed_doc.doc_id,
+        title=parsed_doc.title,
+        sections=list(parsed_doc.sections.keys()),
+        section_validation=analysis.section_validation,
+        message="Document uploaded and parsed successfully",
+        previous_document_id=previous_document_id,
+        changed_paragraphs=parsed_doc.revision.changed_paragraphs if parsed_doc.revision else None,
+        degraded=parsed_doc.degraded
+    )
 
-        # Store document and builder
-        documents_store[parsed_doc.doc_id] = parsed_doc
-        builders_store[parsed_doc.doc_id] = builder  # Store for stage debugging
-        processing_status[parsed_doc.doc_id] = "uploaded"
+
+async def parse_upload(
+    contents: bytes,
+    filename: str,
+    doc_id: str,
+    previous_doc: Optional[ParsedDocument] = None,
+    client: str = ANONYMOUS_CLIENT,
+    timeout: Optional[float] = None
+) -> Tuple[ParsedDocument, DocumentAnalysis, bool]:
+    """Parse a PDF (or reuse the parse of an identical one), store it and build its analysis.
+
+    Parsing and analysis run in worker threads, so the event loop keeps
+    serving /events and other requests, and only in one of the fair-share
+    scheduler's parse slots. Publishes the document's parse events,
+    including parse_failed before re-raising an error.
+
+    The timeout is the builder's document budget (settings.parse_stage_timeout
+    bounds each stage): near it, optional stages are skipped and listed in
+    the document's degraded field; past it, the build stops at its next
+    checkpoint. Degraded parses are not cached, so a later upload of the
+    same PDF gets a full parse.
+
+    Args:
+        contents: PDF bytes
+        filename: Upload name
+        doc_id: ID to store the document under
+        previous_doc: Previous version (revision uploads)
+        client: Client the parse is scheduled for
+        timeout: Seconds the parse may take once it has a slot (None: unlimited)
+
+    Raises:
+        TimeoutError: The parse took longer than timeout (DeadlineExceeded
+            when the builder stopped itself)
+
+    Returns:
+        (document, analysis, whether the parse came from the cache)
+    """
+    builder = None
+    try:
+        events.publish(doc_id, event_types.PARSE_STARTED, filename=filename)
+        parse_start = time.perf_counter()
+
+        # Reuse the parse and analysis of an identical PDF. Revisions are
+        # always parsed, since their sentence IDs depend on the previous version.
+        parse_key = cache_key(PARSE, content_hash(contents))
+        cached = cache.get(parse_key) if previous_doc is None else None
+        if cached is not None:
+            logger.info(f"Parse cache hit: {filename}")
+            cached_doc, analysis = cached
+            parsed_doc = replace(cached_doc, doc_id=doc_id)
+            documents_store[parsed_doc.doc_id] = parsed_doc
+            analysis_store[parsed_doc.doc_id] = analysis.for_copy(parsed_doc)
+            processing_status[parsed_doc.doc_id] = "uploaded"
+        else:
+            # Stage events are published as they happen
+            logger.info(f"Parsing document: {filename}")
+            builder = DocumentBuilder(
+                capture_stages=True,  # Enable stage capture for debugging
+                on_event=lambda event, data: events.publish(doc_id, event, **data),
+                timeout=timeout,
+                stage_timeout=settings.parse_stage_timeout
+            )
+            async with parse_scheduler.slot(client):
+                try:
+                    parsed_doc = await asyncio.wait_for(run_in_threadpool(
+                        builder.build, contents, filename, previous=previous_doc, doc_id=doc_id
+                    ), timeout * HARD_TIMEOUT_FACTOR if timeout else None)
+                except asyncio.TimeoutError:
+                    logger.error(f"Abandoning parse of {filename} stuck in stage {builder.current_stage}")
+                    builder.deadline.cancel()  # Stops the thread at its next checkpoint, if any
+                    raise TimeoutError(f"Parse timed out after {timeout} s")
+
+            # Store document and builder
+            documents_store[parsed_doc.doc_id] = parsed_doc
+            builders_store[parsed_doc.doc_id] = builder  # Store for stage debugging
+            processing_status[parsed_doc.doc_id] = "uploaded"
+
+        events.publish(doc_id, event_types.PARSE_FINISHED, sections=list(parsed_doc.sections.keys()),
+                       duration_ms=round((time.perf_counter() - parse_start) * 1000, 1), cached=cached is not None,
+                       degraded=parsed_doc.degraded)
 
         # Check if this is the demo paper
         if settings.demo_mode and parsed_doc.doc_hash == settings.demo_paper_hash:
             logger.info("Demo paper detected")
 
-        # Validate sections
-        from services.parser.pipeline.stages.formatting import validate_required_sections
-        # Check if we have authors from Phase 4 detection
-        has_authors = bool(builder.structure_info and
-                          builder.structure_info.authors and
-                          len(builder.structure_info.authors.authors) > 0)
-        section_validation = validate_required_sections(
-            parsed_doc.sections,
-            title=parsed_doc.title,
-            has_authors=has_authors
-        )
-
-        return UploadResponse(
-            document_id=parsed_doc.doc_id,
-            title=parsed_doc.title,
-            sections=list(parsed_doc.sections.keys()),
-            section_validation=section_validation,
-            message="Document uploaded and parsed successfully"
-        )
+        # Build indexes and validate sections once, while the parse is fresh
+        index_start = time.perf_counter()
+        if cached is None:
+            async with parse_scheduler.slot(client):
+                analysis = await run_in_threadpool(analyze_document, parsed_doc, has_detected_authors(builder))
+            analysis_store[parsed_doc.doc_id] = analysis
+            if previous_doc is None and not parsed_doc.degraded:
+                cache.set(parse_key, (parsed_doc, analysis))
+        events.publish(doc_id, event_types.INDEX_BUILT,
+                       sentences=sum(len(section.sentences) for section in parsed_doc.sections.values()),
+                       duration_ms=round((time.perf_counter() - index_start) * 1000, 1))
+        return parsed_doc, analysis, cached is not None
 
     except Exception as e:
-        logger.error(f"Upload failed: {e}")
-        raise HTTPException(500, str(e))
+        events.publish(doc_id, event_types.PARSE_FAILED, stage=builder.current_stage if builder else None,
+                       error=str(e))
+        raise
+
+
+@app.post("/upload/batch")
+async def upload_batch(request: Request, files: list[UploadFile] = File(...)):
+    """Upload and parse many PDFs (or zips of PDFs) at once.
+
+    Every PDF counts against the client's rate limit. Up to
+    settings.batch_parse_concurrency PDFs are parsed at a time, sharing
+    the parse slots fairly with other clients.
+    Responds with NDJSON: one line per document as soon as it is parsed or
+    fails, then a summary line with counts and throughput. A file that
+    fails, or takes longer than settings.processing_timeout, is reported
+    on its own line without affecting the others.
+    """
+    # Every file is at least one PDF: check the count and the rate limit before reading any
+    if len(files) > settings.max_batch_files:
+        raise HTTPException(413, f"Too many files. Maximum is {settings.max_batch_files} PDFs per batch")
+    client = client_id(request)
+    admit(client, len(files), check_only=True)
+
+    uploads = [(file.filename, await file.read()) for file in files]
+    items = expand_uploads(uploads, settings.max_file_size)
+    if len(items) > settings.max_batch_files:
+        raise HTTPException(413, f"Too many files. Maximum is {settings.max_batch_files} PDFs per batch")
+    admit(client, len(items))  # Counting the PDFs inside zips
+    logger.info(f"Batch upload: {len(items)} PDFs from {len(files)} files")
+
+    async def stream():
+        semaphore = asyncio.Semaphore(settings.batch_parse_concurrency)
+        stats = BatchStats(total=len(items))
+        tasks = [asyncio.create_task(parse_batch_item(item, semaphore, client)) for item in items]
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                result = await next_result
+                stats.record(result)
+                yield encode_json(result) + b"\n"
+            yield encode_json({"summary": stats.summary()}) + b"\n"
+        finally:
+            for task in tasks:  # Client went away
+                task.cancel()
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+
+async def parse_batch_item(item: BatchItem, semaphore: asyncio.Semaphore,
+                           client: str = ANONYMOUS_CLIENT) -> Dict[str, Any]:
+    """Parse one PDF of a batch; errors are returned as a failed result rather than raised."""
+    doc_id = str(uuid.uuid4())
+    result: Dict[str, Any] = {"filename": item.filename, "document_id": doc_id}
+    if item.error is not None:
+        return {**result, "status": "failed", "error": item.error}
+
+    async with semaphore:
+        start = time.perf_counter()
+        try:
+            contents = await run_in_threadpool(item.load)
+            parsed_doc, analysis, cached = await parse_upload(
+                contents, item.filename, doc_id, client=client, timeout=settings.processing_timeout
+            )
+        except Exception as e:
+            logger.error(f"Batch parse failed: {item.filename}: {e}")
+            return {**result, "status": "failed", "error": str(e) or type(e).__name__}
+
+    return {
+        **result,
+        "status": "parsed",
+        "title": parsed_doc.title,
+        "sections": list(parsed_doc.sections.keys()),
+        "section_validation": analysis.section_validation,
+        "cached": cached,
+        "degraded": parsed_doc.degraded,
+        "duration_ms": round((time.perf_counter() - start) * 1000, 1)
+    }
 
 
 # ============== Document Analysis ==============
 
+def has_detected_authors(builder: Any) -> bool:
+    """Whether author detection (Phase 4) found any authors."""
+    return bool(builder and builder.structure_info and
+                builder.structure_info.authors and
+                len(builder.structure_info.authors.authors) > 0)
+
+
+def get_analysis(document_id: str) -> DocumentAnalysis:
+    """Return the document's indexes and statistics.
+
+    Uploads store the analysis with the document, so this only reads it
+    back (reattaching the loaded document). Documents stored without one
+    are analysed once here, keeping the author flag of any analysis found.
+    """
+    doc = documents_store[document_id]
+    analysis = analysis_store.get(document_id)
+    if analysis is not None and analysis.is_current(doc):
+        return analysis.bind(doc)
+    logger.warning(f"No analysis stored for {document_id}; analyzing it now")
+    analysis = analyze_document(doc, has_authors=analysis.has_authors if analysis is not None else False)
+    analysis_store[document_id] = analysis
+    return analysis
+
+
 @app.get("/document/{document_id}")
-async def get_document(document_id: str):
-    """Get parsed document details."""
+async def get_document(
+    document_id: str,
+    request: Request,
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. title,statistics")
+):
+    """Get parsed document details.
+
+    Supports ?fields= projection, gzip/brotli compression and conditional
+    requests: documents never change under an ID, so the ETag only depends
+    on the document and the requested fields.
+    """
     if document_id not in documents_store:
         raise HTTPException(404, "Document not found")
 
     doc = documents_store[document_id]
 
-    # Build indices for analysis
-    cross_index = CrossDocIndexer().build(doc)
-    citation_index = CitationIndexer().build(doc)
-    figure_index = FigureIndexer().build(doc)
-
-    # Validate sections
-    from services.parser.pipeline.stages.formatting import validate_required_sections
-    # Check if we have authors from Phase 4 detection
-    builder = builders_store.get(document_id)
-    has_authors = bool(builder and builder.structure_info and
-                      builder.structure_info.authors and
-                      len(builder.structure_info.authors.authors) > 0)
-    section_validation = validate_required_sections(
-        doc.sections,
-        title=doc.title,
-        has_authors=has_authors
-    )
+    def build():
+        analysis = get_analysis(document_id)
+        return {
+            "document_id": doc.doc_id,
+            "title": doc.title,
+            "degraded": doc.degraded,
+            "raw_markdown": doc.raw_markdown,
+            "sections": analysis.section_stats,
+            "section_validation": analysis.section_validation,
+            "statistics": analysis.statistics
+        }
+
+    try:
+        return negotiated_response(request, build, ("document", doc.doc_id, doc.doc_hash), fields,
+                                   cache=cache, cache_key=cache_key(RESPONSE, "document", document_id))
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+
+
+@app.get("/document/{document_id}/search")
+async def search_document(
+    document_id: str,
+    q: str = Query(..., min_length=1),
+    limit: int = Query(10, ge=1, le=100),
+    section: Optional[str] = None
+):
+    """Find the sentences most relevant to a query (BM25)."""
+    if document_id not in documents_store:
+        raise HTTPException(404, "Document not found")
+
+    hits = get_analysis(document_id).search.search(q, limit=limit, section=section)
 
     return {
-        "document_id": doc.doc_id,
-        "title": doc.title,
-        "raw_markdown": doc.raw_markdown,
-        "sections": {
-            name: {
-                "text": section.text[:500] + "..." if len(section.text) > 500 else section.text,
-                "sentence_count": len(section.sentences),
-                "word_count": len(section.text.split())
+        "document_id": document_id,
+        "query": q,
+        "results": [
+            {
+                "sentence_id": hit.sentence.id,
+                "section": hit.sentence.section,
+                "text": hit.sentence.text,
+                "char_start": hit.sentence.char_start,
+                "char_end": hit.sentence.char_end,
+                "score": round(hit.score, 4)
             }
-            for name, section in doc.sections.items()
-        },
-        "section_validation": section_validation,
-        "statistics": {
-            "total_citations": len(doc.citations),
-            "total_bibliography": len(doc.bibliography),
-            "total_figures": len(doc.figures),
-            "figure_references": len(doc.figure_refs),
-            "sample_sizes": cross_index.ns_by_section,
-            "unmatched_citations": citation_index.unmatched_citations,
-            "orphaned_figures": [f.label for f in figure_index.orphaned_figures],
-            "dangling_figure_refs": [r.label for r in figure_index.dangling_refs]
-        }
+            for hit in hits
+        ]
     }
 
 
+@app.post("/document/{document_id}/quotes")
+async def resolve_quotes(document_id: str, request: ResolveQuotesRequest):
+    """Resolve quoted excerpts (e.g. TextLocation.quote) to sentence IDs and offsets.
+
+    Each quote gets up to `limit` matches with the sentences they overlap,
+    offsets in the section text and a confidence (1.0 for an exact match
+    ignoring whitespace, hyphenation, ligatures and punctuation).
+    """
+    if document_id not in documents_store:
+        raise HTTPException(404, "Document not found")
+
+    results = get_analysis(document_id).quotes.resolve_many(
+        ((query.quote, query.section) for query in request.quotes), limit=request.limit
+    )
+    return {
+        "document_id": document_id,
+        "results": [
+            {"quote": query.quote, "matches": [asdict(match) for match in matches]}
+            for query, matches in zip(request.quotes, results)
+        ]
+    }
+
+
+# Largest markdown range served per request
+MARKDOWN_MAX_CHARS = 200_000
+
+
+@app.get("/document/{document_id}/sections/{section_name}/sentences")
+async def get_section_sentences(
+    document_id: str,
+    section_name: str,
+    request: Request,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000)
+):
+    """Page through a section's sentences (IDs, text and offsets in the section text).
+
+    Only the requested section is loaded from storage.
+    """
+    if document_id not in documents_store:
+        raise HTTPException(404, "Document not found")
+    doc = documents_store[document_id]
+    if section_name not in doc.sections:
+        raise HTTPException(404, f"Section not found: {section_name}")
+
+    def build():
+        sentences = doc.sections[section_name].sentences
+        return {
+            "document_id": document_id,
+            "section": section_name,
+            "offset": offset,
+            "limit": limit,
+            "total": len(sentences),
+            "sentences": [
+                {
+                    "id": sentence.id,
+                    "text": sentence.text,
+                    "char_start": sentence.char_start,
+                    "char_end": sentence.char_end,
+                    "paragraph_index": sentence.paragraph_index
+                }
+                for sentence in sentences[offset:offset + limit]
+            ]
+        }
+
+    return negotiated_response(request, build, ("sentences", document_id, doc.doc_hash, section_name, offset, limit))
+
+
+@app.get("/document/{document_id}/markdown")
+async def get_markdown_range(
+    document_id: str,
+    request: Request,
+    start: int = Query(0, ge=0),
+    end: Optional[int] = Query(None, ge=0, description="Exclusive; defaults to the end of the document")
+):
+    """Return characters start:end of the document's markdown.
+
+    At most MARKDOWN_MAX_CHARS are returned; `total_length` tells the
+    viewer how far it can page.
+    """
+    if document_id not in documents_store:
+        raise HTTPException(404, "Document not found")
+    if end is not None and end < start:
+        raise HTTPException(400, "end must not be before start")
+    end = min(end if end is not None else start + MARKDOWN_MAX_CHARS, start + MARKDOWN_MAX_CHARS)
+
+    def build():
+        text, total_length = documents_store.markdown_range(document_id, start, end)
+        return {
+            "document_id": document_id,
+            "start": start,
+            "end": start + len(text),
+            "total_length": total_length,
+            "text": text
+        }
+
+    # Documents never change under an ID
+    return negotiated_response(request, build, ("markdown", document_id, start, end))
+
+
 # ============== Review Trigger ==============
 
 @app.post("/review")
-async def trigger_review(request: ReviewRequest, background_tasks: BackgroundTasks):
-    """Trigger the review process for a document."""
+async def trigger_review(request: ReviewRequest):
+    """Queue the review of a document."""
     if request.document_id not in documents_store:
         raise HTTPException(404, "Document not found")
 
@@ -218,29 +676,74 @@ async def trigger_review(request: ReviewRequest, background_tasks: BackgroundTas
     if processing_status.get(request.document_id) == "processing":
         raise HTTPException(409, "Review already in progress")
 
-    # Start processing
     processing_status[request.document_id] = "processing"
-
-    # In production, this would use Celery or similar
-    # For now, we'll use background tasks
-    background_tasks.add_task(
-        run_review_pipeline,
-        request.document_id,
-        request.track_b_enabled,
-        request.agents_to_run
-    )
+    review_jobs.submit(request.document_id, {
+        "track_b_enabled": request.track_b_enabled,
+        "agents_to_run": request.agents_to_run,
+        "changed_only": request.changed_only
+    }, request.priority)
+    events.publish(request.document_id, event_types.REVIEW_QUEUED, priority=request.priority)
 
     return {
         "document_id": request.document_id,
         "status": "processing",
-        "message": "Review started. Check status endpoint for progress."
+        "message": "Review queued. Follow /events or check the status endpoint for progress."
     }
 
 
-async def run_review_pipeline(document_id: str, track_b_enabled: bool, agents_to_run: Optional[list[str]]):
-    """Run the complete review pipeline."""
+async def run_review_job(job: Job, progress: ProgressCallback):
+    """Worker handler: review the job's document."""
+    events.publish(job.job_id, event_types.REVIEW_STARTED, attempt=job.attempts)
+    try:
+        await run_review_pipeline(job.job_id, progress=progress, **job.params)
+    except Exception as e:
+        if job.attempts < review_jobs.max_attempts:
+            events.publish(job.job_id, event_types.REVIEW_RETRYING, attempt=job.attempts, error=str(e))
+        raise
+
+
+def review_failed(job: Job):
+    """Record a review that failed on its last attempt."""
+    processing_status[job.job_id] = f"failed: {job.error}"
+    events.publish(job.job_id, event_types.REVIEW_FAILED, error=job.error)
+
+
+review_workers = WorkerPool(review_jobs, run_review_job, settings.review_workers, on_failure=review_failed)
+
+
+def sections_to_review(doc: ParsedDocument, changed_only: bool = True) -> Optional[list[str]]:
+    """Sections the review agents should run on (None means all sections).
+
+    For a revision whose previous version has been reviewed, only sections
+    with changed paragraphs need review; everything else is carried over.
+    """
+    revision = doc.revision
+    if not changed_only or revision is None or revision.previous_doc_id not in reviews_store:
+        return None
+    return [name for name in doc.sections if name in revision.changed_paragraphs]
+
+
+async def run_review_pipeline(
+    document_id: str,
+    track_b_enabled: bool,
+    agents_to_run: Optional[list[str]],
+    changed_only: bool = True,
+    progress: Optional[ProgressCallback] = None
+):
+    """Run the complete review pipeline.
+
+    Errors propagate to the review worker, which retries the job.
+
+    Args:
+        progress: Called with (stage, fraction done) as the review advances
+    """
+    report_progress = progress or (lambda stage, fraction: None)
     try:
+        report_progress("loading", 0.05)
         doc = documents_store[document_id]
+        review_sections = sections_to_review(doc, changed_only)
+        if review_sections is not None:
+            logger.info(f"Re-reviewing changed sections of {document_id}: {review_sections}")
 
         # For now, create a mock review
         # In next phase, this will call actual agents
@@ -251,10 +754,12 @@ async def run_review_pipeline(document_id: str, track_b_enabled: bool, agents_to
         )
 
         # Create mock reports
-        mock_review = FullReviewOutput(
-            document_id=document_id,
-            title=doc.title,
-            sections=[
+        report_progress("section_review", 0.2)
+        agent_start = time.perf_counter()
+        events.publish(document_id, event_types.AGENT_STARTED, agent="section_review", sections=review_sections)
+        section_reports = []
+        if review_sections is None or "methods" in review_sections:
+            section_reports.append(
                 SectionReviewReport(
                     section="methods",
                     track_a_issues=[
@@ -271,7 +776,54 @@ async def run_review_pipeline(document_id: str, track_b_enabled: bool, agents_to
                     track_b_suggestions=[],
                     passed_checks=["IRB statement present", "Statistical methods described"]
                 )
-            ],
+            )
+
+        events.publish(document_id, event_types.AGENT_FINISHED, agent="section_review",
+                       issues=sum(len(report.track_a_issues) for report in section_reports),
+                       duration_ms=round((time.perf_counter() - agent_start) * 1000, 1))
+
+        # Recomputed statistics are Track A issues without an agent call
+        report_progress("statistics", 0.6)
+        agent_start = time.perf_counter()
+        events.publish(document_id, event_types.AGENT_STARTED, agent="statistics", sections=review_sections)
+        statistic_issues = [
+            issue for issue in get_analysis(document_id).statistic_issues
+            if review_sections is None or issue.location.section in review_sections
+        ]
+        events.publish(document_id, event_types.AGENT_FINISHED, agent="statistics", issues=len(statistic_issues),
+                       duration_ms=round((time.perf_counter() - agent_start) * 1000, 1))
+        reports_by_section = {report.section: report for report in section_reports}
+        for issue in statistic_issues:
+            report = reports_by_section.get(issue.location.section)
+            if report is None:
+                report = SectionReviewReport(
+                    section=issue.location.section,
+                    track_a_issues=[],
+                    track_b_suggestions=[],
+                    passed_checks=[]
+                )
+                reports_by_section[report.section] = report
+                section_reports.append(report)
+            report.track_a_issues.append(issue)
+
+        # Attach sentence IDs to issues that only quote their text
+        located = locate_issues(get_analysis(document_id).quotes,
+                                (issue for report in section_reports for issue in report.track_a_issues))
+        logger.debug(f"Located {located} quoted issues in {document_id}")
+
+        # Carry over reports for sections unchanged since the reviewed previous version
+        if review_sections is not None:
+            previous_review = reviews_store[doc.revision.previous_doc_id]
+            section_reports.extend(
+                report for report in previous_review.sections
+                if report.section in doc.sections and report.section not in review_sections
+            )
+
+        report_progress("assembling", 0.9)
+        mock_review = FullReviewOutput(
+            document_id=document_id,
+            title=doc.title,
+            sections=section_reports,
             cross_doc=CrossDocReport(
                 issues=[],
                 consistency_score=0.85,
@@ -303,10 +855,12 @@ async def run_review_pipeline(document_id: str, track_b_enabled: bool, agents_to
         # Store review
         reviews_store[document_id] = mock_review
         processing_status[document_id] = "completed"
+        events.publish(document_id, event_types.RESULTS_READY,
+                       issues=sum(len(report.track_a_issues) for report in section_reports))
 
     except Exception as e:
         logger.error(f"Review pipeline failed: {e}")
-        processing_status[document_id] = f"failed: {str(e)}"
+        raise
 
 
 # ============== Status & Results ==============
@@ -319,25 +873,94 @@ async def get_status(document_id: str):
 
     status = processing_status.get(document_id, "unknown")
 
+    # Queued or running review: report the job's own stage and progress
+    job = review_jobs.get(document_id) if status == "processing" else None
+    if job is not None:
+        retry = f" (retrying after error: {job.error})" if job.error else ""
+        return StatusResponse(
+            document_id=document_id,
+            status=status,
+            message=f"Review {job.status}{retry}",
+            progress=job.progress,
+            stage=job.stage
+        )
+
     return StatusResponse(
         document_id=document_id,
         status=status,
         message=f"Document is {status}",
-        progress=0.5 if status == "processing" else 1.0 if status == "completed" else 0.0
+        progress=1.0 if status == "completed" else 0.0
     )
 
 
 @app.get("/results/{document_id}")
-async def get_results(document_id: str):
-    """Get review results for a document."""
+async def get_results(
+    document_id: str,
+    request: Request,
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. summary,sections.section")
+):
+    """Get review results for a document.
+
+    Supports ?fields= projection, gzip/brotli compression and conditional
+    requests; the ETag changes whenever a new review is stored.
+    """
     if document_id not in reviews_store:
         # Check if still processing
         if processing_status.get(document_id) == "processing":
             raise HTTPException(202, "Review still in progress")
         raise HTTPException(404, "No results found for this document")
 
-    review = reviews_store[document_id]
-    return review.dict()
+    # Versioned by the stored bytes, so the ETag changes exactly when a new review is stored
+    review, version = reviews_store.get_versioned(document_id)
+
+    try:
+        return negotiated_response(request, review.dict, ("results", document_id, version), fields)
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+
+
+# ============== Progress Events ==============
+
+# Seconds between keep-alive comments on an idle stream
+EVENTS_KEEPALIVE = 15
+
+
+@app.get("/events/{document_id}")
+async def stream_events(
+    document_id: str,
+    request: Request,
+    last_event_id: Optional[str] = Header(None)
+):
+    """Stream parse and review progress as Server-Sent Events.
+
+    Replays the document's events so far, then pushes new ones as they
+    happen. The stream ends when the latest event is terminal (results
+    ready, parse or review failed). Reconnecting clients send
+    Last-Event-ID to resume after the last event they received.
+    """
+    try:
+        cursor = int(last_event_id) + 1 if last_event_id else 0
+    except ValueError:
+        raise HTTPException(400, "Last-Event-ID must be an event ID")
+
+    async def stream():
+        nonlocal cursor
+        while not await request.is_disconnected():
+            batch = await events.read_async(document_id, cursor)
+            for event in batch:
+                yield format_sse(event)
+            if batch:
+                cursor = batch[-1]['id'] + 1
+                if batch[-1]['event'] in TERMINAL_EVENTS:
+                    return
+            elif not await events.wait(document_id, cursor, EVENTS_KEEPALIVE):
+                yield ": keep-alive\n\n"
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 
 # ============== Debug Endpoints (remove in production) ==============
@@ -352,11 +975,11 @@ async def list_documents():
         "documents": [
             {
                 "id": doc_id,
-                "title": doc.title,
+                "title": title,
                 "status": processing_status.get(doc_id, "unknown"),
-                "sections": list(doc.sections.keys())
+                "sections": section_names
             }
-            for doc_id, doc in documents_store.items()
+            for doc_id, title, section_names in documents_store.summaries()
         ]
     }
 
@@ -367,14 +990,33 @@ async def clear_all():
     if not settings.debug:
         raise HTTPException(403, "Debug endpoints disabled")
 
-    documents_store.clear()
-    reviews_store.clear()
-    processing_status.clear()
+    storage.clear()
     builders_store.clear()
+    cache.clear()
+    review_jobs.queue.clear()
+    events.clear()
 
     return {"message": "All data cleared"}
 
 
+@app.get("/debug/cache")
+async def cache_metrics():
+    """Cache backend and hit/miss counts of this worker (debug only)."""
+    if not settings.debug:
+        raise HTTPException(403, "Debug endpoints disabled")
+
+    return cache.metrics()
+
+
+@app.get("/debug/admission")
+async def admission_metrics():
+    """Rate-limit rejections, parse slot use and queue times of this worker (debug only)."""
+    if not settings.debug:
+        raise HTTPException(403, "Debug endpoints disabled")
+
+    return {"rate_limit": rate_limiter.metrics(), "scheduler": parse_scheduler.metrics()}
+
+
 @app.get("/debug/pipeline-stages/{document_id}")
 async def get_pipeline_stages(document_id: str):
     """Get all pipeline stage outputs for debugging (debug only)."""
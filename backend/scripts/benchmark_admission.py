@@ -0,0 +1,91 @@
+"""Benchmark parse admission: interactive queue time behind a batch client.
+
+A batch client queues many parses at once while an interactive client
+uploads one document at a time. Parses are simulated with a fixed sleep
+so only the scheduling differs: a FIFO semaphore (the previous
+behaviour) serves the interactive uploads after the whole batch, the
+FairScheduler after at most one parse per other client. Also times
+RateLimiter.acquire(), which runs on every upload.
+
+Usage:
+    python scripts/benchmark_admission.py [--batch N] [--interactive N] [--slots N] [--parse-ms MS]
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from core.admission import FairScheduler, RateLimiter
+
+
+class FifoScheduler:
+    """All clients share one semaphore, served in arrival order."""
+
+    def __init__(self, slots):
+        self.semaphore = asyncio.Semaphore(slots)
+
+    @asynccontextmanager
+    async def slot(self, client):
+        async with self.semaphore:
+            yield
+
+
+async def simulate(scheduler, batch, interactive, parse_s):
+    waits = {'batch': [], 'interactive': []}
+
+    async def parse(client):
+        queued_at = time.perf_counter()
+        async with scheduler.slot(client):
+            waits[client].append(time.perf_counter() - queued_at)
+            await asyncio.sleep(parse_s)
+
+    async def interactive_user():
+        for _ in range(interactive):
+            await asyncio.sleep(parse_s * 2)  # Think time between uploads
+            await parse('interactive')
+
+    start = time.perf_counter()
+    await asyncio.gather(*(parse('batch') for _ in range(batch)), interactive_user())
+    return time.perf_counter() - start, waits
+
+
+def summarize(seconds):
+    return sum(seconds) / len(seconds) * 1000, max(seconds) * 1000
+
+
+def main_():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--batch', type=int, default=80)
+    parser.add_argument('--interactive', type=int, default=5)
+    parser.add_argument('--slots', type=int, default=4)
+    parser.add_argument('--parse-ms', type=float, default=20)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    print(f"{args.batch} batch parses + {args.interactive} interactive, {args.slots} slots, "
+          f"{args.parse_ms:.0f} ms per parse")
+    print(f"{'scheduler':<12}{'total s':>9}{'interactive mean/max ms':>26}{'batch mean/max ms':>22}")
+    for name, scheduler in (('fifo', FifoScheduler(args.slots)), ('fair', FairScheduler(args.slots))):
+        elapsed, waits = asyncio.run(simulate(scheduler, args.batch, args.interactive, args.parse_ms / 1000))
+        interactive = '%.0f / %.0f' % summarize(waits['interactive'])
+        batch = '%.0f / %.0f' % summarize(waits['batch'])
+        print(f"{name:<12}{elapsed:>9.2f}{interactive:>26}{batch:>22}")
+
+    limiter = RateLimiter(rate_per_minute=60, burst=100)
+    calls = 100_000
+    start = time.perf_counter()
+    for i in range(calls):
+        limiter.acquire(f"client{i % 1000}")
+    elapsed = time.perf_counter() - start
+    print(f"\nRateLimiter.acquire: {elapsed / calls * 1e6:.2f} us per call (1000 clients)")
+
+
+if __name__ == '__main__':
+    main_()
@@ -0,0 +1,95 @@
+"""Benchmark batch uploads: sequential /upload calls versus /upload/batch.
+
+Generates text-only PDFs with PyMuPDF (distinct, so the parse cache never
+hits), then parses them through main.parse_batch_item() - the real
+pipeline with the built-in sentence splitter, in-memory storage - one
+at a time as sequential /upload calls would, and with the batch's
+concurrency. Also shows that a malformed PDF in the batch fails on its
+own line without holding up the rest.
+
+Usage:
+    python scripts/benchmark_batch.py [--documents N] [--pages N] [--concurrency N ...]
+"""
+
+import argparse
+import asyncio
+import functools
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+os.environ.update(DATABASE_URL='sqlite://', REDIS_URL='', ENABLE_CACHE='false')
+
+import fitz
+
+import main
+from core.batch import BatchItem
+from services.parser.pipeline.builder import PipelineBuilder
+from services.parser.pipeline.config import default_config
+
+
+def make_pdf(pages, seed):
+    pdf = fitz.open()
+    for number in range(pages):
+        page = pdf.new_page()
+        y = 72
+        if number == 0:
+            page.insert_text((72, y), f"Manuscript {seed}: Traction Forces of Contracting Cells", fontsize=16)
+            y += 40
+        while y < 740:
+            page.insert_text((72, y), f"Cells on {seed}.{number}.{y} kPa gels contracted and traction forces "
+                                      f"were measured.", fontsize=10)
+            y += 14
+    return pdf.tobytes()
+
+
+async def run_batch(items, concurrency):
+    semaphore = asyncio.Semaphore(concurrency)
+    start = time.perf_counter()
+    finished = []
+
+    async def parse(item):
+        result = await main.parse_batch_item(item, semaphore)
+        finished.append((result['filename'], result['status'], time.perf_counter() - start))
+
+    await asyncio.gather(*(parse(item) for item in items))
+    return time.perf_counter() - start, finished
+
+
+def main_():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--documents', type=int, default=8)
+    parser.add_argument('--pages', type=int, default=5)
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 2, 4])
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    config = default_config()
+    config.indexing.splitter = 'scientific'  # No NLTK data needed
+    main.DocumentBuilder = functools.partial(PipelineBuilder, config)
+
+    pdfs = {concurrency: [make_pdf(args.pages, f"{concurrency}-{i}") for i in range(args.documents)]
+            for concurrency in args.concurrency}
+    print(f"{args.documents} PDFs of {args.pages} pages, {os.cpu_count()} CPUs")
+    print(f"{'concurrency':<14}{'seconds':>10}{'docs/min':>10}")
+    for concurrency, batch in pdfs.items():
+        items = [BatchItem(f"paper{i}.pdf", load=lambda pdf=pdf: pdf) for i, pdf in enumerate(batch)]
+        elapsed, _ = asyncio.run(run_batch(items, concurrency))
+        print(f"{concurrency:<14}{elapsed:>10.2f}{len(items) / elapsed * 60:>10.1f}")
+
+    # One malformed PDF among good ones
+    items = [BatchItem("malformed.pdf", load=lambda: b'%PDF-1.4 truncated')] + [
+        BatchItem(f"good{i}.pdf", load=lambda i=i: make_pdf(args.pages, f"good-{i}")) for i in range(3)
+    ]
+    _, finished = asyncio.run(run_batch(items, max(args.concurrency)))
+    print("\nWith a malformed PDF:")
+    for filename, status, at in finished:
+        print(f"  {filename:<16}{status:<8} at {at:.2f} s")
+
+
+if __name__ == '__main__':
+    main_()
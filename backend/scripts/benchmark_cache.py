@@ -0,0 +1,80 @@
+"""Benchmark the parse cache: re-analysing a document versus a cache hit.
+
+Uses the synthetic long document from benchmark_storage.py. A repeated
+upload of the same PDF normally re-runs parsing and analyze_document();
+with the cache it deserializes the stored (document, analysis) pair and
+rebinds it to a new document ID. The PDF parse itself is not timed here
+(it needs real PDFs and dominates further), so the "miss" column is a
+lower bound. Also times the cached /document response body.
+
+Usage:
+    python scripts/benchmark_cache.py [--sentences N] [--repeat N]
+"""
+
+import argparse
+import logging
+import sys
+import uuid
+from dataclasses import replace
+from pathlib import Path
+
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from fastapi.responses import JSONResponse
+
+from core.cache import Cache, MemoryBackend
+from scripts.benchmark_storage import make_document, timed
+from services.indexers.document_analysis import analyze_document
+from services.parser.pipeline.config import IndexingConfig
+from services.parser.pipeline.stages.indexing import index_sentences
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sentences', type=int, default=3000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)  # analyze_document warns about the synthetic document
+
+    doc = make_document(args.sentences)
+    doc.sections = index_sentences(
+        {name: replace(section, sentences=[]) for name, section in doc.sections.items()},
+        IndexingConfig(splitter='scientific')
+    )
+    cache = Cache(MemoryBackend())
+
+    def analyze():
+        return analyze_document(replace(doc, doc_id=str(uuid.uuid4()), lookup=None))
+
+    analysis = analyze()
+    cache.set('parse:bench', (doc, analysis))
+
+    def hit():
+        cached_doc, cached_analysis = cache.get('parse:bench')
+        return cached_analysis.for_copy(replace(cached_doc, doc_id=str(uuid.uuid4())))
+
+    def response():
+        return JSONResponse({
+            "document_id": doc.doc_id,
+            "title": doc.title,
+            "raw_markdown": doc.raw_markdown,
+            "sections": analysis.section_stats,
+            "section_validation": analysis.section_validation,
+            "statistics": analysis.statistics
+        }).body
+
+    cache.set('response:bench', response())
+    stored = len(cache.backend.get('parse:bench'))
+
+    print(f"Document: {args.sentences} sentences; cached entry {stored:,} B compressed")
+    print(f"\n{'operation':<28}{'ms':>10}")
+    print(f"{'analyze (cache miss)':<28}{timed(analyze, args.repeat):>10.1f}")
+    print(f"{'cache hit + rebind':<28}{timed(hit, args.repeat):>10.1f}")
+    print(f"{'/document body, built':<28}{timed(response, args.repeat):>10.2f}")
+    print(f"{'/document body, cached':<28}{timed(lambda: cache.get('response:bench'), args.repeat):>10.2f}")
+    print(f"\n{cache.metrics()}")
+
+
+if __name__ == '__main__':
+    main()
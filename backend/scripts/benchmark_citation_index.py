@@ -0,0 +1,123 @@
+"""Benchmark CitationIndexer matching on a large synthetic bibliography.
+
+Builds a document with 500 references and 1500 citations (half numeric,
+half author-year) and compares the previous linear-scan matching with the
+hashed bibliography indexes now built in CitationIndexer.build.
+
+Usage:
+    python scripts/benchmark_citation_index.py [--references N] [--citations N] [--repeat N]
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from services.indexers.citation_indexer import CitationIndexer
+from services.parser.pipeline.models import ParsedDocument, CitationRef, BibliographyEntry
+
+SURNAMES = ['Smith', 'Lee', 'Garcia', 'Chen', 'Nakamura', 'Okafor', 'Rossi', 'Kowalski', 'Silva', 'Novak',
+            'Jensen', 'Kaur', 'Haddad', 'Ivanova', 'Moreau', 'Tanaka', 'Walker', 'Zhang', 'Patel', 'Costa']
+
+
+class LegacyCitationIndexer(CitationIndexer):
+    """Previous matching: scan the full bibliography for every citation."""
+
+    def _build_bib_indexes(self, bibliography):
+        pass
+
+    def _find_matching_bib(self, citation, bibliography):
+        if citation.id.isdigit():
+            for bib in bibliography:
+                if bib.id == citation.id:
+                    return bib
+                if (bib.raw_text.startswith(f"[{citation.id}]") or
+                        bib.raw_text.startswith(f"{citation.id}.")):
+                    return bib
+        else:
+            author_year_match = re.match(r'([A-Z][a-z]+)(?:\s+et\s+al\.)?,?\s*(\d{4})', citation.id)
+            if author_year_match:
+                author = author_year_match.group(1).lower()
+                year = author_year_match.group(2)
+                for bib in bibliography:
+                    bib_lower = bib.raw_text.lower()
+                    if author in bib_lower and year in bib.raw_text:
+                        return bib
+        return None
+
+    def _find_unmatched_citations(self, doc, citation_to_bib):
+        unmatched = []
+        for citation in doc.citations:
+            if citation.id not in citation_to_bib:
+                if citation.id not in unmatched:
+                    unmatched.append(citation.id)
+        return unmatched
+
+
+def make_document(n_refs, n_citations, seed=0):
+    """Synthetic document with a large bibliography."""
+    rng = random.Random(seed)
+    bibliography = []
+    author_years = []
+
+    for i in range(1, n_refs + 1):
+        surname = f"{rng.choice(SURNAMES)}{rng.choice(['', 'son', 'er', 'ini', 'ova'])}"
+        year = str(rng.randint(1980, 2024))
+        coauthors = ', '.join(f"{rng.choice(SURNAMES)}, {chr(65 + rng.randint(0, 25))}." for _ in range(3))
+        bibliography.append(BibliographyEntry(
+            id=str(i),
+            raw_text=f"{surname}, {chr(65 + rng.randint(0, 25))}., {coauthors} ({year}). "
+                     f"Contractility of cell type {i} under mechanical load. "
+                     f"J. Mechanobiol. {rng.randint(1, 60)}: {rng.randint(1, 900)}-{rng.randint(901, 999)}.",
+            doi=f"10.1000/jmb.{i}"
+        ))
+        author_years.append(f"{surname} et al., {year}")
+
+    citations = []
+    for i in range(n_citations):
+        if i % 2:
+            cid = str(rng.randint(1, n_refs + 20))  # A few dangling
+        else:
+            cid = rng.choice(author_years)
+        citations.append(CitationRef(id=cid, section='introduction', sentence_id=f"introduction_{i}_x"))
+
+    return ParsedDocument(
+        doc_id='bench', doc_hash='bench', title='Benchmark', sections={}, figures=[], figure_refs=[],
+        citations=citations, bibliography=bibliography, raw_markdown=''
+    )
+
+
+def time_build(indexer, doc, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        index = indexer.build(doc)
+    return (time.perf_counter() - start) / repeat, index
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--references', type=int, default=500)
+    parser.add_argument('--citations', type=int, default=1500)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    doc = make_document(args.references, args.citations)
+    print(f"Document: {len(doc.bibliography)} references, {len(doc.citations)} citations")
+
+    legacy_time, legacy_index = time_build(LegacyCitationIndexer(), doc, args.repeat)
+    hashed_time, hashed_index = time_build(CitationIndexer(), doc, args.repeat)
+
+    print(f"\n{'indexer':<10}{'ms':>10}{'matched':>10}{'unmatched':>11}")
+    for label, elapsed, index in [('legacy', legacy_time, legacy_index), ('hashed', hashed_time, hashed_index)]:
+        print(f"{label:<10}{elapsed * 1000:>10.1f}{len(index.citation_to_bib):>10}"
+              f"{len(index.unmatched_citations):>11}")
+    print(f"\nSpeedup: {legacy_time / hashed_time:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+"""Benchmark citation extraction on a synthetic citation-dense review article.
+
+Generates a review-style document (default 350 references, numeric and
+author-year citations with ranges and lists), then compares the previous
+per-sentence, per-pattern extractor with the single-pass scanner in
+extractors/citations.py for time and number of citation keys found.
+
+Usage:
+    python scripts/benchmark_citations.py [--references N] [--paragraphs N] [--repeat N]
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from services.parser.pipeline.config import IndexingConfig
+from services.parser.pipeline.extractors.citations import extract_citations
+from services.parser.pipeline.models import ParsedSection
+from services.parser.pipeline.stages.indexing import index_sentences
+
+SURNAMES = ['Smith', 'Lee', 'Garcia', 'Chen', 'Müller', 'Nakamura', 'Okafor', 'Rossi', 'Kowalski', 'Silva']
+
+LEGACY_PATTERNS = [
+    r'\[(\d+(?:,\s*\d+)*)\]',
+    r'\(([A-Z][a-z]+(?:\s+et\s+al\.?)?,?\s*\d{4})\)',
+]
+
+
+def legacy_extract(sections):
+    """Previous extractor: every pattern over every sentence, sentence text copied."""
+    refs = []
+    for name, section in sections.items():
+        if name == 'references':
+            continue
+        for sent in section.sentences:
+            for pat in LEGACY_PATTERNS:
+                for match in re.finditer(pat, sent.text):
+                    refs.append((match.group(1), name, sent.id, sent.text))
+    return refs
+
+
+def make_citation(rng, n_refs):
+    """Random citation marker in one of the supported styles."""
+    style = rng.random()
+    if style < 0.4:
+        return f"[{rng.randint(1, n_refs)}]"
+    if style < 0.6:
+        start = rng.randint(1, n_refs - 5)
+        return f"[{start}-{start + rng.randint(1, 4)}]"
+    if style < 0.75:
+        return "[" + ", ".join(str(rng.randint(1, n_refs)) for _ in range(3)) + "]"
+    items = [
+        f"{rng.choice(SURNAMES)}{' et al.' if rng.random() < 0.5 else ''}, {rng.randint(1990, 2024)}"
+        for _ in range(rng.randint(1, 3))
+    ]
+    return "(" + "; ".join(items) + ")"
+
+
+def make_document(n_refs, n_paragraphs, seed=0):
+    """Synthetic review article sections."""
+    rng = random.Random(seed)
+    sections = {}
+    names = ['introduction', 'background', 'mechanisms', 'clinical_evidence', 'discussion']
+
+    for name in names:
+        paragraphs = []
+        for _ in range(n_paragraphs // len(names)):
+            sentences = [
+                f"Contractile signalling in cell type {rng.randint(1, 50)} was shown to depend "
+                f"on pathway {rng.randint(1, 20)} {make_citation(rng, n_refs)}."
+                for _ in range(rng.randint(3, 7))
+            ]
+            paragraphs.append(' '.join(sentences))
+        sections[name] = ParsedSection(name, '\n\n'.join(paragraphs), [])
+
+    return index_sentences(sections, IndexingConfig(splitter='scientific'))
+
+
+def time_call(func, sections, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func(sections)
+    return (time.perf_counter() - start) / repeat, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--references', type=int, default=350)
+    parser.add_argument('--paragraphs', type=int, default=400)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    sections = make_document(args.references, args.paragraphs)
+    n_sentences = sum(len(s.sentences) for s in sections.values())
+    n_chars = sum(len(s.text) for s in sections.values())
+    print(f"Document: {len(sections)} sections, {n_sentences} sentences, {n_chars:,} chars, "
+          f"{args.references} references")
+
+    legacy_time, legacy_refs = time_call(legacy_extract, sections, args.repeat)
+    scan_time, scan_refs = time_call(extract_citations, sections, args.repeat)
+
+    # The legacy extractor misses ranges, lists and author-year groups, so
+    # compare cost per citation key found as well as total time
+    copied = sum(len(ref[3]) for ref in legacy_refs)
+    print(f"\n{'extractor':<12}{'ms':>10}{'citation keys':>16}{'us/key':>10}{'copied chars':>16}")
+    for label, elapsed, refs, chars in [
+        ('legacy', legacy_time, legacy_refs, copied),
+        ('scanner', scan_time, scan_refs, 0),
+    ]:
+        per_key = elapsed * 1e6 / len(refs) if refs else 0.0
+        print(f"{label:<12}{elapsed * 1000:>10.1f}{len(refs):>16}{per_key:>10.2f}{chars:>16,}")
+
+
+if __name__ == '__main__':
+    main()
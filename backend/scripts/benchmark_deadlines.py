@@ -0,0 +1,96 @@
+"""Benchmark parse deadlines on a drawing-heavy PDF.
+
+Generates a PDF whose pages carry a caption and thousands of small vector
+strokes (a plotted figure drawn as individual segments), which makes
+text extraction slow. Parses it with PipelineBuilder without a timeout,
+then with timeouts around and below the full parse time: just above it,
+optional stages are skipped and listed as degraded; below it, the parse
+stops at the first checkpoint past the budget instead of running to the
+end. Also compares a plain text PDF with and without deadlines, since
+extraction runs page by page under a deadline.
+
+Usage:
+    python scripts/benchmark_deadlines.py [--pages N] [--strokes N] [--repeat N]
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+import fitz
+
+from services.parser.pipeline.builder import PipelineBuilder
+from services.parser.pipeline.config import default_config
+from services.parser.pipeline.deadline import DeadlineExceeded
+
+
+def make_pdf(pages, strokes):
+    pdf = fitz.open()
+    for number in range(pages):
+        page = pdf.new_page()
+        y = 72
+        if number == 0:
+            page.insert_text((72, y), "Traction Forces of Contracting Cells", fontsize=16)
+            y += 40
+        while y < 300:
+            page.insert_text((72, y), f"Cells on {number}.{y} kPa gels contracted and traction forces "
+                                      f"were measured.", fontsize=10)
+            y += 14
+        shape = page.new_shape()
+        for i in range(strokes):
+            x, h = 80 + (i * 7) % 440, 320 + (i * 13) % 360
+            shape.draw_line((x, h), (x + 3, h + 2))
+        shape.finish(color=(0, 0, 0), width=0.5)
+        shape.commit()
+        page.insert_text((72, 700), f"Figure {number + 1}. Traction map of contracting cells.", fontsize=9)
+    return pdf.tobytes()
+
+
+def parse(pdf_bytes, config, timeout=None):
+    builder = PipelineBuilder(config, timeout=timeout)
+    start = time.perf_counter()
+    try:
+        doc = builder.build(pdf_bytes, 'paper.pdf')
+        outcome = f"degraded: {', '.join(doc.degraded)}" if doc.degraded else "complete"
+    except DeadlineExceeded as e:
+        outcome = f"stopped ({e.scope} budget) in {e.stage}"
+    return time.perf_counter() - start, outcome, builder.stage_timings
+
+
+def main_():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--pages', type=int, default=10)
+    parser.add_argument('--strokes', type=int, default=3000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    config = default_config()
+    config.indexing.splitter = 'scientific'  # No NLTK data needed
+
+    pdf_bytes = make_pdf(args.pages, args.strokes)
+    full, _, timings = parse(pdf_bytes, config)
+    slowest = sorted(timings.items(), key=lambda item: -item[1])[:3]
+    print(f"{args.pages} pages x {args.strokes} strokes; full parse {full:.2f} s "
+          f"(slowest: {', '.join(f'{stage} {ms / 1000:.2f} s' for stage, ms in slowest)})")
+    print(f"{'timeout s':<12}{'seconds':>9}  outcome")
+    for fraction in (None, 1.2, 0.9, 0.6, 0.3, 0.1):
+        timeout = full * fraction if fraction else None
+        elapsed, outcome, _ = parse(pdf_bytes, config, timeout)
+        label = f"{timeout:.2f}" if timeout else "none"
+        print(f"{label:<12}{elapsed:>9.2f}  {outcome}")
+
+    text_pdf = make_pdf(args.pages, 0)
+    for timeout in (None, 3600):
+        runs = [parse(text_pdf, config, timeout)[0] for _ in range(args.repeat)]
+        print(f"\nText-only PDF, timeout {timeout}: best of {args.repeat} {min(runs) * 1000:.1f} ms", end='')
+    print()
+
+
+if __name__ == '__main__':
+    main_()
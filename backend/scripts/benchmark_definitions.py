@@ -0,0 +1,125 @@
+"""Benchmark notation extraction: whole-document regexes vs. the definition index.
+
+Runs the previous CrossDocIndexer._extract_notation patterns over a synthetic
+document's raw markdown and the one-pass definition index over its
+sentences, and reports time, spans matched and definitions kept. Then times
+"is this term used before it is defined?" for every defined term, answered
+by scanning sentences for the term versus looking it up in the index.
+
+Usage:
+    python scripts/benchmark_definitions.py [--sentences N] [--repeat N]
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from services.indexers.definitions import build_definition_index
+from services.parser.pipeline.models import ParsedDocument
+from services.parser.pipeline.config import IndexingConfig
+from services.parser.pipeline.models import ParsedSection
+from services.parser.pipeline.stages.indexing import index_sentences
+
+LEGACY_PATTERNS = [
+    r'([α-ωΑ-Ω])\s*[=:]\s*([^,\n]+)',
+    r'([A-Z])\s*[=:]\s*(?:the\s+)?([^,\n]+)',
+]
+
+TEMPLATES = [
+    "We used traction force microscopy (TFM) to measure forces in {n} cells.",
+    "TFM maps were computed for each of the {n} cells (N = {n}).",
+    "Stiffness was fit with a Hertz model, where E is the Young's modulus of the gel.",
+    "Figure {n}: A: control cells, B: treated cells, C: rescue.",
+    "The extracellular matrix (ECM) was coated at {n} µg/ml.",
+    "σ denotes the standard deviation across {n} replicates.",
+    "Values are given as mean ± SD with P = 0.0{n} for the comparison.",
+    "Cells were imaged on a confocal microscope for {n} minutes.",
+]
+
+
+def legacy(markdown):
+    """Previous notation extraction: later matches overwrite earlier ones."""
+    notation, spans = {}, 0
+    for pattern in LEGACY_PATTERNS:
+        for match in re.finditer(pattern, markdown):
+            spans += 1
+            definition = match.group(2).strip()
+            if len(definition) < 100:
+                notation[match.group(1)] = definition
+    return notation, spans
+
+
+def scan_used_before_defined(doc, term, definition_sentence_id):
+    """Whether a term occurs in a sentence before its definition, by scanning."""
+    pattern = re.compile(rf'(?<!\w){re.escape(term)}(?!\w)')
+    for section in doc.sections.values():
+        for sentence in section.sentences:
+            if sentence.id == definition_sentence_id:
+                return False
+            if pattern.search(sentence.text):
+                return True
+    return False
+
+
+def make_sections(n_sentences, seed=0):
+    rng = random.Random(seed)
+    sections = {}
+    for name in ['introduction', 'methods', 'results', 'discussion']:
+        text = ' '.join(rng.choice(TEMPLATES).format(n=rng.randint(2, 9)) for _ in range(n_sentences // 4))
+        sections[name] = ParsedSection(name, text)
+    return index_sentences(sections, IndexingConfig(splitter='scientific'))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sentences', type=int, default=4000)
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    sections = make_sections(args.sentences)
+    markdown = '\n\n'.join(section.text for section in sections.values())
+    print(f"Document: {args.sentences} sentences, {len(markdown):,} chars")
+
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        notation, spans = legacy(markdown)
+    legacy_time = (time.perf_counter() - start) / args.repeat
+
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        index = build_definition_index(sections)
+    index_time = (time.perf_counter() - start) / args.repeat
+
+    print(f"\n{'approach':<10}{'ms':>10}{'spans':>8}{'kept':>6}")
+    print(f"{'legacy':<10}{legacy_time * 1000:>10.1f}{spans:>8}{len(notation):>6}")
+    definition_count = sum(len(definitions) for definitions in index.definitions.values())
+    print(f"{'index':<10}{index_time * 1000:>10.1f}{definition_count:>8}{len(index.definitions):>6}")
+
+    doc = ParsedDocument('bench', 'bench', 'Benchmark', sections, [], [], [], [], markdown)
+    terms = {term: index.definition(term).sentence_id for term in index.definitions}
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        scanned = [scan_used_before_defined(doc, term, sentence_id) for term, sentence_id in terms.items()]
+    scan_time = (time.perf_counter() - start) / args.repeat
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        looked_up = [index.used_before_defined(term) for term in terms]
+    lookup_time = (time.perf_counter() - start) / args.repeat
+    assert scanned == looked_up
+    print(f"\nUsed before defined, {len(terms)} terms: scan {scan_time * 1000:.3f} ms, "
+          f"index {lookup_time * 1000:.3f} ms")
+
+    print(f"\nLegacy notation: {notation}")
+    print(f"Index notation: {index.notation_map()}")
+    print(f"Index also has first uses for {len(index.first_use)} terms; "
+          f"used before defined: {[term for term, _, _ in index.early_uses()]}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""Benchmark progress events: publish cost and delivery latency.
+
+Times publishing an event to the in-process log (what each parse stage
+pays for instrumentation), and the delay between a worker thread
+publishing and a waiting /events stream waking up, which is what a
+client would otherwise approximate by polling /status.
+
+Usage:
+    python scripts/benchmark_events.py [--events N] [--repeat N]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from core.events import LocalEventLog, format_sse
+
+
+async def delivery_latency(log, repeat):
+    latencies = []
+    for i in range(repeat):
+        sent = []
+
+        def publish():
+            sent.append(time.perf_counter())
+            log.publish('latency', 'stage_finished', stage='load_pdf', duration_ms=1.0)
+
+        threading.Timer(0.002, publish).start()
+        await log.wait('latency', i, timeout=5)
+        latencies.append((time.perf_counter() - sent[0]) * 1000)
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--events', type=int, default=20000)
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+
+    log = LocalEventLog()
+    start = time.perf_counter()
+    for i in range(args.events):
+        log.publish(f"doc-{i % 50}", 'stage_finished', stage='reflow_text', duration_ms=12.5)
+    publish_us = (time.perf_counter() - start) / args.events * 1e6
+
+    events = log.read('doc-0')
+    start = time.perf_counter()
+    for event in events:
+        format_sse(event)
+    format_us = (time.perf_counter() - start) / len(events) * 1e6
+
+    latencies = asyncio.run(delivery_latency(log, args.repeat))
+    print(f"publish {publish_us:.1f} us/event, SSE formatting {format_us:.1f} us/event")
+    print(f"thread publish -> stream wake: median {statistics.median(latencies):.3f} ms, "
+          f"max {max(latencies):.3f} ms over {args.repeat} events")
+
+
+if __name__ == '__main__':
+    main()
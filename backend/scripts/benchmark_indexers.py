@@ -0,0 +1,85 @@
+"""Benchmark build time and allocations of the citation and figure indexers.
+
+Builds a synthetic document (default 500 references, 1500 citations, 40
+figures, 400 figure references) and reports, per indexer, the mean build
+time and the number and size of allocations made by one build (tracemalloc).
+Run it on two revisions of the tree to compare them.
+
+Usage:
+    python scripts/benchmark_indexers.py [--references N] [--citations N] [--figures N] [--repeat N]
+"""
+
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from services.indexers.citation_indexer import CitationIndexer
+from services.indexers.figure_indexer import FigureIndexer
+from services.parser.pipeline.models import FigureBlock, FigureRef
+
+from benchmark_citation_index import make_document
+
+
+def add_figures(doc, n_figures, n_refs, seed=0):
+    """Attach figures and in-text figure references (a few dangling) to doc."""
+    rng = random.Random(seed)
+    doc.figures = [
+        FigureBlock(id=f"fig-{i}", label=f"Figure {i}",
+                    caption=f"Figure {i}. Traction force maps of cell type {i} under load.", page=i // 4)
+        for i in range(1, n_figures + 1)
+    ]
+    doc.figure_refs = [
+        FigureRef(label=f"Fig. {rng.randint(1, n_figures + 5)}", section='results',
+                  sentence_id=f"results_{i}_x", sentence_text=f"Force rose in condition {i} (Fig. X).")
+        for i in range(n_refs)
+    ]
+    return doc
+
+
+def measure(indexer, doc, repeat):
+    """Mean build time, and allocation count and bytes for a single build."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        indexer.build(doc)
+    elapsed = (time.perf_counter() - start) / repeat
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    index = indexer.build(doc)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    stats = after.compare_to(before, 'filename')
+    blocks = sum(max(stat.count_diff, 0) for stat in stats)
+    size = sum(max(stat.size_diff, 0) for stat in stats)
+    del index
+    return elapsed, blocks, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--references', type=int, default=500)
+    parser.add_argument('--citations', type=int, default=1500)
+    parser.add_argument('--figures', type=int, default=40)
+    parser.add_argument('--figure-refs', type=int, default=400)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    doc = add_figures(make_document(args.references, args.citations), args.figures, args.figure_refs)
+    print(f"Document: {len(doc.bibliography)} references, {len(doc.citations)} citations, "
+          f"{len(doc.figures)} figures, {len(doc.figure_refs)} figure refs")
+
+    print(f"\n{'indexer':<10}{'ms':>10}{'allocations':>14}{'KiB':>10}")
+    for label, indexer in [('citation', CitationIndexer()), ('figure', FigureIndexer())]:
+        elapsed, blocks, size = measure(indexer, doc, args.repeat)
+        print(f"{label:<10}{elapsed * 1000:>10.2f}{blocks:>14,}{size / 1024:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
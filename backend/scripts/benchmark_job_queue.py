@@ -0,0 +1,81 @@
+"""Benchmark the review job queue: submit, claim and progress overhead.
+
+Times the per-job cost the API and workers pay for durable job records
+in a SQLite database with the in-process queue, and runs a pool of
+workers over jobs that sleep for a fixed time to show the concurrency
+cap at work. Redis adds one round trip per queue operation on top.
+
+Usage:
+    python scripts/benchmark_job_queue.py [--jobs N] [--concurrency N]
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from core.jobs import JobQueue, LocalQueue, WorkerPool
+from core.storage import Database, KeyValueStore
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--jobs', type=int, default=500)
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--job-seconds', type=float, default=0.05)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)  # One log line per submitted job
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(f"sqlite:///{tmp}/jobs.db")
+        jobs = JobQueue(LocalQueue(), KeyValueStore(db, 'jobs', cache_size=0))
+
+        start = time.perf_counter()
+        for i in range(args.jobs):
+            jobs.submit(f"doc-{i}", {'changed_only': True}, priority=i % 3)
+        submit_ms = (time.perf_counter() - start) / args.jobs * 1000
+
+        start = time.perf_counter()
+        claimed = [jobs.claim() for _ in range(args.jobs)]
+        claim_ms = (time.perf_counter() - start) / args.jobs * 1000
+
+        start = time.perf_counter()
+        for job in claimed:
+            jobs.update(job, 'statistics', 0.6)
+        update_ms = (time.perf_counter() - start) / args.jobs * 1000
+
+        print(f"{args.jobs} jobs, SQLite records")
+        print(f"  submit {submit_ms:.3f} ms, claim {claim_ms:.3f} ms, progress update {update_ms:.3f} ms per job")
+
+        async def sleep_job(job, progress):
+            progress('running', 0.5)
+            await asyncio.sleep(args.job_seconds)
+
+        async def drain(n):
+            pool = WorkerPool(jobs, sleep_job, args.concurrency, poll_interval=0.001)
+            start = time.perf_counter()
+            pool.start()
+            while len(jobs.queue):
+                await asyncio.sleep(0.001)
+            while any(jobs.get(f"pool-{i}").status != 'completed' for i in range(n)):
+                await asyncio.sleep(0.001)
+            await pool.stop()
+            return time.perf_counter() - start
+
+        n = args.concurrency * 10
+        for i in range(n):
+            jobs.submit(f"pool-{i}", {})
+        elapsed = asyncio.run(drain(n))
+        print(f"  {n} jobs of {args.job_seconds * 1000:.0f} ms with {args.concurrency} workers: {elapsed:.2f} s "
+              f"(ideal {n * args.job_seconds / args.concurrency:.2f} s)")
+        db.close()
+
+
+if __name__ == '__main__':
+    main()
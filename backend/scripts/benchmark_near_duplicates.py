@@ -0,0 +1,80 @@
+"""Benchmark near-duplicate detection: MinHash/LSH vs. comparing every pair.
+
+Builds synthetic sentences with a known share of reworded copies, then times
+exact Jaccard comparison of every sentence pair against the MinHash/LSH
+index (which only verifies candidate pairs), and reports how many of the
+exact pairs LSH recovered.
+
+Usage:
+    python scripts/benchmark_near_duplicates.py [--sentences N] [--duplicates F] [--repeat N]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from services.indexers.near_duplicates import DEFAULT_THRESHOLD, jaccard, near_duplicate_pairs, shingles
+
+WORDS = ['traction', 'force', 'cells', 'stiffness', 'substrate', 'myosin', 'contraction', 'gel',
+         'spreading', 'area', 'adhesion', 'focal', 'integrin', 'actin', 'stress', 'fibers',
+         'measured', 'increased', 'decreased', 'control', 'treated', 'blebbistatin', 'paired', 'test',
+         'nuclear', 'volume', 'migration', 'speed', 'collagen', 'matrix', 'density', 'imaging']
+
+
+def make_items(n_sentences, duplicate_fraction, seed=0):
+    rng = random.Random(seed)
+    items = []
+    for i in range(n_sentences):
+        if items and rng.random() < duplicate_fraction:
+            # Reworded copy of an earlier sentence: one word appended
+            words = rng.choice(items)[1].split() + [rng.choice(WORDS)]
+        else:
+            words = rng.choices(WORDS, k=rng.randint(12, 30))
+        items.append((f"s{i}", ' '.join(words)))
+    return items
+
+
+def pairwise(items, threshold=DEFAULT_THRESHOLD):
+    """Exact Jaccard over every pair of sentences."""
+    ids = [item_id for item_id, _ in items]
+    sets = [shingles(text) for _, text in items]
+    return [
+        (ids[i], ids[j])
+        for i in range(len(sets)) for j in range(i + 1, len(sets))
+        if sets[i] and sets[j] and jaccard(sets[i], sets[j]) >= threshold
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sentences', type=int, default=2000)
+    parser.add_argument('--duplicates', type=float, default=0.05)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    items = make_items(args.sentences, args.duplicates)
+    print(f"Document: {len(items)} sentences")
+
+    start = time.perf_counter()
+    exact = set(pairwise(items))
+    pairwise_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        found = near_duplicate_pairs(items)
+    lsh_time = (time.perf_counter() - start) / args.repeat
+    found = {(first, second) for first, second, _ in found}
+
+    print(f"\n{'approach':<10}{'ms':>10}{'pairs':>8}")
+    print(f"{'pairwise':<10}{pairwise_time * 1000:>10.1f}{len(exact):>8}")
+    print(f"{'lsh':<10}{lsh_time * 1000:>10.1f}{len(found):>8}")
+    print(f"\nRecall {len(found & exact) / max(len(exact), 1):.1%}, false positives {len(found - exact)}")
+
+
+if __name__ == '__main__':
+    main()
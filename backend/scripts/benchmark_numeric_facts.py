@@ -0,0 +1,128 @@
+"""Benchmark numeric fact extraction and consistency checks.
+
+Compares the previous CrossDocIndexer approach (ten regexes per section,
+values without locations, nested-loop N comparison) with the single-pass
+numeric fact table and its vectorized checks, on a synthetic document.
+
+Usage:
+    python scripts/benchmark_numeric_facts.py [--sections N] [--sentences N] [--repeat N]
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from services.indexers.numeric_facts import extract_numeric_facts, check_numeric_consistency
+from services.parser.pipeline.config import IndexingConfig
+from services.parser.pipeline.models import ParsedSection
+from services.parser.pipeline.stages.indexing import index_sentences
+
+LEGACY_N_PATTERNS = [
+    r'[Nn]\s*=\s*(\d+)',
+    r'(\d+)\s+participants?',
+    r'(\d+)\s+subjects?',
+    r'(\d+)\s+patients?',
+    r'sample\s+(?:size|of)\s+(\d+)',
+    r'total\s+of\s+(\d+)',
+    r'recruited\s+(\d+)',
+]
+LEGACY_P_VALUE = r'[pP]\s*[<>=]\s*(0\.\d+)'
+LEGACY_PERCENTAGE = r'(\d+(?:\.\d+)?)\s*%'
+LEGACY_MEAN_SD = r'(\d+(?:\.\d+)?)\s*±\s*(\d+(?:\.\d+)?)'
+
+
+def legacy(sections):
+    """Previous extraction and nested-loop N contradiction search."""
+    ns_by_section = {}
+    key_numbers = {'p_values': [], 'percentages': [], 'means': [], 'sds': []}
+    for name, section in sections.items():
+        ns = set()
+        for pattern in LEGACY_N_PATTERNS:
+            for match in re.finditer(pattern, section.text, re.IGNORECASE):
+                n = int(match.group(1))
+                if 1 <= n <= 100000:
+                    ns.add(n)
+        ns_by_section[name] = list(ns)
+        key_numbers['p_values'] += [float(m.group(1)) for m in re.finditer(LEGACY_P_VALUE, section.text)]
+        key_numbers['percentages'] += [float(m.group(1)) for m in re.finditer(LEGACY_PERCENTAGE, section.text)]
+        for match in re.finditer(LEGACY_MEAN_SD, section.text):
+            key_numbers['means'].append(float(match.group(1)))
+            key_numbers['sds'].append(float(match.group(2)))
+
+    contradictions = []
+    names = list(ns_by_section)
+    for i, sec1 in enumerate(names):
+        for sec2 in names[i + 1:]:
+            ns1, ns2 = set(ns_by_section[sec1]), set(ns_by_section[sec2])
+            if ns1 and ns2 and not ns1 & ns2:
+                for n1 in ns1:
+                    for n2 in ns2:
+                        if abs(n1 - n2) > 2 and (n1 > n2 * 1.5 or n2 > n1 * 1.5):
+                            contradictions.append((sec1, n1, sec2, n2))
+    return contradictions
+
+
+def table(sections):
+    return check_numeric_consistency(extract_numeric_facts(sections))
+
+
+def make_sections(n_sections, n_sentences, seed=0):
+    rng = random.Random(seed)
+    templates = [
+        "We recruited {n} participants (N = {n}).",
+        "Force was {m} ± {s} nN in {n} subjects.",
+        "Responses were {a}%, {b}% and {c}% (p < 0.0{d}).",
+        "Cells spread over {m} ± {s} µm after treatment.",
+        "No numeric content appears in this sentence at all.",
+    ]
+    sections = {}
+    for k in range(n_sections):
+        sentences = [
+            rng.choice(templates).format(
+                n=n, m=round(rng.uniform(1, 50), 1), s=round(rng.uniform(0.5, 60), 1),
+                a=a, b=b, c=100 - a - b + rng.choice([0, 0, 0, 4]), d=rng.randint(1, 5)
+            )
+            for n, a, b in (
+                (rng.choice([20 + 7 * k, 24 * (k % 3 + 1)]), rng.randint(10, 50), rng.randint(10, 40))
+                for _ in range(n_sentences)
+            )
+        ]
+        sections[f"section_{k}"] = ParsedSection(f"section_{k}", ' '.join(sentences))
+    return index_sentences(sections, IndexingConfig(splitter='scientific'))
+
+
+def time_call(func, sections, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func(sections)
+    return (time.perf_counter() - start) / repeat, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sections', type=int, default=40)
+    parser.add_argument('--sentences', type=int, default=200)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    sections = make_sections(args.sections, args.sentences)
+    print(f"Document: {len(sections)} sections, {sum(len(s.text) for s in sections.values()):,} chars")
+
+    legacy_time, contradictions = time_call(legacy, sections, args.repeat)
+    table_time, report = time_call(table, sections, args.repeat)
+
+    print(f"\n{'approach':<10}{'ms':>10}{'N mismatches':>15}")
+    print(f"{'legacy':<10}{legacy_time * 1000:>10.1f}{len(contradictions):>15}")
+    print(f"{'table':<10}{table_time * 1000:>10.1f}{len(report['n_mismatches']):>15}")
+    print(f"\nTable also found {len(report['percentage_sums'])} percentage breakdowns off 100 and "
+          f"{len(report['sd_exceeds_mean'])} SDs larger than their means, with locations")
+
+
+if __name__ == '__main__':
+    main()
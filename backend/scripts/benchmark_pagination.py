@@ -0,0 +1,73 @@
+"""Benchmark loading the visible part of a long document.
+
+Stores the synthetic long document from benchmark_storage.py and times
+what a worker that has not loaded it yet pays to show one screen of the
+viewer: every section's sentences (the only way to get them before
+paging), one page of a section's sentences, and a range of the markdown
+read from the database against one sliced from the loaded document.
+
+Usage:
+    python scripts/benchmark_pagination.py [--sentences N] [--page N] [--chars N] [--repeat N]
+"""
+
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from core.responses import encode_json
+from core.storage import DocumentStore, open_storage
+from scripts.benchmark_storage import make_document, timed
+
+
+def sentence_rows(sentences):
+    return [
+        {"id": s.id, "text": s.text, "char_start": s.char_start, "char_end": s.char_end,
+         "paragraph_index": s.paragraph_index}
+        for s in sentences
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sentences', type=int, default=6000)
+    parser.add_argument('--page', type=int, default=100)
+    parser.add_argument('--chars', type=int, default=20000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    doc = make_document(args.sentences)
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = open_storage(f"sqlite:///{tmp}/bench.db")
+        storage.documents['bench'] = doc
+
+        def fresh():
+            # A worker that has not loaded the document yet
+            return DocumentStore(storage.db, cache_size=0)
+
+        def all_sentences():
+            sections = fresh()['bench'].sections
+            return encode_json({name: sentence_rows(sections[name].sentences) for name in sections})
+
+        def sentence_page():
+            sentences = fresh()['bench'].sections['results'].sentences
+            return encode_json(sentence_rows(sentences[args.page:2 * args.page]))
+
+        start = len(doc.raw_markdown) // 2
+        full_body = all_sentences()
+        print(f"Document: {args.sentences} sentences, {len(doc.raw_markdown):,} chars of markdown")
+        print(f"Bodies: all sentences {len(full_body):,} B, one page {len(sentence_page()):,} B")
+        print(f"\n{'cold read':<44}{'ms':>10}")
+        print(f"{'every section, all sentences':<44}{timed(all_sentences, args.repeat):>10.2f}")
+        print(f"{f'one section, sentences {args.page}-{2 * args.page}':<44}{timed(sentence_page, args.repeat):>10.2f}")
+        print(f"{f'markdown {args.chars:,} chars, document load + slice':<44}"
+              f"{timed(lambda: fresh()['bench'].raw_markdown[start:start + args.chars], args.repeat):>10.2f}")
+        print(f"{f'markdown {args.chars:,} chars, markdown_range':<44}"
+              f"{timed(lambda: fresh().markdown_range('bench', start, start + args.chars), args.repeat):>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+"""Benchmark resolving issue quotes to sentences.
+
+Builds the quote index for a synthetic long document and resolves issue
+quotes taken from random sentences, each altered the way PDF text and
+agent quotes differ (line-break hyphenation, ligatures, collapsed
+whitespace, curly quotes, a changed word). Compares the index with a
+scan of every section for each quote, which is what resolving quotes
+costs without it.
+
+Two documents are generated: the storage benchmark's document, whose
+24-word vocabulary makes every n-gram common (the index's worst case),
+and one with a Zipf-distributed vocabulary of a few thousand words,
+closer to a real paper.
+
+Usage:
+    python scripts/benchmark_quotes.py [--sentences N] [--quotes N] [--scan-quotes N] [--repeat N]
+"""
+
+import argparse
+import difflib
+import logging
+import random
+import string
+import sys
+import time
+from pathlib import Path
+
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from scripts.benchmark_storage import SECTIONS, make_document
+from services.indexers.quote_index import QuoteIndex, normalize
+from services.parser.pipeline.models import ParsedDocument, ParsedSection, Sentence
+
+
+def make_zipf_document(n_sentences, vocabulary=4000, seed=0):
+    rng = random.Random(seed)
+    words = [''.join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 11))) for _ in range(vocabulary)]
+    weights = [1 / rank for rank in range(1, vocabulary + 1)]
+    sections = {}
+    for name in SECTIONS:
+        sentences, parts, offset = [], [], 0
+        for i in range(n_sentences // len(SECTIONS)):
+            text = ' '.join(rng.choices(words, weights, k=rng.randint(10, 30))).capitalize() + '.'
+            sentences.append(Sentence(f"{name}_{i}", name, text, offset, offset + len(text), i // 5))
+            parts.append(text)
+            offset += len(text) + 1
+        sections[name] = ParsedSection(name, ' '.join(parts), sentences)
+    return ParsedDocument('zipf', 'zipf', 'Benchmark', sections, [], [], [], [], '')
+
+
+def make_quotes(doc, n_quotes, seed=1):
+    """(quote, sentence ID) pairs: 40-120 character excerpts with one alteration each."""
+    rng = random.Random(seed)
+    sentences = [s for section in doc.sections.values() for s in section.sentences]
+    quotes = []
+    for _ in range(n_quotes):
+        sentence = rng.choice(sentences)
+        start = rng.randint(0, max(len(sentence.text) - 40, 0))
+        quote = sentence.text[start:start + rng.randint(40, 120)]
+        change = rng.randrange(5)
+        if change == 0 and ' ' in quote:
+            quote = quote.replace(' ', '-\n', 1)
+        elif change == 1:
+            quote = quote.replace('fi', 'ﬁ').replace('fl', 'ﬂ')
+        elif change == 2:
+            quote = f"“{'  '.join(quote.split())}”"
+        elif change == 3:
+            words = quote.split()
+            words[len(words) // 2] = 'xyzzy'
+            quote = ' '.join(words)
+        quotes.append((quote, sentence.id))
+    return quotes
+
+
+def scan(doc, quote):
+    """Best matching sentence by scanning every section's sentences."""
+    query = normalize(quote)[0]
+    best, best_ratio = None, 0.0
+    for section in doc.sections.values():
+        for sentence in section.sentences:
+            text = normalize(sentence.text)[0]
+            if query in text:
+                return sentence.id
+            matcher = difflib.SequenceMatcher(None, query, text, autojunk=False)
+            if matcher.real_quick_ratio() > best_ratio and matcher.quick_ratio() > best_ratio:
+                ratio = matcher.ratio()
+                if ratio > best_ratio:
+                    best, best_ratio = sentence.id, ratio
+    return best
+
+
+def report(label, doc, quotes, scan_quotes, repeat):
+    start = time.perf_counter()
+    index = QuoteIndex(doc)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    resolve_ms = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = index.resolve_many(((quote, None) for quote, _ in quotes), limit=1)
+        resolve_ms = min(resolve_ms, (time.perf_counter() - start) * 1000)
+    found = sum(bool(matches) and sentence_id in matches[0].sentence_ids
+                for matches, (_, sentence_id) in zip(results, quotes))
+
+    start = time.perf_counter()
+    for quote, _ in quotes[:scan_quotes]:
+        scan(doc, quote)
+    scan_ms = (time.perf_counter() - start) * 1000 / scan_quotes * len(quotes)
+
+    print(f"{label}: {len(index)} sentences, {len(index._ngram_keys):,} distinct n-grams")
+    print(f"  build {build_ms:.0f} ms; {len(quotes)} quotes: index {resolve_ms:.1f} ms "
+          f"(best of {repeat}; {found} resolved to the quoted sentence), scan ~{scan_ms:,.0f} ms "
+          f"(extrapolated from {scan_quotes})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sentences', type=int, default=6000)
+    parser.add_argument('--quotes', type=int, default=200)
+    parser.add_argument('--scan-quotes', type=int, default=3)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    for label, doc in (("Zipf vocabulary", make_zipf_document(args.sentences)),
+                       ("24-word vocabulary", make_document(args.sentences))):
+        report(label, doc, make_quotes(doc, args.quotes), args.scan_quotes, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
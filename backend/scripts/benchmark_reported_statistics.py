@@ -0,0 +1,89 @@
+"""Benchmark recomputing reported statistics.
+
+Builds a synthetic results section full of APA-style reports (t, F, χ², r,
+z and means with n), a share of them with wrong p-values, then times
+extraction plus recomputation and reports how many issues were found.
+
+Usage:
+    python scripts/benchmark_reported_statistics.py [--sentences N] [--errors F] [--repeat N]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from services.indexers.reported_statistics import (
+    check_reported_statistics, extract_reported_statistics, p_from_statistic
+)
+from services.parser.pipeline.config import IndexingConfig
+from services.parser.pipeline.models import ParsedSection
+from services.parser.pipeline.stages.indexing import index_sentences
+
+
+def report(rng, error_rate):
+    """One sentence with a test statistic and its (sometimes wrong) p-value."""
+    test = rng.choice(['t', 'F', 'chi2', 'r', 'z'])
+    df1, df2 = rng.randint(1, 4), rng.randint(10, 200)
+    if test == 't':
+        statistic, label = round(rng.uniform(0.5, 4), 2), f"t({df2})"
+        p = p_from_statistic('t', statistic, df2)
+    elif test == 'F':
+        statistic, label = round(rng.uniform(0.5, 10), 2), f"F({df1}, {df2})"
+        p = p_from_statistic('F', statistic, df1, df2)
+    elif test == 'chi2':
+        statistic, label = round(rng.uniform(0.5, 15), 2), f"χ²({df1}, N = {df2})"
+        p = p_from_statistic('chi2', statistic, df1)
+    elif test == 'r':
+        statistic, label = round(rng.uniform(0.05, 0.6), 2), f"r({df2})"
+        p = p_from_statistic('r', statistic, df2)
+    else:
+        statistic, label = round(rng.uniform(0.5, 4), 2), "z"
+        p = p_from_statistic('z', statistic)
+    if rng.random() < error_rate:
+        p = min(p * rng.choice([0.2, 5]), 0.99)
+    p_text = "p < .001" if p < 0.001 else f"p = {p:.3f}"
+    return f"The effect was tested, {label} = {statistic:.2f}, {p_text}."
+
+
+def make_sections(n_sentences, error_rate, seed=0):
+    rng = random.Random(seed)
+    sentences = []
+    for _ in range(n_sentences):
+        if rng.random() < 0.2:
+            n = rng.randint(10, 60)
+            sentences.append(f"Ratings were M = {rng.randint(n, 5 * n) / n + rng.choice([0, 0, 0.004]):.2f} (n = {n}).")
+        else:
+            sentences.append(report(rng, error_rate))
+    sections = {'results': ParsedSection('results', ' '.join(sentences))}
+    return index_sentences(sections, IndexingConfig(splitter='scientific'))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sentences', type=int, default=1000)
+    parser.add_argument('--errors', type=float, default=0.1)
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    sections = make_sections(args.sentences, args.errors)
+    statistics, means = extract_reported_statistics(sections)
+    print(f"Results section: {args.sentences} sentences, {len(statistics)} statistics, {len(means)} means")
+
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        issues = check_reported_statistics(sections)
+    elapsed = (time.perf_counter() - start) / args.repeat
+
+    checked = len(statistics) + len(means)
+    print(f"Check: {elapsed * 1000:.1f} ms ({elapsed / checked * 1e6:.1f} µs per statistic)")
+    print(f"Issues: {sum(i.issue_type == 'p_value_mismatch' for i in issues)} p-value mismatches, "
+          f"{sum(i.issue_type == 'grim_inconsistency' for i in issues)} GRIM failures")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""Benchmark /document responses on a 100-page document payload.
+
+Builds the /document content of the synthetic long document from
+benchmark_storage.py and compares the previous response path (FastAPI's
+jsonable_encoder + JSONResponse) with encode_json(), a ?fields=
+projection, gzip, and a conditional request answered with 304.
+
+Usage:
+    python scripts/benchmark_responses.py [--sentences N] [--repeat N]
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from core.cache import Cache, MemoryBackend
+from core.responses import (
+    compress, encode_json, etag_matches, make_etag, orjson, parse_fields, project
+)
+from scripts.benchmark_storage import make_document, timed
+from services.indexers.document_analysis import analyze_document
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sentences', type=int, default=6000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)  # analyze_document warns about the synthetic document
+
+    doc = make_document(args.sentences)
+    analysis = analyze_document(doc)
+    content = {
+        "document_id": doc.doc_id,
+        "title": doc.title,
+        "raw_markdown": doc.raw_markdown,
+        "sections": analysis.section_stats,
+        "section_validation": analysis.section_validation,
+        "statistics": analysis.statistics
+    }
+    body = encode_json(content)
+    fields = parse_fields('title,sections,statistics.total_figures')
+    projected = encode_json(project(content, fields))
+    gzipped = compress(body, 'gzip')
+    etag = make_etag('document', doc.doc_id, doc.doc_hash, '')
+
+    print(f"Payload: {args.sentences} sentences, {len(body):,} B JSON "
+          f"(encoder: {'orjson' if orjson is not None else 'json'})")
+    print(f"  ?fields=title,sections,statistics.total_figures: {len(projected):,} B")
+    print(f"  gzip: {len(gzipped):,} B ({len(gzipped) / len(body):.0%})")
+    print(f"\n{'response path':<40}{'ms':>10}")
+    print(f"{'jsonable_encoder + JSONResponse (before)':<40}"
+          f"{timed(lambda: JSONResponse(jsonable_encoder(content)).body, args.repeat):>10.2f}")
+    print(f"{'encode_json':<40}{timed(lambda: encode_json(content), args.repeat):>10.2f}")
+    print(f"{'encode_json + gzip':<40}{timed(lambda: compress(encode_json(content), 'gzip'), args.repeat):>10.2f}")
+    cache = Cache(MemoryBackend())
+    cache.set('response:bench', (gzipped, 'gzip'))
+    print(f"{'cached gzip body (cache hit)':<40}{timed(lambda: cache.get('response:bench'), args.repeat):>10.2f}")
+    print(f"{'projection + encode_json':<40}"
+          f"{timed(lambda: encode_json(project(content, fields)), args.repeat):>10.3f}")
+    print(f"{'If-None-Match -> 304':<40}"
+          f"{timed(lambda: etag_matches(etag, make_etag('document', doc.doc_id, doc.doc_hash, '')), args.repeat):>10.4f}")
+
+
+if __name__ == '__main__':
+    main()
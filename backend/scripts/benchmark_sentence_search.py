@@ -0,0 +1,74 @@
+"""Benchmark sentence lookups: BM25 index vs. scanning every sentence.
+
+Builds a synthetic document, then times CrossDocIndexer.find_sentences_by_term
+(lowercases every sentence per call) against SentenceSearchIndex.search for a
+set of queries, and reports the one-off index build time.
+
+Usage:
+    python scripts/benchmark_sentence_search.py [--sentences N] [--repeat N]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from services.indexers.cross_doc_indexer import CrossDocIndexer
+from services.indexers.sentence_search import SentenceSearchIndex
+from services.parser.pipeline.models import ParsedDocument, ParsedSection, Sentence
+
+WORDS = ['traction', 'force', 'cells', 'stiffness', 'substrate', 'myosin', 'contraction', 'gel',
+         'spreading', 'area', 'adhesion', 'focal', 'integrin', 'actin', 'stress', 'fibers',
+         'measured', 'increased', 'decreased', 'control', 'treated', 'blebbistatin', 'paired', 't-test']
+
+QUERIES = ['traction force', 'blebbistatin', 'focal adhesion integrin', 'paired t-test', 'myosin contraction']
+
+
+def make_document(n_sentences, seed=0):
+    rng = random.Random(seed)
+    sections = {}
+    for name in ['introduction', 'methods', 'results', 'discussion']:
+        sentences, offset, parts = [], 0, []
+        for i in range(n_sentences // 4):
+            text = ' '.join(rng.choices(WORDS, k=rng.randint(10, 30))).capitalize() + '.'
+            sentences.append(Sentence(f"{name}_{i}_x", name, text, offset, offset + len(text), 0))
+            parts.append(text)
+            offset += len(text) + 1
+        sections[name] = ParsedSection(name, ' '.join(parts), sentences)
+    return ParsedDocument('bench', 'bench', 'Benchmark', sections, [], [], [], [], '')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sentences', type=int, default=20000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    doc = make_document(args.sentences)
+    print(f"Document: {args.sentences} sentences")
+
+    start = time.perf_counter()
+    index = SentenceSearchIndex(doc)
+    print(f"Index build: {(time.perf_counter() - start) * 1000:.1f} ms, {len(index.postings)} tokens")
+
+    indexer = CrossDocIndexer()
+    print(f"\n{'query':<26}{'scan ms':>10}{'bm25 ms':>10}")
+    for query in QUERIES:
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            indexer.find_sentences_by_term(doc, query)
+        scan_time = (time.perf_counter() - start) / args.repeat
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            index.search(query)
+        search_time = (time.perf_counter() - start) / args.repeat
+        print(f"{query:<26}{scan_time * 1000:>10.2f}{search_time * 1000:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
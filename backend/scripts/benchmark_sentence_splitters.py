@@ -0,0 +1,97 @@
+"""Benchmark sentence splitters on the test corpus sections.
+
+Compares the scientific and simple splitters against NLTK punkt for speed
+and boundary agreement (precision/recall/F1 of sentence end offsets, with
+punkt as the reference). Sections come from the parsed markdown outputs in
+docs/testPDFs/test_outputs.
+
+Usage:
+    python scripts/benchmark_sentence_splitters.py [--repeat N]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from services.parser.pipeline.stages.formatting import split_sections
+from services.parser.pipeline.stages.indexing import SPLITTERS, load_tokenizer, sentence_spans
+
+CORPUS_DIR = backend_dir / "docs" / "testPDFs" / "test_outputs"
+
+
+def load_corpus_sections():
+    """Load section texts from the parsed test corpus."""
+    texts = []
+    for md_path in sorted(CORPUS_DIR.glob("*.pdf.md")):
+        sections = split_sections(md_path.read_text(encoding='utf-8'))
+        texts.extend(section.text for section in sections.values() if section.text.strip())
+    return texts
+
+
+def time_splitter(splitter, texts, repeat):
+    """Return (seconds per pass, spans per text) for a splitter."""
+    spans = [sentence_spans(text, splitter=splitter) for text in texts]  # warm up
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in texts:
+            sentence_spans(text, splitter=splitter)
+    elapsed = (time.perf_counter() - start) / repeat
+
+    return elapsed, spans
+
+
+def boundary_agreement(reference, candidate):
+    """Precision, recall and F1 of sentence end offsets against a reference."""
+    ref_ends = set()
+    cand_ends = set()
+    for i, (ref_spans, cand_spans) in enumerate(zip(reference, candidate)):
+        ref_ends.update((i, end) for _, end in ref_spans)
+        cand_ends.update((i, end) for _, end in cand_spans)
+
+    matched = len(ref_ends & cand_ends)
+    precision = matched / len(cand_ends) if cand_ends else 0.0
+    recall = matched / len(ref_ends) if ref_ends else 0.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return precision, recall, f1
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5, help="Timed passes per splitter")
+    args = parser.parse_args()
+
+    texts = load_corpus_sections()
+    total_chars = sum(len(text) for text in texts)
+    print(f"Corpus: {len(texts)} sections, {total_chars:,} chars from {CORPUS_DIR}")
+
+    splitters = list(SPLITTERS)
+    try:
+        start = time.perf_counter()
+        load_tokenizer()
+        print(f"punkt load time: {(time.perf_counter() - start) * 1000:.1f} ms")
+    except LookupError:
+        print("NLTK punkt data not installed - skipping punkt and agreement scores")
+        splitters.remove('nltk')
+
+    results = {}
+    for splitter in splitters:
+        results[splitter] = time_splitter(splitter, texts, args.repeat)
+
+    print(f"\n{'splitter':<12}{'sentences':>10}{'ms/pass':>10}{'MB/s':>8}{'P':>8}{'R':>8}{'F1':>8}")
+    for splitter, (elapsed, spans) in results.items():
+        count = sum(len(s) for s in spans)
+        throughput = total_chars / elapsed / 1e6 if elapsed else 0.0
+        row = f"{splitter:<12}{count:>10}{elapsed * 1000:>10.1f}{throughput:>8.1f}"
+        if 'nltk' in results:
+            precision, recall, f1 = boundary_agreement(results['nltk'][1], spans)
+            row += f"{precision:>8.3f}{recall:>8.3f}{f1:>8.3f}"
+        print(row)
+
+
+if __name__ == '__main__':
+    main()
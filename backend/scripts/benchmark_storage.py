@@ -0,0 +1,94 @@
+"""Benchmark document storage: size and load times of the SQLite store.
+
+Stores a synthetic long document (about 100 pages) and reports the stored
+size against plain pickle and JSON, then times the reads the API makes:
+an existence check (/status), loading the document header, loading one
+section, and loading every section.
+
+Usage:
+    python scripts/benchmark_storage.py [--sentences N] [--repeat N]
+"""
+
+import argparse
+import json
+import pickle
+import random
+import sys
+import tempfile
+import time
+from dataclasses import asdict
+from pathlib import Path
+
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from core.storage import DocumentStore, open_storage
+from services.parser.pipeline.models import ParsedDocument, ParsedSection, Sentence
+
+WORDS = ['traction', 'force', 'cells', 'stiffness', 'substrate', 'myosin', 'contraction', 'gel',
+         'spreading', 'area', 'adhesion', 'focal', 'integrin', 'actin', 'stress', 'fibers',
+         'measured', 'increased', 'decreased', 'control', 'treated', 'blebbistatin', 'the', 'of']
+SECTIONS = ['abstract', 'introduction', 'methods', 'results', 'discussion', 'references']
+
+
+def make_document(n_sentences, seed=0):
+    rng = random.Random(seed)
+    sections = {}
+    for name in SECTIONS:
+        sentences, parts, offset = [], [], 0
+        for i in range(n_sentences // len(SECTIONS)):
+            text = ' '.join(rng.choices(WORDS, k=rng.randint(10, 30))).capitalize() + '.'
+            sentences.append(Sentence(f"{name}_{i}_{rng.getrandbits(32):08x}", name, text,
+                                      offset, offset + len(text), i // 5))
+            parts.append(text)
+            offset += len(text) + 1
+        sections[name] = ParsedSection(name, ' '.join(parts), sentences)
+    markdown = '\n\n'.join(section.text for section in sections.values())
+    return ParsedDocument('bench', 'bench', 'Benchmark', sections, [], [], [], [], markdown)
+
+
+def timed(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sentences', type=int, default=6000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    doc = make_document(args.sentences)
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = open_storage(f"sqlite:///{tmp}/bench.db")
+        start = time.perf_counter()
+        storage.documents['bench'] = doc
+        write_time = (time.perf_counter() - start) * 1000
+
+        stored = storage.db.execute(
+            "SELECT SUM(LENGTH(section_names) + LENGTH(header)) FROM documents"
+        )[0][0] + storage.db.execute("SELECT SUM(LENGTH(data)) FROM sections")[0][0]
+        print(f"Document: {args.sentences} sentences, {len(doc.raw_markdown):,} chars of markdown")
+        print(f"Size: json {len(json.dumps(asdict(doc))):,} B, "
+              f"pickle {len(pickle.dumps(doc, protocol=pickle.HIGHEST_PROTOCOL)):,} B, stored {stored:,} B")
+        print(f"Write: {write_time:.1f} ms")
+
+        def fresh():
+            # A worker that has not loaded the document yet
+            return DocumentStore(storage.db, cache_size=0)
+
+        print(f"\n{'read':<22}{'ms':>8}")
+        print(f"{'exists (/status)':<22}{timed(lambda: 'bench' in fresh(), args.repeat):>8.3f}")
+        print(f"{'header (title)':<22}{timed(lambda: fresh()['bench'].title, args.repeat):>8.3f}")
+        print(f"{'one section':<22}{timed(lambda: fresh()['bench'].sections['methods'], args.repeat):>8.3f}")
+        print(f"{'all sections':<22}{timed(lambda: dict(fresh()['bench'].sections), args.repeat):>8.3f}")
+        print(f"{'whole pickle':<22}"
+              f"{timed(lambda: pickle.loads(pickle.dumps(doc, protocol=pickle.HIGHEST_PROTOCOL)), args.repeat):>8.3f}"
+              f"  (reference: serialize + deserialize, no I/O)")
+        storage.db.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""Benchmark term matching against growing vocabularies.
+
+Compares the previous per-term substring check (every term tested against
+every sentence) with the Aho–Corasick TermMatcher, for the bundled
+vocabulary padded with synthetic terms up to each requested size.
+
+Usage:
+    python scripts/benchmark_term_index.py [--sizes 250 2000 10000] [--sentences N] [--repeat N]
+"""
+
+import argparse
+import random
+import string
+import sys
+import time
+from pathlib import Path
+
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from services.indexers.term_matcher import TermMatcher, load_default_vocabulary
+
+WORDS = ['cells', 'force', 'were', 'measured', 'using', 'the', 'control', 'group', 'and', 'treatment',
+         'after', 'baseline', 'with', 'a', 'paired', 't-test', 'linear', 'model', 'follow-up', 'ANOVA']
+
+
+def legacy_terms(terms, text):
+    """Previous matching: substring test for every term."""
+    text_lower = text.lower()
+    return {term for term in terms if term.lower() in text_lower}
+
+
+def synthetic_terms(rng, count):
+    """Random two-word pseudo-terms (e.g. ontology entries)."""
+    letters = string.ascii_lowercase
+    return [
+        f"{''.join(rng.choices(letters, k=rng.randint(4, 9)))} {''.join(rng.choices(letters, k=rng.randint(4, 9)))}"
+        for _ in range(count)
+    ]
+
+
+def time_call(func, sentences, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for sentence in sentences:
+            func(sentence)
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[250, 2000, 10000])
+    parser.add_argument('--sentences', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    sentences = [' '.join(rng.choices(WORDS, k=rng.randint(12, 30))) + '.' for _ in range(args.sentences)]
+    base = load_default_vocabulary()
+    print(f"{len(sentences)} sentences, {sum(len(s) for s in sentences):,} chars")
+
+    print(f"\n{'terms':>8}{'build ms':>10}{'substring ms':>14}{'automaton ms':>14}")
+    for size in args.sizes:
+        terms = base + synthetic_terms(rng, max(0, size - len(base)))
+
+        start = time.perf_counter()
+        matcher = TermMatcher(terms)
+        build_time = time.perf_counter() - start
+
+        legacy_time = time_call(lambda text: legacy_terms(terms, text), sentences, args.repeat)
+        automaton_time = time_call(matcher.find_terms, sentences, args.repeat)
+        print(f"{len(terms):>8}{build_time * 1000:>10.1f}{legacy_time * 1000:>14.1f}{automaton_time * 1000:>14.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -3,10 +3,25 @@
 import re
 from typing import Dict, List
 from collections import defaultdict
-from dataclasses import asdict
 from core.models import ParsedDocument, CitationIndex
-from core.models import CitationRef as CitationRefModel
-from core.models import BibliographyEntry as BibliographyEntryModel
+
+
+# Author-year citation keys from the citation extractor:
+# "Smith, 2020", "Smith & Lee, 2020", "Smith et al., 2020a"
+CITATION_KEY_PATTERN = re.compile(
+    r'^(?P<surname>.+?)(?:\s+et\s+al\.?|\s+(?:&|and)\s+.+?)?,?\s*(?P<year>\d{4})(?P<letter>[a-z]?)$'
+)
+
+# First author surname at the start of a bibliography entry: "Smith, J.", "van der Berg A"
+BIB_SURNAME_PATTERN = re.compile(
+    r"^\W*(?P<surname>(?:(?:van|von|de|der|den|da|del|di|le|la)\s+)*[A-ZÀ-ÖØ-Þ](?:[^\W\d_]|['’\-])+)"
+)
+
+# Publication year with optional disambiguation letter: "2020", "2020a"
+BIB_YEAR_PATTERN = re.compile(r'\b((?:19|20)\d{2})([a-z]?)\b')
+
+# Leading number of a bibliography entry: "[12]" or "12."
+BIB_NUMBER_PATTERN = re.compile(r'^\[(\d+)\]|^(\d+)\.')
 
 
 class CitationIndexer:
@@ -14,6 +29,8 @@ class CitationIndexer:
 
     def build(self, doc: ParsedDocument) -> CitationIndex:
         """Build citation index."""
+        self._build_bib_indexes(doc.bibliography)
+
         citation_to_bib = {}
         bib_to_citations = defaultdict(list)
 
@@ -28,75 +45,85 @@ class CitationIndexer:
         unmatched_citations = self._find_unmatched_citations(doc, citation_to_bib)
         unmatched_bib_entries = self._find_unmatched_bib(doc, bib_to_citations)
 
-        # Convert dataclasses to Pydantic models
-        citation_to_bib_models = {}
-        for cit_id, bib in citation_to_bib.items():
-            # Convert dataclass to dict if needed, then to Pydantic model
-            bib_dict = asdict(bib) if hasattr(bib, '__dataclass_fields__') else bib
-            citation_to_bib_models[cit_id] = BibliographyEntryModel(**bib_dict)
-
-        bib_to_citations_models = {}
-        for bib_id, citations in bib_to_citations.items():
-            citations_models = []
-            for cit in citations:
-                cit_dict = asdict(cit) if hasattr(cit, '__dataclass_fields__') else cit
-                citations_models.append(CitationRefModel(**cit_dict))
-            bib_to_citations_models[bib_id] = citations_models
-
-        return CitationIndex(
-            citation_to_bib=citation_to_bib_models,
-            bib_to_citations=bib_to_citations_models,
+        # Entries and refs are the document's own objects; skip re-validation
+        return CitationIndex.model_construct(
+            citation_to_bib=citation_to_bib,
+            bib_to_citations=dict(bib_to_citations),
             unmatched_citations=unmatched_citations,
             unmatched_bib_entries=unmatched_bib_entries
         )
 
+    def _build_bib_indexes(self, bibliography: List):
+        """Index bibliography entries by number and by (surname, year, letter).
+
+        Built once per document so each citation is matched with dictionary
+        lookups instead of scanning the bibliography.
+        """
+        self._by_number = {}
+        self._by_author_year = {}
+        self._by_year = defaultdict(list)  # year -> [(lowercased text, entry)] for loose matching
+
+        for bib in bibliography:
+            self._by_number.setdefault(bib.id, bib)
+            number_match = BIB_NUMBER_PATTERN.match(bib.raw_text)
+            if number_match:
+                self._by_number.setdefault(number_match.group(1) or number_match.group(2), bib)
+
+            year_match = BIB_YEAR_PATTERN.search(bib.raw_text)
+            if not year_match:
+                continue
+            year, letter = year_match.groups()
+            self._by_year[year].append((bib.raw_text.lower(), bib))
+
+            surname_match = BIB_SURNAME_PATTERN.match(bib.raw_text)
+            if surname_match:
+                surname = surname_match.group('surname').lower()
+                self._by_author_year.setdefault((surname, year, letter), bib)
+                # Citations without a letter still match "2020a" entries
+                self._by_author_year.setdefault((surname, year, ''), bib)
+
     def _find_matching_bib(self, citation, bibliography: List):
         """Find the bibliography entry matching a citation."""
         # For numbered citations [1], [2,3], etc.
         if citation.id.isdigit():
-            # Direct match by number
-            for bib in bibliography:
-                if bib.id == citation.id:
-                    return bib
-                # Also check if the bibliography text starts with [n] or n.
-                if (bib.raw_text.startswith(f"[{citation.id}]") or
-                    bib.raw_text.startswith(f"{citation.id}.")):
-                    return bib
+            return self._by_number.get(citation.id)
 
         # For author-year citations (Smith, 2020)
-        else:
-            # Extract author and year from citation
-            author_year_match = re.match(r'([A-Z][a-z]+)(?:\s+et\s+al\.)?,?\s*(\d{4})', citation.id)
-            if author_year_match:
-                author = author_year_match.group(1).lower()
-                year = author_year_match.group(2)
-
-                # Find in bibliography
-                for bib in bibliography:
-                    bib_lower = bib.raw_text.lower()
-                    if author in bib_lower and year in bib.raw_text:
-                        return bib
+        key_match = CITATION_KEY_PATTERN.match(citation.id)
+        if not key_match:
+            return None
+
+        surname = key_match.group('surname').lower()
+        year = key_match.group('year')
+        letter = key_match.group('letter')
+
+        bib = self._by_author_year.get((surname, year, letter))
+        if bib is None and letter:
+            bib = self._by_author_year.get((surname, year, ''))
+        if bib is not None:
+            return bib
+
+        # Fall back to any entry from that year that mentions the surname
+        for text_lower, bib in self._by_year.get(year, []):
+            if surname in text_lower:
+                return bib
 
         return None
 
     def _find_unmatched_citations(self, doc: ParsedDocument, citation_to_bib: Dict) -> List[str]:
         """Find citations that don't have matching bibliography entries."""
-        unmatched = []
-        for citation in doc.citations:
-            if citation.id not in citation_to_bib:
-                # Check if it's already in the list (same citation ID)
-                if citation.id not in unmatched:
-                    unmatched.append(citation.id)
-        return unmatched
+        cited = dict.fromkeys(citation.id for citation in doc.citations)  # Unique, in first-cited order
+        matched = citation_to_bib.keys()
+        return [cit_id for cit_id in cited if cit_id not in matched]
 
     def _find_unmatched_bib(self, doc: ParsedDocument, bib_to_citations: Dict) -> List[str]:
         """Find bibliography entries that are never cited."""
-        unmatched = []
-        for bib in doc.bibliography:
-            if bib.id not in bib_to_citations or not bib_to_citations[bib.id]:
-                # Return first 100 chars of the bibliography entry
-                unmatched.append(bib.raw_text[:100] + "..." if len(bib.raw_text) > 100 else bib.raw_text)
-        return unmatched
+        cited_ids = set(bib_to_citations)
+        return [
+            bib.raw_text[:100] + "..." if len(bib.raw_text) > 100 else bib.raw_text
+            for bib in doc.bibliography
+            if bib.id not in cited_ids
+        ]
 
     def check_citation_consistency(self, index: CitationIndex) -> Dict[str, List[str]]:
         """Check for various citation consistency issues."""
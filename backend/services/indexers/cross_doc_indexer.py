@@ -1,166 +1,92 @@
 """Cross-document indexer for consistency checking."""
 
-import re
-from typing import Dict, List, Set
+from typing import Dict, List, Optional
 from collections import defaultdict
+import numpy as np
 from core.models import ParsedDocument, CrossDocIndex, Sentence
+from .numeric_facts import (
+    KIND_N, KIND_P_VALUE, KIND_MEAN_SD, KIND_PERCENTAGE,
+    extract_numeric_facts, check_numeric_consistency, n_mismatch_pairs
+)
+from .definitions import build_definition_index
+from .near_duplicates import DEFAULT_THRESHOLD, find_near_duplicates
+from .term_matcher import TermMatcher, default_matcher
+
+# Conventional meanings assumed when a document does not define these symbols
+DEFAULT_NOTATION = {'α': 'significance level', 'N': 'sample size', 'p': 'p-value'}
 
 
 class CrossDocIndexer:
     """Builds CrossDocIndex from ParsedDocument."""
 
-    N_PATTERNS = [
-        r'[Nn]\s*=\s*(\d+)',
-        r'(\d+)\s+participants?',
-        r'(\d+)\s+subjects?',
-        r'(\d+)\s+patients?',
-        r'sample\s+(?:size|of)\s+(\d+)',
-        r'total\s+of\s+(\d+)',
-        r'recruited\s+(\d+)',
-    ]
+    def __init__(
+        self,
+        term_matcher: Optional[TermMatcher] = None,
+        duplicate_threshold: float = DEFAULT_THRESHOLD
+    ):
+        """Create an indexer.
 
-    P_VALUE_PATTERN = r'[pP]\s*[<>=]\s*(0\.\d+)'
-    PERCENTAGE_PATTERN = r'(\d+(?:\.\d+)?)\s*%'
-    MEAN_SD_PATTERN = r'(\d+(?:\.\d+)?)\s*±\s*(\d+(?:\.\d+)?)'
+        Args:
+            term_matcher: Term automaton; defaults to the shared vocabulary automaton
+            duplicate_threshold: Shingle similarity at which text counts as repeated
+        """
+        self.term_matcher = term_matcher or default_matcher()
+        self.duplicate_threshold = duplicate_threshold
 
     def build(self, doc: ParsedDocument) -> CrossDocIndex:
         """Build cross-document index."""
-        ns_by_section = {}
-        key_numbers = defaultdict(list)
         term_to_sentence_ids = defaultdict(list)
-        notation_map = {}
+        term_positions = defaultdict(list)
+
+        # Numeric facts: one scan per section into a columnar table
+        facts = extract_numeric_facts(doc.sections)
+        ns_by_section = {
+            name: [int(n) for n in np.unique(facts.values(KIND_N, name))]
+            for name in doc.sections
+        }
+        mean_sd = facts.kind == KIND_MEAN_SD
+        key_numbers = {
+            "p_values": facts.values(KIND_P_VALUE).tolist(),
+            "percentages": facts.values(KIND_PERCENTAGE).tolist(),
+            "means": facts.value[mean_sd].tolist(),
+            "sds": facts.spread[mean_sd].tolist(),
+        }
 
-        # Process each section
         for section_name, section in doc.sections.items():
-            # Extract N values
-            ns_by_section[section_name] = self._extract_ns(section.text)
-
-            # Extract key numbers
-            for p_val in self._extract_p_values(section.text):
-                key_numbers["p_values"].append(p_val)
-
-            for pct in self._extract_percentages(section.text):
-                key_numbers["percentages"].append(pct)
-
-            for mean, sd in self._extract_means_sds(section.text):
-                key_numbers["means"].append(mean)
-                key_numbers["sds"].append(sd)
-
-            # Build term index
+            # Build term index: one automaton pass per sentence
             for sentence in section.sentences:
-                terms = self._extract_key_terms(sentence.text)
-                for term in terms:
-                    term_to_sentence_ids[term.lower()].append(sentence.id)
-
-        # Extract notation (simplified for now)
-        notation_map = self._extract_notation(doc.raw_markdown)
+                for term, start, end in self.term_matcher.finditer(sentence.text):
+                    postings = term_to_sentence_ids[term]
+                    if not postings or postings[-1] != sentence.id:
+                        postings.append(sentence.id)
+                    term_positions[term].append(
+                        (sentence.id, sentence.char_start + start, sentence.char_start + end)
+                    )
+
+        # Repeated sentences and paragraphs (MinHash + LSH)
+        duplicate_sentences, duplicate_paragraphs = find_near_duplicates(doc.sections, self.duplicate_threshold)
+
+        # Acronym and symbol definitions with first uses, one scan per sentence
+        definitions = build_definition_index(doc.sections)
+        notation_map = definitions.notation_map()
+        for symbol, meaning in DEFAULT_NOTATION.items():
+            notation_map.setdefault(symbol, meaning)
 
         return CrossDocIndex(
             ns_by_section=ns_by_section,
-            key_numbers=dict(key_numbers),
+            key_numbers={kind: values for kind, values in key_numbers.items() if values},
             term_to_sentence_ids=dict(term_to_sentence_ids),
-            notation_map=notation_map
+            term_positions=dict(term_positions),
+            numeric_facts=facts,
+            near_duplicate_sentences=duplicate_sentences,
+            near_duplicate_paragraphs=duplicate_paragraphs,
+            notation_map=notation_map,
+            definitions=definitions
         )
 
-    def _extract_ns(self, text: str) -> List[int]:
-        """Extract sample sizes from text."""
-        ns = []
-        for pattern in self.N_PATTERNS:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                try:
-                    n = int(match.group(1))
-                    if 1 <= n <= 100000:  # Reasonable range
-                        ns.append(n)
-                except (ValueError, IndexError):
-                    pass
-        return list(set(ns))  # Remove duplicates
-
-    def _extract_p_values(self, text: str) -> List[float]:
-        """Extract p-values from text."""
-        p_values = []
-        matches = re.finditer(self.P_VALUE_PATTERN, text)
-        for match in matches:
-            try:
-                p = float(match.group(1))
-                if 0 <= p <= 1:
-                    p_values.append(p)
-            except (ValueError, IndexError):
-                pass
-        return p_values
-
-    def _extract_percentages(self, text: str) -> List[float]:
-        """Extract percentages from text."""
-        percentages = []
-        matches = re.finditer(self.PERCENTAGE_PATTERN, text)
-        for match in matches:
-            try:
-                pct = float(match.group(1))
-                if 0 <= pct <= 100:
-                    percentages.append(pct)
-            except (ValueError, IndexError):
-                pass
-        return percentages
-
-    def _extract_means_sds(self, text: str) -> List[tuple]:
-        """Extract mean ± SD values."""
-        results = []
-        matches = re.finditer(self.MEAN_SD_PATTERN, text)
-        for match in matches:
-            try:
-                mean = float(match.group(1))
-                sd = float(match.group(2))
-                results.append((mean, sd))
-            except (ValueError, IndexError):
-                pass
-        return results
-
-    def _extract_key_terms(self, text: str) -> Set[str]:
-        """Extract important terms from sentence."""
-        # Statistical terms
-        stat_terms = {'ANOVA', 'regression', 't-test', 'chi-square', 'Mann-Whitney',
-                      'Wilcoxon', 'Kruskal-Wallis', 'correlation', 'linear model'}
-
-        # Medical/scientific terms (can be expanded)
-        sci_terms = {'treatment', 'control', 'placebo', 'intervention', 'outcome',
-                     'baseline', 'follow-up', 'primary', 'secondary', 'endpoint'}
-
-        found_terms = set()
-        text_lower = text.lower()
-
-        for term in stat_terms | sci_terms:
-            if term.lower() in text_lower:
-                found_terms.add(term)
-
-        return found_terms
-
-    def _extract_notation(self, markdown: str) -> Dict[str, str]:
-        """Extract mathematical notation definitions."""
-        notation = {}
-
-        # Look for patterns like "α = 0.05" or "N = sample size"
-        patterns = [
-            r'([α-ωΑ-Ω])\s*[=:]\s*([^,\n]+)',  # Greek letters
-            r'([A-Z])\s*[=:]\s*(?:the\s+)?([^,\n]+)',  # Capital letters
-        ]
-
-        for pattern in patterns:
-            matches = re.finditer(pattern, markdown)
-            for match in matches:
-                symbol = match.group(1)
-                definition = match.group(2).strip()
-                if len(definition) < 100:  # Reasonable length
-                    notation[symbol] = definition
-
-        # Add common defaults
-        if 'α' not in notation:
-            notation['α'] = 'significance level'
-        if 'N' not in notation:
-            notation['N'] = 'sample size'
-        if 'p' not in notation:
-            notation['p'] = 'p-value'
-
-        return notation
+    def _extract_key_terms(self, text: str) -> List[str]:
+        """Extract vocabulary terms from a sentence (lowercased, in order of appearance)."""
+        return self.term_matcher.find_terms(text)
 
     def find_sentences_by_term(self, doc: ParsedDocument, term: str) -> List[Sentence]:
         """Helper to find all sentences containing a term."""
@@ -175,25 +101,28 @@ class CrossDocIndexer:
         return sentences
 
     def find_n_contradictions(self, index: CrossDocIndex) -> List[tuple]:
-        """Find contradictory N values across sections."""
-        contradictions = []
-
-        sections = list(index.ns_by_section.keys())
-        for i, sec1 in enumerate(sections):
-            for sec2 in sections[i+1:]:
-                ns1 = set(index.ns_by_section[sec1])
-                ns2 = set(index.ns_by_section[sec2])
-
-                # If sections have N values and they don't match
-                if ns1 and ns2 and not ns1.intersection(ns2):
-                    # Check if values are close (might be subsample)
-                    for n1 in ns1:
-                        for n2 in ns2:
-                            if abs(n1 - n2) <= 2:  # Allow small differences
-                                continue
-                            elif n1 > n2 * 1.5 or n2 > n1 * 1.5:  # Significant difference
-                                contradictions.append((
-                                    sec1, n1, sec2, n2
-                                ))
-
-        return contradictions
\ No newline at end of file
+        """Find contradictory N values across sections.
+
+        Returns:
+            List of (section1, n1, section2, n2) tuples
+        """
+        sections = list(index.ns_by_section)
+        codes = [code for code, name in enumerate(sections) for _ in index.ns_by_section[name]]
+        values = [n for name in sections for n in index.ns_by_section[name]]
+        section_codes = np.array(codes, dtype=np.intp)
+        ns = np.array(values, dtype=np.float64)
+
+        return [
+            (sections[section_codes[i]], values[i], sections[section_codes[j]], values[j])
+            for i, j in n_mismatch_pairs(section_codes, ns)
+        ]
+
+    def check_numeric_consistency(self, index: CrossDocIndex) -> Dict[str, List[dict]]:
+        """Check sample sizes, percentage breakdowns and mean ± SD values.
+
+        Returns:
+            Findings keyed by "n_mismatches", "percentage_sums" and "sd_exceeds_mean"
+        """
+        if index.numeric_facts is None:
+            return {"n_mismatches": [], "percentage_sums": [], "sd_exceeds_mean": []}
+        return check_numeric_consistency(index.numeric_facts)
@@ -0,0 +1,246 @@
+"""Acronym and notation definition index.
+
+One scan per sentence, in document order, records where each acronym
+("traction force microscopy (TFM)") and symbol ("where E is the Young's
+modulus", "N = number of cells") is first defined and where each acronym
+or symbol is first used. "Used before defined" and "used but never
+defined" questions then become dictionary lookups instead of an LLM pass.
+"""
+
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from services.parser.pipeline.models import ParsedSection
+
+logger = logging.getLogger(__name__)
+
+# Definition kinds
+KIND_ACRONYM = 'acronym'
+KIND_SYMBOL = 'symbol'
+
+# Sections not scanned (reference titles define nothing in the manuscript)
+SKIP_SECTIONS = {'references', 'bibliography'}
+
+# One-letter words that are not symbols when used
+ONE_LETTER_WORDS = {'a', 'A', 'I'}
+
+# Longest acronym and symbol definition accepted
+MAX_ACRONYM_LENGTH = 10
+MAX_DEFINITION_CHARS = 80
+
+_SYMBOL = r'[α-ωΑ-ΩA-Z](?:_\w+|\d)?'
+_DEFINITION = r'(?:the\s+|an?\s+)?(?P<{name}>[A-Za-z][A-Za-z\'’\-]*(?:[ \t]+[A-Za-z][A-Za-z\'’\-]*)*)'
+
+# One alternation per sentence: definitions first, then uses. Every branch
+# starts with a literal or a character set so the regex engine can skip
+# ahead to candidate positions; word-boundary checks are done on matches.
+DEFINITION_SCANNER = re.compile(
+    # "long form (LF)"
+    r'\((?P<acronym>[^\s()]{2,' + str(MAX_ACRONYM_LENGTH) + r'})\)'
+    # "where E is the Young's modulus", "where k is a constant"
+    r'|where\s+(?P<where_symbol>[α-ωΑ-ΩA-Za-z](?:_\w+|\d)?)\s+is\s+' +
+    _DEFINITION.format(name='where_definition') +
+    # "N = number of cells", "σ denotes the standard deviation"
+    r'|(?P<symbol>' + _SYMBOL + r')(?!\w)\s*'
+    r'(?:=|:=|\bdenotes\b|\brepresents\b|\bstands\s+for\b|\bis\s+defined\s+as\b)\s*' +
+    _DEFINITION.format(name='definition') +
+    # Uses: capitalised tokens (acronyms are kept) and Greek letters
+    r'|(?P<token>[A-Zα-ωΑ-Ω]\w*)'
+)
+
+
+@dataclass
+class Definition:
+    """Where an acronym or symbol is defined."""
+    term: str                   # "TFM", "E"
+    kind: str                   # KIND_ACRONYM or KIND_SYMBOL
+    expansion: str              # "traction force microscopy", "Young's modulus"
+    sentence_id: str
+    position: int               # Sentence position in document order
+    char_start: int             # Offsets of the definition in section text
+    char_end: int
+
+
+@dataclass
+class DefinitionIndex:
+    """First definitions and first uses of acronyms and symbols."""
+    definitions: Dict[str, List[Definition]] = field(default_factory=dict)  # term -> definitions in order
+    first_use: Dict[str, Tuple[str, int]] = field(default_factory=dict)     # term -> (sentence_id, position)
+
+    def definition(self, term: str) -> Optional[Definition]:
+        """First definition of a term, if any."""
+        definitions = self.definitions.get(term)
+        return definitions[0] if definitions else None
+
+    def first_use_sentence(self, term: str) -> Optional[str]:
+        """ID of the first sentence using a term, if any."""
+        use = self.first_use.get(term)
+        return use[0] if use else None
+
+    def used_before_defined(self, term: str) -> bool:
+        """Whether a term appears in a sentence before the one defining it."""
+        definition = self.definition(term)
+        use = self.first_use.get(term)
+        return definition is not None and use is not None and use[1] < definition.position
+
+    def early_uses(self) -> List[Tuple[str, str, str]]:
+        """Terms used before their definition.
+
+        Returns:
+            (term, first use sentence ID, definition sentence ID) tuples in order of first use
+        """
+        return sorted(
+            (
+                (term, self.first_use[term][0], definitions[0].sentence_id)
+                for term, definitions in self.definitions.items()
+                if self.used_before_defined(term)
+            ),
+            key=lambda entry: self.first_use[entry[0]][1]
+        )
+
+    def undefined_acronyms(self) -> List[str]:
+        """Acronym-like terms that are used but never defined, in order of first use."""
+        return [
+            term for term, _ in sorted(self.first_use.items(), key=lambda item: item[1][1])
+            if term not in self.definitions and _is_acronym(term)
+        ]
+
+    def conflicting_definitions(self) -> Dict[str, List[Definition]]:
+        """Terms defined more than once with different expansions."""
+        return {
+            term: definitions for term, definitions in self.definitions.items()
+            if len({d.expansion.lower() for d in definitions}) > 1
+        }
+
+    def notation_map(self) -> Dict[str, str]:
+        """Term -> expansion of its first definition."""
+        return {term: definitions[0].expansion for term, definitions in self.definitions.items()}
+
+
+def _is_acronym(token: str) -> bool:
+    """Whether a token has at least two capitals (or a capital and a digit)."""
+    return sum(c.isupper() or c.isdigit() for c in token) >= 2 and any(c.isupper() for c in token)
+
+
+def _is_symbol(token: str) -> bool:
+    """Whether a token is a letter with a subscript ("E_0", "R2")."""
+    return len(token) > 1 and ('_' in token[1:2] or token[1:].isdigit())
+
+
+def _acronym_key(token: str) -> str:
+    """Acronym without a plural 's' ("ROIs" -> "ROI")."""
+    if len(token) > 2 and token.endswith('s') and token[-2].isupper():
+        return token[:-1]
+    return token
+
+
+def _trim_definition(text: str) -> str:
+    """Cut a symbol definition to a reasonable length at a word boundary."""
+    if len(text) <= MAX_DEFINITION_CHARS:
+        return text
+    return text[:MAX_DEFINITION_CHARS].rsplit(' ', 1)[0]
+
+
+def find_long_form(acronym: str, preceding: str) -> Optional[str]:
+    """Find the long form of an acronym in the text before it.
+
+    Schwartz–Hearst matching: each letter or digit of the acronym, from the
+    last, is matched right to left in the preceding words, and the first
+    character must start a word.
+
+    Args:
+        acronym: Short form without parentheses
+        preceding: Sentence text before the opening parenthesis
+
+    Returns:
+        Long form, or None if the acronym's characters cannot be matched
+    """
+    words = preceding.split()
+    # Search window from Schwartz & Hearst (2003)
+    window = ' '.join(words[-min(len(acronym) + 5, len(acronym) * 2):])
+    short_index, long_index = len(acronym) - 1, len(window) - 1
+
+    while short_index >= 0:
+        char = acronym[short_index].lower()
+        if not char.isalnum():
+            short_index -= 1
+            continue
+        while (
+            (long_index >= 0 and window[long_index].lower() != char)
+            or (short_index == 0 and long_index > 0 and window[long_index - 1].isalnum())
+        ):
+            long_index -= 1
+        if long_index < 0:
+            return None
+        long_index -= 1
+        short_index -= 1
+
+    long_form = window[window.rfind(' ', 0, long_index + 1) + 1:].strip(' ,;:')
+    if len(long_form) <= len(acronym) or acronym in long_form.split():
+        return None
+    return long_form
+
+
+def build_definition_index(sections: Dict[str, ParsedSection]) -> DefinitionIndex:
+    """Scan sentences in document order for definitions and first uses.
+
+    Args:
+        sections: Indexed sections, in document order
+
+    Returns:
+        DefinitionIndex
+    """
+    index = DefinitionIndex()
+    definitions = index.definitions
+    first_use = index.first_use
+    position = 0
+
+    for name, section in sections.items():
+        if name in SKIP_SECTIONS:
+            continue
+        for sentence in section.sentences:
+            text = sentence.text
+            for match in DEFINITION_SCANNER.finditer(text):
+                start = match.start()
+                if start and (text[start - 1].isalnum() or text[start - 1] in '_-'):
+                    continue  # Inside a word ("mRNA", "nowhere")
+                kind = match.lastgroup
+
+                if kind == 'token':
+                    token = match.group('token')
+                    if len(token) > 1 and token[1:].islower():
+                        continue  # Ordinary capitalised word
+                    if len(token) == 1 or _is_symbol(token):
+                        if token not in ONE_LETTER_WORDS and text[match.end():match.end() + 1] != '-':
+                            first_use.setdefault(token, (sentence.id, position))
+                    elif _is_acronym(token):
+                        first_use.setdefault(_acronym_key(token), (sentence.id, position))
+                    continue
+
+                if kind == 'acronym':
+                    acronym = match.group('acronym')
+                    if not _is_acronym(acronym):
+                        continue
+                    term = _acronym_key(acronym)
+                    first_use.setdefault(term, (sentence.id, position))
+                    expansion = find_long_form(acronym, text[:start])
+                    if expansion is None:
+                        continue
+                    definition = Definition(term, KIND_ACRONYM, expansion, sentence.id, position,
+                                            sentence.char_start + text.rfind(expansion, 0, start),
+                                            sentence.char_start + match.end())
+                else:
+                    symbol_group = 'symbol' if kind == 'definition' else 'where_symbol'
+                    term = match.group(symbol_group)
+                    first_use.setdefault(term, (sentence.id, position))
+                    definition = Definition(term, KIND_SYMBOL, _trim_definition(match.group(kind)), sentence.id,
+                                            position, sentence.char_start + match.start(symbol_group),
+                                            sentence.char_start + match.end(kind))
+
+                definitions.setdefault(definition.term, []).append(definition)
+            position += 1
+
+    logger.debug(f"Definition index: {len(definitions)} terms defined, {len(first_use)} terms used")
+    return index
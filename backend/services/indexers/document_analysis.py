@@ -0,0 +1,134 @@
+"""Per-document analysis computed once when a parse finishes.
+
+Bundles the cross-document, citation and figure indexes, the sentence
+search index and the quote index with section validation and per-section
+statistics, so API handlers and agents read precomputed results instead
+of rebuilding indexes on every request.
+"""
+
+import logging
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, List
+
+from core.models import ParsedDocument, CrossDocIndex, CitationIndex, FigureIndex, Issue
+from services.parser.pipeline.stages.formatting import validate_required_sections
+from .cross_doc_indexer import CrossDocIndexer
+from .citation_indexer import CitationIndexer
+from .figure_indexer import FigureIndexer
+from .reported_statistics import check_reported_statistics
+from .quote_index import QuoteIndex
+from .sentence_search import SentenceSearchIndex
+
+logger = logging.getLogger(__name__)
+
+# Length of the section text preview returned by GET /document/{id}
+PREVIEW_CHARS = 500
+
+
+@dataclass
+class DocumentAnalysis:
+    """Indexes and statistics for one parsed document."""
+    doc: ParsedDocument             # The analysed document (reattached with bind() after loading)
+    cross: CrossDocIndex
+    citations: CitationIndex
+    figures: FigureIndex
+    search: SentenceSearchIndex
+    quotes: QuoteIndex              # Resolves issue quotes to sentences
+    section_validation: Dict[str, bool]
+    section_stats: Dict[str, Dict[str, Any]] = field(default_factory=dict)  # name -> preview and counts
+    statistics: Dict[str, Any] = field(default_factory=dict)  # Document-level counts and findings
+    numeric_consistency: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)  # Numeric fact checks
+    statistic_issues: List[Issue] = field(default_factory=list)  # Recomputed p-value and GRIM mismatches
+    has_authors: bool = False       # Author detection result the section validation used
+    doc_id: str = ''                # Document the analysis was computed for
+    doc_hash: str = ''
+
+    def is_current(self, doc: ParsedDocument) -> bool:
+        """Whether this analysis was computed for this document (by ID and content hash).
+
+        Documents are reloaded from storage as new objects, so identity
+        cannot be used.
+        """
+        return self.doc_id == doc.doc_id and self.doc_hash == doc.doc_hash
+
+    def __getstate__(self):
+        # Stored next to its document; the loader reattaches it with bind()
+        return {**self.__dict__, 'doc': None}
+
+    def bind(self, doc: ParsedDocument) -> 'DocumentAnalysis':
+        """Attach the loaded document object this analysis was computed for."""
+        if self.is_current(doc):
+            self.doc = doc
+        return self
+
+    def for_copy(self, doc: ParsedDocument) -> 'DocumentAnalysis':
+        """This analysis for a copy of its document stored under another ID (parse cache hits)."""
+        return replace(self, doc=doc, doc_id=doc.doc_id, doc_hash=doc.doc_hash)
+
+
+def section_statistics(doc: ParsedDocument) -> Dict[str, Dict[str, Any]]:
+    """Text preview, sentence count and word count for each section."""
+    return {
+        name: {
+            "text": section.text[:PREVIEW_CHARS] + "..." if len(section.text) > PREVIEW_CHARS else section.text,
+            "sentence_count": len(section.sentences),
+            "word_count": len(section.text.split())
+        }
+        for name, section in doc.sections.items()
+    }
+
+
+def analyze_document(doc: ParsedDocument, has_authors: bool = False) -> DocumentAnalysis:
+    """Build all indexes and statistics for a document.
+
+    Args:
+        doc: Parsed document
+        has_authors: Whether author detection found any authors
+
+    Returns:
+        DocumentAnalysis for doc
+    """
+    cross_indexer = CrossDocIndexer()
+    cross_index = cross_indexer.build(doc)
+    citation_index = CitationIndexer().build(doc)
+    figure_index = FigureIndexer().build(doc)
+
+    section_validation = validate_required_sections(
+        doc.sections,
+        title=doc.title,
+        has_authors=has_authors
+    )
+
+    statistics = {
+        "total_citations": len(doc.citations),
+        "total_bibliography": len(doc.bibliography),
+        "total_figures": len(doc.figures),
+        "figure_references": len(doc.figure_refs),
+        "sample_sizes": cross_index.ns_by_section,
+        "unmatched_citations": citation_index.unmatched_citations,
+        "orphaned_figures": [f.label for f in figure_index.orphaned_figures],
+        "dangling_figure_refs": [r.label for r in figure_index.dangling_refs],
+        "near_duplicate_sentences": len(cross_index.near_duplicate_sentences),
+        "near_duplicate_paragraphs": len(cross_index.near_duplicate_paragraphs),
+        "used_before_defined": [term for term, _, _ in cross_index.definitions.early_uses()],
+        "undefined_acronyms": cross_index.definitions.undefined_acronyms()
+    }
+
+    logger.info(f"Analyzed document {doc.doc_id}: {len(doc.sections)} sections")
+
+    return DocumentAnalysis(
+        doc=doc,
+        cross=cross_index,
+        citations=citation_index,
+        figures=figure_index,
+        search=SentenceSearchIndex(doc),
+        quotes=QuoteIndex(doc),
+        section_validation=section_validation,
+        section_stats=section_statistics(doc),
+        statistics=statistics,
+        numeric_consistency=cross_indexer.check_numeric_consistency(cross_index),
+        statistic_issues=check_reported_statistics(doc.sections),
+        has_authors=has_authors,
+        doc_id=doc.doc_id,
+        doc_hash=doc.doc_hash
+    )
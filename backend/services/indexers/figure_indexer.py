@@ -3,10 +3,7 @@
 import re
 from typing import Dict, List
 from collections import defaultdict
-from dataclasses import asdict
 from core.models import ParsedDocument, FigureIndex
-from core.models import FigureBlock as FigureBlockModel
-from core.models import FigureRef as FigureRefModel
 
 
 class FigureIndexer:
@@ -17,16 +14,13 @@ class FigureIndexer:
         label_to_figure = {self._normalize(f.label): f for f in doc.figures}
         label_to_refs = defaultdict(list)
 
+        # Find dangling refs (ref to figure that doesn't exist), one per label
+        dangling = {}
         for ref in doc.figure_refs:
             normalized_label = self._normalize(ref.label)
             label_to_refs[normalized_label].append(ref)
-
-        # Find dangling refs (ref to figure that doesn't exist)
-        dangling = []
-        for ref in doc.figure_refs:
-            if self._normalize(ref.label) not in label_to_figure:
-                if not any(d.label == ref.label for d in dangling):  # Avoid duplicates
-                    dangling.append(ref)
+            if normalized_label not in label_to_figure:
+                dangling.setdefault(ref.label, ref)
 
         # Find orphaned figures (figure never referenced)
         orphaned = []
@@ -34,36 +28,12 @@ class FigureIndexer:
             if self._normalize(fig.label) not in label_to_refs:
                 orphaned.append(fig)
 
-        # Convert dataclasses to Pydantic models
-        label_to_figure_models = {}
-        for label, fig in label_to_figure.items():
-            fig_dict = asdict(fig) if hasattr(fig, '__dataclass_fields__') else fig
-            label_to_figure_models[label] = FigureBlockModel(**fig_dict)
-
-        label_to_refs_models = {}
-        for label, refs in label_to_refs.items():
-            refs_models = []
-            for ref in refs:
-                ref_dict = asdict(ref) if hasattr(ref, '__dataclass_fields__') else ref
-                refs_models.append(FigureRefModel(**ref_dict))
-            label_to_refs_models[label] = refs_models
-
-        # Convert dangling and orphaned
-        dangling_models = []
-        for ref in dangling:
-            ref_dict = asdict(ref) if hasattr(ref, '__dataclass_fields__') else ref
-            dangling_models.append(FigureRefModel(**ref_dict))
-
-        orphaned_models = []
-        for fig in orphaned:
-            fig_dict = asdict(fig) if hasattr(fig, '__dataclass_fields__') else fig
-            orphaned_models.append(FigureBlockModel(**fig_dict))
-
-        return FigureIndex(
-            label_to_figure=label_to_figure_models,
-            label_to_refs=label_to_refs_models,
-            dangling_refs=dangling_models,
-            orphaned_figures=orphaned_models
+        # Figures and refs are the document's own objects; skip re-validation
+        return FigureIndex.model_construct(
+            label_to_figure=label_to_figure,
+            label_to_refs=dict(label_to_refs),
+            dangling_refs=list(dangling.values()),
+            orphaned_figures=orphaned
         )
 
     def _normalize(self, label: str) -> str:
@@ -0,0 +1,212 @@
+"""Near-duplicate sentence and paragraph detection with MinHash and LSH.
+
+Each text is reduced to a set of word shingles (consecutive word triples),
+summarised by a MinHash signature, and the signatures are split into bands
+for locality-sensitive hashing. Only texts that share a band bucket are
+compared, so finding repeated text (abstract sentences reused in the
+discussion, copy-paste between methods subsections) takes roughly linear
+time instead of comparing every pair.
+"""
+
+import logging
+import re
+import zlib
+from collections import defaultdict
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from services.parser.pipeline.models import ParsedSection
+
+logger = logging.getLogger(__name__)
+
+# Words per shingle
+SHINGLE_SIZE = 3
+# Texts with fewer words are too short to call duplicates
+MIN_WORDS = 6
+# MinHash signature length
+NUM_PERMUTATIONS = 128
+# Jaccard similarity of shingle sets at or above which texts are near-duplicates
+DEFAULT_THRESHOLD = 0.7
+# Sections not checked (reference lists are repetitive by nature)
+SKIP_SECTIONS = {'references', 'bibliography'}
+
+# Universal hashing (a * x + b) mod p with a Mersenne prime; products fit in int64
+_PRIME = (1 << 31) - 1
+# Shingle hashes are computed in batches of about this many shingles
+_BATCH_SHINGLES = 16384
+
+WORD_PATTERN = re.compile(r'[^\W_]+')
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> Set[int]:
+    """Hashed word shingles of a text.
+
+    Args:
+        text: Text to shingle
+        size: Words per shingle
+
+    Returns:
+        Set of 31-bit shingle hashes (empty if the text has fewer than MIN_WORDS words)
+    """
+    words = WORD_PATTERN.findall(text.lower())
+    if len(words) < max(MIN_WORDS, size):
+        return set()
+    return {
+        zlib.crc32(' '.join(words[i:i + size]).encode('utf-8')) % _PRIME
+        for i in range(len(words) - size + 1)
+    }
+
+
+def jaccard(a: Set[int], b: Set[int]) -> float:
+    """Jaccard similarity of two shingle sets."""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def choose_bands(threshold: float, num_permutations: int = NUM_PERMUTATIONS) -> Tuple[int, int]:
+    """Pick (bands, rows per band) whose LSH threshold is closest below the target.
+
+    Pairs with similarity s share at least one bucket with probability
+    1 - (1 - s^rows)^bands; the curve's midpoint is about (1/bands)^(1/rows).
+    Choosing it slightly below the target threshold favours recall; exact
+    Jaccard verification then removes the false positives.
+    """
+    best = (num_permutations, 1)
+    best_gap = float('inf')
+    for rows in range(1, num_permutations + 1):
+        if num_permutations % rows:
+            continue
+        bands = num_permutations // rows
+        midpoint = (1 / bands) ** (1 / rows)
+        gap = threshold - midpoint
+        if 0 <= gap < best_gap:
+            best, best_gap = (bands, rows), gap
+    return best
+
+
+class MinHasher:
+    """MinHash signatures from a fixed family of hash permutations."""
+
+    def __init__(self, num_permutations: int = NUM_PERMUTATIONS, seed: int = 1):
+        rng = np.random.default_rng(seed)
+        self.num_permutations = num_permutations
+        self._a = rng.integers(1, _PRIME, size=num_permutations, dtype=np.int64)
+        self._b = rng.integers(0, _PRIME, size=num_permutations, dtype=np.int64)
+
+    def signatures(self, shingle_sets: Sequence[Set[int]]) -> np.ndarray:
+        """MinHash signatures of non-empty shingle sets.
+
+        Args:
+            shingle_sets: Shingle sets from shingles()
+
+        Returns:
+            Array of shape (len(shingle_sets), num_permutations)
+        """
+        result = np.empty((len(shingle_sets), self.num_permutations), dtype=np.int64)
+        start = 0
+        while start < len(shingle_sets):
+            # Batch sets so the (permutations x shingles) matrix stays small
+            end, total = start, 0
+            while end < len(shingle_sets) and (total == 0 or total + len(shingle_sets[end]) <= _BATCH_SHINGLES):
+                total += len(shingle_sets[end])
+                end += 1
+
+            batch = shingle_sets[start:end]
+            values = np.fromiter((h for s in batch for h in s), dtype=np.int64, count=total)
+            offsets = np.cumsum([0] + [len(s) for s in batch[:-1]])
+            hashed = (self._a[:, None] * values[None, :] + self._b[:, None]) % _PRIME
+            result[start:end] = np.minimum.reduceat(hashed, offsets, axis=1).T
+            start = end
+        return result
+
+
+def near_duplicate_pairs(
+    items: Sequence[Tuple[str, str]],
+    threshold: float = DEFAULT_THRESHOLD,
+    hasher: Optional[MinHasher] = None
+) -> List[Tuple[str, str, float]]:
+    """Find near-duplicate texts.
+
+    Args:
+        items: (ID, text) pairs
+        threshold: Minimum Jaccard similarity of word shingles
+        hasher: MinHasher to use (a default one is created if omitted)
+
+    Returns:
+        (ID, ID, similarity) tuples, in item order of the first then second ID
+    """
+    hasher = hasher or _default_hasher()
+    ids, sets = [], []
+    for item_id, text in items:
+        shingle_set = shingles(text)
+        if shingle_set:
+            ids.append(item_id)
+            sets.append(shingle_set)
+    if len(sets) < 2:
+        return []
+
+    signatures = hasher.signatures(sets)
+    bands, rows = choose_bands(threshold, hasher.num_permutations)
+
+    candidates: Set[Tuple[int, int]] = set()
+    for band in range(bands):
+        buckets: Dict[bytes, List[int]] = defaultdict(list)
+        band_values = np.ascontiguousarray(signatures[:, band * rows:(band + 1) * rows])
+        for position in range(len(sets)):
+            buckets[band_values[position].tobytes()].append(position)
+        for members in buckets.values():
+            for i, first in enumerate(members):
+                for second in members[i + 1:]:
+                    candidates.add((first, second))
+
+    pairs = []
+    for first, second in sorted(candidates):
+        similarity = jaccard(sets[first], sets[second])
+        if similarity >= threshold:
+            pairs.append((ids[first], ids[second], round(similarity, 3)))
+
+    logger.debug(f"Near-duplicates: {len(sets)} texts, {len(candidates)} candidates, {len(pairs)} pairs")
+    return pairs
+
+
+def section_items(sections: Dict[str, ParsedSection]) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+    """(ID, text) items for the sentences and paragraphs of checked sections."""
+    sentences, paragraphs = [], []
+    for name, section in sections.items():
+        if name in SKIP_SECTIONS:
+            continue
+        sentences.extend((sentence.id, sentence.text) for sentence in section.sentences)
+        paragraphs.extend(
+            (paragraph.id, section.text[paragraph.char_start:paragraph.char_end])
+            for paragraph in section.paragraphs
+        )
+    return sentences, paragraphs
+
+
+def find_near_duplicates(
+    sections: Dict[str, ParsedSection],
+    threshold: float = DEFAULT_THRESHOLD
+) -> Tuple[List[Tuple[str, str, float]], List[Tuple[str, str, float]]]:
+    """Near-duplicate sentence and paragraph pairs of a document.
+
+    Args:
+        sections: Indexed sections
+        threshold: Minimum Jaccard similarity of word shingles
+
+    Returns:
+        Tuple of (sentence pairs, paragraph pairs) as (ID, ID, similarity)
+    """
+    sentences, paragraphs = section_items(sections)
+    return near_duplicate_pairs(sentences, threshold), near_duplicate_pairs(paragraphs, threshold)
+
+
+_DEFAULT_HASHER = None
+
+
+def _default_hasher() -> MinHasher:
+    global _DEFAULT_HASHER
+    if _DEFAULT_HASHER is None:
+        _DEFAULT_HASHER = MinHasher()
+    return _DEFAULT_HASHER
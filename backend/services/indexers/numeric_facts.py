@@ -0,0 +1,290 @@
+"""Numeric fact extraction and vectorized consistency checks.
+
+A single compiled scanner runs once over each section's text and records
+every sample size, p-value, mean ± SD and percentage it finds, with its
+unit, section, sentence and offsets, in a columnar NumericFactTable backed
+by NumPy arrays. Consistency checks (sample sizes that disagree across
+sections, percentage breakdowns that do not sum to 100, SDs larger than
+their means) are computed with array operations over the whole table.
+"""
+
+import logging
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from services.parser.pipeline.models import ParsedSection
+
+logger = logging.getLogger(__name__)
+
+
+# Fact kinds; NumericFactTable.kind holds indices into this tuple
+KINDS = ('n', 'p_value', 'mean_sd', 'percentage')
+KIND_N, KIND_P_VALUE, KIND_MEAN_SD, KIND_PERCENTAGE = range(len(KINDS))
+
+# Measurement units recognised after "mean ± SD"
+_UNIT = (
+    r'%|mg/kg|mg/dl|mg/dL|mmol/l|mmol/L|mmHg|bpm|kPa|Pa|pN|nN|µN|μN|'
+    r'µm|μm|nm|mm|cm|µl|μl|µL|μL|ml|mL|µM|μM|nM|mM|'
+    r'ms|min|hr|h|s|days?|weeks?|months?|years?|kg|mg|g|Hz|°C|IU|U|m|L|l|M|N'
+)
+
+# One alternation, scanned once per section. Number-led facts share one
+# branch so each number is parsed once; the leading lookahead lets the regex
+# engine skip positions that cannot start a fact.
+NUMERIC_SCANNER = re.compile(
+    r'(?=[\dNnSsTtRrPp])(?:'
+    r'(?<![\w.])(?P<number>\d+(?:\.\d+)?)(?:'
+    # "3.5 ± 1.2 mm"
+    rf'\s*±\s*(?P<sd>\d+(?:\.\d+)?)(?:\s*(?P<mean_unit>{_UNIT})(?![\w/]))?'
+    # "45%", "12.5 %"
+    r'|\s*(?P<percent>%)'
+    # "24 participants", "12 Patients"
+    r'|\s+(?P<n_noun>(?i:participants?|subjects?|patients?))\b)'
+    # "N = 24", "n=12"
+    r'|(?<!\w)(?:[Nn]\s*=\s*(?P<n_eq>\d+)\b'
+    # "sample size of 24", "a total of 24", "recruited 24"
+    r'|(?:[Ss]ample\s+(?:size|of)|[Tt]otal\s+of|[Rr]ecruited)\s+(?P<n_phrase>\d+)\b'
+    # "p < 0.05", "P = .003"
+    r'|[pP]\s*(?P<p_rel>[<>=≤≥])\s*(?P<p_value>0?\.\d+))'
+    r')'
+)
+
+# Plausible sample sizes
+MIN_N, MAX_N = 1, 100000
+
+# Sample sizes within this distance are treated as consistent (exclusions, dropouts)
+N_TOLERANCE = 2
+# Sample sizes differing by more than this ratio are reported
+N_RATIO = 1.5
+
+# A sentence with at least this many percentages summing to within
+# PERCENT_WINDOW of 100 is treated as a breakdown that should sum to 100
+MIN_BREAKDOWN_PERCENTAGES = 3
+PERCENT_WINDOW = 15.0
+# Allowed rounding error per reported percentage
+PERCENT_ROUNDING = 0.5
+
+
+@dataclass
+class NumericFactTable:
+    """Columnar table of numeric facts; row i is one fact."""
+    sections: List[str]         # Section names; the section column indexes this list
+    kind: np.ndarray            # int8 index into KINDS
+    value: np.ndarray           # float64: N, p-value, mean or percentage
+    spread: np.ndarray          # float64: SD for mean_sd, NaN otherwise
+    unit: np.ndarray            # object: "participants", "%", "mm", "" ...
+    relation: np.ndarray        # object: "=", "<", ">", "≤", "≥" (p-values may be bounds)
+    section: np.ndarray         # int32 index into sections
+    sentence_id: np.ndarray     # object: sentence ID, or None if the section is not indexed
+    char_start: np.ndarray      # int64 offsets in section text
+    char_end: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.kind)
+
+    def values(self, kind: int, section: Optional[str] = None) -> np.ndarray:
+        """Values of one kind of fact, optionally restricted to a section."""
+        mask = self.kind == kind
+        if section is not None:
+            if section not in self.sections:
+                return self.value[:0]
+            mask &= self.section == self.sections.index(section)
+        return self.value[mask]
+
+    def rows(self, indices: np.ndarray) -> List[Dict[str, Any]]:
+        """Selected facts as dictionaries, in the order given."""
+        indices = np.asarray(indices, dtype=np.intp)
+        spreads = self.spread[indices]
+        columns = zip(
+            self.kind[indices].tolist(),
+            self.value[indices].tolist(),
+            np.where(np.isnan(spreads), None, spreads).tolist(),
+            self.unit[indices].tolist(),
+            self.relation[indices].tolist(),
+            self.section[indices].tolist(),
+            self.sentence_id[indices].tolist(),
+            self.char_start[indices].tolist(),
+            self.char_end[indices].tolist(),
+        )
+        return [
+            {
+                "kind": KINDS[kind],
+                "value": value,
+                "spread": spread,
+                "unit": unit,
+                "relation": relation,
+                "section": self.sections[section],
+                "sentence_id": sentence_id,
+                "char_start": start,
+                "char_end": end,
+            }
+            for kind, value, spread, unit, relation, section, sentence_id, start, end in columns
+        ]
+
+    def row(self, i: int) -> Dict[str, Any]:
+        """One fact as a dictionary."""
+        return self.rows([i])[0]
+
+
+def _object_array(items) -> np.ndarray:
+    array = np.empty(len(items), dtype=object)
+    array[:] = items
+    return array
+
+
+def extract_numeric_facts(sections: Dict[str, ParsedSection]) -> NumericFactTable:
+    """Extract numeric facts from all sections in one pass per section.
+
+    Args:
+        sections: Parsed sections, ideally with indexed sentences
+
+    Returns:
+        NumericFactTable with one row per fact, in document order
+    """
+    names = list(sections)
+    # Rows as (kind, value, spread, unit, relation, section, sentence_id, start, end)
+    rows = []
+
+    for code, name in enumerate(names):
+        section = sections[name]
+        starts = [sent.char_start for sent in section.sentences]
+        found = []
+
+        for match in NUMERIC_SCANNER.finditer(section.text):
+            number, sd, mean_unit, percent, n_noun, n_eq, n_phrase, p_rel, p_value = match.groups()
+            start, end = match.span()
+
+            if sd is not None:
+                found.append((KIND_MEAN_SD, float(number), float(sd), mean_unit or '', '=', start, end))
+            elif percent is not None:
+                pct = float(number)
+                if 0 <= pct <= 100:
+                    found.append((KIND_PERCENTAGE, pct, np.nan, '%', '=', start, end))
+            elif p_value is not None:
+                p = float(p_value)
+                if 0 <= p <= 1:
+                    found.append((KIND_P_VALUE, p, np.nan, '', p_rel, start, end))
+            else:
+                n_text = n_eq or n_phrase or number
+                if n_text.isdigit() and MIN_N <= int(n_text) <= MAX_N:
+                    found.append((KIND_N, int(n_text), np.nan, n_noun or '', '=', start, end))
+
+        if not found:
+            continue
+
+        # Containing sentence of every fact in one vectorized lookup
+        positions = np.searchsorted(starts, [fact[5] for fact in found], side='right') - 1
+        for fact, position in zip(found, positions.tolist()):
+            sentence_id = section.sentences[position].id if position >= 0 else None
+            rows.append(fact[:5] + (code, sentence_id) + fact[5:])
+
+    columns = list(zip(*rows)) if rows else [()] * 9
+    table = NumericFactTable(
+        sections=names,
+        kind=np.array(columns[0], dtype=np.int8),
+        value=np.array(columns[1], dtype=np.float64),
+        spread=np.array(columns[2], dtype=np.float64),
+        unit=_object_array(columns[3]),
+        relation=_object_array(columns[4]),
+        section=np.array(columns[5], dtype=np.int32),
+        sentence_id=_object_array(columns[6]),
+        char_start=np.array(columns[7], dtype=np.int64),
+        char_end=np.array(columns[8], dtype=np.int64),
+    )
+    logger.debug(f"Extracted {len(table)} numeric facts")
+    return table
+
+
+def n_mismatch_pairs(section_codes: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Find contradictory sample sizes between sections.
+
+    Two sections contradict when both report sample sizes, they share none,
+    and a pair of their values differs by more than N_TOLERANCE and by more
+    than a factor of N_RATIO.
+
+    Args:
+        section_codes: Section index of each (unique per section) N value
+        values: The N values
+
+    Returns:
+        Array of (i, j) row pairs with section_codes[i] < section_codes[j]
+    """
+    if len(values) < 2:
+        return np.empty((0, 2), dtype=np.intp)
+
+    # Section x value membership, to test whether two sections share any N
+    _, value_codes = np.unique(values, return_inverse=True)
+    n_sections = int(section_codes.max()) + 1
+    membership = np.zeros((n_sections, value_codes.max() + 1), dtype=np.int32)
+    membership[section_codes, value_codes] = 1
+    shares = (membership @ membership.T) > 0
+
+    a, b = values[:, None], values[None, :]
+    contradicts = (
+        (section_codes[:, None] < section_codes[None, :])
+        & ~shares[section_codes[:, None], section_codes[None, :]]
+        & (np.abs(a - b) > N_TOLERANCE)
+        & ((a > b * N_RATIO) | (b > a * N_RATIO))
+    )
+    return np.argwhere(contradicts)
+
+
+def check_numeric_consistency(table: NumericFactTable) -> Dict[str, List[Dict[str, Any]]]:
+    """Run all numeric consistency checks over a fact table.
+
+    Args:
+        table: Facts from extract_numeric_facts
+
+    Returns:
+        Dictionary with "n_mismatches", "percentage_sums" and
+        "sd_exceeds_mean" findings; each finding cites the facts involved
+    """
+    report = {"n_mismatches": [], "percentage_sums": [], "sd_exceeds_mean": []}
+    if not len(table):
+        return report
+
+    # Sample sizes: first occurrence of each distinct (section, N). Findings
+    # share the dictionaries of these facts rather than copying them per pair
+    n_rows = np.flatnonzero(table.kind == KIND_N)
+    if len(n_rows):
+        keys = np.stack([table.section[n_rows], table.value[n_rows].astype(np.int64)], axis=1)
+        _, first = np.unique(keys, axis=0, return_index=True)
+        rows = n_rows[np.sort(first)]
+        facts = table.rows(rows)
+        report["n_mismatches"] = [
+            {"first": facts[i], "second": facts[j]}
+            for i, j in n_mismatch_pairs(table.section[rows], table.value[rows]).tolist()
+        ]
+
+    # Percentages per sentence: breakdowns that do not sum to 100
+    pct_rows = np.flatnonzero((table.kind == KIND_PERCENTAGE) & (table.sentence_id != None))  # noqa: E711
+    if len(pct_rows):
+        sentence_ids, first, groups = np.unique(
+            table.sentence_id[pct_rows].astype(str), return_index=True, return_inverse=True
+        )
+        counts = np.bincount(groups)
+        totals = np.bincount(groups, weights=table.value[pct_rows])
+        error = np.abs(totals - 100.0)
+        flagged = (
+            (counts >= MIN_BREAKDOWN_PERCENTAGES)
+            & (error <= PERCENT_WINDOW)
+            & (error > PERCENT_ROUNDING * counts)
+        )
+        # Members of each group in document order, then groups in document order
+        members = np.split(pct_rows[np.argsort(groups, kind='stable')], np.cumsum(counts)[:-1])
+        for group in sorted(np.flatnonzero(flagged).tolist(), key=lambda g: first[g]):
+            report["percentage_sums"].append({
+                "sentence_id": str(sentence_ids[group]),
+                "total": float(totals[group]),
+                "facts": table.rows(members[group]),
+            })
+
+    # Mean ± SD with SD larger than the mean
+    report["sd_exceeds_mean"] = table.rows(
+        np.flatnonzero((table.kind == KIND_MEAN_SD) & (table.spread > table.value))
+    )
+
+    return report
@@ -0,0 +1,329 @@
+"""Resolve quoted excerpts (TextLocation.quote) to sentences.
+
+Agents point at text by quoting it, and quotes rarely match the parsed
+text character for character: PDF extraction leaves ligatures ("ﬁ"),
+line-break hyphenation ("con- traction") and different whitespace or
+quote marks. Both the document and the quote are therefore compared in
+a normalized form that keeps only letters and digits (NFKC, casefolded),
+with a map back to offsets in the section text.
+
+The index is built once per document: every sentence's normalized text
+is split into character n-grams, stored as one CSR posting structure
+(n-gram -> sentence positions). Resolving a quote counts the shared
+n-grams per sentence over the rarest posting lists, then looks for the quote around
+the best few sentences: exactly (confidence 1.0) or, failing that, as
+the densest run of its n-grams.
+"""
+
+import bisect
+import re
+import unicodedata
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from core.models import Issue
+from services.parser.pipeline.models import ParsedDocument
+
+# Characters per n-gram
+QUOTE_NGRAM = 4
+
+# N-grams of a quote used for candidate scoring (the rarest in the document)
+MAX_QUERY_NGRAMS = 32
+
+# Sentences checked in detail per quote
+CANDIDATES_CHECKED = 5
+
+# Matches below this share of the quote's n-grams are not reported
+MIN_CONFIDENCE = 0.5
+
+WORD_PATTERN = re.compile(r'[^\W_]+')
+
+
+def normalize(text: str) -> Tuple[str, List[int]]:
+    """Letters and digits of text, NFKC-normalized and casefolded.
+
+    Returns:
+        (normalized text, offset in text of each normalized character)
+    """
+    chars: List[str] = []
+    offsets: List[int] = []
+    for match in WORD_PATTERN.finditer(text):
+        word, start = match.group(), match.start()
+        if word.isascii():
+            chars.append(word.lower())
+            offsets.extend(range(start, start + len(word)))
+            continue
+        for i, ch in enumerate(word):
+            folded = unicodedata.normalize('NFKC', ch).casefold()
+            for c in folded:
+                if c.isalnum():
+                    chars.append(c)
+                    offsets.append(start + i)
+    return ''.join(chars), offsets
+
+
+@dataclass
+class QuoteMatch:
+    """Where a quote was found."""
+    section: str
+    sentence_ids: List[str]     # Sentences the matched text overlaps, in order
+    char_start: int             # Offsets in section text
+    char_end: int
+    confidence: float           # 1.0 for an exact (normalized) match
+
+    @property
+    def sentence_id(self) -> str:
+        return self.sentence_ids[0]
+
+
+class _SectionText:
+    """A section's normalized text with offsets and sentence boundaries."""
+
+    def __init__(self, name: str, text: str, sentences):
+        self.name = name
+        self.text, offsets = normalize(text)
+        self.offsets = np.array(offsets, dtype=np.int32)
+        self.sentence_ids = [sentence.id for sentence in sentences]
+        # Normalized start and end of each sentence
+        self.starts = np.searchsorted(self.offsets, [s.char_start for s in sentences]).tolist()
+        self.ends = np.searchsorted(self.offsets, [s.char_end for s in sentences]).tolist()
+
+    def char_range(self, start: int, end: int) -> Tuple[int, int]:
+        """Section text offsets of normalized characters start:end."""
+        return int(self.offsets[start]), int(self.offsets[end - 1]) + 1
+
+    def sentences_between(self, start: int, end: int) -> List[str]:
+        first = max(bisect.bisect_right(self.starts, start) - 1, 0)
+        last = max(bisect.bisect_left(self.starts, end) - 1, first)
+        return self.sentence_ids[first:last + 1]
+
+
+class QuoteIndex:
+    """Character n-gram index from quotes to sentences."""
+
+    def __init__(self, doc: ParsedDocument, n: int = QUOTE_NGRAM):
+        """Index every sentence of a document.
+
+        Args:
+            doc: Parsed document with indexed sentences
+            n: Characters per n-gram
+        """
+        self.n = n
+        self.sections: List[_SectionText] = []
+        # Sentence position -> (section position, sentence index in section)
+        self._section_of: List[int] = []
+        self._index_in_section: List[int] = []
+        self._section_codes: Dict[str, int] = {}
+
+        sentence_bounds: List[Tuple[int, int]] = []  # In the concatenated normalized text
+        offset = 0
+        for code, (name, section) in enumerate(doc.sections.items()):
+            section_text = _SectionText(name, section.text, section.sentences)
+            self.sections.append(section_text)
+            self._section_codes[name] = code
+            for i, (start, end) in enumerate(zip(section_text.starts, section_text.ends)):
+                sentence_bounds.append((offset + start, offset + end))
+                self._section_of.append(code)
+                self._index_in_section.append(i)
+            offset += len(section_text.text)
+        self._sentence_sections = np.array(self._section_of, dtype=np.int32)
+
+        # Characters as dense codes; an n-gram's key is its codes in base
+        # len(alphabet) + 1, the last code standing for characters of a quote
+        # that the document does not contain
+        codes = np.frombuffer(''.join(s.text for s in self.sections).encode('utf-32-le'), dtype=np.uint32)
+        alphabet, codes = np.unique(codes, return_inverse=True)
+        self._alphabet = {chr(c): i for i, c in enumerate(alphabet.tolist())}
+        self._base = len(alphabet) + 1
+        if self._base ** n >= 2 ** 63:
+            raise ValueError(f"Alphabet of {len(alphabet)} characters is too large for {n}-gram keys")
+
+        # Start of every n-gram that fits in its sentence, and that sentence's position
+        bounds = np.array(sentence_bounds, dtype=np.int64).reshape(-1, 2)
+        counts = np.maximum(bounds[:, 1] - bounds[:, 0] - n + 1, 0)
+        positions = np.repeat(np.arange(len(bounds)), counts)
+        starts = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts) + bounds[positions, 0]
+        keys = self._keys_of(codes.astype(np.int64), starts)
+
+        # Unique (n-gram, sentence) pairs sorted by n-gram: a CSR posting structure
+        pairs = np.unique(keys * max(len(bounds), 1) + positions)
+        pair_keys = pairs // max(len(bounds), 1)
+        self._ngram_keys, first = np.unique(pair_keys, return_index=True)
+        self._indptr = np.append(first, len(pairs))
+        self._postings = (pairs % max(len(bounds), 1)).astype(np.int32)
+
+    def _keys_of(self, codes: np.ndarray, starts: np.ndarray) -> np.ndarray:
+        """Integer keys of the n-grams of codes at starts."""
+        keys = np.zeros(len(starts), dtype=np.int64)
+        for k in range(self.n):
+            keys = keys * self._base + codes[starts + k]
+        return keys
+
+    def __len__(self) -> int:
+        return len(self._section_of)
+
+    def resolve(self, quote: str, section: Optional[str] = None, limit: int = 3) -> List[QuoteMatch]:
+        """Find where a quote occurs.
+
+        Args:
+            quote: Quoted excerpt (whitespace, hyphenation and ligatures may differ)
+            section: Section the quote is expected in; other sections are
+                only searched when it has no match
+            limit: Maximum number of matches
+
+        Returns:
+            Matches in descending confidence (ties in document order)
+        """
+        query, _ = normalize(quote)
+        if not query:
+            return []
+        if section is not None and section in self._section_codes:
+            matches = self._resolve(query, self._section_codes[section], limit)
+            if matches:
+                return matches
+        return self._resolve(query, None, limit)
+
+    def resolve_many(self, quotes: Iterable[Tuple[str, Optional[str]]], limit: int = 1) -> List[List[QuoteMatch]]:
+        """resolve() for (quote, section) pairs."""
+        return [self.resolve(quote, section, limit) for quote, section in quotes]
+
+    def _resolve(self, query: str, section_code: Optional[int], limit: int) -> List[QuoteMatch]:
+        n = self.n
+        if len(query) < n:
+            return self._scan_short(query, section_code, limit)
+        if not len(self._ngram_keys):
+            return []
+
+        unknown = len(self._alphabet)
+        codes = np.array([self._alphabet.get(c, unknown) for c in query], dtype=np.int64)
+        keys = np.unique(self._keys_of(codes, np.arange(len(query) - n + 1)))
+        ids = np.searchsorted(self._ngram_keys, keys)
+        ids = ids[self._ngram_keys[np.minimum(ids, len(self._ngram_keys) - 1)] == keys]
+        if not len(ids):
+            return []
+        # Score with the rarest n-grams: short posting lists, most selective
+        ids = ids[np.argsort(self._indptr[ids + 1] - self._indptr[ids], kind='stable')[:MAX_QUERY_NGRAMS]]
+
+        # An exact match contains the rarest n-gram: when that is rare enough,
+        # look around its sentences before scoring anything
+        rarest = self._postings[self._indptr[ids[0]]:self._indptr[ids[0] + 1]]
+        if section_code is not None:
+            rarest = rarest[self._sentence_sections[rarest] == section_code]
+        if len(rarest) <= CANDIDATES_CHECKED:
+            matches = self._collect(query, rarest.tolist(), exact=True)
+            if len(matches) >= limit:
+                return self._ranked(matches, limit)
+        postings = np.concatenate([self._postings[self._indptr[i]:self._indptr[i + 1]] for i in ids.tolist()])
+        if section_code is not None:
+            postings = postings[self._sentence_sections[postings] == section_code]
+        candidates, scores = np.unique(postings, return_counts=True)
+        # A quote split over two sentences shares about half its n-grams with each
+        keep = scores >= len(ids) * MIN_CONFIDENCE / 2
+        candidates, scores = candidates[keep], scores[keep]
+        if len(candidates) > CANDIDATES_CHECKED:
+            top = np.argpartition(-scores, CANDIDATES_CHECKED - 1)[:CANDIDATES_CHECKED]
+            candidates, scores = candidates[top], scores[top]
+        candidates = candidates[np.lexsort((candidates, -scores))].tolist()
+
+        # Exact matches first; approximate ones only when there are too few
+        matches = self._collect(query, candidates, exact=True)
+        if len(matches) < limit:
+            for key, match in self._collect(query, candidates, exact=False).items():
+                matches.setdefault(key, match)
+        return self._ranked(matches, limit)
+
+    def _collect(self, query: str, positions: List[int], exact: bool) -> Dict[Tuple[str, int], QuoteMatch]:
+        """Matches around candidate sentences, keyed by where they start."""
+        matches: Dict[Tuple[str, int], QuoteMatch] = {}
+        for position in positions:
+            match = self._locate(query, position, exact)
+            if match is not None:
+                key = (match.section, match.char_start)
+                if key not in matches or matches[key].confidence < match.confidence:
+                    matches[key] = match
+        return matches
+
+    def _ranked(self, matches: Dict[Tuple[str, int], QuoteMatch], limit: int) -> List[QuoteMatch]:
+        ranked = sorted(matches.values(), key=lambda m: (-m.confidence, self._section_codes[m.section], m.char_start))
+        return ranked[:limit]
+
+    def _locate(self, query: str, position: int, exact: bool) -> Optional[QuoteMatch]:
+        """Find the quote in the text around one candidate sentence (exactly, or approximately)."""
+        section = self.sections[self._section_of[position]]
+        i = self._index_in_section[position]
+        # The quote may start before the sentence or run into the next ones
+        window_start = max(section.starts[i] - len(query), 0)
+        window_end = min(section.ends[i] + len(query), len(section.text))
+        window = section.text[window_start:window_end]
+
+        if exact:
+            found = window.find(query)
+            if found < 0:
+                return None
+            start, end = window_start + found, window_start + found + len(query)
+            confidence = 1.0
+        else:
+            span = self._densest_run(query, window)
+            if span is None:
+                return None
+            start, end, confidence = window_start + span[0], window_start + span[1], span[2]
+            if confidence < MIN_CONFIDENCE:
+                return None
+
+        char_start, char_end = section.char_range(start, end)
+        return QuoteMatch(section.name, section.sentences_between(start, end), char_start, char_end,
+                          round(confidence, 3))
+
+    def _densest_run(self, query: str, window: str) -> Optional[Tuple[int, int, float]]:
+        """(start, end, share of the quote's n-grams) of the best approximate match in window."""
+        n = self.n
+        ngrams = {query[j:j + n] for j in range(len(query) - n + 1)}
+        hits = [j for j in range(len(window) - n + 1) if window[j:j + n] in ngrams]
+        if not hits:
+            return None
+        # Most hits within a stretch of the quote's length
+        best_count, best, first = 0, (hits[0], hits[0]), 0
+        for last, hit in enumerate(hits):
+            while hit - hits[first] > len(query) - n:
+                first += 1
+            if last - first + 1 > best_count:
+                best_count, best = last - first + 1, (hits[first], hit)
+        start, end = best[0], best[1] + n
+        matched = {window[j:j + n] for j in hits if start <= j <= best[1]}
+        return start, end, len(matched) / len(ngrams)
+
+    def _scan_short(self, query: str, section_code: Optional[int], limit: int) -> List[QuoteMatch]:
+        """Quotes shorter than an n-gram: exact search in each section."""
+        matches = []
+        for code, section in enumerate(self.sections):
+            if section_code is not None and code != section_code:
+                continue
+            found = section.text.find(query)
+            if found >= 0:
+                start, end = section.char_range(found, found + len(query))
+                matches.append(QuoteMatch(section.name, section.sentences_between(found, found + len(query)),
+                                          start, end, 1.0))
+                if len(matches) == limit:
+                    break
+        return matches
+
+
+def locate_issues(index: QuoteIndex, issues: Iterable[Issue]) -> int:
+    """Fill in sentence_id and the section of issues located only by a quote.
+
+    Returns:
+        Number of issues located
+    """
+    located = 0
+    for issue in issues:
+        location = issue.location
+        if location.sentence_id is not None or not location.quote:
+            continue
+        matches = index.resolve(location.quote, location.section, limit=1)
+        if matches:
+            location.sentence_id = matches[0].sentence_id
+            location.section = matches[0].section
+            located += 1
+    return located
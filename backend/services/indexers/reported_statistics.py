@@ -0,0 +1,356 @@
+"""Recompute reported test statistics and check them against their p-values.
+
+Results sections report tests as "t(34) = 2.10, p = .04", "F(2, 57) = 4.3,
+p < .05", "χ²(1, N = 90) = 5.2, p = .02", "r(28) = .41, p = .02" or
+"z = 2.3, p = .02", and means as "M = 3.47, n = 21". Checking these is
+arithmetic, not judgement: each reported statistic is recomputed into the
+p-value range its rounding allows, and each mean is checked for
+granularity (GRIM: a mean of n integer scores must be a multiple of 1/n).
+Mismatches become Track A issues pointing at the sentence, so review agents
+do not need an LLM call for any statistic checked here.
+"""
+
+import logging
+import math
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from core.models import Issue, ParsedSection, Severity, TextLocation
+
+logger = logging.getLogger(__name__)
+
+# Significance level used to tell decision errors from rounding slips
+ALPHA = 0.05
+
+# Continued fraction accuracy for the incomplete beta and gamma functions
+_EPSILON = 3e-16
+_MAX_ITERATIONS = 300
+_TINY = 1e-300
+
+_NUMBER = r'[-−–]?(?:\d+(?:\.\d*)?|\.\d+)'
+_P_VALUE = r'[_*]{0,2}[pP][_*]{0,2}\s*(?P<relation>[<>=≤≥])\s*(?P<p_value>0?\.\d+|[01](?:\.\d+)?)'
+
+# "t(34) = 2.10, p = .04"; markdown emphasis around symbols is allowed ("_t_(34)")
+TEST_PATTERN = re.compile(
+    r'(?<![\w.])[_*]{0,2}(?P<test>t|F|χ2|χ²|chi2|chi²|[rR]|[zZ])[_*]{0,2}'
+    r'(?:\s*\(\s*(?P<df1>\d+(?:\.\d+)?)(?:\s*,\s*(?P<df2>\d+(?:\.\d+)?))?(?:\s*,\s*[nN]\s*=\s*\d+)?\s*\))?'
+    rf'\s*=\s*(?P<statistic>{_NUMBER})'
+    rf'\s*[,;]\s*{_P_VALUE}'
+)
+
+# "M = 3.47, n = 21" (APA-style means; GRIM needs the reported decimals)
+MEAN_PATTERN = re.compile(r'(?<![\w.])[_*]{0,2}M[_*]{0,2}\s*=\s*(?P<mean>\d+\.\d+)')
+N_PATTERN = re.compile(r'(?<![\w.])[_*]{0,2}[nN][_*]{0,2}\s*=\s*(?P<n>\d+)(?![\d.])')
+
+ONE_TAILED_PATTERN = re.compile(r'one[- ](?:tailed|sided)', re.IGNORECASE)
+
+# Reported test names -> canonical names
+TEST_NAMES = {'t': 't', 'F': 'F', 'χ2': 'chi2', 'χ²': 'chi2', 'chi2': 'chi2', 'chi²': 'chi2',
+              'r': 'r', 'R': 'r', 'z': 'z', 'Z': 'z'}
+
+
+# ============== Distributions ==============
+
+def _continued_fraction_beta(a: float, b: float, x: float) -> float:
+    """Continued fraction for the incomplete beta function (modified Lentz)."""
+    qab, qap, qam = a + b, a + 1.0, a - 1.0
+    c, d = 1.0, 1.0 - qab * x / qap
+    d = 1.0 / (d if abs(d) > _TINY else _TINY)
+    h = d
+    for m in range(1, _MAX_ITERATIONS + 1):
+        m2 = 2 * m
+        for numerator in (m * (b - m) * x / ((qam + m2) * (a + m2)),
+                          -(a + m) * (qab + m) * x / ((a + m2) * (qap + m2))):
+            d = 1.0 + numerator * d
+            d = 1.0 / (d if abs(d) > _TINY else _TINY)
+            c = 1.0 + numerator / c
+            c = c if abs(c) > _TINY else _TINY
+            h *= d * c
+        if abs(d * c - 1.0) < _EPSILON:
+            break
+    return h
+
+
+def regularized_beta(x: float, a: float, b: float) -> float:
+    """Regularized incomplete beta function I_x(a, b)."""
+    if x <= 0.0:
+        return 0.0
+    if x >= 1.0:
+        return 1.0
+    log_front = math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b) + a * math.log(x) + b * math.log1p(-x)
+    if x < (a + 1.0) / (a + b + 2.0):
+        return math.exp(log_front) * _continued_fraction_beta(a, b, x) / a
+    return 1.0 - math.exp(log_front) * _continued_fraction_beta(b, a, 1.0 - x) / b
+
+
+def regularized_gamma_upper(a: float, x: float) -> float:
+    """Regularized upper incomplete gamma function Q(a, x)."""
+    if x <= 0.0:
+        return 1.0
+    log_front = a * math.log(x) - x - math.lgamma(a)
+    if x < a + 1.0:
+        # Series for P(a, x)
+        term = total = 1.0 / a
+        denominator = a
+        for _ in range(_MAX_ITERATIONS):
+            denominator += 1.0
+            term *= x / denominator
+            total += term
+            if abs(term) < abs(total) * _EPSILON:
+                break
+        return 1.0 - total * math.exp(log_front)
+
+    # Continued fraction for Q(a, x) (modified Lentz)
+    b = x + 1.0 - a
+    c, d = 1.0 / _TINY, 1.0 / b
+    h = d
+    for i in range(1, _MAX_ITERATIONS + 1):
+        numerator = -i * (i - a)
+        b += 2.0
+        d = numerator * d + b
+        d = 1.0 / (d if abs(d) > _TINY else _TINY)
+        c = b + numerator / c
+        c = c if abs(c) > _TINY else _TINY
+        h *= d * c
+        if abs(d * c - 1.0) < _EPSILON:
+            break
+    return math.exp(log_front) * h
+
+
+def p_from_statistic(test: str, statistic: float, df1: Optional[float] = None,
+                     df2: Optional[float] = None, one_tailed: bool = False) -> float:
+    """p-value of a test statistic.
+
+    Args:
+        test: 't', 'F', 'chi2', 'r' or 'z'
+        statistic: Test statistic
+        df1: Degrees of freedom (numerator df for F; unused for z)
+        df2: Denominator degrees of freedom for F
+        one_tailed: One-tailed p for t, r and z
+
+    Returns:
+        p-value (two-tailed for t, r and z unless one_tailed)
+    """
+    if test == 'z':
+        p = math.erfc(abs(statistic) / math.sqrt(2.0))
+    elif test in ('t', 'r'):
+        if test == 'r':
+            if abs(statistic) >= 1.0:
+                return 0.0
+            statistic = statistic * math.sqrt(df1 / (1.0 - statistic * statistic))
+        p = regularized_beta(df1 / (df1 + statistic * statistic), df1 / 2.0, 0.5)
+    elif test == 'F':
+        if statistic <= 0.0:
+            return 1.0
+        return regularized_beta(df2 / (df2 + df1 * statistic), df2 / 2.0, df1 / 2.0)
+    elif test == 'chi2':
+        return regularized_gamma_upper(df1 / 2.0, max(statistic, 0.0) / 2.0)
+    else:
+        raise ValueError(f"Unknown test: {test}")
+    return p / 2.0 if one_tailed else p
+
+
+# ============== Extraction and checks ==============
+
+@dataclass
+class ReportedStatistic:
+    """A test statistic reported with its p-value."""
+    test: str                   # 't', 'F', 'chi2', 'r' or 'z'
+    statistic: float
+    df1: Optional[float]
+    df2: Optional[float]
+    relation: str               # '=', '<', '>', '≤' or '≥'
+    p_reported: float
+    section: str
+    sentence_id: str
+    char_start: int             # Offsets of the report in section text
+    char_end: int
+    quote: str
+    one_tailed: bool = False
+    p_rounding: float = 0.0     # Half a unit in the last reported digit of p
+    p_low: float = 0.0          # Recomputed p range allowed by the statistic's rounding
+    p_high: float = 1.0
+
+    @property
+    def consistent(self) -> bool:
+        """Whether the reported p-value fits the recomputed range."""
+        if self.relation in '<≤':
+            return self.p_low <= self.p_reported
+        if self.relation in '>≥':
+            return self.p_high >= self.p_reported
+        return self.p_low <= self.p_reported + self.p_rounding and self.p_high >= self.p_reported - self.p_rounding
+
+    @property
+    def decision_error(self) -> bool:
+        """Whether the reported and recomputed p fall on different sides of ALPHA."""
+        reported_significant = self.p_reported < ALPHA or (self.relation in '<≤' and self.p_reported <= ALPHA)
+        if reported_significant:
+            return self.p_low >= ALPHA
+        return self.relation not in '<≤' and self.p_high < ALPHA
+
+
+@dataclass
+class ReportedMean:
+    """A mean reported with its sample size."""
+    mean: float
+    decimals: int
+    n: int
+    section: str
+    sentence_id: str
+    char_start: int
+    char_end: int
+    quote: str
+
+    @property
+    def grim_consistent(self) -> bool:
+        """Whether some integer total divided by n rounds to the reported mean."""
+        tolerance = 0.5 * 10 ** -self.decimals + 1e-9
+        total = self.mean * self.n
+        return any(
+            abs(candidate / self.n - self.mean) <= tolerance
+            for candidate in (math.floor(total), math.ceil(total))
+        )
+
+
+def _half_unit(number: str) -> float:
+    """Half of the last reported digit's place value ("2.10" -> 0.005)."""
+    decimals = len(number.split('.', 1)[1]) if '.' in number else 0
+    return 0.5 * 10 ** -decimals
+
+
+def _number(text: str) -> float:
+    return float(text.replace('−', '-').replace('–', '-'))
+
+
+def extract_reported_statistics(
+    sections: Dict[str, ParsedSection]
+) -> Tuple[List[ReportedStatistic], List[ReportedMean]]:
+    """Find test statistics with p-values and means with sample sizes.
+
+    Args:
+        sections: Indexed sections
+
+    Returns:
+        Tuple of (statistics with recomputed p ranges, means checkable with GRIM)
+    """
+    statistics, means = [], []
+    for name, section in sections.items():
+        for sentence in section.sentences:
+            text = sentence.text
+            if '=' not in text:
+                continue
+            one_tailed = bool(ONE_TAILED_PATTERN.search(text))
+
+            for match in TEST_PATTERN.finditer(text):
+                test = TEST_NAMES[match.group('test')]
+                df1 = float(match.group('df1')) if match.group('df1') else None
+                df2 = float(match.group('df2')) if match.group('df2') else None
+                if (test == 'F') != (df2 is not None) or (test != 'z' and df1 is None):
+                    continue  # Missing or extra degrees of freedom
+                if df1 is not None and df1 <= 0 or df2 is not None and df2 <= 0:
+                    continue
+                raw = match.group('statistic')
+                reported = ReportedStatistic(
+                    test=test,
+                    statistic=_number(raw),
+                    df1=df1,
+                    df2=df2,
+                    relation=match.group('relation'),
+                    p_reported=float(match.group('p_value')),
+                    section=name,
+                    sentence_id=sentence.id,
+                    char_start=sentence.char_start + match.start(),
+                    char_end=sentence.char_start + match.end(),
+                    quote=match.group(0),
+                    one_tailed=one_tailed and test in ('t', 'r', 'z'),
+                    p_rounding=_half_unit(match.group('p_value')),
+                )
+                # p falls as |statistic| grows; rounding leaves half a unit either way
+                magnitude, half_unit = abs(reported.statistic), _half_unit(raw)
+                reported.p_low = p_from_statistic(test, magnitude + half_unit, df1, df2, reported.one_tailed)
+                reported.p_high = p_from_statistic(test, max(magnitude - half_unit, 0.0), df1, df2,
+                                                   reported.one_tailed)
+                statistics.append(reported)
+
+            mean_matches = list(MEAN_PATTERN.finditer(text))
+            if mean_matches:
+                sizes = {int(match.group('n')) for match in N_PATTERN.finditer(text)}
+                if len(sizes) != 1:
+                    continue  # No sample size, or ambiguous
+                n = sizes.pop()
+                for match in mean_matches:
+                    raw = match.group('mean')
+                    decimals = len(raw.split('.')[1])
+                    if n <= 0 or n >= 10 ** decimals:
+                        continue  # Every mean is possible at this precision
+                    means.append(ReportedMean(
+                        mean=float(raw),
+                        decimals=decimals,
+                        n=n,
+                        section=name,
+                        sentence_id=sentence.id,
+                        char_start=sentence.char_start + match.start(),
+                        char_end=sentence.char_start + match.end(),
+                        quote=match.group(0),
+                    ))
+
+    return statistics, means
+
+
+def _label(reported: ReportedStatistic) -> str:
+    """Reported statistic as text ("t(34) = 2.1", "F(2, 57) = 4.3")."""
+    name = 'χ²' if reported.test == 'chi2' else reported.test
+    dfs = [f"{df:g}" for df in (reported.df1, reported.df2) if df is not None]
+    return f"{name}({', '.join(dfs)}) = {reported.statistic:g}" if dfs else f"{name} = {reported.statistic:g}"
+
+
+def statistic_issue(reported: ReportedStatistic) -> Issue:
+    """Track A issue for an inconsistent test statistic."""
+    computed = (reported.p_low + reported.p_high) / 2
+    tails = 'one-tailed' if reported.one_tailed else 'two-tailed' if reported.test in ('t', 'r', 'z') else ''
+    description = (
+        f"Reported p {reported.relation} {reported.p_reported:g} does not match {_label(reported)}"
+        f" (recomputed {tails + ' ' if tails else ''}p ≈ {computed:.4f})"
+    )
+    if reported.decision_error:
+        description += f"; the conclusion at α = {ALPHA} changes"
+    return Issue(
+        issue_type="p_value_mismatch",
+        severity=Severity.MAJOR if reported.decision_error else Severity.MINOR,
+        description=description,
+        location=TextLocation(section=reported.section, sentence_id=reported.sentence_id, quote=reported.quote),
+        evidence=f"Recomputed p range for the reported rounding: {reported.p_low:.4g} to {reported.p_high:.4g}",
+        suggestion="Check the test statistic, degrees of freedom and p-value against the analysis output",
+    )
+
+
+def mean_issue(reported: ReportedMean) -> Issue:
+    """Track A issue for a mean that fails the GRIM check."""
+    return Issue(
+        issue_type="grim_inconsistency",
+        severity=Severity.MINOR,
+        description=(
+            f"Mean {reported.mean:.{reported.decimals}f} is not possible for {reported.n} integer-valued "
+            f"observations"
+        ),
+        location=TextLocation(section=reported.section, sentence_id=reported.sentence_id, quote=reported.quote),
+        evidence=f"No integer total divided by {reported.n} rounds to {reported.mean:.{reported.decimals}f}",
+        suggestion="If the measure is a count or single-item scale, check the mean and sample size",
+    )
+
+
+def check_reported_statistics(sections: Dict[str, ParsedSection]) -> List[Issue]:
+    """Recompute reported statistics and return issues for the inconsistent ones.
+
+    Args:
+        sections: Indexed sections
+
+    Returns:
+        Track A issues: p-value mismatches, then GRIM failures, each in document order
+    """
+    statistics, means = extract_reported_statistics(sections)
+    issues = [statistic_issue(reported) for reported in statistics if not reported.consistent]
+    issues += [mean_issue(reported) for reported in means if not reported.grim_consistent]
+    logger.debug(f"Recomputed {len(statistics)} statistics and {len(means)} means: {len(issues)} issues")
+    return issues
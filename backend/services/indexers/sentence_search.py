@@ -0,0 +1,130 @@
+"""BM25 search over a document's indexed sentences.
+
+Built once per document: sentences are tokenized, an inverted index maps
+each token to the sentences containing it, and each posting list stores
+the precomputed BM25 term weights as NumPy arrays. A query is then a
+vectorized sum of posting weights over the query's tokens and a partial
+sort, instead of a scan over every sentence's text.
+"""
+
+import math
+import re
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from services.parser.pipeline.models import ParsedDocument, Sentence
+
+# BM25 parameters (standard defaults)
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Letters and digits, keeping internal hyphens and apostrophes ("t-test", "Student's")
+TOKEN_PATTERN = re.compile(r"[^\W_]+(?:['’\-][^\W_]+)*")
+
+STOPWORDS = frozenset("""
+a an and are as at be been but by for from had has have in into is it its of on or that the their
+there these this those to was were which while with we our than then thus also
+""".split())
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens without stopwords.
+
+    Hyphenated tokens are indexed whole and by their parts, so "t-test"
+    matches queries for "t-test" and for "test".
+    """
+    tokens = []
+    for token in TOKEN_PATTERN.findall(text.lower()):
+        if token in STOPWORDS:
+            continue
+        tokens.append(token)
+        if '-' in token:
+            tokens.extend(part for part in token.split('-') if part and part not in STOPWORDS)
+    return tokens
+
+
+@dataclass
+class SearchHit:
+    """A sentence matching a query."""
+    sentence: Sentence
+    score: float
+
+
+class SentenceSearchIndex:
+    """Inverted index with BM25 scoring over sentences."""
+
+    def __init__(self, doc: ParsedDocument, k1: float = BM25_K1, b: float = BM25_B):
+        """Index every sentence of a document.
+
+        Args:
+            doc: Parsed document with indexed sentences
+            k1: BM25 term-frequency saturation
+            b: BM25 length normalization
+        """
+        self.sentences: List[Sentence] = [
+            sentence for section in doc.sections.values() for sentence in section.sentences
+        ]
+        self.section_names: List[str] = list(doc.sections)
+        section_codes = {name: code for code, name in enumerate(self.section_names)}
+        self._section_codes = np.array(
+            [section_codes.get(sentence.section, -1) for sentence in self.sentences], dtype=np.int32
+        )
+        # Token -> (sentence positions, BM25 weights)
+        self.postings: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+
+        counts = [Counter(tokenize(sentence.text)) for sentence in self.sentences]
+        lengths = np.array([sum(c.values()) for c in counts], dtype=np.float64)
+        n_sentences = len(self.sentences)
+        avg_length = lengths.mean() if n_sentences else 0.0
+
+        raw_postings = defaultdict(list)
+        for position, token_counts in enumerate(counts):
+            for token, tf in token_counts.items():
+                raw_postings[token].append((position, tf))
+
+        for token, entries in raw_postings.items():
+            positions = np.array([position for position, _ in entries], dtype=np.int32)
+            tf = np.array([count for _, count in entries], dtype=np.float64)
+            # BM25 idf, kept positive for tokens in most sentences
+            idf = math.log(1 + (n_sentences - len(entries) + 0.5) / (len(entries) + 0.5))
+            norm = k1 * (1 - b + b * lengths[positions] / avg_length)
+            self.postings[token] = (positions, idf * tf * (k1 + 1) / (tf + norm))
+
+    def __len__(self) -> int:
+        return len(self.sentences)
+
+    def search(self, query: str, limit: int = 10, section: Optional[str] = None) -> List[SearchHit]:
+        """Return the sentences most relevant to a query.
+
+        Args:
+            query: Free-text query
+            limit: Maximum number of hits
+            section: Only return sentences from this section
+
+        Returns:
+            Hits in descending score order (ties in document order)
+        """
+        scores = np.zeros(len(self.sentences))
+        matched = False
+        for token in set(tokenize(query)):
+            if token in self.postings:
+                positions, weights = self.postings[token]
+                scores[positions] += weights  # Positions are unique within a posting list
+                matched = True
+
+        if not matched:
+            return []
+        if section is not None:
+            if section not in self.section_names:
+                return []
+            scores[self._section_codes != self.section_names.index(section)] = 0.0
+
+        candidates = np.flatnonzero(scores)
+        if len(candidates) > limit:
+            candidates = candidates[np.argpartition(-scores[candidates], limit - 1)[:limit]]
+        # Descending score, ties in document order
+        ranked = candidates[np.lexsort((candidates, -scores[candidates]))]
+        return [SearchHit(self.sentences[position], float(scores[position])) for position in ranked.tolist()]
@@ -0,0 +1,189 @@
+"""Multi-term matching with an Aho–Corasick automaton.
+
+The automaton is built once from a vocabulary and finds every occurrence
+of every term in a single pass over the text, so matching cost grows with
+text length rather than with vocabulary size. Matching is case-insensitive
+and treats runs of whitespace in terms as single spaces; a match must start
+and end on a word boundary ("control" does not match "uncontrolled").
+"""
+
+import logging
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Directory holding the bundled vocabulary files
+VOCABULARY_DIR = Path(__file__).parent / 'vocabularies'
+
+# Vocabularies used when none are configured
+DEFAULT_VOCABULARIES = ('statistics.txt', 'study_design.txt')
+
+# Newlines and tabs are matched as spaces (one-for-one, so offsets are kept)
+WHITESPACE = str.maketrans('\n\t\r\f\v', '     ')
+
+
+def normalize_term(term: str) -> str:
+    """Lowercase a term and collapse its whitespace to single spaces."""
+    return ' '.join(term.lower().split())
+
+
+def load_vocabulary(path: Path) -> List[str]:
+    """Load terms from a vocabulary file.
+
+    One term per line; blank lines and lines starting with '#' are ignored.
+
+    Args:
+        path: Vocabulary file
+
+    Returns:
+        Terms in file order
+    """
+    terms = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            term = line.strip()
+            if term and not term.startswith('#'):
+                terms.append(term)
+    return terms
+
+
+def load_default_vocabulary() -> List[str]:
+    """Load the bundled vocabularies."""
+    terms = []
+    for name in DEFAULT_VOCABULARIES:
+        terms.extend(load_vocabulary(VOCABULARY_DIR / name))
+    return terms
+
+
+def _fold(text: str) -> str:
+    """Lowercase text for matching without changing its length."""
+    folded = text.lower()
+    if len(folded) != len(text):
+        # A few characters lowercase to two code points ("İ"); keep offsets aligned
+        folded = ''.join(c.lower() if len(c.lower()) == 1 else c for c in text)
+    return folded.translate(WHITESPACE)
+
+
+class TermMatcher:
+    """Aho–Corasick automaton over a vocabulary of terms."""
+
+    def __init__(self, terms: Iterable[str]):
+        """Build the automaton.
+
+        Args:
+            terms: Vocabulary; duplicates (after normalization) are merged
+        """
+        self.terms: List[str] = []          # Normalized terms, indexed by term ID
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[int, ...]] = [()]  # Node -> IDs of terms ending here
+
+        term_ids: Dict[str, int] = {}
+        for term in terms:
+            normalized = normalize_term(term)
+            if normalized and normalized not in term_ids:
+                term_ids[normalized] = len(self.terms)
+                self.terms.append(normalized)
+                self._insert(normalized, term_ids[normalized])
+
+        self._build_failure_links()
+        logger.debug(f"Built term automaton: {len(self.terms)} terms, {len(self._goto)} states")
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def _insert(self, term: str, term_id: int):
+        node = 0
+        for char in term:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+            node = next_node
+        self._output[node] += (term_id,)
+
+    def _build_failure_links(self):
+        """Breadth-first pass setting each state's failure link and merged outputs."""
+        queue = list(self._goto[0].values())
+        for node in queue:
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                link = self._goto[fallback].get(char, 0)
+                self._fail[child] = link if link != child else 0
+                self._output[child] += self._output[self._fail[child]]
+
+    def finditer(self, text: str) -> Iterator[Tuple[str, int, int]]:
+        """Find all vocabulary terms in text.
+
+        Args:
+            text: Text to scan
+
+        Yields:
+            Tuples of (normalized term, char_start, char_end), ordered by end offset
+        """
+        goto, fail, output, terms = self._goto, self._fail, self._output, self.terms
+        folded = _fold(text)
+        node = 0
+
+        for position, char in enumerate(folded):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+
+            for term_id in output[node]:
+                term = terms[term_id]
+                end = position + 1
+                start = end - len(term)
+                # Word boundaries: no letter or digit directly around an alphanumeric edge
+                if start > 0 and term[0].isalnum() and folded[start - 1].isalnum():
+                    continue
+                if end < len(folded) and term[-1].isalnum() and folded[end].isalnum():
+                    continue
+                yield term, start, end
+
+    def find_terms(self, text: str) -> List[str]:
+        """Distinct terms found in text, in order of first occurrence."""
+        return list(dict.fromkeys(term for term, _, _ in self.finditer(text)))
+
+
+def matcher_from_files(paths: Sequence[Path]) -> TermMatcher:
+    """Build an automaton from one or more vocabulary files."""
+    terms = []
+    for path in paths:
+        terms.extend(load_vocabulary(Path(path)))
+    return TermMatcher(terms)
+
+
+_DEFAULT_MATCHER: Optional[TermMatcher] = None
+
+
+def configure_vocabulary(extra_paths: Sequence[Path] = ()) -> TermMatcher:
+    """Build the shared automaton from the bundled vocabularies plus extra files.
+
+    Args:
+        extra_paths: Additional vocabulary files (e.g. domain ontologies)
+
+    Returns:
+        The new shared TermMatcher
+    """
+    global _DEFAULT_MATCHER
+    terms = load_default_vocabulary()
+    for path in extra_paths:
+        terms.extend(load_vocabulary(Path(path)))
+    _DEFAULT_MATCHER = TermMatcher(terms)
+    logger.info(f"Loaded term vocabulary: {len(_DEFAULT_MATCHER)} terms")
+    return _DEFAULT_MATCHER
+
+
+def default_matcher() -> TermMatcher:
+    """Shared automaton, built from the bundled vocabularies on first use."""
+    if _DEFAULT_MATCHER is None:
+        return configure_vocabulary()
+    return _DEFAULT_MATCHER
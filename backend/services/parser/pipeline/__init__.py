@@ -16,7 +16,8 @@ Pipeline Stages:
 
 # Only import what exists
 from .config import PipelineConfig, default_config, load_config_from_yaml
-from .models import ParsedDocument, ParsedSection, Sentence
+from .models import ParsedDocument, ParsedSection, Paragraph, Sentence
+from .lookup import DocumentLookup
 
 __all__ = [
     'PipelineConfig',
@@ -24,7 +25,9 @@ __all__ = [
     'load_config_from_yaml',
     'ParsedDocument',
     'ParsedSection',
+    'Paragraph',
     'Sentence',
+    'DocumentLookup',
 ]
 
 # Import builder
@@ -4,13 +4,19 @@ This is the main entry point that runs the complete parsing pipeline.
 """
 
 import hashlib
+import time
 import uuid
-from typing import Optional
+from typing import Any, Dict, Optional
 import logging
 
 from .config import PipelineConfig, default_config
+from .deadline import BIBLIOGRAPHY, Deadline
+from .events import STAGE_FINISHED, STAGE_SKIPPED, STAGE_STARTED, EventHook
 from .models import ParsedDocument, GeometryInfo, StructureInfo
-from .stages import loader, geometry, analysis, extraction, reflow, cleanup, labeling, formatting, indexing
+from .lookup import DocumentLookup
+from .stages import (
+    loader, geometry, analysis, extraction, blocks, reflow, cleanup, labeling, formatting, indexing
+)
 from .extractors import citations, figures, bibliography
 
 logger = logging.getLogger(__name__)
@@ -19,36 +25,66 @@ logger = logging.getLogger(__name__)
 class PipelineBuilder:
     """Coordinates the complete PDF parsing pipeline."""
 
-    def __init__(self, config: Optional[PipelineConfig] = None, capture_stages: bool = False):
+    def __init__(
+        self,
+        config: Optional[PipelineConfig] = None,
+        capture_stages: bool = False,
+        on_event: Optional[EventHook] = None,
+        timeout: Optional[float] = None,
+        stage_timeout: Optional[float] = None
+    ):
         """Initialize pipeline with configuration.
 
         Args:
             config: Pipeline configuration (uses defaults if None)
             capture_stages: Whether to capture intermediate stage outputs for debugging
+            on_event: Called with stage start and finish events (progress reporting)
+            timeout: Seconds the whole build may take (None: unlimited)
+            stage_timeout: Seconds any one stage may take (None: unlimited)
         """
         self.config = config or default_config()
         self.capture_stages = capture_stages
+        self.on_event = on_event
         self.stage_outputs = {}  # Store intermediate stage outputs for debug
+        self.stage_timings: Dict[str, float] = {}  # Stage name -> milliseconds
+        self.current_stage: Optional[str] = None  # Running stage (the failing one after an error)
         self.structure_info: Optional[StructureInfo] = None  # Store for author access
+        self._stage_start = 0.0
+        self.deadline = Deadline(timeout, stage_timeout)  # Cancel it to stop a running build
+        self._skips_reported = 0
 
         if self.config.debug_logging:
             logging.basicConfig(level=logging.DEBUG)
 
-    def build(self, pdf_bytes: bytes, filename: str) -> ParsedDocument:
+    def build(
+        self,
+        pdf_bytes: bytes,
+        filename: str,
+        previous: Optional[ParsedDocument] = None,
+        doc_id: Optional[str] = None
+    ) -> ParsedDocument:
         """Run complete parsing pipeline.
 
         Args:
             pdf_bytes: Raw PDF file bytes
             filename: PDF filename
+            previous: Previous version of the document (revision mode). Unchanged
+                sentences keep their IDs and the result records what changed.
+            doc_id: Document ID to assign (a new UUID if None)
 
         Returns:
-            ParsedDocument with all extracted data
+            ParsedDocument with all extracted data. Optional stages skipped to
+            stay within the timeout are listed in its degraded field.
+
+        Raises:
+            DeadlineExceeded: A checkpoint (stage start, or a page of a long
+                stage) was reached past a timeout, or the deadline was cancelled
 
         Pipeline stages:
         1. Load PDF
         2. Analyze structure (bold text)
         3. Apply geometric cleaning
-        4. Extract markdown
+        4. Extract blocks
         5. Reflow text
         6. Cleanup artifacts
         7. Inject section labels
@@ -61,131 +97,184 @@ class PipelineBuilder:
 
         # Generate document ID and hash
         doc_hash = hashlib.sha256(pdf_bytes).hexdigest()
-        doc_id = str(uuid.uuid4())
+        doc_id = doc_id or str(uuid.uuid4())
+        self.deadline.start()
 
         # Stage 1: Load PDF
+        self._enter_stage('load_pdf')
         doc = loader.load_pdf(pdf_bytes)
-        metadata = loader.extract_metadata(doc)
-        loader.validate_pdf(doc)
-
-        # Capture raw text BEFORE any processing
-        if self.capture_stages:
-            raw_text = ""
-            for page in doc:
-                raw_text += page.get_text() + "\n\n"
-            self.stage_outputs['01_raw_pdf'] = raw_text
-
-        # Stage 2: Analyze structure (before cropping)
-        structure_info = analysis.analyze_structure(doc, self.config.analysis)
-        self.structure_info = structure_info  # Store for access in main.py
-        if self.capture_stages:
-            self.stage_outputs['02_analyze_structure'] = (
-                f"Title: {structure_info.title}\n"
-                f"Abstract: {structure_info.abstract[:200] if structure_info.abstract else 'None'}...\n"
-                f"Sections found: {len(structure_info.section_headers)}"
+        try:
+            metadata = loader.extract_metadata(doc)
+            loader.validate_pdf(doc)
+
+            # Capture raw text BEFORE any processing
+            if self.capture_stages:
+                raw_text = ""
+                for page in doc:
+                    raw_text += page.get_text() + "\n\n"
+                self.stage_outputs['01_raw_pdf'] = raw_text
+
+            # Stage 2: Analyze structure (before cropping)
+            self._enter_stage('analyze_structure')
+            structure_info = analysis.analyze_structure(doc, self.config.analysis)
+            self.structure_info = structure_info  # Store for access in main.py
+            if self.capture_stages:
+                self.stage_outputs['02_analyze_structure'] = (
+                    f"Title: {structure_info.title}\n"
+                    f"Abstract: {structure_info.abstract[:200] if structure_info.abstract else 'None'}...\n"
+                    f"Sections found: {len(structure_info.section_headers)}"
+                )
+
+            # Stage 3: Geometric cleaning (crops margins, then detects captions & figures)
+            self._enter_stage('geometric_cleaning')
+            doc, geom_info = geometry.apply_geometric_cleaning(
+                doc,
+                self.config.geometry,
+                structure_info,
+                self.deadline
             )
 
-        # Stage 3: Geometric cleaning (crops margins, then detects captions & figures)
-        doc, geom_info = geometry.apply_geometric_cleaning(
-            doc,
-            self.config.geometry,
-            structure_info
-        )
-
-        # Capture text AFTER cropping + caption/figure detection
-        if self.capture_stages:
-            cropped_text = ""
-            for page in doc:
-                cropped_text += page.get_text() + "\n\n"
-            self.stage_outputs['03_geometric_cleaning'] = (
-                f"Cropped text:\n{cropped_text}\n\n"
-                f"Captions detected (on cropped pages): {len(geom_info.figure_captions)}\n"
-                f"Figure regions detected: {len(geom_info.figure_regions)}"
+            # Capture text AFTER cropping + caption/figure detection
+            if self.capture_stages:
+                cropped_text = ""
+                for page in doc:
+                    cropped_text += page.get_text() + "\n\n"
+                self.stage_outputs['03_geometric_cleaning'] = (
+                    f"Cropped text:\n{cropped_text}\n\n"
+                    f"Captions detected (on cropped pages): {len(geom_info.figure_captions)}\n"
+                    f"Figure regions detected: {len(geom_info.figure_regions)}"
+                )
+
+            # Stages 4-8 pass typed blocks; markdown is rendered only when needed
+            # Stage 4: Extract blocks (with figure-aware filtering)
+            self._enter_stage('extract_blocks')
+            doc_blocks = extraction.extract_blocks(
+                doc,
+                geom_info,       # Has figure regions
+                structure_info,  # Has caption list
+                self.deadline
             )
+            if self.capture_stages:
+                self.stage_outputs['04_extract_markdown'] = blocks.render_markdown(doc_blocks)
 
-        # Stage 4: Extract markdown (with figure-aware filtering)
-        markdown = extraction.extract_markdown(
-            doc,
-            geom_info,      # Has figure regions
-            structure_info  # Has caption list
-        )
-        if self.capture_stages:
-            self.stage_outputs['04_extract_markdown'] = markdown
-
-        # Stage 5: Reflow text
-        markdown = reflow.reflow_text(markdown, self.config.reflow)
-        if self.capture_stages:
-            self.stage_outputs['05_reflow_text'] = markdown
-
-        # Stage 6: Cleanup artifacts
-        markdown = cleanup.cleanup_all(markdown, self.config.cleanup)
-        if self.capture_stages:
-            self.stage_outputs['06_cleanup_artifacts'] = markdown
-
-        # Stage 7: Inject section labels
-        markdown = labeling.inject_section_labels(markdown, structure_info)
-        if self.capture_stages:
-            self.stage_outputs['07_inject_section_labels'] = markdown
-
-        # Stage 8: Split into sections
-        sections = formatting.split_sections(markdown, self.config.sections)
-        if self.capture_stages:
-            self.stage_outputs['08_split_sections'] = markdown
-
-        # Stage 9: Validate required sections
-        validation = formatting.validate_required_sections(sections, self.config.sections)
-        if self.capture_stages:
-            self.stage_outputs['09_validate_sections'] = markdown
-        for check, passed in validation.items():
-            if not passed:
-                logger.warning(f"Validation failed: {check}")
-
-        # Stage 10: Index sentences
-        if self.config.indexing.enable_sentence_indexing:
-            sections = indexing.index_sentences(sections, self.config.indexing)
+            # Stage 5: Reflow text
+            self._enter_stage('reflow_text')
+            doc_blocks = reflow.reflow_blocks(doc_blocks, self.config.reflow)
             if self.capture_stages:
-                self.stage_outputs['10_index_sentences'] = markdown
-
-        # Stage 11: Extract metadata
-        citation_list = []
-        figure_list = []
-        figure_refs = []
-        bib_list = []
-
-        if self.config.extraction.extract_citations:
-            citation_list = citations.extract_citations(sections)
-
-        if self.config.extraction.extract_figures:
-            figure_list, figure_refs = figures.extract_figures(markdown, sections)
-
-        if self.config.extraction.extract_bibliography:
-            bib_section = sections.get('references') or sections.get('bibliography')
-            bib_list = bibliography.parse_bibliography(bib_section)
-
-        if self.capture_stages:
-            self.stage_outputs['11_extract_metadata'] = markdown
-            self.stage_outputs['12_final_output'] = markdown
-
-        # Extract title
-        title = structure_info.title or metadata.get('pdf_title', '') or filename
-
-        # Build final document
-        parsed_doc = ParsedDocument(
-            doc_id=doc_id,
-            doc_hash=doc_hash,
-            title=title,
-            sections=sections,
-            figures=figure_list,
-            figure_refs=figure_refs,
-            citations=citation_list,
-            bibliography=bib_list,
-            raw_markdown=markdown
-        )
-
-        logger.info(f"Pipeline complete: {len(sections)} sections, {len(citation_list)} citations, "
-                   f"{len(figure_list)} figures, {len(bib_list)} bibliography entries")
-
-        # Close PDF document
-        doc.close()
+                self.stage_outputs['05_reflow_text'] = blocks.render_markdown(doc_blocks)
+
+            # Stage 6: Cleanup artifacts
+            self._enter_stage('cleanup_artifacts')
+            doc_blocks = cleanup.cleanup_blocks(doc_blocks, self.config.cleanup)
+            if self.capture_stages:
+                self.stage_outputs['06_cleanup_artifacts'] = blocks.render_markdown(doc_blocks)
+
+            # Stage 7: Inject section labels
+            self._enter_stage('inject_section_labels')
+            doc_blocks = labeling.label_blocks(doc_blocks, structure_info)
+            markdown = blocks.render_markdown(doc_blocks)
+            if self.capture_stages:
+                self.stage_outputs['07_inject_section_labels'] = markdown
+
+            # Stage 8: Split into sections
+            self._enter_stage('split_sections')
+            sections = formatting.split_section_blocks(doc_blocks, self.config.sections)
+            if self.capture_stages:
+                self.stage_outputs['08_split_sections'] = markdown
+
+            # Stage 9: Validate required sections
+            self._enter_stage('validate_sections')
+            validation = formatting.validate_required_sections(sections, self.config.sections)
+            if self.capture_stages:
+                self.stage_outputs['09_validate_sections'] = markdown
+            for check, passed in validation.items():
+                if not passed:
+                    logger.warning(f"Validation failed: {check}")
+
+            # Stage 10: Index sentences
+            self._enter_stage('index_sentences')
+            revision = None
+            if self.config.indexing.enable_sentence_indexing:
+                previous_sections = previous.sections if previous else None
+                sections = indexing.index_sentences(sections, self.config.indexing, previous=previous_sections)
+                if previous is not None:
+                    revision = indexing.diff_revision(previous.doc_id, previous.sections, sections)
+                if self.capture_stages:
+                    self.stage_outputs['10_index_sentences'] = markdown
+
+            # Stage 11: Extract metadata
+            self._enter_stage('extract_metadata')
+            citation_list = []
+            figure_list = []
+            figure_refs = []
+            bib_list = []
+
+            if self.config.extraction.extract_citations:
+                citation_list = citations.extract_citations(sections)
+
+            if self.config.extraction.extract_figures:
+                figure_list, figure_refs = figures.extract_figures(markdown, sections)
+
+            if self.config.extraction.extract_bibliography and self.deadline.allows(BIBLIOGRAPHY):
+                bib_section = sections.get('references') or sections.get('bibliography')
+                bib_list = bibliography.parse_bibliography(bib_section)
+
+            if self.capture_stages:
+                self.stage_outputs['11_extract_metadata'] = markdown
+                self.stage_outputs['12_final_output'] = markdown
+
+            # Extract title
+            title = structure_info.title or metadata.get('pdf_title', '') or filename
+
+            # Build final document
+            parsed_doc = ParsedDocument(
+                doc_id=doc_id,
+                doc_hash=doc_hash,
+                title=title,
+                sections=sections,
+                figures=figure_list,
+                figure_refs=figure_refs,
+                citations=citation_list,
+                bibliography=bib_list,
+                raw_markdown=markdown,
+                revision=revision,
+                degraded=list(self.deadline.skipped),
+                lookup=DocumentLookup(sections)
+            )
+
+            logger.info(f"Pipeline complete: {len(sections)} sections, {len(citation_list)} citations, "
+                       f"{len(figure_list)} figures, {len(bib_list)} bibliography entries")
+            if parsed_doc.degraded:
+                logger.warning(f"Degraded parse of {filename}: skipped {', '.join(parsed_doc.degraded)}")
+        finally:
+            doc.close()  # Also when a stage fails or the deadline is exceeded
+        self._enter_stage(None)
 
         return parsed_doc
+
+    def _enter_stage(self, stage: Optional[str]):
+        """Finish the running stage, if any, and start the next (None only finishes).
+
+        Starting a stage is a deadline checkpoint: raises DeadlineExceeded
+        once the document's budget is spent.
+        """
+        now = time.perf_counter()
+        for skipped in self.deadline.skipped[self._skips_reported:]:
+            self._emit(STAGE_SKIPPED, stage=skipped)
+        self._skips_reported = len(self.deadline.skipped)
+        if self.current_stage is not None:
+            duration_ms = round((now - self._stage_start) * 1000, 1)
+            self.stage_timings[self.current_stage] = duration_ms
+            self._emit(STAGE_FINISHED, stage=self.current_stage, duration_ms=duration_ms)
+        self.current_stage, self._stage_start = stage, now
+        if stage is not None:
+            self._emit(STAGE_STARTED, stage=stage)
+            self.deadline.start_stage(stage)
+
+    def _emit(self, event: str, **data: Any):
+        if self.on_event is None:
+            return
+        try:
+            self.on_event(event, data)
+        except Exception as e:
+            logger.warning(f"Pipeline event hook failed: {e}")
@@ -113,8 +113,14 @@ class IndexingConfig:
     """Configuration for sentence indexing stage."""
     enable_sentence_indexing: bool = True
     use_nltk: bool = True
+    # Sentence splitter: 'nltk' (punkt), 'scientific' (built-in, no NLTK) or 'simple'
+    splitter: str = 'nltk'
     # Language for NLTK tokenization
     language: str = 'english'
+    # Worker processes for tokenizing long documents (1 = tokenize in-process)
+    max_workers: int = 1
+    # Minimum total section text (chars) before fanning out to the process pool
+    parallel_min_chars: int = 200000
 
 
 @dataclass
@@ -0,0 +1,110 @@
+"""Processing deadlines for the parsing pipeline.
+
+A parse has a budget for the whole document and one for each stage.
+Both are enforced cooperatively: the builder checks them when a stage
+starts, and long page loops check them between pages, raising
+DeadlineExceeded so the worker thread is freed without losing the
+process. PyMuPDF calls cannot be interrupted, so a single call that
+never returns is only caught by the caller's hard timeout.
+
+Optional stages (drawing clusters, figure-text redaction, bibliography
+parsing) improve the output but are not needed for a usable document.
+Once a budget is nearly spent they are skipped, or cut short, and
+listed in ParsedDocument.degraded.
+"""
+
+import logging
+import time
+from typing import Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Fraction of a budget left below which optional stages are skipped
+DEGRADE_BELOW = 0.25
+
+# Optional stages that may be skipped near the deadline
+DRAWING_CLUSTERS = 'drawing_clusters'
+FIGURE_TEXT_REDACTION = 'figure_text_redaction'
+BIBLIOGRAPHY = 'bibliography'
+
+
+class DeadlineExceeded(TimeoutError):
+    """A parse ran past its document or stage budget."""
+
+    def __init__(self, stage: Optional[str], budget: float, scope: str):
+        self.stage = stage
+        self.budget = budget
+        self.scope = scope  # 'document', 'stage' or 'cancelled'
+        if scope == 'cancelled':
+            message = f"Parse cancelled in stage {stage}"
+        else:
+            message = f"Parse timed out in stage {stage} ({scope} budget of {budget:g} s)"
+        super().__init__(message)
+
+
+class Deadline:
+    """Document and stage time budgets of one parse."""
+
+    def __init__(
+        self,
+        timeout: Optional[float] = None,
+        stage_timeout: Optional[float] = None,
+        degrade_below: float = DEGRADE_BELOW,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            timeout: Seconds for the whole document (None: unlimited)
+            stage_timeout: Seconds for any one stage (None: unlimited)
+            degrade_below: Skip optional stages once less than this fraction
+                of either budget remains
+            clock: Time source in seconds
+        """
+        self.timeout = timeout
+        self.stage_timeout = stage_timeout
+        self.degrade_below = degrade_below
+        self.clock = clock
+        self.stage: Optional[str] = None
+        self.skipped: List[str] = []  # Optional stages skipped or cut short, in order
+        self.cancelled = False
+        self._started_at = self._stage_started_at = clock()
+
+    def start(self):
+        """Start the document's budget (when the parse starts, not when it is queued)."""
+        self._started_at = self._stage_started_at = self.clock()
+        self.check()
+
+    def start_stage(self, stage: Optional[str]):
+        """Start the stage's budget, after checking the document's."""
+        self.stage, self._stage_started_at = stage, self.clock()
+        self.check()
+
+    def check(self):
+        """Raise DeadlineExceeded if the parse was cancelled or a budget is spent."""
+        if self.cancelled:
+            raise DeadlineExceeded(self.stage, 0, 'cancelled')
+        now = self.clock()
+        if self.timeout is not None and now - self._started_at > self.timeout:
+            raise DeadlineExceeded(self.stage, self.timeout, 'document')
+        if self.stage_timeout is not None and now - self._stage_started_at > self.stage_timeout:
+            raise DeadlineExceeded(self.stage, self.stage_timeout, 'stage')
+
+    def allows(self, optional_stage: str) -> bool:
+        """Whether an optional stage may run (or continue); records it as skipped if not.
+
+        Call between units of work (pages) to cut a running optional stage short.
+        """
+        if optional_stage in self.skipped:
+            return False
+        now = self.clock()
+        for budget, started in ((self.timeout, self._started_at), (self.stage_timeout, self._stage_started_at)):
+            if budget is not None and budget - (now - started) < self.degrade_below * budget:
+                logger.warning(f"Skipping {optional_stage}: {budget - (now - started):.1f} s of "
+                               f"{budget:g} s budget left")
+                self.skipped.append(optional_stage)
+                return False
+        return True
+
+    def cancel(self):
+        """Make the next check raise, e.g. after the caller has given up waiting."""
+        self.cancelled = True
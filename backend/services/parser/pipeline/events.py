@@ -0,0 +1,13 @@
+"""Events the PipelineBuilder emits through its instrumentation hook.
+
+The API publishes them as document progress events (core.events).
+"""
+
+from typing import Any, Callable, Dict
+
+# Instrumentation hook: called with an event name and its data
+EventHook = Callable[[str, Dict[str, Any]], None]
+
+STAGE_STARTED = 'stage_started'    # {'stage'}
+STAGE_FINISHED = 'stage_finished'  # {'stage', 'duration_ms'}
+STAGE_SKIPPED = 'stage_skipped'    # {'stage'} optional stage skipped or cut short near the deadline
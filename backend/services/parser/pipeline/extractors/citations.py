@@ -1,7 +1,18 @@
-"""Citation extraction from parsed documents."""
+"""Citation extraction from parsed documents.
+
+A single compiled scanner runs once over each section's text and
+recognises numeric brackets ("[3]", "[1, 4-6]"), superscript-style numbers
+("cells.12,13", "cells¹²"), parenthetical author-year groups
+("(Smith, 2020; Lee et al., 2021a)") and narrative author-year citations
+("Smith et al. (2020)"). Ranges, lists and year suffixes ("2019a, b")
+are expanded into one CitationRef per key; each ref records its
+character offsets in the section text and the ID of the sentence
+containing it.
+"""
 
 import re
-from typing import Dict, List
+from bisect import bisect_right
+from typing import Dict, Iterator, List, Optional, Tuple
 import logging
 
 from ..models import ParsedSection, CitationRef
@@ -9,10 +20,182 @@ from ..models import ParsedSection, CitationRef
 logger = logging.getLogger(__name__)
 
 
-CITATION_PATTERNS = [
-    r'\[(\d+(?:,\s*\d+)*)\]',  # [1,2,3] style
-    r'\(([A-Z][a-z]+(?:\s+et\s+al\.?)?,?\s*\d{4})\)',  # (Author et al., 2023) style
-]
+# Sections whose text is not scanned for citations
+SKIP_SECTIONS = {'references', 'bibliography'}
+
+# Ranges longer than this are not expanded ("[1-2020]" is not 2020 citations)
+MAX_RANGE = 100
+
+SUPERSCRIPT_DIGITS = str.maketrans('⁰¹²³⁴⁵⁶⁷⁸⁹⁻', '0123456789-')
+
+# Capitalised surname (letters incl. accented, apostrophes, hyphens) with optional particles
+_NAME = r"[A-ZÀ-ÖØ-Þ](?:[^\W\d_]|['’\-])+"
+_SURNAME = rf"(?:(?:van|von|de|der|den|da|del|di|le|la)\s+)*{_NAME}"
+_YEAR = r'(?:1[89]|20)\d{2}[a-z]?'
+# Bare disambiguation letter continuing a year list: the "b" of "2019a, b"
+_SUFFIX = r'[a-z](?!\w)(?=\s*(?:[,;]|$))'
+
+# One alternation, scanned once per section. The leading lookahead lets the
+# regex engine skip positions that cannot start a citation.
+CITATION_SCANNER = re.compile(
+    r'(?=[\[(.,;:⁰¹²³⁴⁵⁶⁷⁸⁹])(?:'
+    # [1], [1,2], [1-3], [1, 4–6]
+    r'\[(?P<numeric>\d{1,4}(?:\s*[,–—-]\s*\d{1,4})*)\]'
+    # Parenthetical group containing at least one year: (Smith, 2020; Lee et al., 2021),
+    # or the year of a narrative citation: Smith et al. (2020)
+    rf'|\((?P<group>[^()\[\]]*?{_YEAR}[^()\[\]]*)\)'
+    # Unicode superscripts: cells¹²,¹³ or cells¹⁻³
+    r'|(?P<unicode_sup>[⁰¹²³⁴⁵⁶⁷⁸⁹]+(?:[,⁻–-][⁰¹²³⁴⁵⁶⁷⁸⁹]+)*)'
+    # Superscript-style digits after punctuation: cells.12,13 (preceding word checked in code)
+    r'|[.,;:](?P<sup>\d{1,3}(?:[,–-]\d{1,3})*)(?=\s|$)'
+    r')'
+)
+
+# Authors of a narrative citation, immediately before "(2020)"
+NARRATIVE_AUTHORS = re.compile(
+    rf'(?P<author>{_SURNAME})'
+    rf'(?:\s+(?:and|&)\s+(?P<author2>{_SURNAME})|\s+(?P<etal>et\s+al\.?))?\s+$'
+)
+
+# How far back to look for narrative citation authors
+NARRATIVE_LOOKBEHIND = 80
+
+# A parenthetical that holds only a year
+BARE_YEAR = re.compile(rf'\s*(?P<year>{_YEAR})\s*')
+
+# One author-year item inside a parenthetical group
+AUTHOR_YEAR_ITEM = re.compile(
+    rf'(?P<author>{_SURNAME})'
+    rf'(?:\s+(?:and|&)\s+(?P<author2>{_SURNAME})|\s+(?P<etal>et\s+al\.?))?'
+    rf',?\s+(?P<years>{_YEAR}(?:\s*,\s*(?:{_YEAR}|{_SUFFIX}))*)'
+)
+
+YEAR_PATTERN = re.compile(_YEAR)
+
+LIST_SEPARATOR = re.compile(r'\s*,\s*')
+RANGE_SEPARATOR = re.compile(r'\s*[–—-]\s*')
+
+
+def expand_numeric(body: str) -> List[str]:
+    """Expand a numeric citation list with ranges into individual keys.
+
+    Args:
+        body: Citation body such as "1, 4-6"
+
+    Returns:
+        List of numeric keys, e.g. ['1', '4', '5', '6']
+    """
+    if body.isdigit():
+        return [body]
+
+    keys = []
+
+    for part in LIST_SEPARATOR.split(body.strip()):
+        bounds = RANGE_SEPARATOR.split(part)
+        if len(bounds) == 2 and bounds[0].isdigit() and bounds[1].isdigit():
+            start, end = int(bounds[0]), int(bounds[1])
+            if start < end and end - start <= MAX_RANGE:
+                keys.extend(str(n) for n in range(start, end + 1))
+                continue
+            keys.extend(bounds)
+        elif part.isdigit():
+            keys.append(part)
+
+    return keys
+
+
+def expand_years(body: str) -> List[str]:
+    """Expand a year list with bare suffix letters into individual years.
+
+    Args:
+        body: Years of one author, such as "2019a, b, 2020"
+
+    Returns:
+        List of years, e.g. ['2019a', '2019b', '2020']
+    """
+    years = []
+    base = None  # Year a following bare letter belongs to
+
+    for part in LIST_SEPARATOR.split(body.strip()):
+        if YEAR_PATTERN.fullmatch(part):
+            years.append(part)
+            base = part[:-1] if part[-1].isalpha() else None
+        elif base:
+            years.append(base + part)
+
+    return years
+
+
+def author_year_key(author: str, year: str, author2: Optional[str] = None, etal: bool = False) -> str:
+    """Build the normalized key for an author-year citation.
+
+    Args:
+        author: First author surname
+        year: Year, with optional disambiguation letter ("2020a")
+        author2: Second author surname for two-author citations
+        etal: Whether the citation uses "et al."
+
+    Returns:
+        Key such as "Smith, 2020", "Smith & Lee, 2020" or "Smith et al., 2020a"
+    """
+    if etal:
+        return f"{author} et al., {year}"
+    if author2:
+        return f"{author} & {author2}, {year}"
+    return f"{author}, {year}"
+
+
+def scan_citations(text: str) -> Iterator[Tuple[str, int, int]]:
+    """Scan text once for citations.
+
+    Args:
+        text: Section text
+
+    Yields:
+        Tuples of (citation key, char_start, char_end) in text order
+    """
+    for match in CITATION_SCANNER.finditer(text):
+        # Each alternative has exactly one named group
+        kind = match.lastgroup
+
+        if kind == 'numeric':
+            start, end = match.span()
+            for key in expand_numeric(match.group('numeric')):
+                yield key, start, end
+
+        elif kind == 'group':
+            bare_year = BARE_YEAR.fullmatch(match.group('group'))
+            if bare_year:
+                # Narrative citation: authors precede the parenthesised year
+                window_start = max(0, match.start() - NARRATIVE_LOOKBEHIND)
+                authors = NARRATIVE_AUTHORS.search(text, window_start, match.start())
+                if authors:
+                    key = author_year_key(
+                        authors.group('author'), bare_year.group('year'),
+                        authors.group('author2'), bool(authors.group('etal'))
+                    )
+                    yield key, authors.start(), match.end()
+                continue
+
+            offset = match.start('group')
+            for item in AUTHOR_YEAR_ITEM.finditer(match.group('group')):
+                for year in expand_years(item.group('years')):
+                    key = author_year_key(
+                        item.group('author'), year,
+                        item.group('author2'), bool(item.group('etal'))
+                    )
+                    yield key, offset + item.start(), offset + item.end()
+
+        elif kind == 'unicode_sup':
+            for key in expand_numeric(match.group('unicode_sup').translate(SUPERSCRIPT_DIGITS)):
+                yield key, match.start(), match.end()
+
+        elif kind == 'sup':
+            # Only after a word or closing bracket, so decimals ("0.05 mg") are skipped
+            before = text[match.start() - 1] if match.start() > 0 else ''
+            if before.islower() or before in ')]':
+                for key in expand_numeric(match.group('sup')):
+                    yield key, match.start('sup'), match.end()
 
 
 def extract_citations(sections: Dict[str, ParsedSection]) -> List[CitationRef]:
@@ -22,29 +205,27 @@ def extract_citations(sections: Dict[str, ParsedSection]) -> List[CitationRef]:
         sections: Dictionary of parsed sections with indexed sentences
 
     Returns:
-        List of CitationRef objects
+        List of CitationRef objects, one per cited key
     """
     refs = []
 
     for name, section in sections.items():
-        if name == 'references':
+        if name in SKIP_SECTIONS:
             continue
 
-        for sent in section.sentences:
-            for pat in CITATION_PATTERNS:
-                for match in re.finditer(pat, sent.text):
-                    # Extract citation ID
-                    try:
-                        citation_id = match.group(1) if match.lastindex and match.lastindex >= 1 else match.group(0)
-                    except (IndexError, AttributeError):
-                        citation_id = match.group(0)
-
-                    refs.append(CitationRef(
-                        id=citation_id,
-                        section=name,
-                        sentence_id=sent.id,
-                        sentence_text=sent.text
-                    ))
+        starts = [sent.char_start for sent in section.sentences]
+
+        for key, start, end in scan_citations(section.text):
+            index = bisect_right(starts, start) - 1
+            sentence_id = section.sentences[index].id if index >= 0 else None
+
+            refs.append(CitationRef(
+                id=key,
+                section=name,
+                sentence_id=sentence_id,
+                char_start=start,
+                char_end=end
+            ))
 
     logger.info(f"Extracted {len(refs)} citations")
     return refs
@@ -0,0 +1,117 @@
+"""Document-level ID lookups.
+
+Built once at parse time from indexed sections, so agents can go from a
+sentence or paragraph ID to the object, its paragraph and its neighbors
+with dictionary lookups instead of rescanning section text.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from .models import Paragraph, ParsedSection, Sentence
+
+
+class DocumentLookup:
+    """O(1) lookups from sentence and paragraph IDs to objects and neighbors."""
+
+    def __init__(self, sections: Dict[str, ParsedSection]):
+        """Build lookup tables from indexed sections.
+
+        Args:
+            sections: Sections populated by index_sentences
+        """
+        self.sections = sections
+        self.sentences: Dict[str, Sentence] = {}
+        self.paragraphs: Dict[str, Paragraph] = {}
+
+        # ID -> (section name, position in section) for neighbor access
+        self._sentence_pos: Dict[str, Tuple[str, int]] = {}
+        self._paragraph_pos: Dict[str, Tuple[str, int]] = {}
+
+        for name, section in sections.items():
+            for position, sentence in enumerate(section.sentences):
+                self.sentences[sentence.id] = sentence
+                self._sentence_pos[sentence.id] = (name, position)
+            for position, paragraph in enumerate(section.paragraphs):
+                self.paragraphs[paragraph.id] = paragraph
+                self._paragraph_pos[paragraph.id] = (name, position)
+
+    def sentence(self, sentence_id: str) -> Optional[Sentence]:
+        """Return the sentence with this ID, or None."""
+        return self.sentences.get(sentence_id)
+
+    def paragraph(self, paragraph_id: str) -> Optional[Paragraph]:
+        """Return the paragraph with this ID, or None."""
+        return self.paragraphs.get(paragraph_id)
+
+    def paragraph_of(self, sentence_id: str) -> Optional[Paragraph]:
+        """Return the paragraph containing a sentence.
+
+        Args:
+            sentence_id: Sentence ID
+
+        Returns:
+            Paragraph, or None if the sentence is unknown or has no paragraph record
+        """
+        sentence = self.sentences.get(sentence_id)
+        if sentence is None:
+            return None
+        paragraphs = self.sections[sentence.section].paragraphs
+        if 0 <= sentence.paragraph_index < len(paragraphs):
+            return paragraphs[sentence.paragraph_index]
+        return None
+
+    def paragraph_text(self, paragraph_id: str) -> Optional[str]:
+        """Return the text of a paragraph."""
+        paragraph = self.paragraphs.get(paragraph_id)
+        if paragraph is None:
+            return None
+        return self.sections[paragraph.section].text[paragraph.char_start:paragraph.char_end]
+
+    def context(self, sentence_id: str) -> Optional[str]:
+        """Return the text of the paragraph around a sentence.
+
+        Args:
+            sentence_id: Sentence ID
+
+        Returns:
+            Paragraph text, or None if the sentence is unknown
+        """
+        paragraph = self.paragraph_of(sentence_id)
+        if paragraph is None:
+            sentence = self.sentences.get(sentence_id)
+            return sentence.text if sentence else None
+        return self.paragraph_text(paragraph.id)
+
+    def neighbors(self, sentence_id: str, before: int = 1, after: int = 1) -> List[Sentence]:
+        """Return the sentences around a sentence within its section.
+
+        Args:
+            sentence_id: Sentence ID
+            before: Number of preceding sentences
+            after: Number of following sentences
+
+        Returns:
+            Sentences in document order, including the sentence itself
+        """
+        if sentence_id not in self._sentence_pos:
+            return []
+        name, position = self._sentence_pos[sentence_id]
+        sentences = self.sections[name].sentences
+        return sentences[max(0, position - before):position + after + 1]
+
+    def adjacent_paragraphs(self, paragraph_id: str) -> Tuple[Optional[Paragraph], Optional[Paragraph]]:
+        """Return the (previous, next) paragraphs within the same section.
+
+        Args:
+            paragraph_id: Paragraph ID
+
+        Returns:
+            Tuple of previous and next paragraph (None at section edges)
+        """
+        if paragraph_id not in self._paragraph_pos:
+            return None, None
+        name, position = self._paragraph_pos[paragraph_id]
+        paragraphs = self.sections[name].paragraphs
+        previous = paragraphs[position - 1] if position > 0 else None
+        following = paragraphs[position + 1] if position + 1 < len(paragraphs) else None
+        return previous, following
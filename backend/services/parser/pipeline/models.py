@@ -5,16 +5,32 @@ parsed document structure and metadata.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .lookup import DocumentLookup
 
 
 @dataclass
 class ParsedSection:
-    """Represents a document section with indexed sentences."""
+    """Represents a document section with indexed paragraphs and sentences."""
     name: str
     text: str
     sentences: List['Sentence'] = field(default_factory=list)
     order_priority: int = 100  # For section reordering
+    paragraphs: List['Paragraph'] = field(default_factory=list)
+
+
+@dataclass
+class Paragraph:
+    """Represents a paragraph within a section (blank-line delimited)."""
+    id: str
+    section: str
+    index: int                  # Position of the paragraph in its section
+    char_start: int             # Offsets in section text
+    char_end: int
+    content_hash: str           # Whitespace-insensitive content hash
+    sentence_ids: List[str] = field(default_factory=list)
 
 
 @dataclass
@@ -25,16 +41,18 @@ class Sentence:
     text: str
     char_start: int
     char_end: int
-    paragraph_index: int
+    paragraph_index: int        # Index into the section's paragraphs
 
 
 @dataclass
 class CitationRef:
-    """Represents an in-text citation reference."""
-    id: str
+    """Represents an in-text citation reference (one per cited key)."""
+    id: str                     # "3" or "Smith et al., 2020a"
     section: str
-    sentence_id: str
-    sentence_text: str
+    sentence_id: Optional[str]  # Sentence containing the citation (None if not indexed)
+    sentence_text: Optional[str] = None  # Deprecated: look up text by sentence_id
+    char_start: int = 0         # Offsets of the citation marker in section text
+    char_end: int = 0
 
 
 @dataclass
@@ -44,6 +62,8 @@ class FigureBlock:
     label: str
     caption: str
     page: int
+    image_path: Optional[str] = None  # For future vision pass
+    image_bytes: Optional[bytes] = field(default=None, repr=False)
 
 
 @dataclass
@@ -61,6 +81,17 @@ class BibliographyEntry:
     id: str
     raw_text: str
     doi: Optional[str] = None
+    is_review_paper: Optional[bool] = None  # From Semantic Scholar or mock
+
+
+@dataclass
+class RevisionInfo:
+    """What changed relative to the previous version of a document."""
+    previous_doc_id: str
+    changed_paragraphs: Dict[str, List[int]] = field(default_factory=dict)  # section -> paragraph indices ([] if text was only removed)
+    changed_sentence_ids: List[str] = field(default_factory=list)  # New or edited sentences
+    removed_sentence_ids: List[str] = field(default_factory=list)  # Previous sentences no longer present
+    unchanged_sentences: int = 0
 
 
 @dataclass
@@ -78,6 +109,9 @@ class ParsedDocument:
     citations: List[CitationRef]
     bibliography: List[BibliographyEntry]
     raw_markdown: str
+    revision: Optional[RevisionInfo] = None  # Set when parsed as a revision of another document
+    degraded: List[str] = field(default_factory=list)  # Optional stages skipped to meet the deadline
+    lookup: Optional['DocumentLookup'] = field(default=None, repr=False, compare=False)  # ID lookups
 
 
 # Pipeline stage intermediate data structures
@@ -177,3 +211,28 @@ class Section:
     name: str
     content: List[str]  # List of text chunks
     priority: int  # For ordering
+
+
+# Block kinds for the block-level IR
+BLOCK_HEADING = 'heading'
+BLOCK_PARAGRAPH = 'paragraph'
+BLOCK_CAPTION = 'caption'
+BLOCK_LIST_ITEM = 'list_item'
+BLOCK_TABLE = 'table'
+BLOCK_FIGURE = 'figure'
+
+
+@dataclass
+class Block:
+    """Typed block of the document IR passed between stages 4-8.
+
+    Blocks are classified once when the extracted markdown is parsed, so
+    reflow, cleanup, labeling and section splitting never re-detect
+    headers, captions or list markers. Markdown is rendered from blocks
+    only at the end of the pipeline (or on demand for stage capture).
+    """
+    kind: str                   # 'heading', 'paragraph', 'caption', 'list_item', 'table', 'figure'
+    text: str                   # Block text (line breaks preserved until reflow)
+    page: int = 0               # 0-indexed page the block starts on
+    span: Tuple[int, int] = (0, 0)  # (start, end) char offsets in extracted markdown
+    section: Optional[str] = None   # Section label if this heading opens a section
@@ -4,6 +4,7 @@ Each stage is responsible for a specific transformation step
 in the document processing pipeline.
 """
 
+from . import blocks
 from . import loader
 from . import geometry
 from . import analysis
@@ -15,6 +16,7 @@ from . import formatting
 from . import indexing
 
 __all__ = [
+    'blocks',
     'loader',
     'geometry',
     'analysis',
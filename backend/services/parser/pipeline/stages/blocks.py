@@ -0,0 +1,156 @@
+"""Block-level document IR.
+
+Parses extracted markdown into typed blocks (heading, paragraph, caption,
+list item, table, figure placeholder) once, so that the reflow, cleanup,
+labeling and section splitting stages operate on classified blocks
+instead of re-splitting and re-classifying one big markdown string.
+Markdown is rendered from blocks only when it is actually needed.
+"""
+
+import re
+from typing import List, Optional, Tuple
+import logging
+
+from ..models import (
+    Block, BLOCK_HEADING, BLOCK_PARAGRAPH, BLOCK_CAPTION,
+    BLOCK_LIST_ITEM, BLOCK_TABLE, BLOCK_FIGURE,
+)
+from .reflow import is_header_line
+
+logger = logging.getLogger(__name__)
+
+# Kinds whose following non-blank lines are continuations of the same block
+CONTINUABLE_KINDS = {BLOCK_PARAGRAPH, BLOCK_CAPTION, BLOCK_LIST_ITEM}
+
+# Section heading convention used by labeling and split_sections: ### **NAME**
+SECTION_HEADING_PATTERN = re.compile(r'^### \*\*(.*?)\*\*$')
+
+# Figure placeholders emitted by pymupdf4llm or the extraction stage
+FIGURE_PLACEHOLDER_PATTERN = re.compile(r'intentionally omitted|^\[FIGURE', re.IGNORECASE)
+
+# Bold captions (**Fig. 1 | ...) anywhere, plain "Figure 1." labels only at block start
+BOLD_CAPTION_PATTERN = re.compile(r'^\*\*(Fig|Table|Scheme)', re.IGNORECASE)
+CAPTION_LABEL_PATTERN = re.compile(
+    r'^(Figure|Fig\.?|Table|Scheme|Supplementary (Figure|Table)|Extended Data Figure)'
+    r'\s*S?\d+[A-Za-z]?\s*[.:|]',
+    re.IGNORECASE
+)
+
+# List markers: "- item", "1. item", "a. item", "(a) item", "[1] item" or bare markers
+LIST_MARKER_PATTERN = re.compile(r'^([-*•]|\d+\.|[a-z]\.|\([a-z0-9]+\)|\[\d+\])(\s+|$)')
+
+
+def classify_line(
+    stripped: str,
+    index: int,
+    lines: List[str],
+    current: Optional[Block]
+) -> Tuple[Optional[str], Optional[str]]:
+    """Classify a non-blank markdown line.
+
+    Args:
+        stripped: Stripped line text
+        index: Line index (for header lookahead)
+        lines: All lines being parsed
+        current: Block the previous line belongs to (None at block start)
+
+    Returns:
+        Tuple of (block kind, section label). Kind is None when the line
+        continues the current block.
+    """
+    if current is not None and current.kind == BLOCK_TABLE and stripped.startswith('|'):
+        return None, None
+
+    match = SECTION_HEADING_PATTERN.match(stripped)
+    if match:
+        return BLOCK_HEADING, match.group(1)
+
+    if FIGURE_PLACEHOLDER_PATTERN.search(stripped):
+        return BLOCK_FIGURE, None
+
+    if stripped.startswith('|'):
+        return BLOCK_TABLE, None
+
+    if BOLD_CAPTION_PATTERN.match(stripped) or (current is None and CAPTION_LABEL_PATTERN.match(stripped)):
+        return BLOCK_CAPTION, None
+
+    if is_header_line(stripped, index, lines):
+        return BLOCK_HEADING, None
+
+    if LIST_MARKER_PATTERN.match(stripped) and (current is None or current.kind == BLOCK_LIST_ITEM):
+        return BLOCK_LIST_ITEM, None
+
+    if current is not None:
+        return None, None
+
+    return BLOCK_PARAGRAPH, None
+
+
+def parse_blocks(markdown: str, page: int = 0, offset: int = 0) -> List[Block]:
+    """Parse markdown into typed blocks.
+
+    Blank lines end a block. Block text keeps the original lines, so
+    ``markdown[span[0] - offset:span[1] - offset] == block.text`` until
+    a later stage rewrites the block.
+
+    Args:
+        markdown: Markdown text (typically one page chunk)
+        page: 0-indexed page number for the blocks
+        offset: Character offset of ``markdown`` in the full document
+
+    Returns:
+        List of Block objects in reading order
+    """
+    blocks = []
+    lines = markdown.split('\n')
+    current = None
+    pos = offset
+
+    for i, line in enumerate(lines):
+        start = pos
+        end = pos + len(line)
+        pos = end + 1
+
+        stripped = line.strip()
+        if not stripped:
+            current = None
+            continue
+
+        kind, section = classify_line(stripped, i, lines, current)
+
+        if kind is None:
+            current.text += '\n' + line
+            current.span = (current.span[0], end)
+            continue
+
+        block = Block(kind=kind, text=line, page=page, span=(start, end), section=section)
+        blocks.append(block)
+        current = block if kind in CONTINUABLE_KINDS or kind == BLOCK_TABLE else None
+
+    return blocks
+
+
+def render_block(block: Block) -> str:
+    """Render a single block back to markdown.
+
+    Args:
+        block: Block to render
+
+    Returns:
+        Markdown text for the block
+    """
+    if block.kind == BLOCK_HEADING and block.section is not None:
+        return f"### **{block.section}**"
+    return block.text
+
+
+def render_markdown(blocks: List[Block]) -> str:
+    """Render blocks to markdown, separating blocks with blank lines.
+
+    Args:
+        blocks: Blocks to render
+
+    Returns:
+        Markdown text
+    """
+    return '\n\n'.join(render_block(block) for block in blocks)
@@ -5,9 +5,12 @@ Build up carefully to avoid deleting real content.
 """
 
 import re
+from dataclasses import replace
+from typing import List
 import logging
 
 from ..config import CleanupConfig
+from ..models import Block, BLOCK_HEADING, BLOCK_PARAGRAPH, BLOCK_TABLE
 
 logger = logging.getLogger(__name__)
 
@@ -28,28 +31,23 @@ def remove_short_gibberish_lines(text: str) -> str:
     filtered = []
 
     for line in lines:
-        stripped = line.strip()
-
-        # Keep empty lines
-        if not stripped:
-            filtered.append(line)
+        if is_short_gibberish(line.strip()):
+            logger.debug(f"Removed short line: '{line.strip()}'")
             continue
+        filtered.append(line)
 
-        # Keep lines longer than 3 chars
-        if len(stripped) > 3:
-            filtered.append(line)
-            continue
+    return '\n'.join(filtered)
 
-        # Keep valid list markers
-        # a. b. c. / 1. 2. 3. / - / * / (a) / (1)
-        if re.match(r'^[a-z]\.$|^\d+\.$|^[-*]$|^\([a-z0-9]+\)$', stripped):
-            filtered.append(line)
-            continue
 
-        # Otherwise skip this short gibberish line
-        logger.debug(f"Removed short line: '{stripped}'")
+def is_short_gibberish(stripped: str) -> bool:
+    """Check if a stripped line is 1-3 characters of non-list-marker text."""
+    # Keep empty lines and lines longer than 3 chars
+    if not stripped or len(stripped) > 3:
+        return False
 
-    return '\n'.join(filtered)
+    # Keep valid list markers
+    # a. b. c. / 1. 2. 3. / - / * / (a) / (1)
+    return not re.match(r'^[a-z]\.$|^\d+\.$|^[-*]$|^\([a-z0-9]+\)$', stripped)
 
 
 def normalize_whitespace(text: str) -> str:
@@ -86,37 +84,32 @@ def remove_scattered_chars(text: str) -> str:
     filtered = []
 
     for line in lines:
-        stripped = line.strip()
-
-        # Keep empty lines
-        if not stripped:
-            filtered.append(line)
+        if is_scattered_chars(line.strip()):
+            logger.debug(f"Removed scattered chars: '{line.strip()}'")
             continue
+        filtered.append(line)
 
-        # Keep lines longer than 50 chars (likely real content)
-        if len(stripped) > 50:
-            filtered.append(line)
-            continue
+    return '\n'.join(filtered)
 
-        # Check if line is just single letters with spaces: "a b c d"
-        tokens = stripped.split()
-        if len(tokens) >= 3:
-            # If all tokens are single chars, it's likely figure labels
-            if all(len(t) == 1 for t in tokens):
-                logger.debug(f"Removed scattered chars: '{stripped}'")
-                continue
 
-            # If line is mostly numbers with spaces: "0 5 10 15 20 25"
-            # Check if >70% of tokens are pure numbers
-            number_tokens = sum(1 for t in tokens if t.replace('.', '').replace('-', '').isdigit())
-            if len(tokens) >= 4 and number_tokens / len(tokens) > 0.7:
-                logger.debug(f"Removed number sequence: '{stripped}'")
-                continue
+def is_scattered_chars(stripped: str) -> bool:
+    """Check if a stripped line is scattered single chars or a number sequence."""
+    # Keep empty lines and lines longer than 50 chars (likely real content)
+    if not stripped or len(stripped) > 50:
+        return False
 
-        # Keep the line
-        filtered.append(line)
+    tokens = stripped.split()
+    if len(tokens) < 3:
+        return False
 
-    return '\n'.join(filtered)
+    # If all tokens are single chars, it's likely figure labels: "a b c d"
+    if all(len(t) == 1 for t in tokens):
+        return True
+
+    # If line is mostly numbers with spaces: "0 5 10 15 20 25"
+    # Check if >70% of tokens are pure numbers
+    number_tokens = sum(1 for t in tokens if t.replace('.', '').replace('-', '').isdigit())
+    return len(tokens) >= 4 and number_tokens / len(tokens) > 0.7
 
 
 def remove_table_remnants(text: str) -> str:
@@ -137,37 +130,43 @@ def remove_table_remnants(text: str) -> str:
     filtered = []
 
     for line in lines:
-        stripped = line.strip()
-
-        # Skip empty lines
-        if not stripped:
-            filtered.append(line)
+        if is_table_remnant(line.strip()):
+            logger.debug(f"Removed table remnant: '{line.strip()[:60]}'")
             continue
+        filtered.append(line)
 
-        # Remove lines that are just pipes and dashes: |---|---|
-        if re.match(r'^[\|\-\s]+$', stripped):
-            logger.debug(f"Removed table divider: '{stripped[:60]}'")
-            continue
+    return '\n'.join(filtered)
 
-        # Remove lines with >4 pipe characters (likely table rows)
-        pipe_count = stripped.count('|')
-        if pipe_count > 4:
-            # Check if line has actual sentence-like content
-            # Real content has multiple words in at least one cell
-            content_between_pipes = [s.strip() for s in stripped.split('|')]
-            content_parts = [s for s in content_between_pipes if s]
 
-            # If no cell has >2 words, it's likely a table row with just labels/numbers
-            has_real_content = any(len(s.split()) > 2 for s in content_parts)
+def is_table_remnant(stripped: str) -> bool:
+    """Check if a stripped line is a table divider or a label-only table row."""
+    if not stripped:
+        return False
 
-            if not has_real_content:
-                logger.debug(f"Removed table row: '{stripped[:60]}'")
-                continue
+    # Lines that are just pipes and dashes: |---|---|
+    if re.match(r'^[\|\-\s]+$', stripped):
+        return True
 
-        # Keep the line
-        filtered.append(line)
+    # Lines with >4 pipe characters (likely table rows)
+    if stripped.count('|') > 4:
+        # Real content has multiple words in at least one cell
+        content_parts = [s.strip() for s in stripped.split('|') if s.strip()]
+
+        # If no cell has >2 words, it's likely a table row with just labels/numbers
+        return not any(len(s.split()) > 2 for s in content_parts)
+
+    return False
 
-    return '\n'.join(filtered)
+
+URL_PATTERN = re.compile(
+    r'https?://'       # http:// or https://
+    r'|www\.'          # www.
+    r'|\.com\b'        # .com
+    r'|\.org\b'        # .org
+    r'|\.edu\b'        # .edu
+    r'|\.gov\b',       # .gov
+    re.IGNORECASE
+)
 
 
 def remove_url_lines(text: str) -> str:
@@ -184,29 +183,55 @@ def remove_url_lines(text: str) -> str:
     lines = text.split('\n')
     filtered = []
 
-    url_patterns = [
-        r'https?://',      # http:// or https://
-        r'www\.',          # www.
-        r'\.com\b',        # .com
-        r'\.org\b',        # .org
-        r'\.edu\b',        # .edu
-        r'\.gov\b',        # .gov
-    ]
-
     for line in lines:
-        has_url = False
-        for pattern in url_patterns:
-            if re.search(pattern, line, re.IGNORECASE):
-                has_url = True
-                logger.debug(f"Removed URL line: '{line.strip()[:80]}'")
-                break
-
-        if not has_url:
-            filtered.append(line)
+        if has_url(line):
+            logger.debug(f"Removed URL line: '{line.strip()[:80]}'")
+            continue
+        filtered.append(line)
 
     return '\n'.join(filtered)
 
 
+def has_url(line: str) -> bool:
+    """Check if a line contains a URL or web address."""
+    return bool(URL_PATTERN.search(line))
+
+
+def is_fragment_line(s: str) -> bool:
+    """Check if a stripped line is an incomplete sentence fragment."""
+    if not s:
+        return False
+
+    # Very long lines are likely complete sentences (100+ chars)
+    if len(s) > 100:
+        return False
+
+    # Statistical notation (e.g., "_P_ = 0.321", "_n_ = 324 cells")
+    if re.search(r'_[A-Za-z]_\s*=', s):
+        return True  # Treat as fragment
+
+    # Short lines with just numbers/symbols (e.g., "Histamine 6")
+    word_count = len(s.split())
+    if word_count <= 3 and not s.rstrip()[-1:] in '.!?':
+        return True
+
+    # Has sentence-ending punctuation at end AND reasonable length
+    if s.rstrip()[-1:] in '.!?' and len(s) > 30:
+        return False  # Complete sentence
+
+    # Contains 3+ periods (likely multiple sentences or abbreviations)
+    if s.count('.') >= 3:
+        return False  # Likely real content
+
+    # Check if line has sentence structure (has common words like "the", "is", "are", "has")
+    has_sentence_words = bool(re.search(r'\b(the|is|are|was|were|has|have|had|can|will|would|should)\b', s, re.IGNORECASE))
+    if has_sentence_words and len(s) > 40:
+        return False  # Likely complete sentence
+
+    # Otherwise it's a fragment
+    return True
+
+
 def remove_incomplete_sentence_fragments(text: str) -> str:
     """Remove consecutive lines that are incomplete sentence fragments.
 
@@ -259,40 +284,6 @@ def remove_incomplete_sentence_fragments(text: str) -> str:
             i += 1
             continue
 
-        # Define what makes a line a "fragment" (incomplete sentence)
-        def is_fragment_line(s):
-            if not s:
-                return False
-
-            # Very long lines are likely complete sentences (100+ chars)
-            if len(s) > 100:
-                return False
-
-            # Statistical notation (e.g., "_P_ = 0.321", "_n_ = 324 cells")
-            if re.search(r'_[A-Za-z]_\s*=', s):
-                return True  # Treat as fragment
-
-            # Short lines with just numbers/symbols (e.g., "Histamine 6")
-            word_count = len(s.split())
-            if word_count <= 3 and not s.rstrip()[-1:] in '.!?':
-                return True
-
-            # Has sentence-ending punctuation at end AND reasonable length
-            if s.rstrip()[-1:] in '.!?' and len(s) > 30:
-                return False  # Complete sentence
-
-            # Contains 3+ periods (likely multiple sentences or abbreviations)
-            if s.count('.') >= 3:
-                return False  # Likely real content
-
-            # Check if line has sentence structure (has common words like "the", "is", "are", "has")
-            has_sentence_words = bool(re.search(r'\b(the|is|are|was|were|has|have|had|can|will|would|should)\b', s, re.IGNORECASE))
-            if has_sentence_words and len(s) > 40:
-                return False  # Likely complete sentence
-
-            # Otherwise it's a fragment
-            return True
-
         # Check if current line is a fragment
         if is_fragment_line(stripped):
             # Look ahead and collect all consecutive fragments (skip blank lines and single bold chars)
@@ -384,3 +375,86 @@ def cleanup_all(text: str, config: CleanupConfig = None) -> str:
     logger.info(f"Cleanup: {original_length} -> {len(text)} chars ({len(text)/original_length*100:.1f}% retained)")
 
     return text
+
+
+def _remove_fragment_blocks(blocks: List[Block]) -> List[Block]:
+    """Remove runs of 2+ consecutive fragment paragraph blocks.
+
+    Single bold characters (**a**, **b**) inside a run are removed with it.
+    """
+    kept = []
+    i = 0
+
+    while i < len(blocks):
+        block = blocks[i]
+
+        if block.kind == BLOCK_PARAGRAPH and is_fragment_line(block.text.strip()):
+            run_length = 1
+            j = i + 1
+            while j < len(blocks):
+                following = blocks[j]
+                stripped = following.text.strip()
+                if following.kind == BLOCK_HEADING and re.match(r'^\*\*[a-z0-9]\*\*$', stripped, re.IGNORECASE):
+                    j += 1
+                    continue
+                if following.kind == BLOCK_PARAGRAPH and is_fragment_line(stripped):
+                    run_length += 1
+                    j += 1
+                    continue
+                break
+
+            if run_length >= 2:
+                logger.debug(f"Removed {run_length} consecutive fragment blocks")
+                i = j
+                continue
+
+        kept.append(block)
+        i += 1
+
+    return kept
+
+
+def cleanup_blocks(blocks: List[Block], config: CleanupConfig = None) -> List[Block]:
+    """Apply minimal cleanup operations to typed blocks.
+
+    Block-level counterpart of cleanup_all, with the same output. Block
+    kinds replace the header/caption/list-marker regexes: headings and
+    captions are never fragment candidates and tables are filtered row by
+    row. Figure placeholders are kept, as cleanup_all keeps them.
+
+    Args:
+        blocks: Reflowed blocks
+        config: Cleanup configuration
+
+    Returns:
+        Cleaned blocks
+    """
+    if config is None:
+        config = CleanupConfig()
+
+    original_count = len(blocks)
+    filtered = []
+
+    for block in blocks:
+        if block.kind == BLOCK_TABLE:
+            rows = [row for row in block.text.split('\n')
+                    if row.strip() and not is_table_remnant(row.strip()) and not has_url(row)]
+            if rows:
+                filtered.append(replace(block, text='\n'.join(rows)))
+            continue
+
+        lines = [line for line in block.text.split('\n')
+                 if not is_short_gibberish(line.strip())
+                 and not is_scattered_chars(line.strip())
+                 and not has_url(line)]
+        if not any(line.strip() for line in lines):
+            continue
+
+        text = re.sub(r' {3,}', ' ', '\n'.join(lines))
+        filtered.append(block if text == block.text else replace(block, text=text))
+
+    cleaned = _remove_fragment_blocks(filtered)
+
+    logger.info(f"Cleanup: {original_count} -> {len(cleaned)} blocks")
+
+    return cleaned
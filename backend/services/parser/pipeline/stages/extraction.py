@@ -13,7 +13,9 @@ import pymupdf4llm
 from typing import List, Tuple, Optional
 import logging
 
-from ..models import FigureCaption, FigureRegion, GeometryInfo, StructureInfo
+from ..deadline import FIGURE_TEXT_REDACTION, Deadline
+from ..models import Block, FigureCaption, FigureRegion, GeometryInfo, StructureInfo
+from .blocks import parse_blocks
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
@@ -415,13 +417,7 @@ def extract_markdown(
     logger.info(f"Extracting markdown from {len(doc)} pages using pymupdf4llm")
 
     # Smart filtering if we have figure data
-    if geom_info and geom_info.figure_regions:
-        for page_num, page in enumerate(doc):
-            page_figure_regions = [f for f in geom_info.figure_regions if f.page == page_num]
-            page_captions = [c for c in geom_info.figure_captions if c.page == page_num]
-
-            if page_figure_regions:
-                filter_figure_text_from_page(page, page_figure_regions, page_captions, page_num)
+    filter_figure_text(doc, geom_info)
 
     # Extract with pymupdf4llm (existing code works great)
     markdown = pymupdf4llm.to_markdown(doc)
@@ -430,6 +426,73 @@ def extract_markdown(
     return markdown
 
 
+def extract_blocks(
+    doc: pymupdf.Document,
+    geom_info: GeometryInfo = None,
+    structure_info: StructureInfo = None,
+    deadline: Optional[Deadline] = None
+) -> List[Block]:
+    """Extract typed blocks from PDF with figure-aware filtering.
+
+    Same extraction as extract_markdown, but pymupdf4llm output is taken
+    per page and parsed into blocks carrying page numbers and source
+    spans in the concatenated markdown.
+
+    Args:
+        doc: pymupdf Document (after geometric cleaning)
+        geom_info: Optional GeometryInfo with figure regions and captions
+        structure_info: Optional StructureInfo (not currently used)
+        deadline: Optional parse deadline, checked before each page (figure
+            text is kept when it is close)
+
+    Returns:
+        List of Block objects in reading order
+    """
+    logger.info(f"Extracting blocks from {len(doc)} pages using pymupdf4llm")
+
+    filter_figure_text(doc, geom_info, deadline)
+
+    if deadline is None:
+        chunks = pymupdf4llm.to_markdown(doc, page_chunks=True)
+    else:
+        # Page by page, checking the deadline between pages (same output, no measurable cost)
+        chunks = []
+        for page_num in range(len(doc)):
+            deadline.check()
+            chunks.extend(pymupdf4llm.to_markdown(doc, pages=[page_num], page_chunks=True))
+
+    blocks = []
+    offset = 0
+    for page_num, chunk in enumerate(chunks):
+        page_markdown = chunk.get("text", "")
+        blocks.extend(parse_blocks(page_markdown, page=page_num, offset=offset))
+        offset += len(page_markdown)
+
+    logger.info(f"Extracted {len(blocks)} blocks ({offset} characters) total")
+    return blocks
+
+
+def filter_figure_text(doc: pymupdf.Document, geom_info: GeometryInfo = None, deadline: Optional[Deadline] = None):
+    """Redact text inside detected figure regions on every page.
+
+    Args:
+        doc: pymupdf Document (after geometric cleaning)
+        geom_info: Optional GeometryInfo with figure regions and captions
+        deadline: Optional parse deadline; redaction stops when it is close
+    """
+    if not geom_info or not geom_info.figure_regions:
+        return
+
+    for page_num, page in enumerate(doc):
+        if deadline is not None and not deadline.allows(FIGURE_TEXT_REDACTION):
+            break
+        page_figure_regions = [f for f in geom_info.figure_regions if f.page == page_num]
+        page_captions = [c for c in geom_info.figure_captions if c.page == page_num]
+
+        if page_figure_regions:
+            filter_figure_text_from_page(page, page_figure_regions, page_captions, page_num)
+
+
 # ============================================================
 #  TWO-COLUMN SORTING
 # ============================================================
@@ -10,6 +10,7 @@ Strategy:
 import pymupdf
 import logging
 from typing import List, Tuple, Optional
+from ..deadline import DRAWING_CLUSTERS, Deadline
 from ..models import FigureCaption, FigureRegion
 
 logger = logging.getLogger(__name__)
@@ -18,7 +19,8 @@ logger = logging.getLogger(__name__)
 def detect_figure_regions(
     doc: pymupdf.Document,
     captions: List[FigureCaption],
-    config
+    config,
+    deadline: Optional[Deadline] = None
 ) -> List[FigureRegion]:
     """
     Detect figure regions using two methods:
@@ -29,6 +31,8 @@ def detect_figure_regions(
         doc: pymupdf Document (after geometric cleaning)
         captions: List of detected FigureCaption objects
         config: Pipeline configuration
+        deadline: Optional parse deadline, checked per caption; cluster detection
+            stops when it is close
 
     Returns:
         List of FigureRegion objects
@@ -38,6 +42,8 @@ def detect_figure_regions(
 
     # Method 1: Caption-based vertical deletion
     for caption in captions:
+        if deadline is not None:
+            deadline.check()
         page = doc[caption.page]
         region = create_vertical_deletion_region(caption, page)
         if region:
@@ -45,6 +51,8 @@ def detect_figure_regions(
 
     # Method 2: Detect image/vector clusters for proximity filtering
     for page_num, page in enumerate(doc):
+        if deadline is not None and not deadline.allows(DRAWING_CLUSTERS):
+            break
         cluster_regions = detect_image_vector_clusters(page, page_num)
         all_regions.extend(cluster_regions)
 
@@ -8,8 +8,9 @@ import re
 from typing import Dict, List, Optional
 import logging
 
-from ..models import ParsedSection, Section
+from ..models import Block, ParsedSection, Section, BLOCK_HEADING
 from ..config import SectionConfig
+from .blocks import render_markdown
 
 logger = logging.getLogger(__name__)
 
@@ -74,6 +75,66 @@ def split_sections(markdown: str, config: SectionConfig = None) -> Dict[str, Par
     return sections
 
 
+def split_section_blocks(blocks: List[Block], config: SectionConfig = None) -> Dict[str, ParsedSection]:
+    """Split labeled blocks into named sections.
+
+    Block-level counterpart of split_sections: sections open at heading
+    blocks carrying a section label, and each section's text is rendered
+    from its own blocks only.
+
+    Args:
+        blocks: Labeled blocks
+        config: Section configuration
+
+    Returns:
+        Dictionary mapping section names to ParsedSection objects
+    """
+    if config is None:
+        config = SectionConfig()
+
+    sections = {}
+    groups = [(None, [])]
+
+    for block in blocks:
+        if block.kind == BLOCK_HEADING and block.section is not None:
+            groups.append((block.section, []))
+        else:
+            groups[-1][1].append(block)
+
+    # Handle preamble (content before first section)
+    preamble = render_markdown(groups[0][1]).strip()
+    if preamble:
+        sections['preamble'] = ParsedSection(
+            name='preamble',
+            text=preamble,
+            sentences=[],
+            order_priority=0
+        )
+
+    for label, section_blocks in groups[1:]:
+        name = label.strip().lower().replace(' ', '_')
+
+        sections[name] = ParsedSection(
+            name=name,
+            text=render_markdown(section_blocks).strip(),
+            sentences=[],
+            order_priority=config.section_order.get(name, 100)
+        )
+
+    # If no sections found, treat entire document as full_text
+    if not sections:
+        sections['full_text'] = ParsedSection(
+            name='full_text',
+            text=render_markdown(blocks),
+            sentences=[],
+            order_priority=100
+        )
+
+    logger.info(f"Split document into {len(sections)} sections: {list(sections.keys())}")
+
+    return sections
+
+
 def normalize_section_name(name: str) -> str:
     """Normalize section name to standard form.
 
@@ -8,11 +8,12 @@ Handles detection and removal of:
 
 import pymupdf
 import re
-from typing import Tuple, List
+from typing import Tuple, List, Optional
 import logging
 
 from ..models import GeometryInfo, StructureInfo, FigureCaption
 from ..config import GeometryConfig
+from ..deadline import Deadline
 
 logger = logging.getLogger(__name__)
 
@@ -227,7 +228,7 @@ def _check_if_bold(block: dict) -> bool:
     return False
 
 
-def detect_captions(doc: pymupdf.Document) -> List[FigureCaption]:
+def detect_captions(doc: pymupdf.Document, deadline: Optional[Deadline] = None) -> List[FigureCaption]:
     """Detect figure/table captions in a PDF document.
 
     Handles both:
@@ -238,6 +239,7 @@ def detect_captions(doc: pymupdf.Document) -> List[FigureCaption]:
 
     Args:
         doc: pymupdf Document (after cropping)
+        deadline: Optional parse deadline, checked before each page
 
     Returns:
         List of FigureCaption objects
@@ -270,6 +272,8 @@ def detect_captions(doc: pymupdf.Document) -> List[FigureCaption]:
     )
 
     for page_num, page in enumerate(doc):
+        if deadline is not None:
+            deadline.check()
         text_dict = page.get_text("dict")
         blocks = text_dict.get("blocks", [])
 
@@ -461,7 +465,8 @@ def analyze_geometry(doc: pymupdf.Document, config: GeometryConfig) -> GeometryI
 def apply_geometric_cleaning(
     doc: pymupdf.Document,
     config: GeometryConfig,
-    structure_info: StructureInfo = None
+    structure_info: StructureInfo = None,
+    deadline: Optional[Deadline] = None
 ) -> Tuple[pymupdf.Document, GeometryInfo]:
     """Complete geometric cleaning pipeline.
 
@@ -471,6 +476,7 @@ def apply_geometric_cleaning(
         doc: pymupdf Document to clean
         config: Geometry configuration
         structure_info: Optional StructureInfo (not currently used, kept for compatibility)
+        deadline: Optional parse deadline (drawing clusters are skipped when it is close)
 
     Returns:
         Tuple of (cleaned document, geometry info with captions and regions)
@@ -493,7 +499,7 @@ def apply_geometric_cleaning(
         logger.info(f"Cropped left margin at {geom_info.left_margin_cutoff}pt for line numbers")
 
     # Step 4: Detect captions on CROPPED pages (after footer removal)
-    geom_info.figure_captions = detect_captions(doc)
+    geom_info.figure_captions = detect_captions(doc, deadline)
     logger.info(f"Detected {len(geom_info.figure_captions)} captions on cropped pages")
 
     # Step 5: Detect figure regions using captions detected above
@@ -502,7 +508,8 @@ def apply_geometric_cleaning(
         geom_info.figure_regions = detect_figure_regions(
             doc,
             geom_info.figure_captions,
-            config
+            config,
+            deadline
         )
 
     return doc, geom_info
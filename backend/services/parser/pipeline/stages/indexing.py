@@ -1,37 +1,250 @@
-"""Sentence indexing stage using NLTK.
+"""Sentence indexing stage.
 
-Tokenizes section text into indexed sentences.
+Tokenizes section text into indexed sentences with one of three
+splitters (IndexingConfig.splitter): NLTK punkt, the built-in scientific
+splitter, or the simple regex fallback. The punkt model is loaded once per
+process (see preload_tokenizer) and never downloaded at request time;
+sentence offsets come from span tokenization.
 """
 
-import nltk
 import hashlib
-from typing import Dict
+import re
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
 import logging
 
-from ..models import ParsedSection, Sentence
+from ..models import Paragraph, ParsedSection, RevisionInfo, Sentence
 from ..config import IndexingConfig
+from .splitter import scientific_sentence_spans
 
 logger = logging.getLogger(__name__)
 
 
-def ensure_nltk_data():
-    """Ensure NLTK punkt tokenizer is downloaded."""
+# Available sentence splitters (IndexingConfig.splitter)
+SPLITTERS = ('nltk', 'scientific', 'simple')
+
+# Loaded punkt tokenizers, keyed by language (one per process)
+_TOKENIZERS: Dict[str, object] = {}
+
+# Paragraphs are separated by blank lines
+PARAGRAPH_BREAK_PATTERN = re.compile(r'\n\s*\n')
+
+# Memoized paragraph tokenization: (splitter, language, paragraph hash) -> sentence spans
+SPAN_CACHE_SIZE = 20000
+_SPAN_CACHE: "OrderedDict[Tuple[str, str, str], List[Tuple[int, int]]]" = OrderedDict()
+_SPAN_CACHE_LOCK = threading.Lock()  # Batch uploads index documents in several threads
+
+# Process pool for very long documents (created on first use)
+_POOL: Optional[ProcessPoolExecutor] = None
+_POOL_WORKERS = 0
+
+
+def load_tokenizer(language: str = 'english'):
+    """Return the punkt sentence tokenizer for a language, loading it once.
+
+    Args:
+        language: Language of the punkt model
+
+    Returns:
+        Punkt sentence tokenizer
+
+    Raises:
+        LookupError: If the punkt model data is not installed
+    """
+    tokenizer = _TOKENIZERS.get(language)
+    if tokenizer is None:
+        # Imported lazily so workers using the scientific splitter never load NLTK
+        import nltk
+        try:
+            from nltk.tokenize.punkt import PunktTokenizer
+            tokenizer = PunktTokenizer(language)
+        except ImportError:
+            # NLTK < 3.9 ships pickled models only
+            tokenizer = nltk.data.load(f'tokenizers/punkt/{language}.pickle')
+        _TOKENIZERS[language] = tokenizer
+        logger.info(f"Loaded NLTK punkt tokenizer ({language})")
+    return tokenizer
+
+
+def preload_tokenizer(config: IndexingConfig = None):
+    """Load the punkt tokenizer at process start.
+
+    Call from application startup so a missing model fails loudly there
+    instead of on the first upload.
+
+    Args:
+        config: Indexing configuration
+
+    Raises:
+        RuntimeError: If NLTK tokenization is enabled but punkt data is missing
+    """
+    if config is None:
+        config = IndexingConfig()
+
+    if not config.enable_sentence_indexing or resolve_splitter(config) != 'nltk':
+        return
+
     try:
-        nltk.data.find('tokenizers/punkt')
-    except LookupError:
-        logger.info("Downloading NLTK punkt tokenizer...")
-        nltk.download('punkt', quiet=True)
+        load_tokenizer(config.language)
+    except LookupError as e:
+        raise RuntimeError(
+            f"NLTK punkt data for '{config.language}' is not installed. "
+            f"Install it at build time: python -m nltk.downloader punkt_tab punkt"
+        ) from e
+
+
+def resolve_splitter(config: IndexingConfig) -> str:
+    """Return the sentence splitter selected by an indexing config.
+
+    ``use_nltk=False`` keeps its original meaning of falling back to the
+    simple splitter when the NLTK splitter is selected.
+
+    Args:
+        config: Indexing configuration
+
+    Returns:
+        One of SPLITTERS
+
+    Raises:
+        ValueError: If config.splitter is not a known splitter
+    """
+    if config.splitter not in SPLITTERS:
+        raise ValueError(f"Unknown sentence splitter '{config.splitter}'. Expected one of: {SPLITTERS}")
+    if config.splitter == 'nltk' and not config.use_nltk:
+        return 'simple'
+    return config.splitter
+
+
+def ensure_nltk_data(language: str = 'english'):
+    """Ensure NLTK punkt tokenizer is loaded (never downloads)."""
+    load_tokenizer(language)
+
+
+def shutdown_pool():
+    """Shut down the indexing process pool if one was started."""
+    global _POOL, _POOL_WORKERS
+    if _POOL is not None:
+        _POOL.shutdown()
+        _POOL = None
+        _POOL_WORKERS = 0
+
+
+def _get_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Return the shared indexing process pool, creating it on first use."""
+    global _POOL, _POOL_WORKERS
+    if _POOL is None or _POOL_WORKERS != max_workers:
+        shutdown_pool()
+        _POOL = ProcessPoolExecutor(max_workers=max_workers)
+        _POOL_WORKERS = max_workers
+    return _POOL
+
+
+def _paragraph_spans(args: Tuple[str, str, str]) -> List[Tuple[int, int]]:
+    """Pool worker: sentence spans for one paragraph's text."""
+    text, splitter, language = args
+    return sentence_spans(text, splitter=splitter, language=language)
+
+
+def split_paragraphs(text: str) -> List[Tuple[int, int]]:
+    """Return (start, end) spans of the blank-line separated paragraphs in text.
+
+    Args:
+        text: Section text
+
+    Returns:
+        List of paragraph spans, surrounding whitespace excluded
+    """
+    spans = []
+    start = 0
+
+    for end in [m.start() for m in PARAGRAPH_BREAK_PATTERN.finditer(text)] + [len(text)]:
+        chunk = text[start:end]
+        if chunk.strip():
+            spans.append((
+                start + len(chunk) - len(chunk.lstrip()),
+                end - (len(chunk) - len(chunk.rstrip()))
+            ))
+        start = end
+
+    return spans
+
+
+def paragraph_hash(text: str) -> str:
+    """Content hash of a paragraph, insensitive to whitespace changes.
+
+    Args:
+        text: Paragraph text
+
+    Returns:
+        Hex digest identifying the paragraph content
+    """
+    return hashlib.md5(' '.join(text.split()).encode()).hexdigest()
+
+
+def previous_paragraph_ids(sections: Dict[str, ParsedSection]) -> Dict[Tuple[str, str], List[List[str]]]:
+    """Map (section, paragraph hash) to the sentence IDs of an indexed document.
+
+    Used to carry sentence IDs over to a revision. Repeated paragraphs keep
+    one ID list per occurrence, in document order.
+
+    Args:
+        sections: Indexed sections of the previous version
+
+    Returns:
+        Dictionary of (section name, paragraph hash) -> list of sentence ID lists
+    """
+    mapping = {}
+
+    for section_name, section in sections.items():
+        if section.paragraphs:
+            for paragraph in section.paragraphs:
+                key = (section_name, paragraph.content_hash)
+                mapping.setdefault(key, []).append(list(paragraph.sentence_ids))
+            continue
+
+        # Sections indexed before paragraph records existed
+        paragraphs = split_paragraphs(section.text)
+        starts = [start for start, _ in paragraphs]
+        ids_by_paragraph = [[] for _ in paragraphs]
+
+        for sentence in section.sentences:
+            index = bisect_right(starts, sentence.char_start) - 1
+            if index >= 0:
+                ids_by_paragraph[index].append(sentence.id)
+
+        for (start, end), ids in zip(paragraphs, ids_by_paragraph):
+            key = (section_name, paragraph_hash(section.text[start:end]))
+            mapping.setdefault(key, []).append(ids)
+
+    return mapping
 
 
 def index_sentences(
     sections: Dict[str, ParsedSection],
-    config: IndexingConfig = None
+    config: IndexingConfig = None,
+    previous: Optional[Dict[str, ParsedSection]] = None
 ) -> Dict[str, ParsedSection]:
     """Split section text into indexed sentences.
 
+    Sections are split into paragraphs and all paragraphs are tokenized in
+    one batch. Tokenization is memoized per paragraph hash, so repeated or
+    unchanged paragraphs are never re-tokenized. Documents longer than
+    config.parallel_min_chars are fanned out to a process pool when
+    config.max_workers > 1.
+
+    Each section also gets its Paragraph records, and each sentence's
+    paragraph_index points at the paragraph containing it.
+
+    When ``previous`` is given (revision mode), sentences in paragraphs
+    whose content is unchanged keep their previous sentence IDs.
+
     Args:
         sections: Dictionary of sections to index
         config: Indexing configuration
+        previous: Indexed sections of the previous version of the document
 
     Returns:
         Updated sections with indexed sentences
@@ -42,118 +255,335 @@ def index_sentences(
     if not config.enable_sentence_indexing:
         return sections
 
-    if config.use_nltk:
-        ensure_nltk_data()
+    splitter = resolve_splitter(config)
+
+    # Paragraph spans and content keys for every section
+    paragraphs = {}
+    for name, section in sections.items():
+        paragraphs[name] = [
+            (start, end, paragraph_hash(section.text[start:end]))
+            for start, end in split_paragraphs(section.text)
+        ]
+
+    # Spans of this call's paragraphs, read only from here: the cache may evict
+    # them while new paragraphs are added. Tokenize each distinct miss once.
+    spans_by_key = {}
+    pending = {}
+    with _SPAN_CACHE_LOCK:
+        for name, section in sections.items():
+            for start, end, key in paragraphs[name]:
+                cache_key = (splitter, config.language, key)
+                if cache_key in spans_by_key or cache_key in pending:
+                    continue
+                if cache_key in _SPAN_CACHE:
+                    _SPAN_CACHE.move_to_end(cache_key)
+                    spans_by_key[cache_key] = _SPAN_CACHE[cache_key]
+                else:
+                    pending[cache_key] = section.text[start:end]
+
+    jobs = [(text, splitter, config.language) for text in pending.values()]
+    total_chars = sum(len(text) for text, _, _ in jobs)
+
+    if config.max_workers > 1 and total_chars >= config.parallel_min_chars and len(jobs) > 1:
+        logger.info(f"Indexing {total_chars} chars in {len(jobs)} paragraphs with {config.max_workers} workers")
+        chunksize = max(1, len(jobs) // (config.max_workers * 4))
+        results = _get_pool(config.max_workers).map(_paragraph_spans, jobs, chunksize=chunksize)
+    else:
+        results = map(_paragraph_spans, jobs)
 
-    indexed_sections = {}
+    new_spans = dict(zip(pending.keys(), results))
+    spans_by_key.update(new_spans)
+    _cache_spans(new_spans)
 
-    for section_name, section in sections.items():
-        sentences = tokenize_sentences(
-            section.text,
-            section_name,
-            use_nltk=config.use_nltk,
-            language=config.language
-        )
+    previous_ids = previous_paragraph_ids(previous) if previous else {}
+    reused = 0
+    indexed_sections = {}
 
-        indexed_sections[section_name] = ParsedSection(
+    for name, section in sections.items():
+        sentences = []
+        section_paragraphs = []
+        used_ids = set()
+        used_paragraph_ids = set()
+
+        for paragraph_index, (start, end, key) in enumerate(paragraphs[name]):
+            spans = [(start + s, start + e) for s, e in spans_by_key[(splitter, config.language, key)]]
+            paragraph_sentences = build_sentences(
+                section.text, name, spans,
+                first_index=len(sentences),
+                paragraph_index=paragraph_index
+            )
+
+            # Keep previous IDs if this paragraph is unchanged and splits the same way
+            candidates = previous_ids.get((name, key))
+            if candidates:
+                ids = candidates.pop(0)
+                if len(ids) == len(paragraph_sentences) and not used_ids.intersection(ids):
+                    for sentence, sentence_id in zip(paragraph_sentences, ids):
+                        sentence.id = sentence_id
+                    reused += len(ids)
+
+            for sentence in paragraph_sentences:
+                sentence.id = _unique_id(sentence.id, used_ids)
+                used_ids.add(sentence.id)
+
+            sentences.extend(paragraph_sentences)
+
+            paragraph_id = _unique_id(generate_paragraph_id(name, key), used_paragraph_ids)
+            used_paragraph_ids.add(paragraph_id)
+            section_paragraphs.append(Paragraph(
+                id=paragraph_id,
+                section=name,
+                index=paragraph_index,
+                char_start=start,
+                char_end=end,
+                content_hash=key,
+                sentence_ids=[sentence.id for sentence in paragraph_sentences]
+            ))
+
+        indexed_sections[name] = ParsedSection(
             name=section.name,
             text=section.text,
             sentences=sentences,
-            order_priority=section.order_priority
+            order_priority=section.order_priority,
+            paragraphs=section_paragraphs
         )
 
     total_sentences = sum(len(s.sentences) for s in indexed_sections.values())
-    logger.info(f"Indexed {total_sentences} sentences across {len(indexed_sections)} sections")
+    logger.info(f"Indexed {total_sentences} sentences across {len(indexed_sections)} sections"
+                f" ({len(jobs)} paragraphs tokenized, {reused} sentence IDs kept)")
 
     return indexed_sections
 
 
+def diff_revision(
+    previous_doc_id: str,
+    previous: Dict[str, ParsedSection],
+    sections: Dict[str, ParsedSection]
+) -> RevisionInfo:
+    """Compare indexed sections of a revision with its previous version.
+
+    Relies on index_sentences(previous=...) having kept the IDs of
+    unchanged sentences. A paragraph is flagged for re-review if it has a
+    sentence whose ID is new, or if its text matches no paragraph of the
+    previous section (a sentence was deleted from it). A section that only
+    lost text (removed sentences or whole paragraphs) is listed with no
+    paragraph indices, so it is still re-reviewed.
+
+    Args:
+        previous_doc_id: Document ID of the previous version
+        previous: Indexed sections of the previous version
+        sections: Indexed sections of the revision
+
+    Returns:
+        RevisionInfo describing the changes
+    """
+    previous_ids = {s.id for section in previous.values() for s in section.sentences}
+    current_ids = {s.id for section in sections.values() for s in section.sentences}
+    revision = RevisionInfo(previous_doc_id=previous_doc_id)
+
+    for name, section in sections.items():
+        changed = set()
+
+        for sentence in section.sentences:
+            if sentence.id in previous_ids:
+                revision.unchanged_sentences += 1
+                continue
+            revision.changed_sentence_ids.append(sentence.id)
+            changed.add(sentence.paragraph_index)
+
+        previous_section = previous.get(name)
+        if previous_section is not None:
+            previous_hashes = {p.content_hash for p in previous_section.paragraphs}
+            current_hashes = {p.content_hash for p in section.paragraphs}
+            changed.update(p.index for p in section.paragraphs if p.content_hash not in previous_hashes)
+            lost_text = (previous_hashes - current_hashes or
+                         any(s.id not in current_ids for s in previous_section.sentences))
+        else:
+            lost_text = False
+
+        if changed or lost_text:
+            revision.changed_paragraphs[name] = sorted(changed)
+
+    revision.removed_sentence_ids = [
+        s.id for section in previous.values() for s in section.sentences if s.id not in current_ids
+    ]
+
+    logger.info(f"Revision of {previous_doc_id}: {len(revision.changed_sentence_ids)} changed, "
+                f"{len(revision.removed_sentence_ids)} removed, {revision.unchanged_sentences} unchanged sentences")
+
+    return revision
+
+
+def _cache_spans(new_spans: Dict[Tuple[str, str, str], List[Tuple[int, int]]]):
+    """Store paragraph sentence spans, evicting the least recently used."""
+    with _SPAN_CACHE_LOCK:
+        for cache_key, spans in new_spans.items():
+            _SPAN_CACHE[cache_key] = spans
+            _SPAN_CACHE.move_to_end(cache_key)
+        while len(_SPAN_CACHE) > SPAN_CACHE_SIZE:
+            _SPAN_CACHE.popitem(last=False)
+
+
+def _unique_id(sentence_id: str, used_ids: set) -> str:
+    """Suffix a sentence ID that collides with one already used in the section."""
+    if sentence_id not in used_ids:
+        return sentence_id
+
+    suffix = 2
+    while f"{sentence_id}_{suffix}" in used_ids:
+        suffix += 1
+    return f"{sentence_id}_{suffix}"
+
+
 def tokenize_sentences(
     text: str,
     section_name: str,
     use_nltk: bool = True,
-    language: str = 'english'
+    language: str = 'english',
+    splitter: Optional[str] = None
 ) -> list[Sentence]:
     """Tokenize text into sentences.
 
     Args:
         text: Text to tokenize
         section_name: Name of section (for sentence IDs)
-        use_nltk: Whether to use NLTK tokenizer
+        use_nltk: Whether to use NLTK tokenizer (when splitter is not given)
         language: Language for NLTK tokenizer
+        splitter: Sentence splitter to use, one of SPLITTERS
 
     Returns:
         List of Sentence objects
     """
-    if use_nltk:
+    if splitter is None:
+        splitter = 'nltk' if use_nltk else 'simple'
+
+    sentences = []
+    for paragraph_index, (start, end) in enumerate(split_paragraphs(text)):
+        spans = sentence_spans(text[start:end], splitter=splitter, language=language)
+        sentences.extend(build_sentences(
+            text, section_name,
+            [(start + s, start + e) for s, e in spans],
+            first_index=len(sentences),
+            paragraph_index=paragraph_index
+        ))
+
+    return sentences
+
+
+def sentence_spans(
+    text: str,
+    splitter: str = 'nltk',
+    language: str = 'english'
+) -> List[Tuple[int, int]]:
+    """Return (start, end) character spans of the sentences in text.
+
+    Args:
+        text: Text to tokenize
+        splitter: Sentence splitter to use, one of SPLITTERS
+        language: Language for NLTK tokenizer
+
+    Returns:
+        List of sentence spans
+    """
+    if splitter == 'scientific':
+        return scientific_sentence_spans(text)
+
+    if splitter == 'nltk':
         try:
-            sent_detector = nltk.data.load(f'tokenizers/punkt/{language}.pickle')
-            sentence_texts = sent_detector.tokenize(text)
+            return list(load_tokenizer(language).span_tokenize(text))
         except Exception as e:
             logger.warning(f"NLTK tokenization failed: {e}. Falling back to simple split.")
-            sentence_texts = simple_sentence_split(text)
-    else:
-        sentence_texts = simple_sentence_split(text)
 
-    # Create Sentence objects with IDs
+    return simple_sentence_spans(text)
+
+
+def build_sentences(
+    text: str,
+    section_name: str,
+    spans: List[Tuple[int, int]],
+    first_index: int = 0,
+    paragraph_index: int = 0
+) -> list[Sentence]:
+    """Create Sentence objects from sentence spans.
+
+    Args:
+        text: Section text the spans refer to
+        section_name: Name of section (for sentence IDs)
+        spans: Sentence (start, end) spans in text
+        first_index: Index of the first sentence within its section
+        paragraph_index: Index of the paragraph containing the spans
+
+    Returns:
+        List of Sentence objects
+    """
     sentences = []
-    char_pos = 0
 
-    for para_idx, sent_text in enumerate(sentence_texts):
-        sent_text = sent_text.strip()
-        if not sent_text:
+    for start, end in spans:
+        sent_text = text[start:end]
+        stripped = sent_text.strip()
+        if not stripped:
             continue
 
-        # Find position in original text
-        char_start = text.find(sent_text, char_pos)
-        if char_start == -1:
-            char_start = char_pos
-        char_end = char_start + len(sent_text)
-        char_pos = char_end
+        # Tighten span to the stripped text
+        char_start = start + (len(sent_text) - len(sent_text.lstrip()))
+        char_end = char_start + len(stripped)
+        index = first_index + len(sentences)
 
-        # Generate unique ID
-        sent_id = generate_sentence_id(section_name, para_idx, sent_text)
-
-        sentence = Sentence(
-            id=sent_id,
+        sentences.append(Sentence(
+            id=generate_sentence_id(section_name, index, stripped),
             section=section_name,
-            text=sent_text,
+            text=stripped,
             char_start=char_start,
             char_end=char_end,
-            paragraph_index=para_idx
-        )
-
-        sentences.append(sentence)
+            paragraph_index=paragraph_index
+        ))
 
     return sentences
 
 
-def simple_sentence_split(text: str) -> list[str]:
-    """Simple sentence splitting fallback.
+# Sentence boundary for the simple splitter: terminator, whitespace, capital letter
+SIMPLE_BOUNDARY_PATTERN = re.compile(r'[.!?](?=\s+[A-Z])')
+
+
+def simple_sentence_spans(text: str) -> List[Tuple[int, int]]:
+    """Simple sentence splitting fallback returning character spans.
 
     Args:
         text: Text to split
 
     Returns:
-        List of sentence strings
+        List of sentence (start, end) spans, whitespace excluded
     """
-    # Split on sentence terminators followed by space and capital letter
-    import re
-    sentences = re.split(r'([.!?])\s+(?=[A-Z])', text)
+    spans = []
+    start = 0
+
+    for match in SIMPLE_BOUNDARY_PATTERN.finditer(text):
+        spans.append((start, match.end()))
+        start = match.end()
+    spans.append((start, len(text)))
 
-    # Reconstruct sentences (split creates [sent, terminator, sent, terminator, ...])
     result = []
-    for i in range(0, len(sentences) - 1, 2):
-        if i + 1 < len(sentences):
-            result.append(sentences[i] + sentences[i+1])
-        else:
-            result.append(sentences[i])
+    for start, end in spans:
+        chunk = text[start:end]
+        if not chunk.strip():
+            continue
+        start += len(chunk) - len(chunk.lstrip())
+        end -= len(chunk) - len(chunk.rstrip())
+        result.append((start, end))
+
+    return result
+
+
+def simple_sentence_split(text: str) -> list[str]:
+    """Simple sentence splitting fallback.
 
-    # Add final sentence if exists
-    if len(sentences) % 2 == 1:
-        result.append(sentences[-1])
+    Args:
+        text: Text to split
 
-    return [s.strip() for s in result if s.strip()]
+    Returns:
+        List of sentence strings
+    """
+    return [text[start:end] for start, end in simple_sentence_spans(text)]
 
 
 def generate_sentence_id(section: str, index: int, text: str) -> str:
@@ -170,3 +600,19 @@ def generate_sentence_id(section: str, index: int, text: str) -> str:
     # Use hash of text to ensure uniqueness
     text_hash = hashlib.md5(text.encode()).hexdigest()[:8]
     return f"{section}_{index}_{text_hash}"
+
+
+def generate_paragraph_id(section: str, text_hash: str) -> str:
+    """Generate ID for a paragraph from its content hash.
+
+    Content-based, so an unchanged paragraph keeps its ID when paragraphs
+    are inserted or removed around it.
+
+    Args:
+        section: Section name
+        text_hash: Paragraph content hash (see paragraph_hash)
+
+    Returns:
+        Paragraph ID
+    """
+    return f"{section}_p_{text_hash[:8]}"
@@ -6,9 +6,10 @@ for title, abstract, introduction, and other detected sections.
 
 import re
 import logging
-from typing import Optional
+from dataclasses import replace
+from typing import List, Optional
 
-from ..models import StructureInfo
+from ..models import Block, StructureInfo, BLOCK_HEADING, BLOCK_PARAGRAPH
 
 logger = logging.getLogger(__name__)
 
@@ -115,3 +116,69 @@ def inject_section_labels(markdown: str, structure_info: StructureInfo) -> str:
                 logger.info("Inserted Introduction label (fallback)")
 
     return result
+
+
+def _squash(text: str) -> str:
+    """Lowercase text and drop whitespace for header comparison."""
+    return re.sub(r'\s+', '', text.lower())
+
+
+def label_blocks(blocks: List[Block], structure_info: StructureInfo) -> List[Block]:
+    """Mark detected section headers as section-opening heading blocks.
+
+    Block-level counterpart of inject_section_labels. A header matches a
+    heading or single-line paragraph block whose text (ignoring markdown
+    markers, whitespace and numbering) equals the detected header text.
+
+    Args:
+        blocks: Cleaned blocks
+        structure_info: Structure information from analysis stage
+
+    Returns:
+        Blocks with section labels set
+    """
+    logger.info("Labeling section blocks")
+
+    blocks = list(blocks)
+
+    # 1. Label all detected section headers
+    labeled_sections = set()
+    for header in structure_info.section_headers:
+        labeled_sections.add(header.normalized_name)
+
+        header_clean = header.text.strip('*#.: ')
+        header_label = re.sub(r'^\d+\.?\s*', '', header_clean)
+        targets = {_squash(header_clean), _squash(header_label)}
+
+        for idx, block in enumerate(blocks):
+            if block.section is not None or block.kind not in (BLOCK_HEADING, BLOCK_PARAGRAPH):
+                continue
+            if '\n' in block.text.strip():
+                continue
+            if _squash(block.text.strip().lstrip('#').strip('*#.: ')) in targets:
+                blocks[idx] = replace(block, kind=BLOCK_HEADING, section=header_label)
+                logger.info(f"Labeled section: {header.normalized_name}")
+                break
+
+    # 2. Fallback: label substantial content before the first section as introduction
+    if 'introduction' not in labeled_sections:
+        first_section = next((i for i, b in enumerate(blocks) if b.section is not None), None)
+        preamble = blocks[:first_section] if first_section is not None else []
+
+        if sum(len(b.text) + 2 for b in preamble) > 500:
+            char_count = 0
+            for i, block in enumerate(preamble):
+                char_count += len(block.text) + 1
+                if char_count > 300 and len(block.text.strip()) > 100:
+                    if i > 0:
+                        blocks.insert(i, Block(
+                            kind=BLOCK_HEADING,
+                            text='### **Introduction**',
+                            page=block.page,
+                            span=(block.span[0], block.span[0]),
+                            section='Introduction'
+                        ))
+                        logger.info("Inserted Introduction label (fallback)")
+                    break
+
+    return blocks
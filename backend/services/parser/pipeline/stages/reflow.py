@@ -4,10 +4,12 @@ Intelligently reconstructs paragraphs from line-broken PDF text.
 """
 
 import re
+from dataclasses import replace
 from typing import List
 import logging
 
 from ..config import ReflowConfig
+from ..models import Block, BLOCK_PARAGRAPH, BLOCK_CAPTION, BLOCK_LIST_ITEM
 
 logger = logging.getLogger(__name__)
 
@@ -73,6 +75,28 @@ def merge_hyphenations(text: str) -> str:
     return text
 
 
+def ends_paragraph(stripped: str, next_line: str) -> bool:
+    """Decide whether a line closes the paragraph it belongs to.
+
+    A line closes its paragraph when it ends with a sentence terminator
+    or citation and the next line starts with a capital or is empty.
+
+    Args:
+        stripped: Stripped current line
+        next_line: Stripped next line ('' if none)
+
+    Returns:
+        True if the paragraph should break after this line
+    """
+    ends_with_terminator = any(stripped.endswith(p) for p in ['.', '!', '?', ':', ';'])
+    ends_with_citation = re.search(r'\[\d+\]$|\(\d{4}\)$', stripped)
+
+    if not (ends_with_terminator or ends_with_citation):
+        return False
+
+    return not next_line or next_line[0].isupper()
+
+
 def reflow_text(markdown: str, config: ReflowConfig = None) -> str:
     """Intelligently reconstruct paragraphs from line-broken text.
 
@@ -117,24 +141,14 @@ def reflow_text(markdown: str, config: ReflowConfig = None) -> str:
             reflowed.append(line)  # Keep original formatting for headers
             continue
 
-        # Check if line ends with sentence terminator
-        ends_with_terminator = any(stripped.endswith(p) for p in ['.', '!', '?', ':', ';'])
-        ends_with_citation = re.search(r'\[\d+\]$|\(\d{4}\)$', stripped)
-
-        # Check if next line starts with capital or is empty
         next_line = lines[i+1].strip() if i+1 < len(lines) else ''
-        next_starts_capital = next_line and next_line[0].isupper()
 
         # Decide whether to break or continue
-        if ends_with_terminator or ends_with_citation:
-            current_paragraph.append(stripped)
-            if next_starts_capital or not next_line:
-                # Likely sentence/paragraph end
-                reflowed.append(' '.join(current_paragraph))
-                current_paragraph = []
-        else:
-            # Continue paragraph
-            current_paragraph.append(stripped)
+        current_paragraph.append(stripped)
+        if ends_paragraph(stripped, next_line):
+            # Likely sentence/paragraph end
+            reflowed.append(' '.join(current_paragraph))
+            current_paragraph = []
 
     # Flush remaining paragraph
     if current_paragraph:
@@ -144,3 +158,117 @@ def reflow_text(markdown: str, config: ReflowConfig = None) -> str:
     logger.info(f"Reflowed text: {len(lines)} lines -> {len(reflowed)} lines")
 
     return result
+
+
+def join_lines(lines: List[str], merge_hyphens: bool = True) -> str:
+    """Join stripped lines with spaces, merging line-break hyphenations.
+
+    Args:
+        lines: Stripped, non-empty lines
+        merge_hyphens: Whether "hyphen-" + "ated" becomes "hyphenated"
+
+    Returns:
+        Joined text
+    """
+    joined = ''
+    for line in lines:
+        if not joined:
+            joined = line
+        elif merge_hyphens and re.search(r'\w-$', joined) and line[0].isalnum():
+            joined = joined[:-1] + line
+        else:
+            joined += ' ' + line
+    return joined
+
+
+def _merge_hyphenated_blocks(blocks: List[Block]) -> List[Block]:
+    """Merge paragraph blocks split by a blank line inside a hyphenated word.
+
+    Gap characters are kept as newlines so line offsets stay exact.
+    """
+    merged = []
+    for block in blocks:
+        prev = merged[-1] if merged else None
+        if (prev is not None and prev.kind == BLOCK_PARAGRAPH and block.kind == BLOCK_PARAGRAPH
+                and re.search(r'\w-$', prev.text.rstrip()) and block.text.lstrip()[:1].isalnum()):
+            gap = '\n' * max(block.span[0] - prev.span[1], 1)
+            merged[-1] = replace(prev, text=prev.text + gap + block.text, span=(prev.span[0], block.span[1]))
+            continue
+        merged.append(block)
+    return merged
+
+
+def _split_paragraph(block: Block, merge_hyphens: bool) -> List[Block]:
+    """Reflow a paragraph block into one block per reconstructed paragraph."""
+    lines = block.text.split('\n')
+    paragraphs = []
+    current = []
+    current_start = None
+    pos = block.span[0]
+
+    for i, line in enumerate(lines):
+        start = pos
+        pos += len(line) + 1
+        stripped = line.strip()
+        if not stripped:
+            continue
+
+        if current_start is None:
+            current_start = start
+        current.append(stripped)
+
+        next_line = ''
+        for following in lines[i+1:]:
+            if following.strip():
+                next_line = following.strip()
+                break
+
+        if not next_line or ends_paragraph(stripped, next_line):
+            paragraphs.append(replace(
+                block,
+                text=join_lines(current, merge_hyphens),
+                span=(current_start, start + len(line))
+            ))
+            current = []
+            current_start = None
+
+    return paragraphs
+
+
+def reflow_blocks(blocks: List[Block], config: ReflowConfig = None) -> List[Block]:
+    """Reconstruct paragraphs from line-broken blocks.
+
+    Block-level counterpart of reflow_text: headers were classified when
+    the blocks were parsed, so only paragraph, caption and list item
+    blocks are rewritten. Paragraph blocks are split wherever a line ends
+    a sentence and the next starts with a capital.
+
+    Args:
+        blocks: Blocks from the extraction stage
+        config: Reflow configuration
+
+    Returns:
+        Reflowed blocks
+    """
+    if config is None:
+        config = ReflowConfig()
+
+    if not config.enable_reflow:
+        return blocks
+
+    if config.merge_hyphenations:
+        blocks = _merge_hyphenated_blocks(blocks)
+
+    reflowed = []
+    for block in blocks:
+        if block.kind == BLOCK_PARAGRAPH:
+            reflowed.extend(_split_paragraph(block, config.merge_hyphenations))
+        elif block.kind in (BLOCK_CAPTION, BLOCK_LIST_ITEM):
+            lines = [line.strip() for line in block.text.split('\n') if line.strip()]
+            reflowed.append(replace(block, text=join_lines(lines, config.merge_hyphenations)))
+        else:
+            reflowed.append(block)
+
+    logger.info(f"Reflowed blocks: {len(blocks)} -> {len(reflowed)}")
+
+    return reflowed
@@ -0,0 +1,111 @@
+"""Scientific-text sentence splitter.
+
+Dependency-free sentence boundary detection tuned for manuscripts: it
+knows scientific abbreviations ("et al.", "Fig. 2", "e.g.", "i.e."),
+author initials, decimals, and keeps trailing citation markers
+("... cells [3, 4]." / "... cells.12,13") with the sentence they cite.
+Selected with ``IndexingConfig(splitter='scientific')``.
+"""
+
+import re
+from typing import List, Tuple
+
+# Abbreviations that end with a period but do not end a sentence (lowercased, no final period)
+ABBREVIATIONS = {
+    # Citations and cross-references
+    'al', 'fig', 'figs', 'eq', 'eqs', 'ref', 'refs', 'tab', 'tbl', 'sect', 'sec',
+    'ch', 'chap', 'no', 'nos', 'vol', 'vols', 'pp', 'p', 'suppl', 'ext', 'app',
+    # Latin and connective abbreviations
+    'e.g', 'i.e', 'cf', 'vs', 'viz', 'ca', 'resp', 'incl',
+    'et', 'ibid', 'n.b',
+    # Titles and affiliations
+    'dr', 'mr', 'mrs', 'ms', 'prof', 'dept', 'univ', 'inc', 'ltd', 'co', 'corp',
+    # Measurements and taxonomy (units like "min." often end sentences, so are omitted)
+    'approx', 'conc', 'temp', 'wt', 'sp', 'spp', 'var', 'subsp', 'st', 'ed', 'eds', 'rev',
+    # Months
+    'jan', 'feb', 'mar', 'apr', 'jun', 'jul', 'aug', 'sep', 'sept', 'oct', 'nov', 'dec',
+}
+
+# Candidate boundary: terminator(s), closing quotes/brackets, optional trailing
+# citation ("[3, 4]" or superscript-style "12,13"), then whitespace and a
+# sentence start (capital letter, or an opening quote/bracket)
+BOUNDARY_PATTERN = re.compile(
+    r'[.!?]+'
+    r'[\'"”’)\]]*'
+    r'(?P<cite>\s?\[\d+(?:\s*[,–-]\s*\d+)*\]|\d+(?:[,–-]\d+)*)?'
+    r'(?=\s+[(\[“"\']?[A-Z])'
+)
+
+# Word immediately before a period (letters with internal periods, e.g. "e.g")
+PRECEDING_WORD_PATTERN = re.compile(r'([A-Za-z](?:[A-Za-z.]*[A-Za-z])?)$')
+
+
+def is_boundary(text: str, match: re.Match) -> bool:
+    """Decide whether a candidate terminator match ends a sentence.
+
+    Args:
+        text: Text being split
+        match: BOUNDARY_PATTERN match
+
+    Returns:
+        True if the sentence ends at match.end()
+    """
+    start = match.start()
+
+    # Only periods are ambiguous
+    if text[start] != '.':
+        return True
+
+    # Superscript citation digits directly after a number are a decimal ("0.5 Hz")
+    if match.group('cite') and not match.group('cite').lstrip().startswith('['):
+        if start > 0 and text[start - 1].isdigit():
+            return False
+
+    word_match = PRECEDING_WORD_PATTERN.search(text, max(0, start - 20), start)
+    if not word_match:
+        return True
+
+    word = word_match.group(1)
+
+    # Single capital letter: author initial ("J. Smith") or list label
+    if len(word) == 1 and word.isupper():
+        return False
+
+    return word.lower() not in ABBREVIATIONS
+
+
+def scientific_sentence_spans(text: str) -> List[Tuple[int, int]]:
+    """Split scientific text into sentence spans.
+
+    Args:
+        text: Text to split
+
+    Returns:
+        List of sentence (start, end) spans, whitespace excluded
+    """
+    breaks = [match.end() for match in BOUNDARY_PATTERN.finditer(text) if is_boundary(text, match)]
+
+    spans = []
+    start = 0
+    for end in breaks + [len(text)]:
+        chunk = text[start:end]
+        if chunk.strip():
+            spans.append((
+                start + len(chunk) - len(chunk.lstrip()),
+                end - (len(chunk) - len(chunk.rstrip()))
+            ))
+        start = end
+
+    return spans
+
+
+def scientific_sentence_split(text: str) -> List[str]:
+    """Split scientific text into sentence strings.
+
+    Args:
+        text: Text to split
+
+    Returns:
+        List of sentence strings
+    """
+    return [text[start:end] for start, end in scientific_sentence_spans(text)]
@@ -0,0 +1,9 @@
+"""Test configuration shared by all test modules."""
+
+import os
+
+# Keep the API's stores in an in-memory database instead of the default SQLite file
+os.environ.setdefault('DATABASE_URL', 'sqlite://')
+
+# Keep the API's cache in process instead of connecting to a local Redis
+os.environ.setdefault('REDIS_URL', '')
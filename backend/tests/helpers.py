@@ -0,0 +1,16 @@
+"""Builders for documents shared by the indexer tests."""
+
+from services.parser.pipeline.config import IndexingConfig
+from services.parser.pipeline.models import ParsedDocument, ParsedSection
+from services.parser.pipeline.stages.indexing import index_sentences
+
+
+def make_sections(**texts):
+    """Sentence-indexed sections from name=text keyword arguments."""
+    sections = {name: ParsedSection(name, text) for name, text in texts.items()}
+    return index_sentences(sections, IndexingConfig(splitter='scientific'))
+
+
+def make_doc(sections, doc_id='doc', doc_hash='hash'):
+    """Document with the given sections and no figures, citations or markdown."""
+    return ParsedDocument(doc_id, doc_hash, 'Title', sections, [], [], [], [], '')
@@ -0,0 +1,241 @@
+"""Unit tests for upload rate limits and fair parse scheduling."""
+
+import asyncio
+import io
+import zipfile
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from core import admission
+from core.admission import FairScheduler, RateLimiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestRateLimiter:
+    """Tests for per-client token buckets."""
+
+    def test_burst_then_rate(self):
+        """Should admit a burst, reject beyond it, and refill at the rate."""
+        clock = FakeClock()
+        limiter = RateLimiter(rate_per_minute=60, burst=2, clock=clock)
+
+        assert limiter.acquire('a') == 0.0
+        assert limiter.acquire('a') == 0.0
+        assert limiter.acquire('a') == pytest.approx(1.0)
+        clock.now += 1.0
+        assert limiter.acquire('a') == 0.0
+
+    def test_clients_are_independent(self):
+        """Should not let one client's uploads use another's tokens."""
+        limiter = RateLimiter(rate_per_minute=60, burst=1, clock=FakeClock())
+        limiter.acquire('batch')
+
+        assert limiter.acquire('batch') > 0
+        assert limiter.acquire('interactive') == 0.0
+        assert limiter.metrics()['rejected_by_client'] == {'batch': 1}
+
+    def test_large_requests_need_a_full_bucket(self):
+        """Should admit requests larger than the burst once the bucket is full."""
+        clock = FakeClock()
+        limiter = RateLimiter(rate_per_minute=60, burst=10, clock=clock)
+
+        assert limiter.acquire('a', cost=80) == 0.0
+        assert limiter.acquire('a', cost=80) == pytest.approx(10.0)
+
+    def test_check_takes_nothing(self):
+        """Should report the wait without using tokens, counting rejections."""
+        limiter = RateLimiter(rate_per_minute=60, burst=1, clock=FakeClock())
+
+        assert limiter.check('a') == 0.0
+        assert limiter.acquire('a') == 0.0
+        assert limiter.check('a') == pytest.approx(1.0)
+        assert limiter.check('a') == pytest.approx(1.0)
+        assert limiter.metrics()['rejected'] == 2
+
+    def test_rejection_metrics_bounded(self, monkeypatch):
+        """Should keep per-client rejections for recent clients and list the most rejected."""
+        monkeypatch.setattr(admission, 'MAX_TRACKED_CLIENTS', 3)
+        monkeypatch.setattr(admission, 'METRICS_TOP_CLIENTS', 2)
+        limiter = RateLimiter(rate_per_minute=60, burst=1, clock=FakeClock())
+        for client in ['a', 'a', 'a', 'b', 'b', 'c', 'd', 'e']:
+            limiter.acquire(client)
+            limiter.acquire(client)
+
+        metrics = limiter.metrics()
+        assert len(limiter._rejected_by_client) == 3
+        assert metrics['rejected'] == 11
+        assert list(metrics['rejected_by_client']) == ['c', 'd']
+
+    def test_disabled(self):
+        """Should admit everything with a zero rate."""
+        limiter = RateLimiter(rate_per_minute=0, burst=1)
+        assert all(limiter.acquire('a') == 0.0 for _ in range(5))
+
+
+async def run_parses(scheduler, jobs, started):
+    """Run (client, name) jobs through the scheduler, recording start order."""
+    async def parse(client, name):
+        async with scheduler.slot(client):
+            started.append(name)
+            await asyncio.sleep(0.001)
+
+    await asyncio.gather(*(parse(client, name) for client, name in jobs))
+
+
+class TestFairScheduler:
+    """Tests for weighted round-robin parse slots."""
+
+    def test_limits_running_parses(self):
+        """Should never run more parses than slots."""
+        scheduler = FairScheduler(slots=2)
+        peak = []
+
+        async def parse():
+            async with scheduler.slot('a'):
+                peak.append(scheduler.running)
+                await asyncio.sleep(0.001)
+
+        async def run():
+            await asyncio.gather(*(parse() for _ in range(6)))
+
+        asyncio.run(run())
+        assert max(peak) == 2
+        assert scheduler.running == 0
+
+    def test_round_robin_between_clients(self):
+        """Should serve a late interactive client before the rest of a batch."""
+        started = []
+        jobs = [('batch', f'b{i}') for i in range(4)] + [('interactive', 'i0')]
+        asyncio.run(run_parses(FairScheduler(slots=1), jobs, started))
+        assert started == ['b0', 'b1', 'i0', 'b2', 'b3']
+
+    def test_weights(self):
+        """Should give a client with weight 2 two slots per round."""
+        started = []
+        jobs = [('a', 'a0')] + [('b', f'b{i}') for i in range(3)] + [('a', f'a{i}') for i in range(1, 4)]
+        asyncio.run(run_parses(FairScheduler(slots=1, weights={'b': 2}), jobs, started))
+        assert started == ['a0', 'b0', 'b1', 'a1', 'b2', 'a2', 'a3']
+
+    def test_cancelled_waiter_releases_nothing(self):
+        """Should skip parses cancelled while waiting, without losing slots."""
+        scheduler = FairScheduler(slots=1)
+
+        async def run():
+            async with scheduler.slot('a'):
+                waiting = asyncio.create_task(run_parses(scheduler, [('b', 'b0')], []))
+                await asyncio.sleep(0)
+                waiting.cancel()
+                await asyncio.sleep(0)
+            async with scheduler.slot('c'):
+                assert scheduler.running == 1
+
+        asyncio.run(run())
+        assert scheduler.running == 0
+        assert scheduler.metrics()['queued'] == 0
+
+    def test_queue_time_metrics(self):
+        """Should record queue time per client."""
+        scheduler = FairScheduler(slots=1)
+        asyncio.run(run_parses(scheduler, [('a', 'a0'), ('b', 'b0')], []))
+
+        metrics = scheduler.metrics()
+        assert metrics['queue_time']['parses'] == 2
+        assert metrics['queue_time_by_client']['b']['max_wait_ms'] >= 1.0
+
+    def test_queue_time_metrics_bounded(self, monkeypatch):
+        """Should keep queue times for recent clients while totalling every parse."""
+        monkeypatch.setattr(admission, 'MAX_TRACKED_CLIENTS', 2)
+        scheduler = FairScheduler(slots=1)
+        asyncio.run(run_parses(scheduler, [(client, client) for client in 'abcd'], []))
+
+        metrics = scheduler.metrics()
+        assert metrics['queue_time']['parses'] == 4
+        assert set(metrics['queue_time_by_client']) == {'c', 'd'}
+
+
+PDF = {'file': ('paper.pdf', b'%PDF-1.4 test', 'application/pdf')}
+
+
+def make_zip(pdfs):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        for i in range(pdfs):
+            archive.writestr(f'paper{i}.pdf', b'%PDF-1.4 test')
+    return buffer.getvalue()
+
+
+class TestUploadAdmission:
+    """Tests for rate limits on the upload endpoints."""
+
+    @pytest.fixture
+    def client(self, monkeypatch):
+        monkeypatch.setattr(main, 'rate_limiter', RateLimiter(rate_per_minute=60, burst=1))
+        return TestClient(main.app)
+
+    def test_upload_rate_limited(self, client):
+        """Should answer 429 with Retry-After once a client's burst is used."""
+        assert client.post('/upload', files=PDF).status_code == 500  # Admitted; not a real PDF
+
+        response = client.post('/upload', files=PDF)
+        assert response.status_code == 429
+        assert int(response.headers['retry-after']) >= 1
+
+    def test_invalid_uploads_take_no_tokens(self, client):
+        """Should reject invalid uploads without using the client's rate limit."""
+        text = {'file': ('notes.txt', b'text', 'text/plain')}
+        assert client.post('/upload', files=text).status_code == 400
+        assert client.post('/upload', files=PDF, data={'previous_document_id': 'missing'}).status_code == 404
+        assert client.post('/upload', files=PDF, data={'document_id': 'not-a-uuid'}).status_code == 400
+
+        assert client.post('/upload', files=PDF).status_code == 500
+
+    def test_client_headers_trusted_only_from_proxies(self, client, monkeypatch):
+        """Should ignore X-Client-ID from clients, and use it from trusted proxies."""
+        assert client.post('/upload', files=PDF, headers={'X-Client-ID': 'a'}).status_code == 500
+        assert client.post('/upload', files=PDF, headers={'X-Client-ID': 'b'}).status_code == 429
+
+        monkeypatch.setattr(main.settings, 'trusted_proxies', ['testclient'])
+        assert client.post('/upload', files=PDF, headers={'X-Client-ID': 'b'}).status_code == 500
+        assert client.post('/upload', files=PDF, headers={'X-Forwarded-For': '10.0.0.7, 10.0.0.1'}).status_code == 500
+        assert client.post('/upload', files=PDF, headers={'X-Forwarded-For': '10.0.0.7'}).status_code == 429
+
+    def test_batch_admitted_for_all_pdfs_at_once(self, client, monkeypatch):
+        """Should admit a batch for the PDFs inside its zips in one step, taking nothing when rejected."""
+        monkeypatch.setattr(main, 'rate_limiter', RateLimiter(rate_per_minute=1, burst=3))
+        papers = [('files', ('papers.zip', make_zip(2), 'application/zip'))]
+        assert client.post('/upload/batch', files=papers).status_code == 200
+        assert client.post('/upload/batch', files=papers).status_code == 429
+
+        single = [('files', ('paper.pdf', b'%PDF-1.4 test', 'application/pdf'))]
+        assert client.post('/upload/batch', files=single).status_code == 200
+
+    def test_rejected_before_files_are_read(self, client, monkeypatch):
+        """Should reject a limited client's batch without reading or expanding its files."""
+        monkeypatch.setattr(main, 'expand_uploads', lambda *args: pytest.fail('files read'))
+        main.rate_limiter.acquire('testclient')
+
+        files = [('files', ('papers.zip', b'zip', 'application/zip'))]
+        assert client.post('/upload/batch', files=files).status_code == 429
+
+    def test_admission_metrics(self, client):
+        """Should report rejections and scheduler state."""
+        files = [('files', ('notes.txt', b'text', 'text/plain'))] * 2
+        assert client.post('/upload/batch', files=files).status_code == 200
+        assert client.post('/upload/batch', files=files).status_code == 429
+
+        metrics = client.get('/debug/admission').json()
+        assert metrics['rate_limit']['rejected_by_client'] == {'testclient': 1}
+        assert metrics['scheduler']['slots'] == main.settings.parse_slots
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,154 @@
+"""Unit tests for batch uploads."""
+
+import io
+import json
+import threading
+import time
+import zipfile
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from core.batch import BatchStats, expand_uploads
+from core.cache import Cache
+from core.events import EventBus, LocalEventLog
+from services.parser.pipeline.deadline import Deadline
+from services.parser.pipeline.models import ParsedDocument, ParsedSection
+
+
+def make_zip(members):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+
+class TestExpandUploads:
+    """Tests for turning uploaded files into batch items."""
+
+    def test_pdfs_and_zip_members(self):
+        """Should make one item per PDF, including the PDFs inside zips."""
+        archive = make_zip({'issue/a.pdf': b'%PDF a', 'issue/notes.txt': b'x', '__MACOSX/issue/._a.pdf': b'',
+                            'issue/B.PDF': b'%PDF b'})
+        items = expand_uploads([('one.pdf', b'%PDF 1'), ('issue.zip', archive)], max_file_size=100)
+
+        assert [item.filename for item in items] == ['one.pdf', 'issue.zip/issue/a.pdf', 'issue.zip/issue/B.PDF']
+        assert [item.load() for item in items] == [b'%PDF 1', b'%PDF a', b'%PDF b']
+
+    def test_rejected_files_carry_errors(self):
+        """Should turn unsupported, oversized and corrupt files into failed items."""
+        items = expand_uploads([
+            ('notes.txt', b'text'),
+            ('big.pdf', b'x' * 11),
+            ('broken.zip', b'not a zip'),
+            ('empty.zip', make_zip({'readme.md': b'#'})),
+            ('bigger.zip', make_zip({'big.pdf': b'x' * 11})),
+        ], max_file_size=10)
+
+        assert all(item.load is None for item in items)
+        assert [item.error.split(' ')[0] for item in items] == ['Only', 'File', 'Invalid', 'No', 'File']
+
+
+class TestBatchStats:
+    """Tests for batch summaries."""
+
+    def test_summary_counts(self):
+        """Should count parsed, cached and failed documents."""
+        stats = BatchStats(total=3)
+        for result in ({'status': 'parsed', 'cached': True}, {'status': 'parsed'}, {'status': 'failed'}):
+            stats.record(result)
+
+        summary = stats.summary()
+        assert (summary['documents'], summary['parsed'], summary['failed'], summary['cached']) == (3, 2, 1, 1)
+        assert summary['documents_per_minute'] > 0
+
+
+class TestBatchEndpoint:
+    """Tests for POST /upload/batch."""
+
+    @pytest.fixture
+    def client(self, monkeypatch):
+        main.storage.clear()
+        monkeypatch.setattr(main, 'cache', Cache(None))
+        monkeypatch.setattr(main, 'events', EventBus(LocalEventLog()))
+        yield TestClient(main.app)
+        main.storage.clear()
+
+    @pytest.fixture
+    def builder(self, monkeypatch):
+        """Builder that parses b'%PDF <title>' files slowly, fails on malformed ones, and tracks concurrency."""
+        state = {'running': 0, 'peak': 0}
+        lock = threading.Lock()
+
+        class Builder:
+            structure_info = None
+            current_stage = 'load_pdf'
+
+            def __init__(self, **kwargs):
+                self.deadline = Deadline(kwargs.get('timeout'))
+
+            def build(self, contents, filename, previous=None, doc_id=None):
+                with lock:
+                    state['running'] += 1
+                    state['peak'] = max(state['peak'], state['running'])
+                try:
+                    time.sleep(0.05)
+                    if not contents.startswith(b'%PDF'):
+                        raise ValueError('Cannot open malformed PDF')
+                    sections = {'methods': ParsedSection('methods', 'Participants were recruited.')}
+                    return ParsedDocument(doc_id, 'hash', contents[5:].decode(), sections, [], [], [], [], '')
+                finally:
+                    with lock:
+                        state['running'] -= 1
+
+        monkeypatch.setattr(main, 'DocumentBuilder', Builder)
+        return state
+
+    def test_streams_results_and_isolates_failures(self, client, builder, monkeypatch):
+        """Should parse concurrently, report each file, and not let a bad PDF stop the rest."""
+        monkeypatch.setattr(main.settings, 'batch_parse_concurrency', 3)
+        archive = make_zip({f'paper{i}.pdf': f'%PDF Paper {i}'.encode() for i in range(4)})
+        files = [
+            ('files', ('issue.zip', archive, 'application/zip')),
+            ('files', ('broken.pdf', b'garbage', 'application/pdf')),
+            ('files', ('notes.txt', b'text', 'text/plain')),
+        ]
+        response = client.post('/upload/batch', files=files)
+
+        assert response.headers['content-type'].startswith('application/x-ndjson')
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        results, summary = lines[:-1], lines[-1]['summary']
+        by_name = {result['filename']: result for result in results}
+        assert len(results) == 6
+        assert by_name['issue.zip/paper2.pdf']['title'] == 'Paper 2'
+        assert by_name['broken.pdf'] == {**by_name['broken.pdf'], 'status': 'failed',
+                                         'error': 'Cannot open malformed PDF'}
+        assert by_name['notes.txt']['status'] == 'failed'
+        assert (summary['parsed'], summary['failed']) == (4, 2)
+        assert builder['peak'] == 3
+
+        parsed = by_name['issue.zip/paper0.pdf']['document_id']
+        assert main.documents_store[parsed].title == 'Paper 0'
+        assert main.events.read(by_name['broken.pdf']['document_id'])[-1]['event'] == 'parse_failed'
+
+    def test_slow_parse_times_out(self, client, builder, monkeypatch):
+        """Should report a parse that exceeds the processing timeout as failed."""
+        monkeypatch.setattr(main.settings, 'processing_timeout', 0.01)
+        response = client.post('/upload/batch', files=[('files', ('slow.pdf', b'%PDF Slow', 'application/pdf'))])
+
+        result = json.loads(response.text.splitlines()[0])
+        assert result['status'] == 'failed'
+        assert 'timed out' in result['error']
+
+    def test_too_many_files(self, client, monkeypatch):
+        """Should reject batches over the file limit before parsing anything."""
+        monkeypatch.setattr(main.settings, 'max_batch_files', 2)
+        archive = make_zip({f'paper{i}.pdf': b'%PDF' for i in range(3)})
+        response = client.post('/upload/batch', files=[('files', ('issue.zip', archive, 'application/zip'))])
+        assert response.status_code == 413
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,176 @@
+"""Unit tests for the block-level document IR."""
+
+import pytest
+from services.parser.pipeline.stages.blocks import parse_blocks, render_markdown
+from services.parser.pipeline.stages.cleanup import cleanup_all, cleanup_blocks
+from services.parser.pipeline.stages.labeling import label_blocks
+from services.parser.pipeline.models import Block, SectionHeader, StructureInfo
+
+
+def structure_with_headers(*names) -> StructureInfo:
+    """Create StructureInfo with the given section header texts."""
+    headers = [
+        SectionHeader(text=name, normalized_name=name.lower().replace(' ', '_'), page=0, confidence=1.0)
+        for name in names
+    ]
+    return StructureInfo(title=None, abstract=None, section_headers=headers, bold_spans=[])
+
+
+class TestParseBlocks:
+    """Tests for markdown → block parsing."""
+
+    def test_classify_kinds(self):
+        """Should classify headings, captions, lists, tables and figures."""
+        markdown = "\n\n".join([
+            "## Introduction",
+            "Body text of the paper.",
+            "**Fig. 1 | Overview.** Caption text.",
+            "- first item",
+            "| a | b |\n|---|---|",
+            "**==> picture [100 x 80] intentionally omitted <==**",
+        ])
+        kinds = [b.kind for b in parse_blocks(markdown)]
+
+        assert kinds == ['heading', 'paragraph', 'caption', 'list_item', 'table', 'figure']
+
+    def test_section_heading_label(self):
+        """Should read section labels from ### **NAME** headings."""
+        blocks = parse_blocks("### **Methods**\n\nText.")
+
+        assert blocks[0].section == 'Methods'
+
+    def test_paragraph_lines_grouped(self):
+        """Should keep consecutive lines in one paragraph block."""
+        blocks = parse_blocks("Line one of text\nline two of text")
+
+        assert len(blocks) == 1
+        assert blocks[0].text == "Line one of text\nline two of text"
+
+    def test_spans_and_pages(self):
+        """Should record page and source span offsets."""
+        markdown = "First block.\n\nSecond block."
+        blocks = parse_blocks(markdown, page=3, offset=100)
+
+        assert all(b.page == 3 for b in blocks)
+        assert [markdown[b.span[0] - 100:b.span[1] - 100] for b in blocks] == ["First block.", "Second block."]
+
+    def test_inline_figure_label_not_caption(self):
+        """Should not treat a wrapped line starting with a figure label as a caption."""
+        blocks = parse_blocks("as shown in\nFigure 2. the cells contract")
+
+        assert [b.kind for b in blocks] == ['paragraph']
+
+    def test_list_items_split(self):
+        """Should start a new list item at each marker."""
+        blocks = parse_blocks("1. Smith J. Title.\n2. Lee K. Other\ncontinued entry.")
+
+        assert [b.kind for b in blocks] == ['list_item', 'list_item']
+        assert blocks[1].text == "2. Lee K. Other\ncontinued entry."
+
+
+class TestRenderMarkdown:
+    """Tests for block → markdown rendering."""
+
+    def test_render_labeled_heading(self):
+        """Should render section headings in ### **NAME** form."""
+        blocks = [Block(kind='heading', text='**Results**', section='Results'),
+                  Block(kind='paragraph', text='Text.')]
+
+        assert render_markdown(blocks) == "### **Results**\n\nText."
+
+
+class TestCleanupBlocks:
+    """Tests for block-level cleanup."""
+
+    def test_figure_placeholders_kept(self):
+        """Should keep figure placeholders, as cleanup_all does."""
+        placeholder = '**==> picture [120 x 80] intentionally omitted <==**'
+        paragraph = 'Real content here with enough words to stay in place.'
+        blocks = [Block(kind='figure', text=placeholder), Block(kind='paragraph', text=paragraph)]
+
+        assert [b.text for b in cleanup_blocks(blocks)] == [placeholder, paragraph]
+        assert cleanup_all(f"{placeholder}\n\n{paragraph}") == f"{placeholder}\n\n{paragraph}"
+
+    def test_remove_gibberish_and_scattered(self):
+        """Should drop short gibberish and scattered label blocks."""
+        blocks = [
+            Block(kind='paragraph', text='xq'),
+            Block(kind='paragraph', text='a b c d'),
+            Block(kind='paragraph', text='This is a complete sentence with real content in it.'),
+        ]
+
+        assert [b.text for b in cleanup_blocks(blocks)] == [
+            'This is a complete sentence with real content in it.'
+        ]
+
+    def test_remove_fragment_runs(self):
+        """Should drop runs of consecutive fragment paragraphs."""
+        blocks = [
+            Block(kind='paragraph', text='Histamine 6'),
+            Block(kind='heading', text='**a**'),
+            Block(kind='paragraph', text='Control 12'),
+            Block(kind='paragraph', text='This is a complete sentence with real content in it.'),
+        ]
+
+        assert [b.text for b in cleanup_blocks(blocks)] == [
+            'This is a complete sentence with real content in it.'
+        ]
+
+    def test_keep_captions_and_headings(self):
+        """Should never treat captions or headings as fragments."""
+        blocks = [
+            Block(kind='heading', text='## Results'),
+            Block(kind='caption', text='**Fig. 1 | Overview**'),
+        ]
+
+        assert len(cleanup_blocks(blocks)) == 2
+
+    def test_filter_table_rows(self):
+        """Should remove label-only table rows but keep content rows."""
+        table = "|---|---|\n| This cell has real words | b | c | d | e |"
+        result = cleanup_blocks([Block(kind='table', text=table)])
+
+        assert result[0].text == "| This cell has real words | b | c | d | e |"
+
+
+class TestLabelBlocks:
+    """Tests for block-level section labeling."""
+
+    def test_label_bold_heading(self):
+        """Should label a bold heading matching a detected header."""
+        blocks = [Block(kind='heading', text='**Results**'), Block(kind='paragraph', text='Text.')]
+        labeled = label_blocks(blocks, structure_with_headers('Results', 'Introduction'))
+
+        assert labeled[0].section == 'Results'
+
+    def test_label_numbered_heading(self):
+        """Should strip numbering from the label."""
+        blocks = [Block(kind='paragraph', text='1. Introduction')]
+        labeled = label_blocks(blocks, structure_with_headers('1. Introduction'))
+
+        assert labeled[0].kind == 'heading'
+        assert labeled[0].section == 'Introduction'
+
+    def test_ignore_multiline_paragraphs(self):
+        """Should not label paragraphs that merely contain the header text."""
+        blocks = [Block(kind='paragraph', text='Results\nwere significant')]
+        labeled = label_blocks(blocks, structure_with_headers('Results', 'Introduction'))
+
+        assert labeled[0].section is None
+
+    def test_fallback_introduction(self):
+        """Should insert an Introduction label before substantial unlabeled content."""
+        blocks = [
+            Block(kind='paragraph', text='Title of the paper'),
+            Block(kind='paragraph', text='Author names ' * 30),
+            Block(kind='paragraph', text='Introductory sentence with enough words. ' * 5),
+            Block(kind='heading', text='**Methods**'),
+        ]
+        labeled = label_blocks(blocks, structure_with_headers('Methods'))
+
+        sections = [b.section for b in labeled if b.section]
+        assert sections == ['Introduction', 'Methods']
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
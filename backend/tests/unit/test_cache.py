@@ -0,0 +1,219 @@
+"""Unit tests for the parse and response cache."""
+
+import fnmatch
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from core import cache as cache_module
+from core.cache import Cache, MemoryBackend, RedisBackend, cache_key, create_cache
+from services.parser.pipeline.config import IndexingConfig
+from services.parser.pipeline.models import ParsedDocument, ParsedSection
+from services.parser.pipeline.stages.indexing import index_sentences
+
+
+class FakeRedis:
+    """In-memory stand-in for the redis-py client methods the backend uses."""
+
+    def __init__(self):
+        self.data = {}
+        self.expiry = {}
+
+    def get(self, key):
+        if key in self.expiry and self.expiry[key] <= time.monotonic():
+            self.delete(key)
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value
+        if ex:
+            self.expiry[key] = time.monotonic() + ex
+        else:
+            self.expiry.pop(key, None)
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+            self.expiry.pop(key, None)
+
+    def scan_iter(self, match='*'):
+        return [key for key in list(self.data) if fnmatch.fnmatch(key, match)]
+
+
+class BrokenBackend:
+    name = 'broken'
+
+    def get(self, key):
+        raise ConnectionError('down')
+
+    def set(self, key, value, ttl):
+        raise ConnectionError('down')
+
+
+def make_doc(doc_id='doc'):
+    sections = index_sentences({
+        'methods': ParsedSection('methods', 'We recruited 24 participants. Gels were cast.'),
+    }, IndexingConfig(splitter='scientific'))
+    return ParsedDocument(doc_id, 'hash', 'Gels', sections, [], [], [], [], '# Gels')
+
+
+class TestMemoryBackend:
+    """Tests for the in-process backend."""
+
+    def test_round_trip_with_compression(self):
+        """Should return stored values and store them compressed."""
+        cache = Cache(MemoryBackend())
+        value = {'text': 'force ' * 1000}
+        cache.set('parse:a', value)
+        assert cache.get('parse:a') == value
+        assert len(cache.backend.get('parse:a')) < 200
+
+    def test_entries_expire(self, monkeypatch):
+        """Should treat entries past their TTL as misses."""
+        now = [100.0]
+        monkeypatch.setattr(cache_module.time, 'monotonic', lambda: now[0])
+        cache = Cache(MemoryBackend(), ttl=10)
+        cache.set('parse:a', 1)
+        now[0] = 109.0
+        assert cache.get('parse:a') == 1
+        now[0] = 111.0
+        assert cache.get('parse:a') is None
+
+    def test_evicts_least_recently_used(self):
+        """Should keep at most max_entries entries."""
+        cache = Cache(MemoryBackend(max_entries=2))
+        cache.set('parse:a', 1)
+        cache.set('parse:b', 2)
+        cache.get('parse:a')
+        cache.set('parse:c', 3)
+        assert cache.get('parse:b') is None
+        assert cache.get('parse:a') == 1
+
+
+class TestRedisBackend:
+    """Tests for the Redis backend against a fake client."""
+
+    def test_workers_share_entries(self):
+        """Should serve an entry written by one worker to another."""
+        client = FakeRedis()
+        first, second = Cache(RedisBackend(client)), Cache(RedisBackend(client))
+        first.set(cache_key('parse', 'abc'), ('doc', 'analysis'))
+        assert second.get('parse:abc') == ('doc', 'analysis')
+        assert 'peerpreview:parse:abc' in client.data
+
+    def test_ttl_passed_to_redis(self):
+        """Should set the default TTL unless one is given."""
+        client = FakeRedis()
+        cache = Cache(RedisBackend(client), ttl=60)
+        cache.set('parse:a', 1)
+        cache.set('parse:b', 1, ttl=5)
+        assert client.expiry['peerpreview:parse:a'] - client.expiry['peerpreview:parse:b'] == pytest.approx(55, abs=1)
+
+    def test_clear_only_removes_prefixed_keys(self):
+        """Should leave keys of other applications alone."""
+        client = FakeRedis()
+        client.set('other:key', b'1')
+        cache = Cache(RedisBackend(client))
+        cache.set('parse:a', 1)
+        cache.clear()
+        assert list(client.data) == ['other:key']
+
+
+class TestCache:
+    """Tests for metrics, error handling and configuration."""
+
+    def test_metrics_per_namespace(self):
+        """Should count hits, misses and writes per key namespace."""
+        cache = Cache(MemoryBackend())
+        cache.get('parse:a')
+        cache.set('parse:a', 1)
+        cache.get('parse:a')
+        cache.get('response:document:x')
+        metrics = cache.metrics()
+        assert metrics['backend'] == 'memory'
+        assert metrics['namespaces']['parse'] == {'hits': 1, 'misses': 1, 'sets': 1, 'errors': 0, 'hit_rate': 0.5}
+        assert metrics['namespaces']['response']['misses'] == 1
+
+    def test_get_or_compute(self):
+        """Should compute once and serve falsy values from the cache."""
+        cache = Cache(MemoryBackend())
+        calls = []
+        compute = lambda: calls.append(1) or 0
+        assert cache.get_or_compute('parse:a', compute) == 0
+        assert cache.get_or_compute('parse:a', compute) == 0
+        assert len(calls) == 1
+
+    def test_backend_errors_are_misses(self):
+        """Should count backend failures and fall back to computing."""
+        cache = Cache(BrokenBackend())
+        cache.set('parse:a', 1)
+        assert cache.get_or_compute('parse:a', lambda: 2) == 2
+        assert cache.metrics()['namespaces']['parse']['errors'] == 3
+
+    def test_disabled_cache_never_hits(self):
+        """Should not store anything when caching is disabled."""
+        cache = create_cache(False, 60, None)
+        cache.set('parse:a', 1)
+        assert cache.get('parse:a') is None
+        assert cache.metrics()['backend'] == 'disabled'
+
+    def test_falls_back_to_memory(self, monkeypatch):
+        """Should use the in-process backend when Redis is unreachable."""
+        def unreachable(url):
+            raise ConnectionError('refused')
+        monkeypatch.setattr(RedisBackend, 'from_url', unreachable)
+        assert isinstance(create_cache(True, 60, 'redis://localhost:6379').backend, MemoryBackend)
+        assert isinstance(create_cache(True, 60, '').backend, MemoryBackend)
+
+
+class TestApiCache:
+    """Tests for the API's use of the cache."""
+
+    @pytest.fixture
+    def client(self, monkeypatch):
+        main.storage.clear()
+        monkeypatch.setattr(main, 'cache', Cache(MemoryBackend()))
+        yield TestClient(main.app)
+        main.storage.clear()
+
+    def test_document_response_cached(self, client, monkeypatch):
+        """Should serve the serialized document response from the cache."""
+        main.documents_store['doc'] = make_doc()
+        first = client.get('/document/doc')
+        monkeypatch.setattr(main, 'get_analysis', lambda *args: pytest.fail('recomputed'))
+        second = client.get('/document/doc')
+        assert first.status_code == second.status_code == 200
+        assert first.json() == second.json()
+        assert first.json()['title'] == 'Gels'
+        assert main.cache.metrics()['namespaces']['response']['hits'] == 1
+
+    def test_identical_upload_reuses_parse(self, client, monkeypatch):
+        """Should skip parsing and analysis when the same PDF is uploaded again."""
+        builds = []
+
+        class Builder:
+            structure_info = None
+
+            def __init__(self, **kwargs):
+                pass
+
+            def build(self, contents, filename, previous=None, doc_id=None):
+                builds.append(filename)
+                return make_doc(doc_id)
+
+        monkeypatch.setattr(main, 'DocumentBuilder', Builder)
+        files = {'file': ('paper.pdf', b'%PDF-1.4 same bytes', 'application/pdf')}
+        first = client.post('/upload', files=files).json()
+        second = client.post('/upload', files=files).json()
+
+        assert builds == ['paper.pdf']
+        assert first['document_id'] != second['document_id']
+        assert first['sections'] == second['sections']
+        analysis = main.get_analysis(second['document_id'])
+        assert analysis.doc is main.documents_store[second['document_id']]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,73 @@
+"""Unit tests for the citation indexer."""
+
+import pytest
+from services.indexers.citation_indexer import CitationIndexer
+from services.parser.pipeline.models import ParsedDocument, CitationRef, BibliographyEntry
+
+
+def make_doc(citation_ids, bibliography):
+    return ParsedDocument(
+        doc_id='doc',
+        doc_hash='hash',
+        title='Title',
+        sections={},
+        figures=[],
+        figure_refs=[],
+        citations=[CitationRef(id=cid, section='introduction', sentence_id=None) for cid in citation_ids],
+        bibliography=bibliography,
+        raw_markdown=''
+    )
+
+
+class TestCitationIndexer:
+    """Tests for matching citations to bibliography entries."""
+
+    def test_numeric_match(self):
+        """Should match numeric citations by entry number."""
+        bib = [BibliographyEntry('1', 'Smith J. Force. 2020.'), BibliographyEntry('2', 'Lee K. Cells. 2019.')]
+        index = CitationIndexer().build(make_doc(['2', '1', '2'], bib))
+
+        assert index.citation_to_bib['2'].raw_text == 'Lee K. Cells. 2019.'
+        assert len(index.bib_to_citations['2']) == 2
+        assert index.unmatched_citations == []
+
+    def test_author_year_match(self):
+        """Should match author-year citations by first author and year."""
+        bib = [
+            BibliographyEntry('1', 'Smith, J., Lee, K. (2020a). Force.'),
+            BibliographyEntry('2', 'Smith, J. (2020b). More force.'),
+            BibliographyEntry('3', 'van der Berg, A. (2018). Cells.'),
+        ]
+        index = CitationIndexer().build(make_doc(['Smith et al., 2020b', 'van der Berg, 2018', 'Smith, 2020'], bib))
+
+        assert index.citation_to_bib['Smith et al., 2020b'].id == '2'
+        assert index.citation_to_bib['van der Berg, 2018'].id == '3'
+        assert index.citation_to_bib['Smith, 2020'].id == '1'
+
+    def test_author_year_loose_match(self):
+        """Should fall back to any entry of that year mentioning the surname."""
+        bib = [BibliographyEntry('1', 'J. Smith and K. Lee. Force in cells. Nature 2021.')]
+        index = CitationIndexer().build(make_doc(['Smith & Lee, 2021'], bib))
+
+        assert index.citation_to_bib['Smith & Lee, 2021'].id == '1'
+
+    def test_unmatched(self):
+        """Should list unmatched citations once, in order, and uncited entries."""
+        bib = [BibliographyEntry('1', 'Smith J. Force. 2020.'), BibliographyEntry('2', 'Lee K. Cells. 2019.')]
+        index = CitationIndexer().build(make_doc(['7', '1', 'Chen, 2001', '7'], bib))
+
+        assert index.unmatched_citations == ['7', 'Chen, 2001']
+        assert index.unmatched_bib_entries == ['Lee K. Cells. 2019.']
+
+    def test_index_references_document_objects(self):
+        """Should reference the document's own entries and refs, not copies."""
+        bib = [BibliographyEntry('1', 'Smith J. Force. 2020.')]
+        doc = make_doc(['1'], bib)
+        index = CitationIndexer().build(doc)
+
+        assert index.citation_to_bib['1'] is doc.bibliography[0]
+        assert index.bib_to_citations['1'][0] is doc.citations[0]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,109 @@
+"""Unit tests for citation extraction."""
+
+import pytest
+from services.parser.pipeline.extractors.citations import (
+    expand_numeric,
+    scan_citations,
+    extract_citations
+)
+from services.parser.pipeline.stages.indexing import index_sentences
+from services.parser.pipeline.models import ParsedSection
+from services.parser.pipeline.config import IndexingConfig
+
+
+def keys(text):
+    return [key for key, _, _ in scan_citations(text)]
+
+
+class TestExpandNumeric:
+    """Tests for numeric list and range expansion."""
+
+    def test_expand_range(self):
+        """Should expand ranges into individual keys."""
+        assert expand_numeric("9-11") == ['9', '10', '11']
+        assert expand_numeric("9–11") == ['9', '10', '11']
+
+    def test_expand_list_with_range(self):
+        """Should expand mixed lists and ranges."""
+        assert expand_numeric("1, 4-6, 8") == ['1', '4', '5', '6', '8']
+
+    def test_oversized_range_not_expanded(self):
+        """Should keep only the endpoints of implausible ranges."""
+        assert expand_numeric("1-2020") == ['1', '2020']
+
+
+class TestScanCitations:
+    """Tests for the single-pass citation scanner."""
+
+    def test_numeric_brackets(self):
+        """Should expand bracketed lists and ranges."""
+        assert keys("Cells contract [1, 3-5].") == ['1', '3', '4', '5']
+
+    def test_author_year_group(self):
+        """Should split multi-author-year groups on semicolons."""
+        text = "Force rises (Smith, 2020; Lee et al., 2021a; Wu and Chen, 2019)."
+
+        assert keys(text) == ['Smith, 2020', 'Lee et al., 2021a', 'Wu & Chen, 2019']
+
+    def test_author_multiple_years(self):
+        """Should expand one author cited for several years."""
+        assert keys("(Smith, 2019, 2020)") == ['Smith, 2019', 'Smith, 2020']
+
+    def test_year_suffix_letters(self):
+        """Should expand bare suffix letters after a year into one key per letter."""
+        assert keys("(Smith and Jones 2019a, b)") == ['Smith & Jones, 2019a', 'Smith & Jones, 2019b']
+        assert keys("(Lee et al., 2020a,b, c, 2021; Wu, 2018)") == [
+            'Lee et al., 2020a', 'Lee et al., 2020b', 'Lee et al., 2020c', 'Lee et al., 2021', 'Wu, 2018'
+        ]
+        assert keys("(Smith, 2019, a review)") == ['Smith, 2019']
+
+    def test_narrative_citation(self):
+        """Should detect narrative author-year citations."""
+        assert keys("Smith et al. (2018) disagreed.") == ['Smith et al., 2018']
+
+    def test_superscript_digits(self):
+        """Should detect superscript-style numbers after punctuation."""
+        assert keys("Cells contract.12,13 Force rises.") == ['12', '13']
+        assert keys("Cells contract¹⁻³ here.") == ['1', '2', '3']
+
+    def test_ignore_non_citations(self):
+        """Should ignore decimals, years in prose and figure references."""
+        assert keys("p = 0.05 and 3.5 mm. In 2019, we saw (Fig. 2) and (n = 12).") == []
+
+    def test_offsets(self):
+        """Should record offsets of the citation marker."""
+        text = "Cells contract [7]."
+        [(key, start, end)] = list(scan_citations(text))
+
+        assert text[start:end] == "[7]"
+
+
+class TestExtractCitations:
+    """Tests for citation extraction from sections."""
+
+    def test_refers_to_sentence_ids(self):
+        """Should attach each citation to the sentence containing it."""
+        sections = {
+            'introduction': ParsedSection('introduction', 'First claim [1]. Second claim [2-3].', []),
+        }
+        sections = index_sentences(sections, IndexingConfig(use_nltk=False))
+        sentences = sections['introduction'].sentences
+
+        refs = extract_citations(sections)
+
+        assert [r.id for r in refs] == ['1', '2', '3']
+        assert refs[0].sentence_id == sentences[0].id
+        assert refs[1].sentence_id == refs[2].sentence_id == sentences[1].id
+        assert all(r.sentence_text is None for r in refs)
+
+    def test_skip_references_section(self):
+        """Should not scan the references section."""
+        sections = {
+            'references': ParsedSection('references', '[1] Smith J. Title. 2020.', []),
+        }
+
+        assert extract_citations(sections) == []
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
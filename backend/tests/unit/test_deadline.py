@@ -0,0 +1,205 @@
+"""Unit tests for parse deadlines and graceful degradation."""
+
+import fitz
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from core.cache import Cache, MemoryBackend
+from services.parser.pipeline.builder import PipelineBuilder
+from services.parser.pipeline.config import default_config
+from services.parser.pipeline.deadline import (
+    BIBLIOGRAPHY, DRAWING_CLUSTERS, Deadline, DeadlineExceeded
+)
+from services.parser.pipeline.models import FigureCaption, ParsedDocument, ParsedSection
+from services.parser.pipeline.stages import loader
+from services.parser.pipeline.stages.figures import detect_figure_regions
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_pdf():
+    pdf = fitz.open()
+    for number in range(2):
+        page = pdf.new_page()
+        y = 72
+        if number == 0:
+            page.insert_text((72, y), "Traction Forces of Contracting Cells", fontsize=16)
+            y += 40
+        while y < 400:
+            page.insert_text((72, y), "Cells on soft gels contracted and traction forces were measured.", fontsize=10)
+            y += 14
+        page.draw_rect(fitz.Rect(100, 450, 400, 650), color=(0, 0, 0), width=2)
+    return pdf
+
+
+class TestDeadline:
+    """Tests for document and stage budgets."""
+
+    def test_document_budget(self):
+        """Should raise once the document budget is spent, naming the stage."""
+        clock = FakeClock()
+        deadline = Deadline(timeout=10, clock=clock)
+        deadline.start_stage('reflow_text')
+        clock.now += 10
+        deadline.check()
+        clock.now += 1
+        with pytest.raises(DeadlineExceeded, match='reflow_text') as error:
+            deadline.check()
+        assert error.value.scope == 'document'
+
+    def test_stage_budget(self):
+        """Should give each stage its own budget within the document's."""
+        clock = FakeClock()
+        deadline = Deadline(timeout=100, stage_timeout=5, clock=clock)
+        deadline.start_stage('load_pdf')
+        clock.now += 4
+        deadline.start_stage('analyze_structure')
+        clock.now += 4
+        deadline.check()
+        clock.now += 2
+        with pytest.raises(DeadlineExceeded) as error:
+            deadline.check()
+        assert (error.value.stage, error.value.scope) == ('analyze_structure', 'stage')
+
+    def test_optional_stages_skipped_near_deadline(self):
+        """Should skip optional stages once less than a quarter of the budget is left, recording each once."""
+        clock = FakeClock()
+        deadline = Deadline(timeout=100, clock=clock)
+        clock.now += 74
+        assert deadline.allows(BIBLIOGRAPHY)
+        clock.now += 2
+        assert not deadline.allows(BIBLIOGRAPHY)
+        assert not deadline.allows(BIBLIOGRAPHY)
+        assert deadline.skipped == [BIBLIOGRAPHY]
+
+    def test_unlimited_and_cancelled(self):
+        """Should never expire without budgets, but raise once cancelled."""
+        deadline = Deadline()
+        assert deadline.allows(BIBLIOGRAPHY)
+        deadline.check()
+        deadline.cancel()
+        with pytest.raises(DeadlineExceeded, match='cancelled'):
+            deadline.check()
+
+
+class TestDegradedStages:
+    """Tests for optional stages cut short by the deadline."""
+
+    def test_drawing_clusters_skipped(self):
+        """Should keep caption regions but skip drawing clusters near the deadline."""
+        pdf = make_pdf()
+        caption = FigureCaption('Figure 1. Traction map.', 'Figure', '1', 1, (100, 660, 400, 672), 660,
+                                False, 0.9, True)
+        full = detect_figure_regions(pdf, [caption], None, Deadline())
+        assert any(region.detection_method == 'cluster' for region in full)
+
+        clock = FakeClock()
+        deadline = Deadline(timeout=10, clock=clock)
+        clock.now += 9
+        degraded = detect_figure_regions(pdf, [caption], None, deadline)
+        assert degraded and not any(region.detection_method == 'cluster' for region in degraded)
+        assert deadline.skipped == [DRAWING_CLUSTERS]
+
+
+class TestBuilderDeadlines:
+    """Tests for deadlines in PipelineBuilder."""
+
+    @pytest.fixture
+    def config(self):
+        config = default_config()
+        config.indexing.splitter = 'scientific'
+        return config
+
+    def builder(self, config, advance):
+        """Builder whose deadline clock jumps by advance[stage] when a stage starts."""
+        clock = FakeClock()
+        events = []
+
+        def on_event(event, data):
+            events.append((event, data['stage']))
+            if event == 'stage_started':
+                clock.now += advance.get(data['stage'], 0)
+
+        builder = PipelineBuilder(config, on_event=on_event)
+        builder.deadline = Deadline(timeout=10, stage_timeout=5, clock=clock)
+        return builder, events
+
+    def test_full_parse_within_budget(self, config):
+        """Should skip nothing when the budget is ample."""
+        builder, _ = self.builder(config, {})
+        doc = builder.build(make_pdf().tobytes(), 'paper.pdf')
+        assert doc.degraded == []
+
+    def test_degraded_near_deadline(self, config):
+        """Should skip the bibliography near the deadline and report it."""
+        builder, events = self.builder(config, {'extract_metadata': 8})
+        doc = builder.build(make_pdf().tobytes(), 'paper.pdf')
+
+        assert doc.degraded == [BIBLIOGRAPHY]
+        assert doc.sections
+        assert ('stage_skipped', BIBLIOGRAPHY) in events
+
+    def test_stops_past_deadline(self, config):
+        """Should stop at the first checkpoint past the document budget."""
+        builder, _ = self.builder(config, {'reflow_text': 11})
+        with pytest.raises(DeadlineExceeded):
+            builder.build(make_pdf().tobytes(), 'paper.pdf')
+        assert builder.current_stage == 'reflow_text'
+
+    def test_pdf_closed_after_failure(self, config, monkeypatch):
+        """Should close the PDF when the deadline stops the build."""
+        opened = []
+        load_pdf = loader.load_pdf
+        monkeypatch.setattr(loader, 'load_pdf', lambda data: opened.append(load_pdf(data)) or opened[-1])
+
+        builder, _ = self.builder(config, {'extract_blocks': 11})
+        with pytest.raises(DeadlineExceeded):
+            builder.build(make_pdf().tobytes(), 'paper.pdf')
+        assert opened[0].is_closed
+
+
+class TestDegradedUpload:
+    """Tests for degraded parses in the API."""
+
+    @pytest.fixture
+    def client(self, monkeypatch):
+        main.storage.clear()
+        monkeypatch.setattr(main, 'cache', Cache(MemoryBackend()))
+        yield TestClient(main.app)
+        main.storage.clear()
+
+    def test_degraded_parse_reported_and_not_cached(self, client, monkeypatch):
+        """Should return the degraded stages and parse the same PDF again next time."""
+        builds = []
+
+        class Builder:
+            structure_info = None
+
+            def __init__(self, timeout=None, stage_timeout=None, **kwargs):
+                self.deadline = Deadline(timeout, stage_timeout)
+                builds.append((timeout, stage_timeout))
+
+            def build(self, contents, filename, previous=None, doc_id=None):
+                sections = {'methods': ParsedSection('methods', 'Participants were recruited.')}
+                return ParsedDocument(doc_id, 'hash', 'Title', sections, [], [], [], [], '',
+                                      degraded=[BIBLIOGRAPHY])
+
+        monkeypatch.setattr(main, 'DocumentBuilder', Builder)
+        files = {'file': ('paper.pdf', b'%PDF-1.4 slow', 'application/pdf')}
+        first = client.post('/upload', files=files).json()
+        client.post('/upload', files=files)
+
+        assert first['degraded'] == [BIBLIOGRAPHY]
+        assert builds == [(main.settings.processing_timeout, main.settings.parse_stage_timeout)] * 2
+        assert client.get(f"/document/{first['document_id']}").json()['degraded'] == [BIBLIOGRAPHY]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,113 @@
+"""Unit tests for the acronym and notation definition index."""
+
+import pytest
+from services.indexers.definitions import (
+    KIND_ACRONYM, KIND_SYMBOL, build_definition_index, find_long_form
+)
+from services.indexers.cross_doc_indexer import CrossDocIndexer
+from tests.helpers import make_doc, make_sections
+
+
+class TestFindLongForm:
+    """Tests for Schwartz–Hearst long form matching."""
+
+    def test_initials(self):
+        """Should match acronym letters to word starts."""
+        assert find_long_form('TFM', 'We used traction force microscopy') == 'traction force microscopy'
+
+    def test_letters_inside_words(self):
+        """Should match letters inside words and skip unrelated leading words."""
+        assert find_long_form('ECM', 'cells were embedded in an extracellular matrix') == 'extracellular matrix'
+
+    def test_no_match(self):
+        """Should return None when the letters cannot be found."""
+        assert find_long_form('XYZ', 'cells were imaged') is None
+
+
+class TestBuildDefinitionIndex:
+    """Tests for definitions and first uses."""
+
+    def test_acronym_definition_and_offsets(self):
+        """Should record the long form, sentence and offsets of an acronym definition."""
+        sections = make_sections(methods="Cells were seeded. We used traction force microscopy (TFM) on gels.")
+        index = build_definition_index(sections)
+
+        definition = index.definition('TFM')
+        assert definition.kind == KIND_ACRONYM
+        assert definition.expansion == 'traction force microscopy'
+        assert definition.sentence_id == sections['methods'].sentences[1].id
+        text = sections['methods'].text
+        assert text[definition.char_start:definition.char_end] == 'traction force microscopy (TFM)'
+
+    def test_symbol_definitions(self):
+        """Should record symbol definitions but not numeric assignments."""
+        index = build_definition_index(make_sections(
+            methods="Modulus was fit, where E is the Young's modulus. σ denotes the standard deviation. N = 24."
+        ))
+
+        assert index.definition('E').expansion == "Young's modulus"
+        assert index.definition('σ').kind == KIND_SYMBOL
+        assert index.definition('σ').expansion == 'standard deviation'
+        assert index.definition('N') is None
+        assert index.first_use_sentence('N') is not None
+
+    def test_used_before_defined(self):
+        """Should flag terms used in an earlier sentence than their definition."""
+        sections = make_sections(
+            abstract="We measured ECM stiffness with TFM.",
+            methods="Traction force microscopy (TFM) was used. The extracellular matrix (ECM) was collagen.",
+        )
+        index = build_definition_index(sections)
+
+        assert index.used_before_defined('TFM')
+        assert index.first_use_sentence('TFM') == sections['abstract'].sentences[0].id
+        assert {term for term, _, _ in index.early_uses()} == {'ECM', 'TFM'}
+
+    def test_defined_at_first_use(self):
+        """Should not flag a term whose definition is its first use."""
+        index = build_definition_index(make_sections(
+            methods="Regions of interest (ROIs) were drawn. Each ROI was tracked."
+        ))
+
+        assert not index.used_before_defined('ROI')
+        assert index.early_uses() == []
+
+    def test_first_definition_kept(self):
+        """Should keep earlier definitions and report conflicting ones."""
+        index = build_definition_index(make_sections(
+            methods="Atomic force microscopy (AFM) was used.",
+            results="Later, acoustic force mapping (AFM) was compared.",
+        ))
+
+        assert index.definition('AFM').expansion == 'Atomic force microscopy'
+        assert list(index.conflicting_definitions()) == ['AFM']
+
+    def test_undefined_acronyms_and_skipped_sections(self):
+        """Should list acronyms never defined and ignore the references section."""
+        index = build_definition_index(make_sections(
+            results="DNA content rose in the HEK cells.",
+            references="Smith J. Bone marrow stromal cells (BMSC). Cell. 2020.",
+        ))
+
+        assert index.undefined_acronyms() == ['DNA', 'HEK']
+        assert index.definition('BMSC') is None
+
+
+class TestCrossDocNotation:
+    """Tests for the definition index in the cross-doc index."""
+
+    def test_notation_map_from_definitions(self):
+        """Should build notation from definitions, with conventional defaults."""
+        sections = make_sections(methods="A: values were pooled. Traction force microscopy (TFM) was used. N = 24.")
+        doc = make_doc(sections)
+
+        index = CrossDocIndexer().build(doc)
+
+        assert index.notation_map['TFM'] == 'Traction force microscopy'
+        assert index.notation_map['N'] == 'sample size'
+        assert 'A' not in index.notation_map
+        assert index.definitions.definition('TFM') is not None
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
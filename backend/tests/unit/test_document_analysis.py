@@ -0,0 +1,89 @@
+"""Unit tests for per-document analysis and its memoization."""
+
+from dataclasses import replace
+
+import pytest
+import main
+from services.indexers.document_analysis import analyze_document
+from services.parser.pipeline.models import (
+    ParsedDocument, ParsedSection, CitationRef, BibliographyEntry, FigureBlock, FigureRef
+)
+
+
+def make_doc(doc_id='doc'):
+    sections = {
+        'introduction': ParsedSection('introduction', 'Cells contract [1]. ' * 40, []),
+        'methods': ParsedSection('methods', 'We recruited 24 participants (n = 24).', []),
+    }
+    return ParsedDocument(
+        doc_id=doc_id,
+        doc_hash='hash',
+        title='Cell Contraction',
+        sections=sections,
+        figures=[FigureBlock('fig-1', 'Figure 1', 'Figure 1. Force.', 0)],
+        figure_refs=[FigureRef('Fig. 2', 'methods', 'methods_0_x', 'See Fig. 2.')],
+        citations=[CitationRef('1', 'introduction', None), CitationRef('9', 'introduction', None)],
+        bibliography=[BibliographyEntry('1', 'Smith J. Force. 2020.')],
+        raw_markdown=''
+    )
+
+
+@pytest.fixture
+def stores():
+    """Empty the API's in-memory stores around each test."""
+    main.documents_store.clear()
+    main.analysis_store.clear()
+    yield
+    main.documents_store.clear()
+    main.analysis_store.clear()
+
+
+class TestAnalyzeDocument:
+    """Tests for computing indexes and statistics."""
+
+    def test_statistics(self):
+        """Should summarize indexes and sections."""
+        analysis = analyze_document(make_doc())
+
+        assert analysis.statistics['sample_sizes']['methods'] == [24]
+        assert analysis.statistics['unmatched_citations'] == ['9']
+        assert analysis.statistics['orphaned_figures'] == ['Figure 1']
+        assert analysis.statistics['dangling_figure_refs'] == ['Fig. 2']
+        assert analysis.section_validation['has_methods'] is True
+
+    def test_section_stats(self):
+        """Should truncate previews and count words once."""
+        stats = analyze_document(make_doc()).section_stats
+
+        assert stats['introduction']['text'].endswith('...')
+        assert stats['introduction']['word_count'] == 120
+        assert stats['methods']['text'] == 'We recruited 24 participants (n = 24).'
+
+
+class TestAnalysisMemoization:
+    """Tests for reusing analysis across requests."""
+
+    def test_reused_until_document_changes(self, stores, monkeypatch):
+        """Should build once per document content and rebuild when it is replaced."""
+        calls = []
+
+        def counting_analyze(doc, has_authors=False):
+            calls.append(doc)
+            return analyze_document(doc, has_authors)
+
+        monkeypatch.setattr(main, 'analyze_document', counting_analyze)
+
+        main.documents_store['doc'] = make_doc()
+        first = main.get_analysis('doc')
+        assert main.get_analysis('doc') is first
+        main.documents_store['doc'] = make_doc()  # Same content, new object
+        assert main.get_analysis('doc') is first
+        assert len(calls) == 1
+
+        main.documents_store['doc'] = replace(make_doc(), doc_hash='edited')
+        assert main.get_analysis('doc') is not first
+        assert len(calls) == 2
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
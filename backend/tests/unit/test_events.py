@@ -0,0 +1,219 @@
+"""Unit tests for parse and review progress events."""
+
+import asyncio
+import json
+import threading
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from core.events import EventBus, LocalEventLog, RedisEventLog, format_sse
+from services.parser.pipeline.builder import PipelineBuilder
+from services.parser.pipeline.models import ParsedDocument, ParsedSection
+
+
+class FakeRedis:
+    """In-memory stand-in for the redis-py list methods the event log uses."""
+
+    def __init__(self):
+        self.lists = {}
+
+    def rpush(self, key, value):
+        self.lists.setdefault(key, []).append(value.encode())
+        return len(self.lists[key])
+
+    def lrange(self, key, start, end):
+        return self.lists.get(key, [])[start:]
+
+    def llen(self, key):
+        return len(self.lists.get(key, []))
+
+    def expire(self, key, seconds):
+        pass
+
+    def scan_iter(self, match='*'):
+        return [key for key in self.lists if key.startswith(match.rstrip('*'))]
+
+    def delete(self, *keys):
+        for key in keys:
+            self.lists.pop(key, None)
+
+
+def parse_sse(text):
+    """(event, data) pairs of an SSE body, skipping comments."""
+    messages = []
+    for block in text.strip().split('\n\n'):
+        fields = dict(line.split(': ', 1) for line in block.split('\n') if not line.startswith(':'))
+        if fields:
+            messages.append((fields['event'], json.loads(fields['data'])))
+    return messages
+
+
+@pytest.fixture(params=['local', 'redis'])
+def log(request):
+    return LocalEventLog() if request.param == 'local' else RedisEventLog(FakeRedis())
+
+
+class TestEventLog:
+    """Tests for the in-process and Redis event logs."""
+
+    def test_sequential_ids_per_document(self, log):
+        """Should number each document's events from zero and read from an ID on."""
+        log.publish('a', 'parse_started', filename='x.pdf')
+        log.publish('b', 'parse_started', filename='y.pdf')
+        log.publish('a', 'stage_started', stage='load_pdf')
+        assert [(e['id'], e['event']) for e in log.read('a')] == [(0, 'parse_started'), (1, 'stage_started')]
+        assert log.read('a', 1)[0]['data'] == {'stage': 'load_pdf'}
+        assert log.read('missing') == []
+
+    def test_wait_times_out(self, log):
+        """Should return False when no event arrives."""
+        assert asyncio.run(log.wait('a', 0, timeout=0.01)) is False
+
+    def test_wait_returns_for_existing_events(self, log):
+        """Should not wait when the requested event already exists."""
+        log.publish('a', 'parse_started')
+        assert asyncio.run(log.wait('a', 0, timeout=5)) is True
+
+    def test_redis_calls_off_event_loop(self):
+        """Should make a stream's Redis calls in a worker thread."""
+        threads = []
+
+        class RecordingRedis(FakeRedis):
+            def lrange(self, key, start, end):
+                threads.append(threading.get_ident())
+                return super().lrange(key, start, end)
+
+            def llen(self, key):
+                threads.append(threading.get_ident())
+                return super().llen(key)
+
+        log = RedisEventLog(RecordingRedis())
+        log.publish('a', 'parse_started')
+
+        async def stream():
+            return await log.read_async('a'), await log.wait('a', 0, timeout=5), threading.get_ident()
+
+        events, waited, loop_thread = asyncio.run(stream())
+        assert [e['event'] for e in events] == ['parse_started'] and waited
+        assert threads and loop_thread not in threads
+
+    def test_publish_from_thread_wakes_waiter(self):
+        """Should wake a waiting stream when a worker thread publishes."""
+        log = LocalEventLog()
+
+        async def wait_for_publish():
+            threading.Timer(0.01, lambda: log.publish('a', 'stage_started', stage='load_pdf')).start()
+            return await log.wait('a', 0, timeout=5)
+
+        assert asyncio.run(wait_for_publish()) is True
+
+    def test_publish_errors_are_logged(self):
+        """Should not fail the publisher when the log is unavailable."""
+        class BrokenLog:
+            def publish(self, *args, **kwargs):
+                raise ConnectionError('down')
+
+        assert EventBus(BrokenLog()).publish('a', 'parse_started') is None
+
+    def test_format_sse(self):
+        """Should format an event as an SSE message with its ID."""
+        event = LocalEventLog().publish('a', 'stage_finished', stage='load_pdf', duration_ms=3.5)
+        message = format_sse(event)
+        assert message.startswith('id: 0\nevent: stage_finished\ndata: ')
+        assert message.endswith('\n\n')
+        assert parse_sse(message)[0][1]['duration_ms'] == 3.5
+
+
+class TestPipelineHooks:
+    """Tests for the PipelineBuilder instrumentation hook."""
+
+    def test_stage_events_and_timings(self):
+        """Should emit start and finish events and record stage timings."""
+        received = []
+        builder = PipelineBuilder(on_event=lambda event, data: received.append((event, data.get('stage'))))
+        builder._enter_stage('load_pdf')
+        builder._enter_stage('analyze_structure')
+        builder._enter_stage(None)
+        assert received == [
+            ('stage_started', 'load_pdf'), ('stage_finished', 'load_pdf'),
+            ('stage_started', 'analyze_structure'), ('stage_finished', 'analyze_structure'),
+        ]
+        assert set(builder.stage_timings) == {'load_pdf', 'analyze_structure'}
+        assert builder.current_stage is None
+
+    def test_failing_hook_does_not_stop_parse(self):
+        """Should log hook errors instead of raising them."""
+        def hook(event, data):
+            raise RuntimeError('subscriber gone')
+        PipelineBuilder(on_event=hook)._enter_stage('load_pdf')
+
+
+class TestEventsApi:
+    """Tests for the /events stream."""
+
+    @pytest.fixture
+    def client(self, monkeypatch):
+        main.storage.clear()
+        main.review_jobs.queue.clear()
+        monkeypatch.setattr(main, 'events', EventBus(LocalEventLog()))
+        yield TestClient(main.app)
+        main.storage.clear()
+        main.review_jobs.queue.clear()
+
+    def test_upload_and_review_events(self, client, monkeypatch):
+        """Should stream parse, index, agent and results events, ending at results_ready."""
+        class Builder:
+            structure_info = None
+
+            def __init__(self, on_event=None, **kwargs):
+                self.on_event = on_event
+
+            def build(self, contents, filename, previous=None, doc_id=None):
+                self.on_event('stage_started', {'stage': 'load_pdf'})
+                self.on_event('stage_finished', {'stage': 'load_pdf', 'duration_ms': 1.0})
+                sections = {'methods': ParsedSection('methods', 'Participants were recruited.')}
+                return ParsedDocument(doc_id, 'hash', 'Title', sections, [], [], [], [], '')
+
+        monkeypatch.setattr(main, 'DocumentBuilder', Builder)
+        document_id = str(uuid.uuid4())
+        files = {'file': ('paper.pdf', b'%PDF-1.4 events', 'application/pdf')}
+        upload = client.post('/upload', files=files, data={'document_id': document_id})
+        assert upload.json()['document_id'] == document_id
+
+        client.post('/review', json={'document_id': document_id})
+        asyncio.run(main.review_workers.run_next())
+
+        response = client.get(f'/events/{document_id}')
+        assert response.headers['content-type'].startswith('text/event-stream')
+        names = [event for event, _ in parse_sse(response.text)]
+        assert names == [
+            'parse_started', 'stage_started', 'stage_finished', 'parse_finished', 'index_built',
+            'review_queued', 'review_started', 'agent_started', 'agent_finished',
+            'agent_started', 'agent_finished', 'results_ready',
+        ]
+
+    def test_resume_after_last_event_id(self, client):
+        """Should only send events after Last-Event-ID."""
+        for event in ('parse_started', 'parse_finished', 'results_ready'):
+            main.events.publish('doc', event)
+        response = client.get('/events/doc', headers={'Last-Event-ID': '0'})
+        assert [event for event, _ in parse_sse(response.text)] == ['parse_finished', 'results_ready']
+
+    def test_failed_parse_ends_stream(self, client):
+        """Should publish parse_failed for a rejected upload."""
+        document_id = str(uuid.uuid4())
+        client.post('/upload', files={'file': ('notes.txt', b'text', 'text/plain')}, data={'document_id': document_id})
+        events = parse_sse(client.get(f'/events/{document_id}').text)
+        assert events[-1][0] == 'parse_failed'
+
+    def test_document_id_must_be_uuid(self, client):
+        """Should reject client-chosen IDs that are not UUIDs."""
+        files = {'file': ('paper.pdf', b'%PDF', 'application/pdf')}
+        assert client.post('/upload', files=files, data={'document_id': '../x'}).status_code == 400
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
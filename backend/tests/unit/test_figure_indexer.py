@@ -0,0 +1,51 @@
+"""Unit tests for the figure indexer."""
+
+import pytest
+from services.indexers.figure_indexer import FigureIndexer
+from services.parser.pipeline.models import ParsedDocument, FigureBlock, FigureRef
+
+
+def make_doc(figure_labels, ref_labels):
+    return ParsedDocument(
+        doc_id='doc',
+        doc_hash='hash',
+        title='Title',
+        sections={},
+        figures=[FigureBlock(f"fig-{i}", label, f"{label}. Caption.", 0) for i, label in enumerate(figure_labels)],
+        figure_refs=[FigureRef(label, 'results', f"results_{i}_x", 'Text.') for i, label in enumerate(ref_labels)],
+        citations=[],
+        bibliography=[],
+        raw_markdown=''
+    )
+
+
+class TestFigureIndexer:
+    """Tests for mapping figures to their references."""
+
+    def test_label_normalization(self):
+        """Should group 'Fig. 1' and 'Figure 1' under one label."""
+        index = FigureIndexer().build(make_doc(['Figure 1'], ['Fig. 1', 'FIGURE 1']))
+
+        assert list(index.label_to_figure) == ['1']
+        assert len(index.label_to_refs['1']) == 2
+        assert index.dangling_refs == []
+        assert index.orphaned_figures == []
+
+    def test_dangling_and_orphaned(self):
+        """Should report each dangling label once and unreferenced figures."""
+        index = FigureIndexer().build(make_doc(['Figure 1', 'Figure 2'], ['Fig. 1', 'Fig. 5', 'Fig. 5']))
+
+        assert [ref.label for ref in index.dangling_refs] == ['Fig. 5']
+        assert [fig.label for fig in index.orphaned_figures] == ['Figure 2']
+
+    def test_index_references_document_objects(self):
+        """Should reference the document's own figures and refs, not copies."""
+        doc = make_doc(['Figure 1'], ['Fig. 1'])
+        index = FigureIndexer().build(doc)
+
+        assert index.label_to_figure['1'] is doc.figures[0]
+        assert index.label_to_refs['1'][0] is doc.figure_refs[0]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
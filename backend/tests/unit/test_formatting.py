@@ -3,12 +3,13 @@
 import pytest
 from services.parser.pipeline.stages.formatting import (
     split_sections,
+    split_section_blocks,
     normalize_section_name,
     validate_required_sections,
     detect_section_by_keywords,
     format_sections
 )
-from services.parser.pipeline.models import ParsedSection
+from services.parser.pipeline.models import ParsedSection, Block
 from services.parser.pipeline.config import SectionConfig
 
 
@@ -71,6 +72,46 @@ References."""
         assert sections['abstract'].order_priority < sections['references'].order_priority
 
 
+class TestSplitSectionBlocks:
+    """Tests for block-level section splitting."""
+
+    def test_split_at_labeled_headings(self):
+        """Should open sections only at labeled heading blocks."""
+        blocks = [
+            Block(kind='paragraph', text='Title and preamble content.'),
+            Block(kind='heading', text='**Introduction**', section='Introduction'),
+            Block(kind='paragraph', text='Intro content here.'),
+            Block(kind='heading', text='## Subheading'),
+            Block(kind='paragraph', text='More intro.'),
+            Block(kind='heading', text='### **Methods**', section='Methods'),
+            Block(kind='paragraph', text='Methods content here.'),
+        ]
+
+        sections = split_section_blocks(blocks)
+
+        assert list(sections.keys()) == ['preamble', 'introduction', 'methods']
+        assert sections['introduction'].text == 'Intro content here.\n\n## Subheading\n\nMore intro.'
+        assert sections['methods'].text == 'Methods content here.'
+
+    def test_section_priority_from_config(self):
+        """Should assign priority from section order config."""
+        blocks = [
+            Block(kind='heading', text='Results', section='Results'),
+            Block(kind='paragraph', text='Results text.'),
+        ]
+
+        sections = split_section_blocks(blocks)
+
+        assert sections['results'].order_priority == SectionConfig().section_order['results']
+
+    def test_unlabeled_blocks_become_preamble(self):
+        """Should put blocks before any labeled heading into the preamble."""
+        sections = split_section_blocks([Block(kind='paragraph', text='Just text.')])
+
+        assert list(sections.keys()) == ['preamble']
+        assert sections['preamble'].text == 'Just text.'
+
+
 class TestNormalizeSectionName:
     """Tests for section name normalization."""
 
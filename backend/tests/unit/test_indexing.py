@@ -1,11 +1,20 @@
 """Unit tests for indexing stage."""
 
 import pytest
+from collections import OrderedDict
+from nltk.tokenize.punkt import PunktSentenceTokenizer
+
+from services.parser.pipeline.stages import indexing
 from services.parser.pipeline.stages.indexing import (
     tokenize_sentences,
     simple_sentence_split,
     generate_sentence_id,
-    index_sentences
+    index_sentences,
+    split_paragraphs,
+    diff_revision,
+    load_tokenizer,
+    preload_tokenizer,
+    shutdown_pool
 )
 from services.parser.pipeline.models import ParsedSection
 from services.parser.pipeline.config import IndexingConfig
@@ -80,14 +89,33 @@ class TestTokenizeSentences:
             assert sent.char_end > sent.char_start
             assert sent.char_end <= len(text)
 
+    def test_offsets_match_text(self):
+        """Should give offsets that slice back to the sentence text."""
+        text = "First sentence.   Second sentence.\nFirst sentence."
+        sentences = tokenize_sentences(text, "results", use_nltk=False)
+
+        assert len(sentences) == 3
+        for sent in sentences:
+            assert text[sent.char_start:sent.char_end] == sent.text
+        assert sentences[2].char_start == text.rindex("First sentence.")
+
+    def test_nltk_offsets_match_text(self, monkeypatch):
+        """Should take offsets from punkt span tokenization."""
+        monkeypatch.setitem(indexing._TOKENIZERS, 'english', PunktSentenceTokenizer())
+        text = "  We measured it. We measured it again.  "
+        sentences = tokenize_sentences(text, "results", use_nltk=True)
+
+        assert [s.text for s in sentences] == ["We measured it.", "We measured it again."]
+        for sent in sentences:
+            assert text[sent.char_start:sent.char_end] == sent.text
+
     def test_paragraph_index(self):
         """Should track paragraph indices."""
-        text = "First. Second. Third."
+        text = "First. Second.\n\nThird."
         sentences = tokenize_sentences(text, "discussion", use_nltk=False)
 
-        # Indices should be sequential
-        for i, sent in enumerate(sentences):
-            assert sent.paragraph_index == i
+        # Index of the paragraph containing each sentence
+        assert [sent.paragraph_index for sent in sentences] == [0, 0, 1]
 
 
 class TestGenerateSentenceId:
@@ -193,6 +221,196 @@ class TestIndexSentences:
 
         assert len(indexed['empty'].sentences) == 0
 
+    def test_parallel_matches_serial(self, monkeypatch):
+        """Should give the same sentences when fanned out to a process pool."""
+        sections = {
+            f'section_{i}': ParsedSection(f'section_{i}', f'Sentence {i} one. Sentence {i} two.', [])
+            for i in range(4)
+        }
+
+        serial = index_sentences(sections, IndexingConfig(use_nltk=False))
+        monkeypatch.setattr(indexing, '_SPAN_CACHE', OrderedDict())
+        try:
+            parallel = index_sentences(
+                sections,
+                IndexingConfig(use_nltk=False, max_workers=2, parallel_min_chars=0)
+            )
+        finally:
+            shutdown_pool()
+
+        assert parallel == serial
+
+    def test_sentences_do_not_cross_paragraphs(self):
+        """Should tokenize each paragraph separately."""
+        sections = {
+            'intro': ParsedSection('intro', 'Heading without period\n\nFirst sentence. Second one.', [])
+        }
+
+        indexed = index_sentences(sections, IndexingConfig(use_nltk=False))
+
+        assert [s.text for s in indexed['intro'].sentences] == [
+            'Heading without period', 'First sentence.', 'Second one.'
+        ]
+
+    def test_tokenization_memoized(self, monkeypatch):
+        """Should tokenize a repeated paragraph only once."""
+        calls = []
+        original = indexing.sentence_spans
+
+        def counting(text, **kwargs):
+            calls.append(text)
+            return original(text, **kwargs)
+
+        monkeypatch.setattr(indexing, '_SPAN_CACHE', OrderedDict())
+        monkeypatch.setattr(indexing, 'sentence_spans', counting)
+        sections = {
+            'intro': ParsedSection('intro', 'Same paragraph here.\n\nSame paragraph here.', []),
+            'methods': ParsedSection('methods', 'Same paragraph here.', [])
+        }
+
+        index_sentences(sections, IndexingConfig(use_nltk=False))
+        index_sentences(sections, IndexingConfig(use_nltk=False))
+
+        assert calls == ['Same paragraph here.']
+
+    def test_revision_with_full_cache(self, monkeypatch):
+        """Should index a revision whose cached paragraphs are evicted by its new ones."""
+        monkeypatch.setattr(indexing, '_SPAN_CACHE', OrderedDict())
+        monkeypatch.setattr(indexing, 'SPAN_CACHE_SIZE', 3)
+        config = IndexingConfig(use_nltk=False)
+        original = index_sentences({'intro': ParsedSection('intro', 'Alpha one. Alpha two.', [])}, config)
+        index_sentences({'other': ParsedSection('other', 'Gamma.\n\nDelta.', [])}, config)
+
+        revised = index_sentences(
+            {'intro': ParsedSection('intro', 'Alpha one. Alpha two.\n\nBeta one.\n\nBeta two.', [])},
+            config, previous=original
+        )
+
+        assert [s.text for s in revised['intro'].sentences] == ['Alpha one.', 'Alpha two.', 'Beta one.', 'Beta two.']
+        assert revised['intro'].sentences[0].id == original['intro'].sentences[0].id
+        assert len(indexing._SPAN_CACHE) == 3
+
+    def test_paragraph_records(self):
+        """Should build paragraph records with spans and sentence IDs."""
+        text = "Alpha one. Alpha two.\n\nBeta one."
+        indexed = index_sentences({'intro': ParsedSection('intro', text, [])}, IndexingConfig(use_nltk=False))
+        section = indexed['intro']
+
+        assert [p.index for p in section.paragraphs] == [0, 1]
+        assert text[section.paragraphs[1].char_start:section.paragraphs[1].char_end] == "Beta one."
+        assert section.paragraphs[0].sentence_ids == [s.id for s in section.sentences[:2]]
+        assert [s.paragraph_index for s in section.sentences] == [0, 0, 1]
+
+    def test_paragraph_ids_unique(self):
+        """Should give repeated paragraphs distinct IDs."""
+        text = "Same paragraph.\n\nSame paragraph."
+        indexed = index_sentences({'intro': ParsedSection('intro', text, [])}, IndexingConfig(use_nltk=False))
+
+        ids = [p.id for p in indexed['intro'].paragraphs]
+        assert len(set(ids)) == 2
+
+
+class TestSplitParagraphs:
+    """Tests for paragraph splitting."""
+
+    def test_split_on_blank_lines(self):
+        """Should split at blank lines and trim whitespace."""
+        text = "First paragraph.\n\n  Second\nparagraph.  \n \nThird."
+        spans = split_paragraphs(text)
+
+        assert [text[s:e] for s, e in spans] == ["First paragraph.", "Second\nparagraph.", "Third."]
+
+    def test_empty_text(self):
+        """Should return no paragraphs for blank text."""
+        assert split_paragraphs("  \n\n ") == []
+
+
+class TestRevisionIndexing:
+    """Tests for stable sentence IDs across revisions."""
+
+    def _index(self, text, previous=None):
+        sections = {'intro': ParsedSection('intro', text, [])}
+        return index_sentences(sections, IndexingConfig(use_nltk=False), previous=previous)
+
+    def test_inserted_sentence_keeps_other_ids(self):
+        """Should keep IDs of sentences in unchanged paragraphs."""
+        original = self._index("Alpha one. Alpha two.\n\nBeta one. Beta two.")
+        revised = self._index("New opening. Alpha one. Alpha two.\n\nBeta one. Beta two.", previous=original)
+
+        old_ids = [s.id for s in original['intro'].sentences]
+        new_ids = [s.id for s in revised['intro'].sentences]
+
+        assert new_ids[-2:] == old_ids[-2:]
+        assert len(set(new_ids)) == len(new_ids)
+
+    def test_diff_flags_changed_paragraphs(self):
+        """Should flag only changed paragraphs and list removed sentences."""
+        original = self._index("Alpha one. Alpha two.\n\nBeta one.\n\nGamma one.")
+        revised = self._index("Alpha one. Alpha two.\n\nBeta changed.\n\nGamma one.", previous=original)
+
+        revision = diff_revision('doc-1', original, revised)
+
+        assert revision.previous_doc_id == 'doc-1'
+        assert revision.changed_paragraphs == {'intro': [1]}
+        assert revision.changed_sentence_ids == [revised['intro'].sentences[2].id]
+        assert revision.removed_sentence_ids == [original['intro'].sentences[2].id]
+        assert revision.unchanged_sentences == 3
+
+    def test_unchanged_document(self):
+        """Should report no changes when nothing changed."""
+        original = self._index("Alpha one.\n\nBeta one.")
+        revised = self._index("Alpha one.\n\nBeta one.", previous=original)
+
+        revision = diff_revision('doc-1', original, revised)
+
+        assert revision.changed_paragraphs == {}
+        assert revision.changed_sentence_ids == []
+
+    def test_deletion_only_marks_section_changed(self):
+        """Should flag sections that only lost sentences or paragraphs."""
+        original = self._index("Alpha one. Alpha two.\n\nBeta one.\n\nGamma one.")
+        sentence_deleted = self._index("Alpha one.\n\nBeta one.\n\nGamma one.", previous=original)
+        paragraph_deleted = self._index("Alpha one. Alpha two.\n\nGamma one.", previous=original)
+
+        revision = diff_revision('doc-1', original, sentence_deleted)
+        assert revision.changed_sentence_ids == []
+        assert revision.removed_sentence_ids == [original['intro'].sentences[1].id]
+        assert revision.changed_paragraphs == {'intro': [0]}
+
+        revision = diff_revision('doc-1', original, paragraph_deleted)
+        assert revision.removed_sentence_ids == [original['intro'].sentences[2].id]
+        assert revision.changed_paragraphs == {'intro': []}  # Re-reviewed, no paragraph to point at
+
+
+class TestTokenizerLoading:
+    """Tests for process-wide tokenizer loading."""
+
+    def test_tokenizer_cached(self, monkeypatch):
+        """Should reuse the loaded tokenizer instead of reloading it."""
+        tokenizer = PunktSentenceTokenizer()
+        monkeypatch.setitem(indexing._TOKENIZERS, 'english', tokenizer)
+
+        assert load_tokenizer('english') is tokenizer
+
+    def test_preload_fails_when_data_missing(self, monkeypatch):
+        """Should raise at startup when punkt data is not installed."""
+        def missing(language):
+            raise LookupError(language)
+
+        monkeypatch.setattr(indexing, 'load_tokenizer', missing)
+
+        with pytest.raises(RuntimeError, match="punkt"):
+            preload_tokenizer(IndexingConfig())
+
+    def test_preload_skipped_without_nltk(self, monkeypatch):
+        """Should not need punkt data when NLTK tokenization is disabled."""
+        def missing(language):
+            raise LookupError(language)
+
+        monkeypatch.setattr(indexing, 'load_tokenizer', missing)
+
+        preload_tokenizer(IndexingConfig(use_nltk=False))
+
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
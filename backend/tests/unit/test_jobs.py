@@ -0,0 +1,256 @@
+"""Unit tests for the review job queue and worker pool."""
+
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from core.jobs import (
+    COMPLETED, FAILED, QUEUED, RUNNING, JobQueue, LocalQueue, RedisQueue, WorkerPool, create_job_queue
+)
+from core.storage import Database, KeyValueStore
+from services.parser.pipeline.models import ParsedDocument, ParsedSection
+
+
+class FakeRedis:
+    """In-memory stand-in for the redis-py sorted set methods the queue uses."""
+
+    def __init__(self):
+        self.sets = {}
+
+    def zadd(self, key, mapping):
+        self.sets.setdefault(key, {}).update({member.encode(): score for member, score in mapping.items()})
+
+    def zrangebyscore(self, key, low, high):
+        members = self.sets.get(key, {})
+        return sorted((m for m, score in members.items() if score <= high), key=members.get)
+
+    def zrem(self, key, member):
+        return int(self.sets.get(key, {}).pop(member, None) is not None)
+
+    def zpopmin(self, key):
+        members = self.sets.get(key, {})
+        if not members:
+            return []
+        member = min(members, key=members.get)
+        return [(member, members.pop(member))]
+
+    def zcard(self, key):
+        return len(self.sets.get(key, {}))
+
+    def zscore(self, key, member):
+        return self.sets.get(key, {}).get(member.encode())
+
+    def delete(self, *keys):
+        for key in keys:
+            self.sets.pop(key, None)
+
+
+@pytest.fixture(params=['local', 'redis'])
+def jobs(request):
+    queue = LocalQueue() if request.param == 'local' else RedisQueue(FakeRedis())
+    return JobQueue(queue, {}, max_attempts=2, retry_backoff=0.0)
+
+
+class TestJobQueue:
+    """Tests for job records and queue order."""
+
+    def test_priority_then_submission_order(self, jobs):
+        """Should claim higher priorities first, oldest first within a priority."""
+        jobs.submit('a', {})
+        jobs.submit('b', {}, priority=10)
+        jobs.submit('c', {})
+        assert [jobs.claim().job_id for _ in range(3)] == ['b', 'a', 'c']
+        assert jobs.claim() is None
+
+    def test_claim_marks_running(self, jobs):
+        """Should count the attempt and mark the record running."""
+        jobs.submit('a', {'changed_only': False})
+        job = jobs.claim()
+        assert (job.status, job.attempts, job.params) == (RUNNING, 1, {'changed_only': False})
+        assert jobs.get('a').status == RUNNING
+
+    def test_duplicate_entries_run_once(self, jobs):
+        """Should skip queue entries of jobs that are no longer queued."""
+        jobs.submit('a', {})
+        jobs.queue.push('a', 0)
+        assert jobs.claim().job_id == 'a'
+        assert jobs.claim() is None
+
+    def test_retry_then_fail(self, jobs):
+        """Should requeue a failed job until max_attempts, then mark it failed."""
+        jobs.submit('a', {})
+        assert jobs.fail(jobs.claim(), 'timeout') is True
+        assert jobs.get('a').status == QUEUED
+        assert jobs.fail(jobs.claim(), 'timeout again') is False
+        assert (jobs.get('a').status, jobs.get('a').attempts, jobs.get('a').error) == (FAILED, 2, 'timeout again')
+
+    def test_retry_waits_for_backoff(self):
+        """Should not hand out a retried job before its backoff has passed."""
+        jobs = JobQueue(LocalQueue(), {}, retry_backoff=60.0)
+        jobs.submit('a', {})
+        jobs.fail(jobs.claim(), 'error')
+        assert jobs.claim() is None
+        assert len(jobs.queue) == 1
+
+    def test_recover_requeues_unfinished_jobs(self):
+        """Should requeue queued jobs and running jobs whose worker stopped sending heartbeats."""
+        records = {}
+        old = JobQueue(LocalQueue(), records)
+        for job_id in ('running', 'orphaned', 'done'):
+            old.submit(job_id, {})
+            old.claim()
+        old.complete(old.get('done'))
+        old.submit('queued', {})
+        records['running'].updated_at -= 1000  # No progress for a while, but its worker is alive
+        records['orphaned'].heartbeat_at -= 1000
+
+        restarted = JobQueue(LocalQueue(), records)  # The in-process queue was lost
+        assert restarted.recover(heartbeat_timeout=60) == 2
+        assert sorted(restarted.claim().job_id for _ in range(2)) == ['orphaned', 'queued']
+        assert restarted.claim() is None
+        assert records['running'].status == RUNNING
+
+    def test_recover_does_not_duplicate_entries(self, jobs):
+        """Should push only queued jobs that are not already in the queue."""
+        jobs.submit('a', {})
+        jobs.submit('b', {})
+        jobs.fail(jobs.claim(), 'error')  # Waiting for its retry
+
+        assert jobs.recover() == 0
+        assert len(jobs.queue) == 2
+
+    def test_job_claimed_once_across_processes(self, monkeypatch):
+        """Should let only one of two processes claim a job both popped at once."""
+        db = Database('sqlite://')
+        first = JobQueue(LocalQueue(), KeyValueStore(db, 'jobs', cache_size=0))
+        second = JobQueue(LocalQueue(), KeyValueStore(db, 'jobs', cache_size=0))
+        first.submit('a', {})
+        second.queue.push('a', 0)  # Pushed again by another process's recover()
+        update_if = second.records.update_if
+
+        def claimed_meanwhile(job_id, update):
+            # The first process claims the job after the second has read its record
+            return update_if(job_id, lambda job: first.claim() and update(job))
+
+        monkeypatch.setattr(second.records, 'update_if', claimed_meanwhile)
+        assert second.claim() is None
+        assert (first.get('a').status, first.get('a').attempts) == (RUNNING, 1)
+        db.close()
+
+    def test_records_in_database(self):
+        """Should persist job records in a database table."""
+        db = Database('sqlite://')
+        jobs = JobQueue(LocalQueue(), KeyValueStore(db, 'jobs', cache_size=0))
+        jobs.submit('a', {'track_b_enabled': True})
+        jobs.update(jobs.claim(), 'statistics', 0.6)
+        record = KeyValueStore(db, 'jobs')['a']
+        assert (record.status, record.stage, record.progress) == (RUNNING, 'statistics', 0.6)
+        db.close()
+
+    def test_falls_back_to_local_queue(self):
+        """Should use the in-process queue without Redis."""
+        assert create_job_queue({}, '').queue.name == 'local'
+
+
+class TestWorkerPool:
+    """Tests for running jobs."""
+
+    def test_runs_job_with_progress(self):
+        """Should pass a progress callback that updates the record."""
+        jobs = JobQueue(LocalQueue(), {})
+        seen = []
+
+        async def handler(job, progress):
+            progress('statistics', 0.5)
+            seen.append((job.job_id, jobs.get(job.job_id).stage, jobs.get(job.job_id).progress))
+
+        jobs.submit('a', {})
+        assert asyncio.run(WorkerPool(jobs, handler).run_next()) is True
+        assert seen == [('a', 'statistics', 0.5)]
+        assert (jobs.get('a').status, jobs.get('a').progress) == (COMPLETED, 1.0)
+
+    def test_heartbeat_while_running(self):
+        """Should refresh the heartbeat of a long job that reports no progress."""
+        jobs = JobQueue(LocalQueue(), {})
+        beats = []
+
+        async def handler(job, progress):
+            claimed_at = jobs.get(job.job_id).heartbeat_at
+            await asyncio.sleep(0.05)
+            beats.append(jobs.get(job.job_id).heartbeat_at > claimed_at)
+
+        jobs.submit('a', {})
+        asyncio.run(WorkerPool(jobs, handler, heartbeat_interval=0.01).run_next())
+        assert beats == [True]
+
+    def test_final_failure_reported(self):
+        """Should retry a failing job and report it after the last attempt."""
+        jobs = JobQueue(LocalQueue(), {}, max_attempts=2, retry_backoff=0.0)
+        failures = []
+
+        async def handler(job, progress):
+            raise RuntimeError('agent error')
+
+        pool = WorkerPool(jobs, handler, on_failure=failures.append)
+        jobs.submit('a', {})
+        asyncio.run(pool.run_next())
+        assert failures == []
+        asyncio.run(pool.run_next())
+        assert [job.error for job in failures] == ['agent error']
+
+    def test_concurrency_cap(self):
+        """Should run at most `concurrency` jobs at once."""
+        jobs = JobQueue(LocalQueue(), {})
+        running, peak = [0], [0]
+
+        async def handler(job, progress):
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+            await asyncio.sleep(0.01)
+            running[0] -= 1
+
+        async def run_all():
+            pool = WorkerPool(jobs, handler, concurrency=2, poll_interval=0.001)
+            pool.start()
+            while any(not jobs.get(job_id).finished for job_id in 'abcde'):
+                await asyncio.sleep(0.005)
+            await pool.stop()
+
+        for job_id in 'abcde':
+            jobs.submit(job_id, {})
+        asyncio.run(run_all())
+        assert peak[0] == 2
+
+
+class TestReviewJobs:
+    """Tests for the API's review jobs."""
+
+    @pytest.fixture
+    def client(self):
+        main.storage.clear()
+        main.review_jobs.queue.clear()
+        yield TestClient(main.app)
+        main.storage.clear()
+        main.review_jobs.queue.clear()
+
+    def test_review_queued_and_run_by_worker(self, client):
+        """Should queue the review, report its progress, and complete it in a worker."""
+        sections = {'methods': ParsedSection('methods', 'Participants were recruited.')}
+        main.documents_store['doc'] = ParsedDocument('doc', 'hash', 'Title', sections, [], [], [], [], '')
+
+        response = client.post('/review', json={'document_id': 'doc', 'priority': 5})
+        assert response.json()['status'] == 'processing'
+        assert client.post('/review', json={'document_id': 'doc'}).status_code == 409
+        status = client.get('/status/doc').json()
+        assert (status['status'], status['progress'], status['message']) == ('processing', 0.0, 'Review queued')
+
+        assert asyncio.run(main.review_workers.run_next()) is True
+        assert client.get('/status/doc').json()['status'] == 'completed'
+        assert main.review_jobs.get('doc').status == COMPLETED
+        assert 'doc' in main.reviews_store
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,62 @@
+"""Unit tests for document ID lookups."""
+
+import pytest
+from services.parser.pipeline.lookup import DocumentLookup
+from services.parser.pipeline.stages.indexing import index_sentences
+from services.parser.pipeline.models import ParsedSection
+from services.parser.pipeline.config import IndexingConfig
+
+
+@pytest.fixture
+def lookup():
+    sections = {
+        'intro': ParsedSection('intro', 'Alpha one. Alpha two.\n\nBeta one. Beta two.\n\nGamma one.', []),
+        'methods': ParsedSection('methods', 'Methods one.', [])
+    }
+    return DocumentLookup(index_sentences(sections, IndexingConfig(use_nltk=False)))
+
+
+class TestDocumentLookup:
+    """Tests for DocumentLookup."""
+
+    def test_sentence_by_id(self, lookup):
+        """Should find sentences by ID."""
+        sentence = lookup.sections['intro'].sentences[2]
+
+        assert lookup.sentence(sentence.id) is sentence
+        assert lookup.sentence('missing') is None
+
+    def test_paragraph_of_sentence(self, lookup):
+        """Should return the paragraph containing a sentence."""
+        sentence = lookup.sections['intro'].sentences[3]
+        paragraph = lookup.paragraph_of(sentence.id)
+
+        assert paragraph.index == 1
+        assert sentence.id in paragraph.sentence_ids
+        assert lookup.paragraph(paragraph.id) is paragraph
+
+    def test_context(self, lookup):
+        """Should return the paragraph text around a sentence."""
+        sentence = lookup.sections['intro'].sentences[2]
+
+        assert lookup.context(sentence.id) == 'Beta one. Beta two.'
+
+    def test_neighbors(self, lookup):
+        """Should return surrounding sentences within the section."""
+        sentences = lookup.sections['intro'].sentences
+
+        assert lookup.neighbors(sentences[0].id) == sentences[:2]
+        assert lookup.neighbors(sentences[2].id, before=2, after=0) == sentences[:3]
+        assert lookup.neighbors('missing') == []
+
+    def test_adjacent_paragraphs(self, lookup):
+        """Should return previous and next paragraphs in the section."""
+        paragraphs = lookup.sections['intro'].paragraphs
+
+        assert lookup.adjacent_paragraphs(paragraphs[1].id) == (paragraphs[0], paragraphs[2])
+        assert lookup.adjacent_paragraphs(paragraphs[0].id) == (None, paragraphs[1])
+        assert lookup.adjacent_paragraphs('missing') == (None, None)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,130 @@
+"""Unit tests for MinHash/LSH near-duplicate detection."""
+
+import pytest
+from services.indexers.near_duplicates import (
+    MinHasher, choose_bands, find_near_duplicates, jaccard, near_duplicate_pairs, shingles
+)
+from services.indexers.cross_doc_indexer import CrossDocIndexer
+from tests.helpers import make_doc, make_sections
+
+REPEATED = "Traction force increased with substrate stiffness in every cell line we tested."
+
+
+class TestShingles:
+    """Tests for shingling and similarity helpers."""
+
+    def test_short_text_has_no_shingles(self):
+        """Should not shingle texts below the minimum length."""
+        assert shingles("Cells were imaged.") == set()
+
+    def test_case_and_punctuation_insensitive(self):
+        """Should ignore case and punctuation."""
+        assert shingles(REPEATED) == shingles(REPEATED.upper().replace(' ', ' , '))
+
+    def test_jaccard(self):
+        """Should compute set overlap over union."""
+        assert jaccard({1, 2, 3}, {2, 3, 4}) == 0.5
+        assert jaccard(set(), {1}) == 0.0
+
+    def test_choose_bands_divides_signature(self):
+        """Should pick a banding that covers the signature with a threshold below the target."""
+        bands, rows = choose_bands(0.7, 128)
+
+        assert bands * rows == 128
+        assert (1 / bands) ** (1 / rows) <= 0.7
+
+
+class TestMinHasher:
+    """Tests for MinHash signatures."""
+
+    def test_signature_agreement_estimates_jaccard(self):
+        """Should agree on a fraction of positions close to the Jaccard similarity."""
+        a, b = set(range(0, 300)), set(range(100, 400))
+        signatures = MinHasher(num_permutations=512).signatures([a, b])
+
+        agreement = (signatures[0] == signatures[1]).mean()
+        assert abs(agreement - jaccard(a, b)) < 0.1
+
+    def test_batches_match_single_sets(self, monkeypatch):
+        """Should produce the same signatures however sets are batched."""
+        import services.indexers.near_duplicates as module
+        sets = [set(range(i, i + 50)) for i in range(0, 500, 25)]
+        hasher = MinHasher()
+        expected = hasher.signatures(sets)
+
+        monkeypatch.setattr(module, '_BATCH_SHINGLES', 60)
+        assert (hasher.signatures(sets) == expected).all()
+
+
+class TestNearDuplicatePairs:
+    """Tests for LSH candidate search with exact verification."""
+
+    def test_finds_near_duplicates_only(self):
+        """Should report reworded copies and not unrelated text."""
+        pairs = near_duplicate_pairs([
+            ('a', REPEATED),
+            ('b', "Unrelated sentence about spreading area measured on soft gels today."),
+            ('c', REPEATED.replace('tested.', 'tested today.')),
+            ('d', "Too short."),
+        ])
+
+        assert [(first, second) for first, second, _ in pairs] == [('a', 'c')]
+        assert 0.7 <= pairs[0][2] < 1.0
+
+    def test_threshold(self):
+        """Should drop pairs below the similarity threshold."""
+        items = [('a', REPEATED), ('b', REPEATED.replace('tested.', 'tested today.'))]
+
+        assert near_duplicate_pairs(items, threshold=0.95) == []
+
+    def test_matches_pairwise_comparison(self):
+        """Should find the same pairs as comparing every pair exactly."""
+        base = [
+            "Cells were seeded on polyacrylamide gels of three different stiffnesses overnight.",
+            "Images were acquired every five minutes with a confocal microscope at room temperature.",
+            "Statistical significance was assessed with a two sided paired t test throughout.",
+        ]
+        texts = base + [text.replace('were', 'was') for text in base] + [text + ' Again.' for text in base]
+        items = [(str(i), text) for i, text in enumerate(texts)]
+
+        exact = {
+            (items[i][0], items[j][0])
+            for i in range(len(items)) for j in range(i + 1, len(items))
+            if jaccard(shingles(items[i][1]), shingles(items[j][1])) >= 0.7
+        }
+        found = {(first, second) for first, second, _ in near_duplicate_pairs(items)}
+
+        assert found == exact
+
+
+class TestCrossDocIndex:
+    """Tests for near-duplicates in the cross-doc index."""
+
+    def test_sentences_repeated_across_sections(self):
+        """Should report a sentence repeated between abstract and discussion."""
+        sections = make_sections(
+            abstract=f"{REPEATED} This matters for mechanobiology.",
+            discussion=f"As shown, {REPEATED.lower()} Further work is needed.",
+            references=f"{REPEATED} {REPEATED}",
+        )
+        doc = make_doc(sections)
+
+        index = CrossDocIndexer().build(doc)
+
+        assert len(index.near_duplicate_sentences) == 1
+        first, second, _ = index.near_duplicate_sentences[0]
+        assert first.startswith('abstract') and second.startswith('discussion')
+
+    def test_paragraphs(self):
+        """Should report repeated paragraphs."""
+        paragraph = f"{REPEATED} Spreading area was unaffected by blebbistatin treatment in all conditions."
+        sections = make_sections(methods=f"{paragraph}\n\nOther text entirely.\n\n{paragraph}")
+
+        _, paragraph_pairs = find_near_duplicates(sections)
+
+        assert len(paragraph_pairs) == 1
+        assert paragraph_pairs[0][2] == 1.0
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
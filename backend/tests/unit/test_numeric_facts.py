@@ -0,0 +1,127 @@
+"""Unit tests for numeric fact extraction and consistency checks."""
+
+import numpy as np
+import pytest
+from services.indexers.numeric_facts import (
+    KIND_N, KIND_P_VALUE, KIND_MEAN_SD, KIND_PERCENTAGE,
+    extract_numeric_facts, check_numeric_consistency, n_mismatch_pairs
+)
+from services.indexers.cross_doc_indexer import CrossDocIndexer
+from tests.helpers import make_doc, make_sections
+
+
+class TestExtractNumericFacts:
+    """Tests for the single-pass numeric fact extractor."""
+
+    def test_kinds_values_and_units(self):
+        """Should extract each kind with value, unit and relation."""
+        facts = extract_numeric_facts(make_sections(
+            methods="We enrolled 24 patients (n = 24). Age was 34.5 ± 6.2 years. Uptake was 45%. Effect p < 0.05."
+        ))
+
+        assert facts.values(KIND_N).tolist() == [24, 24]
+        assert facts.values(KIND_MEAN_SD).tolist() == [34.5]
+        assert facts.values(KIND_PERCENTAGE).tolist() == [45.0]
+        assert facts.values(KIND_P_VALUE).tolist() == [0.05]
+
+        rows = [facts.row(i) for i in range(len(facts))]
+        assert rows[0]['unit'] == 'patients'
+        assert rows[2]['spread'] == 6.2 and rows[2]['unit'] == 'years'
+        assert rows[4]['relation'] == '<'
+
+    def test_offsets_and_sentences(self):
+        """Should record offsets into section text and the containing sentence."""
+        sections = make_sections(results="Force rose. It was 3.1 ± 0.4 nN in 12 subjects.")
+        facts = extract_numeric_facts(sections)
+        text = sections['results'].text
+
+        assert [text[facts.char_start[i]:facts.char_end[i]] for i in range(len(facts))] == [
+            '3.1 ± 0.4 nN', '12 subjects'
+        ]
+        assert set(facts.sentence_id) == {sections['results'].sentences[1].id}
+
+    def test_capitalised_nouns(self):
+        """Should read sample sizes whatever the case of the noun."""
+        facts = extract_numeric_facts(make_sections(
+            methods="In total, 24 Participants enrolled. 12 PATIENTS withdrew. Data from 10 Subjects were lost."
+        ))
+
+        assert facts.values(KIND_N).tolist() == [24, 12, 10]
+
+    def test_out_of_range_values_dropped(self):
+        """Should skip implausible sample sizes and percentages."""
+        facts = extract_numeric_facts(make_sections(results="A total of 0 cells; 150% growth; N = 500000."))
+
+        assert len(facts) == 0
+
+    def test_empty(self):
+        """Should return an empty table for text without numbers."""
+        facts = extract_numeric_facts(make_sections(intro="No numbers here."))
+
+        assert len(facts) == 0
+        assert check_numeric_consistency(facts) == {
+            "n_mismatches": [], "percentage_sums": [], "sd_exceeds_mean": []
+        }
+
+
+class TestNumericConsistency:
+    """Tests for the vectorized consistency checks."""
+
+    def test_n_mismatch(self):
+        """Should flag sections reporting very different sample sizes."""
+        facts = extract_numeric_facts(make_sections(
+            methods="We recruited 120 participants.",
+            results="Data from 40 participants were analysed.",
+            discussion="Our 119 participants were diverse."
+        ))
+
+        report = check_numeric_consistency(facts)
+
+        pairs = {(m['first']['section'], m['second']['section']) for m in report['n_mismatches']}
+        assert pairs == {('methods', 'results'), ('results', 'discussion')}
+
+    def test_shared_n_not_flagged(self):
+        """Should not flag sections that share a sample size."""
+        codes = np.array([0, 0, 1])
+        values = np.array([120.0, 40.0, 40.0])
+
+        assert len(n_mismatch_pairs(codes, values)) == 0
+
+    def test_percentage_sums(self):
+        """Should flag breakdowns that do not sum to 100 beyond rounding."""
+        facts = extract_numeric_facts(make_sections(
+            results="Responses were 50%, 30% and 12%. Groups were 33.3%, 33.3% and 33.3%."
+        ))
+
+        report = check_numeric_consistency(facts)
+
+        assert [finding['total'] for finding in report['percentage_sums']] == [92.0]
+
+    def test_sd_exceeds_mean(self):
+        """Should flag SDs larger than their means."""
+        facts = extract_numeric_facts(make_sections(results="Counts were 2.0 ± 3.5 and 10 ± 2."))
+
+        report = check_numeric_consistency(facts)
+
+        assert [(f['value'], f['spread']) for f in report['sd_exceeds_mean']] == [(2.0, 3.5)]
+
+
+class TestCrossDocNumbers:
+    """Tests for the numeric parts of CrossDocIndex."""
+
+    def test_index_fields(self):
+        """Should fill ns_by_section, key_numbers and N contradictions from the table."""
+        sections = make_sections(methods="N = 120 mice.", results="In 40 subjects, 55% improved (p = 0.01).")
+        doc = make_doc(sections)
+        indexer = CrossDocIndexer()
+
+        index = indexer.build(doc)
+
+        assert index.ns_by_section == {'methods': [120], 'results': [40]}
+        assert index.key_numbers == {'p_values': [0.01], 'percentages': [55.0]}
+        assert indexer.find_n_contradictions(index) == [('methods', 120, 'results', 40)]
+        assert len(indexer.check_numeric_consistency(index)['n_mismatches']) == 1
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,127 @@
+"""Unit tests for resolving issue quotes to sentences."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from core.models import Issue, Severity, TextLocation
+from services.indexers.quote_index import QuoteIndex, locate_issues, normalize
+from services.parser.pipeline.config import IndexingConfig
+from services.parser.pipeline.models import ParsedDocument, ParsedSection
+from services.parser.pipeline.stages.indexing import index_sentences
+
+
+def make_doc():
+    sections = {
+        'methods': ParsedSection('methods', (
+            "Traction force microscopy was used to measure cell forces. "
+            "Cells were seeded on ﬁbronectin-coated gels of varying stiffness. "
+            "Statistical significance was assessed with a paired t-test."
+        )),
+        'results': ParsedSection('results', (
+            "Traction force increased with substrate stiffness. "
+            "Cells were seeded again for the control experiment. "
+            "Spreading area did not change."
+        )),
+    }
+    sections = index_sentences(sections, IndexingConfig(splitter='scientific'))
+    return ParsedDocument('doc', 'hash', 'Title', sections, [], [], [], [], '')
+
+
+@pytest.fixture(scope='module')
+def doc():
+    return make_doc()
+
+
+@pytest.fixture(scope='module')
+def index(doc):
+    return QuoteIndex(doc)
+
+
+class TestNormalize:
+    """Tests for quote normalization."""
+
+    def test_letters_and_digits_only(self):
+        """Should casefold, expand ligatures and drop whitespace, hyphens and punctuation."""
+        text, offsets = normalize("The ﬁrst con-\ntraction, “measured”")
+        assert text == 'thefirstcontractionmeasured'
+        assert offsets[:5] == [0, 1, 2, 4, 4]  # Both letters of the ligature map to it
+
+
+class TestQuoteIndex:
+    """Tests for quote resolution."""
+
+    def test_exact_quote(self, doc, index):
+        """Should find an exact quote with its sentence and section offsets."""
+        match = index.resolve("used to measure cell forces")[0]
+        sentence = doc.sections['methods'].sentences[0]
+        assert (match.section, match.sentence_ids, match.confidence) == ('methods', [sentence.id], 1.0)
+        assert doc.sections['methods'].text[match.char_start:match.char_end] == "used to measure cell forces"
+
+    def test_tolerates_extraction_differences(self, doc, index):
+        """Should match despite ligatures, hyphenation and whitespace."""
+        match = index.resolve("seeded on fibro-\nnectin coated   gels")[0]
+        assert match.sentence_id == doc.sections['methods'].sentences[1].id
+        assert match.confidence == 1.0
+
+    def test_quote_across_sentences(self, doc, index):
+        """Should report every sentence a quote overlaps."""
+        match = index.resolve("measure cell forces. Cells were seeded on")[0]
+        assert match.sentence_ids == [s.id for s in doc.sections['methods'].sentences[:2]]
+
+    def test_approximate_quote(self, doc, index):
+        """Should find a paraphrased quote with a lower confidence."""
+        match = index.resolve("significance was tested with a paired t-test")[0]
+        assert match.sentence_id == doc.sections['methods'].sentences[2].id
+        assert 0.5 <= match.confidence < 1.0
+
+    def test_section_hint(self, doc, index):
+        """Should prefer the given section and fall back to the others."""
+        assert index.resolve("Cells were seeded", section='results')[0].section == 'results'
+        assert index.resolve("Cells were seeded")[0].section == 'methods'
+        assert index.resolve("paired t-test", section='results')[0].section == 'methods'
+
+    def test_no_match(self, index):
+        """Should return nothing for text that is not in the document."""
+        assert index.resolve("zebrafish embryos were imaged") == []
+        assert index.resolve("...") == []
+
+    def test_empty_document(self):
+        """Should handle documents without sentences."""
+        index = QuoteIndex(ParsedDocument('doc', 'hash', 'Title', {}, [], [], [], [], ''))
+        assert index.resolve("force") == []
+
+    def test_locate_issues(self, doc, index):
+        """Should fill in the sentence of issues located only by a quote."""
+        issue = Issue(issue_type='missing_sample_size', severity=Severity.MAJOR, description='n?',
+                      location=TextLocation(section='results', quote='substrate stiffness'))
+        assert locate_issues(index, [issue]) == 1
+        assert issue.location.sentence_id == doc.sections['results'].sentences[0].id
+
+
+class TestQuotesEndpoint:
+    """Tests for POST /document/{id}/quotes."""
+
+    def test_resolve_quotes(self, doc):
+        """Should resolve each quote to its matches."""
+        main.documents_store['doc'] = doc
+        try:
+            response = TestClient(main.app).post('/document/doc/quotes', json={
+                'quotes': [{'quote': 'paired t-test'}, {'quote': 'zebrafish embryos'}], 'limit': 1
+            })
+        finally:
+            main.documents_store.pop('doc')
+            main.analysis_store.pop('doc', None)
+
+        results = response.json()['results']
+        assert results[0]['matches'][0]['sentence_ids'] == [doc.sections['methods'].sentences[2].id]
+        assert results[1] == {'quote': 'zebrafish embryos', 'matches': []}
+
+    def test_unknown_document(self):
+        """Should return 404 for unknown documents."""
+        response = TestClient(main.app).post('/document/missing/quotes', json={'quotes': []})
+        assert response.status_code == 404
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
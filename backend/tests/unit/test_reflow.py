@@ -4,8 +4,10 @@ import pytest
 from services.parser.pipeline.stages.reflow import (
     is_header_line,
     merge_hyphenations,
-    reflow_text
+    reflow_text,
+    reflow_blocks
 )
+from services.parser.pipeline.stages.blocks import parse_blocks
 from services.parser.pipeline.config import ReflowConfig
 
 
@@ -203,5 +205,61 @@ Methods content here."""
         assert "intro paragraph broken across lines" in result or "intro paragraph" in result
 
 
+class TestReflowBlocks:
+    """Tests for block-level reflow."""
+
+    def test_join_paragraph_lines(self):
+        """Should join line-broken paragraph into one block."""
+        blocks = reflow_blocks(parse_blocks("This is the intro paragraph\nbroken across lines."))
+
+        assert len(blocks) == 1
+        assert blocks[0].text == "This is the intro paragraph broken across lines."
+
+    def test_split_at_sentence_end(self):
+        """Should split where a line ends a sentence and the next starts capitalized."""
+        markdown = "First paragraph ends here.\nSecond paragraph starts\nand continues."
+        blocks = reflow_blocks(parse_blocks(markdown))
+
+        assert [b.text for b in blocks] == [
+            "First paragraph ends here.",
+            "Second paragraph starts and continues.",
+        ]
+
+    def test_split_spans_track_source(self):
+        """Should keep source spans for split paragraphs."""
+        markdown = "First paragraph ends here.\nSecond paragraph."
+        blocks = reflow_blocks(parse_blocks(markdown))
+
+        assert markdown[blocks[0].span[0]:blocks[0].span[1]] == "First paragraph ends here."
+        assert markdown[blocks[1].span[0]:blocks[1].span[1]] == "Second paragraph."
+
+    def test_merge_hyphenation_within_block(self):
+        """Should merge hyphenated words across line breaks."""
+        blocks = reflow_blocks(parse_blocks("This is a hyphen-\nated word"))
+
+        assert blocks[0].text == "This is a hyphenated word"
+
+    def test_merge_hyphenation_across_blank_line(self):
+        """Should merge paragraph blocks split inside a hyphenated word."""
+        blocks = reflow_blocks(parse_blocks("force and con-\n\ntractility in cells"))
+
+        assert len(blocks) == 1
+        assert blocks[0].text == "force and contractility in cells"
+
+    def test_headings_untouched(self):
+        """Should leave heading blocks as they are."""
+        blocks = reflow_blocks(parse_blocks("## Introduction\nThis is the intro\nparagraph."))
+
+        assert blocks[0].text == "## Introduction"
+        assert blocks[1].text == "This is the intro paragraph."
+
+    def test_respect_config_disable(self):
+        """Should return blocks unchanged when reflow is disabled."""
+        blocks = parse_blocks("Line one\nline two")
+        result = reflow_blocks(blocks, ReflowConfig(enable_reflow=False))
+
+        assert result == blocks
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
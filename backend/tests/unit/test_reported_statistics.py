@@ -0,0 +1,137 @@
+"""Unit tests for recomputing reported test statistics."""
+
+import asyncio
+
+import pytest
+import main
+from core.models import Severity
+from services.indexers.reported_statistics import (
+    check_reported_statistics, extract_reported_statistics, p_from_statistic
+)
+from tests.helpers import make_doc, make_sections
+
+
+class TestPFromStatistic:
+    """Tests for p-values from test statistics."""
+
+    @pytest.mark.parametrize('test, statistic, df1, df2', [
+        ('t', 2.228, 10, None),     # Critical values at α = .05
+        ('F', 4.965, 1, 10),
+        ('chi2', 3.841, 1, None),
+        ('z', 1.960, None, None),
+        ('r', 0.361, 28, None),
+    ])
+    def test_critical_values(self, test, statistic, df1, df2):
+        """Should give p = .05 at tabulated critical values."""
+        assert p_from_statistic(test, statistic, df1, df2) == pytest.approx(0.05, abs=2e-4)
+
+    def test_known_values(self):
+        """Should match reference values across distributions."""
+        assert p_from_statistic('t', 2.1, 34) == pytest.approx(0.04322, abs=1e-5)
+        assert p_from_statistic('F', 3.5, 2, 57) == pytest.approx(0.03684, abs=1e-5)
+        assert p_from_statistic('chi2', 30, 10) == pytest.approx(0.000857, abs=1e-6)
+        assert p_from_statistic('t', -2.228, 10) == p_from_statistic('t', 2.228, 10)
+
+    def test_one_tailed(self):
+        """Should halve two-tailed p for one-tailed tests."""
+        assert p_from_statistic('t', 2.0, 20, one_tailed=True) == pytest.approx(p_from_statistic('t', 2.0, 20) / 2)
+
+
+class TestExtractReportedStatistics:
+    """Tests for finding reported statistics in sentences."""
+
+    def test_formats(self):
+        """Should parse t, F, χ², r and z reports with dfs and p relations."""
+        sections = make_sections(results=(
+            "Groups differed, t(34) = 2.10, p = .04. Dose mattered, F(2, 57) = 3.50, p < .05. "
+            "Association χ²(1, N = 90) = 5.2, p = .02. Correlation r(28) = .41, p = .03. "
+            "Overall z = 2.3, p = .02. Emphasis _t_(10) = −2.23, _p_ = 0.05."
+        ))
+        statistics, _ = extract_reported_statistics(sections)
+
+        assert [(s.test, s.df1, s.df2, s.statistic, s.relation, s.p_reported) for s in statistics] == [
+            ('t', 34, None, 2.1, '=', 0.04),
+            ('F', 2, 57, 3.5, '<', 0.05),
+            ('chi2', 1, None, 5.2, '=', 0.02),
+            ('r', 28, None, 0.41, '=', 0.03),
+            ('z', None, None, 2.3, '=', 0.02),
+            ('t', 10, None, -2.23, '=', 0.05),
+        ]
+        assert all(s.consistent for s in statistics)
+
+    def test_offsets_and_sentence(self):
+        """Should record the sentence and offsets of each report."""
+        sections = make_sections(results="Cells spread more. Area rose, t(12) = 3.1, p = .009.")
+        statistics, _ = extract_reported_statistics(sections)
+
+        text = sections['results'].text
+        assert text[statistics[0].char_start:statistics[0].char_end] == 't(12) = 3.1, p = .009'
+        assert statistics[0].sentence_id == sections['results'].sentences[1].id
+
+    def test_missing_degrees_of_freedom_skipped(self):
+        """Should skip statistics that cannot be recomputed."""
+        statistics, _ = extract_reported_statistics(
+            make_sections(results="We found t = 2.1, p = .04 and F(3) = 2, p = .1.")
+        )
+
+        assert statistics == []
+
+
+class TestCheckReportedStatistics:
+    """Tests for issues from recomputed statistics."""
+
+    def test_rounding_tolerated(self):
+        """Should accept p-values within the rounding of the statistic."""
+        assert check_reported_statistics(make_sections(results="Result t(10) = 2.2, p = .05.")) == []
+
+    def test_minor_mismatch(self):
+        """Should flag a wrong p-value that keeps the conclusion as minor."""
+        issues = check_reported_statistics(make_sections(results="Result t(34) = 2.10, p = .01."))
+
+        assert len(issues) == 1
+        assert issues[0].issue_type == 'p_value_mismatch'
+        assert issues[0].severity == Severity.MINOR
+        assert issues[0].location.quote == 't(34) = 2.10, p = .01'
+
+    def test_decision_error(self):
+        """Should flag a p-value on the wrong side of α as major."""
+        sections = make_sections(results="No effect. Dose mattered, F(2, 57) = 1.2, p < .05.")
+        issues = check_reported_statistics(sections)
+
+        assert issues[0].severity == Severity.MAJOR
+        assert issues[0].location.sentence_id == sections['results'].sentences[1].id
+
+    def test_grim(self):
+        """Should flag means impossible for integer data with the reported n."""
+        issues = check_reported_statistics(make_sections(
+            results="Ratings were M = 3.47 (n = 21). Scores were M = 3.48 (n = 21). Times were M = 3.471 (n = 2000)."
+        ))
+
+        assert [issue.issue_type for issue in issues] == ['grim_inconsistency']
+        assert issues[0].location.quote == 'M = 3.47'
+
+
+class TestReviewPipeline:
+    """Tests for statistic issues in the review output."""
+
+    @pytest.fixture
+    def stores(self):
+        for store in (main.documents_store, main.analysis_store, main.reviews_store, main.processing_status):
+            store.clear()
+        yield
+        for store in (main.documents_store, main.analysis_store, main.reviews_store, main.processing_status):
+            store.clear()
+
+    def test_issues_added_to_section_reports(self, stores):
+        """Should add recomputed statistic issues to the section's Track A issues."""
+        sections = make_sections(results="Dose mattered, F(2, 57) = 1.2, p < .05.")
+        main.documents_store['doc'] = make_doc(sections)
+
+        asyncio.run(main.run_review_pipeline('doc', track_b_enabled=False, agents_to_run=None))
+
+        reports = {report.section: report for report in main.reviews_store['doc'].sections}
+        assert [issue.issue_type for issue in reports['results'].track_a_issues] == ['p_value_mismatch']
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,158 @@
+"""Unit tests for JSON encoding, projection, compression and ETags."""
+
+import asyncio
+import json
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from core.cache import Cache, MemoryBackend
+from core import responses
+from core.models import Severity
+from core.responses import (
+    choose_encoding, encode_json, etag_matches, make_etag, parse_fields, project
+)
+from services.parser.pipeline.models import ParsedDocument, ParsedSection
+
+
+class TestEncoding:
+    """Tests for encode_json()."""
+
+    def test_encodes_enums_and_datetimes(self):
+        """Should encode values the API returns that json cannot."""
+        body = encode_json({'severity': Severity.MAJOR, 'at': datetime(2024, 1, 2), 'ids': {'a'}})
+        assert json.loads(body) == {'severity': Severity.MAJOR.value, 'at': '2024-01-02T00:00:00', 'ids': ['a']}
+
+    def test_json_fallback(self, monkeypatch):
+        """Should produce the same JSON without orjson."""
+        content = {'severity': Severity.MINOR, 'n': [1, 2.5], 'symbol': 'α'}
+        fast = encode_json(content)
+        monkeypatch.setattr(responses, 'orjson', None)
+        assert json.loads(encode_json(content)) == json.loads(fast)
+
+    def test_keeps_unicode(self):
+        """Should write non-ASCII text as UTF-8 rather than escapes."""
+        assert encode_json({'symbol': 'α'}) == '{"symbol":"α"}'.encode('utf-8')
+
+
+class TestProjection:
+    """Tests for ?fields= projection."""
+
+    CONTENT = {
+        'title': 'T',
+        'raw_markdown': '# T',
+        'statistics': {'total_figures': 3, 'total_citations': 9},
+        'sections': [{'section': 'methods', 'issues': [1]}, {'section': 'results', 'issues': []}],
+    }
+
+    def test_no_fields_keeps_everything(self):
+        """Should return content unchanged without fields."""
+        assert project(self.CONTENT, parse_fields(None)) is self.CONTENT
+
+    def test_nested_and_list_fields(self):
+        """Should keep dotted fields inside dicts and each list item."""
+        fields = parse_fields('title, statistics.total_figures,sections.section')
+        assert project(self.CONTENT, fields) == {
+            'title': 'T',
+            'statistics': {'total_figures': 3},
+            'sections': [{'section': 'methods'}, {'section': 'results'}],
+        }
+
+    def test_unknown_top_level_field(self):
+        """Should reject fields the content does not have."""
+        with pytest.raises(ValueError, match='titel'):
+            project(self.CONTENT, parse_fields('titel'))
+
+
+class TestNegotiation:
+    """Tests for content coding and ETag matching."""
+
+    def test_choose_encoding(self):
+        """Should pick gzip when accepted and nothing otherwise."""
+        assert choose_encoding('gzip, deflate') == 'gzip'
+        assert choose_encoding('gzip;q=0, deflate') is None
+        assert choose_encoding('') is None
+
+    def test_etag_matching(self):
+        """Should match weak and strong forms and lists of tags."""
+        etag = make_etag('document', 'doc', 'hash')
+        assert etag.startswith('W/"')
+        assert etag_matches(etag, etag)
+        assert etag_matches(f'"other", {etag[2:]}', etag)
+        assert not etag_matches('"other"', etag)
+        assert make_etag('document', 'doc', 'hash2') != etag
+
+
+class TestApiResponses:
+    """Tests for /document and /results responses."""
+
+    @pytest.fixture
+    def client(self, monkeypatch):
+        main.storage.clear()
+        monkeypatch.setattr(main, 'cache', Cache(MemoryBackend()))
+        sections = {'methods': ParsedSection('methods', 'Participants were recruited. ' * 200)}
+        main.documents_store['doc'] = ParsedDocument('doc', 'hash', 'Title', sections, [], [], [], [],
+                                                     '# Title\n\n' + 'Participants were recruited. ' * 200)
+        yield TestClient(main.app)
+        main.storage.clear()
+
+    def test_fields_projection(self, client):
+        """Should return only the requested fields."""
+        response = client.get('/document/doc', params={'fields': 'title,statistics.total_figures'})
+        assert response.json() == {'title': 'Title', 'statistics': {'total_figures': 0}}
+        assert client.get('/document/doc', params={'fields': 'nope'}).status_code == 400
+
+    def test_large_body_gzipped(self, client):
+        """Should gzip large bodies for clients that accept it."""
+        response = client.get('/document/doc', headers={'Accept-Encoding': 'gzip'})
+        assert response.headers['content-encoding'] == 'gzip'
+        assert response.json()['title'] == 'Title'  # Decoded by the client
+
+        raw = client.get('/document/doc', headers={'Accept-Encoding': 'identity'})
+        assert 'content-encoding' not in raw.headers
+
+    def test_small_body_not_compressed(self, client):
+        """Should send small bodies uncompressed."""
+        response = client.get('/document/doc', params={'fields': 'title'}, headers={'Accept-Encoding': 'gzip'})
+        assert 'content-encoding' not in response.headers
+
+    def test_not_modified(self, client, monkeypatch):
+        """Should answer a matching If-None-Match with 304 without building the body."""
+        etag = client.get('/document/doc').headers['etag']
+        get_analysis = main.get_analysis
+        monkeypatch.setattr(main, 'get_analysis', lambda *args: pytest.fail('rebuilt'))
+        response = client.get('/document/doc', headers={'If-None-Match': etag})
+        assert response.status_code == 304
+        assert response.content == b''
+        monkeypatch.setattr(main, 'get_analysis', get_analysis)
+        other = client.get('/document/doc', params={'fields': 'title'}, headers={'If-None-Match': etag})
+        assert other.status_code == 200
+
+    def test_results_etag_changes_with_new_review(self, client):
+        """Should revalidate results against the latest review."""
+        asyncio.run(main.run_review_pipeline('doc', track_b_enabled=False, agents_to_run=None))
+        first = client.get('/results/doc', params={'fields': 'document_id,sections.section'})
+        assert first.json() == {'document_id': 'doc', 'sections': [{'section': 'methods'}]}
+        etag = first.headers['etag']
+        fields = {'fields': 'document_id,sections.section'}
+        assert client.get('/results/doc', params=fields, headers={'If-None-Match': etag}).status_code == 304
+
+        review = main.reviews_store['doc']
+        review.summary = 'Revised.'
+        main.reviews_store['doc'] = review
+        assert client.get('/results/doc', params=fields, headers={'If-None-Match': etag}).status_code == 200
+
+    def test_results_etag_ignores_job_progress(self, client):
+        """Should keep the ETag while only the review job's progress changes."""
+        main.review_jobs.submit('doc', {})
+        asyncio.run(main.run_review_pipeline('doc', track_b_enabled=False, agents_to_run=None))
+        etag = client.get('/results/doc').headers['etag']
+
+        main.review_jobs.update(main.review_jobs.get('doc'), 'statistics', 0.5)
+        assert client.get('/results/doc', headers={'If-None-Match': etag}).status_code == 304
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
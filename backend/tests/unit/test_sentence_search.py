@@ -0,0 +1,106 @@
+"""Unit tests for BM25 sentence search."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from services.indexers.sentence_search import SentenceSearchIndex, tokenize
+from services.parser.pipeline.config import IndexingConfig
+from services.parser.pipeline.models import ParsedDocument, ParsedSection
+from services.parser.pipeline.stages.indexing import index_sentences
+
+
+def make_doc():
+    sections = {
+        'methods': ParsedSection('methods', (
+            "Traction force microscopy was used to measure cell forces. "
+            "Cells were seeded on gels of varying stiffness. "
+            "Statistical significance was assessed with a paired t-test."
+        )),
+        'results': ParsedSection('results', (
+            "Traction force increased with substrate stiffness. "
+            "Force per cell rose, and force per area rose, so force dominated. "
+            "Spreading area did not change."
+        )),
+    }
+    sections = index_sentences(sections, IndexingConfig(splitter='scientific'))
+    return ParsedDocument('doc', 'hash', 'Title', sections, [], [], [], [], '')
+
+
+class TestTokenize:
+    """Tests for search tokenization."""
+
+    def test_lowercase_and_stopwords(self):
+        """Should lowercase and drop stopwords."""
+        assert tokenize("The Force of the cells") == ['force', 'cells']
+
+    def test_hyphenated(self):
+        """Should index hyphenated words whole and by part."""
+        assert tokenize("a paired t-test") == ['paired', 't-test', 't', 'test']
+
+
+class TestSentenceSearchIndex:
+    """Tests for BM25 ranking."""
+
+    def test_ranks_by_relevance(self):
+        """Should rank sentences matching more query terms first."""
+        index = SentenceSearchIndex(make_doc())
+
+        hits = index.search("traction force stiffness")
+
+        assert hits[0].sentence.text == "Traction force increased with substrate stiffness."
+        assert all(a.score >= b.score for a, b in zip(hits, hits[1:]))
+
+    def test_no_match(self):
+        """Should return no hits for unknown terms."""
+        assert SentenceSearchIndex(make_doc()).search("zebrafish") == []
+
+    def test_limit_and_section(self):
+        """Should honour limit and section filter."""
+        index = SentenceSearchIndex(make_doc())
+
+        assert len(index.search("force", limit=2)) == 2
+        assert {hit.sentence.section for hit in index.search("force", section='methods')} == {'methods'}
+
+    def test_term_frequency_saturates(self):
+        """Should not let one repeated word outrank a sentence matching more query terms."""
+        index = SentenceSearchIndex(make_doc())
+
+        hits = index.search("force area")
+
+        assert hits[0].sentence.text.startswith("Force per cell rose")
+
+    def test_empty_document(self):
+        """Should handle documents without sentences."""
+        doc = ParsedDocument('doc', 'hash', 'Title', {}, [], [], [], [], '')
+
+        assert SentenceSearchIndex(doc).search("force") == []
+
+
+class TestSearchEndpoint:
+    """Tests for GET /document/{id}/search."""
+
+    def test_search_endpoint(self):
+        """Should return ranked sentences with IDs and offsets."""
+        doc = make_doc()
+        main.documents_store['doc'] = doc
+        try:
+            response = TestClient(main.app).get('/document/doc/search', params={'q': 't-test', 'limit': 3})
+        finally:
+            main.documents_store.pop('doc')
+            main.analysis_store.pop('doc', None)
+
+        assert response.status_code == 200
+        results = response.json()['results']
+        assert results[0]['sentence_id'] == doc.sections['methods'].sentences[2].id
+        assert results[0]['section'] == 'methods'
+
+    def test_unknown_document(self):
+        """Should return 404 for unknown documents."""
+        response = TestClient(main.app).get('/document/missing/search', params={'q': 'force'})
+
+        assert response.status_code == 404
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,111 @@
+"""Unit tests for the scientific sentence splitter."""
+
+import pytest
+from services.parser.pipeline.stages.splitter import (
+    scientific_sentence_split,
+    scientific_sentence_spans
+)
+from services.parser.pipeline.stages.indexing import index_sentences, resolve_splitter
+from services.parser.pipeline.models import ParsedSection
+from services.parser.pipeline.config import IndexingConfig
+
+
+class TestScientificSentenceSplit:
+    """Tests for scientific sentence splitting."""
+
+    def test_split_basic_sentences(self):
+        """Should split sentences at terminators."""
+        result = scientific_sentence_split("First one. Second one! Third one?")
+
+        assert result == ["First one.", "Second one!", "Third one?"]
+
+    def test_et_al(self):
+        """Should not split after et al."""
+        result = scientific_sentence_split("Smith et al. Reported this. It held.")
+
+        assert result == ["Smith et al. Reported this.", "It held."]
+
+    def test_figure_labels(self):
+        """Should not split after Fig. or Eq. labels."""
+        result = scientific_sentence_split("As shown in Fig. 2 and Eq. 3, force rose. Then it fell.")
+
+        assert len(result) == 2
+
+    def test_latin_abbreviations(self):
+        """Should not split after e.g. and i.e."""
+        result = scientific_sentence_split("We used blots, e.g. Western blots, i.e. WB. Next.")
+
+        assert result == ["We used blots, e.g. Western blots, i.e. WB.", "Next."]
+
+    def test_decimals(self):
+        """Should not split inside decimals."""
+        result = scientific_sentence_split("The mean was 3.5 Hz with p = 0.05 overall. Next.")
+
+        assert result == ["The mean was 3.5 Hz with p = 0.05 overall.", "Next."]
+
+    def test_author_initials(self):
+        """Should not split after single-letter initials."""
+        result = scientific_sentence_split("Data from J. Smith were used. Next.")
+
+        assert result == ["Data from J. Smith were used.", "Next."]
+
+    def test_citation_brackets_stay_with_sentence(self):
+        """Should keep a trailing citation with the sentence it cites."""
+        result = scientific_sentence_split("Cells contract. [3, 4] Force is measured.")
+
+        assert result == ["Cells contract. [3, 4]", "Force is measured."]
+
+    def test_superscript_citations(self):
+        """Should keep superscript-style citation numbers with the sentence."""
+        result = scientific_sentence_split("Cells contract.12,13 Force is measured.")
+
+        assert result == ["Cells contract.12,13", "Force is measured."]
+
+    def test_line_breaks_do_not_split(self):
+        """Should join sentences wrapped across lines, like punkt."""
+        result = scientific_sentence_split("Force was\n\nmeasured here. Next.")
+
+        assert result == ["Force was\n\nmeasured here.", "Next."]
+
+    def test_spans_match_text(self):
+        """Should return spans that slice back to the sentences."""
+        text = "  One sentence here.   Two sentences here.  "
+        spans = scientific_sentence_spans(text)
+
+        assert [text[s:e] for s, e in spans] == ["One sentence here.", "Two sentences here."]
+
+    def test_empty_text(self):
+        """Should return no sentences for blank text."""
+        assert scientific_sentence_spans("   \n ") == []
+
+
+class TestSplitterSelection:
+    """Tests for selecting the splitter through IndexingConfig."""
+
+    def test_resolve_splitter(self):
+        """Should honour splitter and the legacy use_nltk flag."""
+        assert resolve_splitter(IndexingConfig()) == 'nltk'
+        assert resolve_splitter(IndexingConfig(use_nltk=False)) == 'simple'
+        assert resolve_splitter(IndexingConfig(splitter='scientific')) == 'scientific'
+
+    def test_unknown_splitter(self):
+        """Should reject unknown splitter names."""
+        with pytest.raises(ValueError):
+            resolve_splitter(IndexingConfig(splitter='spacy'))
+
+    def test_index_with_scientific_splitter(self):
+        """Should index sections with the scientific splitter."""
+        sections = {
+            'intro': ParsedSection('intro', 'Smith et al. Showed it in Fig. 1. It held.', [])
+        }
+
+        indexed = index_sentences(sections, IndexingConfig(splitter='scientific'))
+
+        assert [s.text for s in indexed['intro'].sentences] == [
+            'Smith et al. Showed it in Fig. 1.',
+            'It held.',
+        ]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
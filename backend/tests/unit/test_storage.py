@@ -0,0 +1,326 @@
+"""Unit tests for persistent document, analysis and review storage."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from core.storage import (
+    Database, DocumentStore, KeyValueStore, LRUCache, deserialize, open_storage, serialize
+)
+from services.indexers.document_analysis import analyze_document
+from services.parser.pipeline.config import IndexingConfig
+from services.parser.pipeline.models import FigureBlock, ParsedDocument, ParsedSection, RevisionInfo
+from services.parser.pipeline.stages.indexing import index_sentences
+
+
+def make_doc(doc_id='doc'):
+    sections = index_sentences({
+        'introduction': ParsedSection('introduction', 'Cells contract. Forces matter.'),
+        'methods': ParsedSection('methods', 'We recruited 24 participants (n = 24).\n\nGels were cast.'),
+    }, IndexingConfig(splitter='scientific'))
+    return ParsedDocument(
+        doc_id=doc_id,
+        doc_hash='hash',
+        title='Cell Contraction',
+        sections=sections,
+        figures=[FigureBlock('fig-1', 'Figure 1', 'Figure 1. Force.', 0)],
+        figure_refs=[],
+        citations=[],
+        bibliography=[],
+        raw_markdown='# Cell Contraction',
+        revision=RevisionInfo('old', changed_paragraphs={'methods': [1]})
+    )
+
+
+@pytest.fixture
+def db():
+    database = Database('sqlite://')
+    yield database
+    database.close()
+
+
+class TestSerialization:
+    """Tests for the compressed binary format."""
+
+    def test_round_trip(self):
+        """Should restore values and compress repetitive data."""
+        value = {'text': 'force ' * 1000, 'numbers': list(range(10))}
+        data = serialize(value)
+
+        assert deserialize(data) == value
+        assert len(data) < 1000
+
+
+class TestDocumentStore:
+    """Tests for storing documents with lazily loaded sections."""
+
+    def test_round_trip(self, db):
+        """Should restore every field of a stored document."""
+        doc = make_doc()
+        DocumentStore(db)['doc'] = doc
+
+        loaded = DocumentStore(db)['doc']
+
+        assert loaded is not doc
+        assert loaded.title == doc.title and loaded.figures == doc.figures and loaded.revision == doc.revision
+        assert dict(loaded.sections) == doc.sections
+        assert list(loaded.sections) == ['introduction', 'methods']
+
+    def test_sections_load_lazily(self, db):
+        """Should fetch only the sections that are accessed."""
+        DocumentStore(db)['doc'] = make_doc()
+        loaded = DocumentStore(db)['doc']
+
+        assert 'methods' in loaded.sections and len(loaded.sections) == 2
+        assert loaded.sections._loaded == {}
+        assert loaded.sections['methods'].sentences[0].text.startswith('We recruited')
+        assert list(loaded.sections._loaded) == ['methods']
+
+    def test_lookup_built_on_first_use(self, db):
+        """Should rebuild ID lookups from the stored sections when first used."""
+        doc = make_doc()
+        sentence = doc.sections['methods'].sentences[1]
+        DocumentStore(db)['doc'] = doc
+        loaded = DocumentStore(db)['doc']
+
+        assert loaded.sections._loaded == {}
+        assert loaded.lookup.sentence(sentence.id).text == sentence.text
+
+    def test_cache_returns_same_object(self, db):
+        """Should return the same object for repeated reads."""
+        store = DocumentStore(db)
+        store['doc'] = make_doc()
+
+        assert DocumentStore(db)['doc'] is not store['doc']
+        assert store['doc'] is store['doc']
+
+    def test_mapping_operations(self, db):
+        """Should support membership, listing, summaries and deletion without loading documents."""
+        store = DocumentStore(db)
+        store['a'] = make_doc('a')
+        store['b'] = make_doc('b')
+
+        assert 'a' in store and 'missing' not in store
+        assert list(store) == ['a', 'b'] and len(store) == 2
+        assert store.summaries()[0] == ('a', 'Cell Contraction', ['introduction', 'methods'])
+
+        del store['a']
+        assert 'a' not in store
+        assert db.execute("SELECT COUNT(*) FROM sections")[0][0] == 2
+        store.clear()
+        assert len(store) == 0
+        with pytest.raises(KeyError):
+            store['b']
+
+    def test_markdown_range(self, db):
+        """Should slice the markdown in the database without loading the document."""
+        DocumentStore(db)['doc'] = make_doc()
+        store = DocumentStore(db)
+
+        assert store.markdown_range('doc', 2, 6) == ('Cell', 18)
+        assert store.markdown_range('doc', 15, 100) == ('ion', 18)
+        assert store.markdown_range('doc', 40, 50) == ('', 18)
+        assert store._cache.get('doc') is None
+        with pytest.raises(KeyError):
+            store.markdown_range('missing', 0, 10)
+
+
+class TestTransactions:
+    """Tests for atomic multi-row writes."""
+
+    def test_failed_write_keeps_previous_document(self, db, monkeypatch):
+        """Should roll back every row of a document write that fails part way."""
+        store = DocumentStore(db)
+        store['doc'] = make_doc()
+        execute = db.execute
+
+        def failing_execute(sql, params=()):
+            if sql.startswith('INSERT INTO markdown'):
+                raise RuntimeError('connection lost')
+            return execute(sql, params)
+
+        monkeypatch.setattr(db, 'execute', failing_execute)
+        edited = make_doc()
+        edited.sections.pop('introduction')
+        with pytest.raises(RuntimeError):
+            store['doc'] = edited
+        monkeypatch.undo()
+
+        loaded = DocumentStore(db)['doc']
+        assert list(loaded.sections) == ['introduction', 'methods']
+        assert loaded.sections['introduction'].text == 'Cells contract. Forces matter.'
+
+    def test_failed_statement_rolled_back(self, db):
+        """Should leave the connection usable after a statement fails."""
+        with pytest.raises(Exception):
+            db.execute("INSERT INTO status (key) VALUES (?)", ('doc',))
+
+        assert not db.connection.in_transaction
+        KeyValueStore(db, 'status')['doc'] = 'uploaded'
+        assert KeyValueStore(db, 'status', cache_size=0)['doc'] == 'uploaded'
+
+    def test_nested_transactions_commit_once(self, db):
+        """Should join nested blocks to the outer transaction."""
+        store = KeyValueStore(db, 'status', cache_size=0)
+        with pytest.raises(RuntimeError):
+            with db.transaction():
+                store['a'] = 'uploaded'
+                with db.transaction():
+                    store['b'] = 'uploaded'
+                raise RuntimeError('abort')
+
+        assert 'a' not in store and 'b' not in store
+
+
+class TestKeyValueStore:
+    """Tests for pickled key-value tables."""
+
+    def test_round_trip_and_overwrite(self, db):
+        """Should store, overwrite and delete values."""
+        store = KeyValueStore(db, 'status', cache_size=0)
+        store['doc'] = 'uploaded'
+        store['doc'] = 'processing'
+
+        assert KeyValueStore(db, 'status')['doc'] == 'processing'
+        assert store.get('missing', 'unknown') == 'unknown'
+        del store['doc']
+        assert 'doc' not in store
+
+    def test_update_if(self, db):
+        """Should update a value only if no other writer changed it since it was read."""
+        store = KeyValueStore(db, 'status', cache_size=0)
+        store['doc'] = 'queued'
+
+        assert store.update_if('doc', lambda value: 'running' if value == 'queued' else None) == 'running'
+        assert store.update_if('doc', lambda value: 'running' if value == 'queued' else None) is None
+        assert store.update_if('missing', lambda value: 'running') is None
+
+        def changed_meanwhile(value):
+            store['doc'] = 'completed'
+            return 'failed'
+
+        assert store.update_if('doc', changed_meanwhile) is None
+        assert store['doc'] == 'completed'
+
+    def test_uncached_reads_see_other_writers(self, db):
+        """Should read values written through another store when not caching."""
+        reader = KeyValueStore(db, 'status', cache_size=0)
+        reader['doc'] = 'processing'
+        KeyValueStore(db, 'status')['doc'] = 'completed'
+
+        assert reader['doc'] == 'completed'
+
+
+class TestLRUCache:
+    """Tests for the bounded cache."""
+
+    def test_evicts_least_recently_used(self):
+        """Should drop the entry used longest ago."""
+        cache = LRUCache(2)
+        cache['a'], cache['b'] = 1, 2
+        cache.get('a')
+        cache['c'] = 3
+
+        assert list(cache) == ['a', 'c']
+
+
+class TestPersistence:
+    """Tests for data surviving a restart."""
+
+    def test_reopen_file_database(self, tmp_path):
+        """Should read back documents, analyses and status from a database file."""
+        url = f"sqlite:///{tmp_path}/store.db"
+        storage = open_storage(url)
+        doc = make_doc()
+        storage.documents['doc'] = doc
+        storage.analyses['doc'] = analyze_document(doc)
+        storage.status['doc'] = 'uploaded'
+        storage.db.close()
+
+        reopened = open_storage(url)
+        loaded = reopened.documents['doc']
+        analysis = reopened.analyses['doc'].bind(loaded)
+
+        assert reopened.status['doc'] == 'uploaded'
+        assert analysis.is_current(loaded)
+        assert analysis.statistics['sample_sizes']['methods'] == [24]
+        assert analysis.search.search('participants')[0].sentence.section == 'methods'
+        reopened.db.close()
+
+    def test_unsupported_url(self):
+        """Should reject unknown database schemes."""
+        with pytest.raises(ValueError):
+            Database('mysql://localhost/db')
+
+
+class TestApiStores:
+    """Tests for the API's use of storage."""
+
+    @pytest.fixture
+    def stores(self):
+        main.storage.clear()
+        yield
+        main.storage.clear()
+
+    def test_stored_analysis_reused_after_restart(self, stores, monkeypatch):
+        """Should reuse an analysis loaded from storage instead of recomputing it."""
+        main.documents_store['doc'] = make_doc()
+        main.get_analysis('doc')
+
+        # Simulate a fresh worker: empty in-memory caches, same database
+        monkeypatch.setattr(main, 'documents_store', DocumentStore(main.storage.db))
+        monkeypatch.setattr(main, 'analysis_store', KeyValueStore(main.storage.db, 'analyses'))
+        monkeypatch.setattr(main, 'analyze_document', lambda *args, **kwargs: pytest.fail('recomputed'))
+
+        analysis = main.get_analysis('doc')
+        assert analysis.doc is main.documents_store['doc']
+
+    def test_analysis_survives_document_eviction(self, stores, monkeypatch):
+        """Should keep using a cached analysis when only its document was evicted and reloaded."""
+        doc = make_doc()
+        main.documents_store['doc'] = doc
+        main.analysis_store['doc'] = analysis = analyze_document(doc, has_authors=True)
+
+        # Document cache evicted: the next read loads a new object from the database
+        monkeypatch.setattr(main, 'documents_store', DocumentStore(main.storage.db))
+        monkeypatch.setattr(main, 'analyze_document', lambda *args, **kwargs: pytest.fail('recomputed'))
+
+        reloaded = main.documents_store['doc']
+        assert reloaded is not doc
+        assert main.get_analysis('doc') is analysis
+        assert analysis.doc is reloaded
+        assert analysis.has_authors and analysis.section_validation['has_authors']
+
+
+class TestPagedDocumentApi:
+    """Tests for the sentence and markdown page endpoints."""
+
+    @pytest.fixture
+    def client(self):
+        main.storage.clear()
+        main.documents_store['doc'] = make_doc()
+        yield TestClient(main.app)
+        main.storage.clear()
+
+    def test_sentence_pages(self, client):
+        """Should return a page of a section's sentences with the total count."""
+        first = client.get('/document/doc/sections/introduction/sentences', params={'limit': 1}).json()
+        assert first['total'] == 2
+        assert [s['text'] for s in first['sentences']] == ['Cells contract.']
+
+        second = client.get('/document/doc/sections/introduction/sentences', params={'offset': 1}).json()
+        assert [s['text'] for s in second['sentences']] == ['Forces matter.']
+        assert second['sentences'][0]['char_start'] == 16
+        assert client.get('/document/doc/sections/results/sentences').status_code == 404
+
+    def test_markdown_range(self, client):
+        """Should return the requested range of the markdown and its length."""
+        page = client.get('/document/doc/markdown', params={'start': 2, 'end': 6}).json()
+        assert (page['text'], page['end'], page['total_length']) == ('Cell', 6, 18)
+        assert client.get('/document/doc/markdown').json()['text'] == '# Cell Contraction'
+        assert client.get('/document/doc/markdown', params={'start': 6, 'end': 2}).status_code == 400
+        assert client.get('/document/missing/markdown').status_code == 404
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,88 @@
+"""Unit tests for the Aho–Corasick term matcher and the term index."""
+
+import pytest
+from services.indexers.term_matcher import TermMatcher, load_vocabulary, default_matcher
+from services.indexers.cross_doc_indexer import CrossDocIndexer
+from services.parser.pipeline.models import ParsedDocument, ParsedSection, Sentence
+
+
+class TestTermMatcher:
+    """Tests for multi-term matching."""
+
+    def test_finds_all_terms_with_offsets(self):
+        """Should report every term occurrence with offsets into the text."""
+        matcher = TermMatcher(['ANOVA', 't-test', 'paired t-test'])
+        text = "A paired t-test and ANOVA, then another ANOVA."
+
+        matches = list(matcher.finditer(text))
+
+        assert ('paired t-test', 2, 15) in matches
+        assert ('t-test', 9, 15) in matches
+        assert [(s, e) for t, s, e in matches if t == 'anova'] == [(20, 25), (40, 45)]
+        assert all(text[s:e].lower() == t for t, s, e in matches)
+
+    def test_word_boundaries(self):
+        """Should not match terms inside longer words."""
+        matcher = TermMatcher(['control', 'primary'])
+
+        assert matcher.find_terms("Uncontrolled, primarily") == []
+        assert matcher.find_terms("The control (primary) arm") == ['control', 'primary']
+
+    def test_overlapping_prefixes(self):
+        """Should find terms that share prefixes and suffixes."""
+        matcher = TermMatcher(['he', 'she', 'his', 'hers'])
+
+        assert matcher.find_terms("ushers she his") == ['she', 'his']
+        assert TermMatcher(['a b', 'b c']).find_terms("a b c") == ['a b', 'b c']
+
+    def test_case_and_whitespace(self):
+        """Should match case-insensitively, across line breaks."""
+        matcher = TermMatcher(['Linear  Model'])
+
+        assert matcher.find_terms("a LINEAR\nmodel") == ['linear model']
+
+    def test_duplicate_terms_merged(self):
+        """Should merge terms that normalize to the same string."""
+        assert len(TermMatcher(['ANOVA', 'anova', ' ANOVA '])) == 1
+
+    def test_load_vocabulary(self, tmp_path):
+        """Should skip comments and blank lines."""
+        path = tmp_path / 'terms.txt'
+        path.write_text("# Tests\nANOVA\n\nlog-rank test\n")
+
+        assert load_vocabulary(path) == ['ANOVA', 'log-rank test']
+
+    def test_default_vocabulary(self):
+        """Should load the bundled vocabularies."""
+        matcher = default_matcher()
+
+        assert len(matcher) > 200
+        assert matcher.find_terms("double-blind randomized controlled trial") == [
+            'double-blind', 'randomized', 'randomized controlled trial'
+        ]
+
+
+class TestTermIndex:
+    """Tests for the cross-document term index."""
+
+    def test_postings_with_offsets(self):
+        """Should map terms to sentence IDs and section offsets."""
+        text = "We used ANOVA. ANOVA and ANOVA again."
+        sentences = [
+            Sentence('results_0_a', 'results', 'We used ANOVA.', 0, 14, 0),
+            Sentence('results_1_b', 'results', 'ANOVA and ANOVA again.', 15, 37, 0),
+        ]
+        doc = ParsedDocument('doc', 'hash', 'Title', {'results': ParsedSection('results', text, sentences)},
+                             [], [], [], [], '')
+
+        index = CrossDocIndexer(TermMatcher(['ANOVA'])).build(doc)
+
+        assert index.term_to_sentence_ids == {'anova': ['results_0_a', 'results_1_b']}
+        positions = index.term_positions['anova']
+        assert [(sid, text[s:e]) for sid, s, e in positions] == [
+            ('results_0_a', 'ANOVA'), ('results_1_b', 'ANOVA'), ('results_1_b', 'ANOVA')
+        ]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
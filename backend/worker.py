@@ -0,0 +1,49 @@
+"""Standalone review worker.
+
+Runs review jobs from the shared Redis job queue outside the API
+processes. Set REVIEW_WORKERS=0 on the API to leave every review to
+these workers and keep the API responsive under load.
+
+Usage:
+    python worker.py [--concurrency N]
+"""
+
+import argparse
+import asyncio
+import logging
+
+import main
+from core.config import settings
+from core.jobs import WorkerPool
+from services.parser.pipeline import default_config
+from services.parser.pipeline.stages.indexing import preload_tokenizer, shutdown_pool
+from services.indexers.term_matcher import configure_vocabulary
+
+logger = logging.getLogger(__name__)
+
+
+async def run(concurrency: int):
+    preload_tokenizer(default_config().indexing)
+    configure_vocabulary(settings.term_vocabularies)
+    main.review_jobs.recover()
+
+    pool = WorkerPool(main.review_jobs, main.run_review_job, concurrency, on_failure=main.review_failed)
+    pool.start()
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await pool.stop()
+        shutdown_pool()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--concurrency', type=int, default=max(settings.review_workers, 1))
+    args = parser.parse_args()
+
+    if main.review_jobs.queue.name != 'redis':
+        raise SystemExit("Standalone workers need Redis (REDIS_URL); the in-process queue is not shared")
+    try:
+        asyncio.run(run(args.concurrency))
+    except KeyboardInterrupt:
+        logger.info("Review worker stopped")